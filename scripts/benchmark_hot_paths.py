@@ -0,0 +1,699 @@
+#!/usr/bin/env python3
+"""
+Hot-path benchmark harness for NFL Predictor API.
+
+Runs micro and macro benchmarks over the in-process hot paths (memory
+retrieval, temporal decay ranking, consensus, feature engineering, ensemble
+predict_proba, cache get/set, WebSocket fan-out and parlay simulation) on
+deterministic synthetic fixtures at 1x/10x/100x season scale. Results are
+stored as JSON and compared against a baseline file; a regression needs both
+a median slowdown above the tolerance and a significant Mann-Whitney U test,
+and produces a flamegraph of the offending case.
+
+Usage:
+    python scripts/benchmark_hot_paths.py run --scales 1x,10x --output hot-path-results.json
+    python scripts/benchmark_hot_paths.py baseline
+    python scripts/benchmark_hot_paths.py check --tolerance 0.10
+    python scripts/benchmark_hot_paths.py compare --current hot-path-results.json
+    python scripts/benchmark_hot_paths.py profile --case consensus --scale 10x
+"""
+import argparse
+import asyncio
+import cProfile
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "src"))
+
+SCALES = {"1x": 1, "10x": 10, "100x": 100}
+
+# One season: 272 regular-season games, 32 teams, 15 council experts
+SEASON_GAMES = 272
+TEAMS = [
+    "BUF", "MIA", "NE", "NYJ", "BAL", "CIN", "CLE", "PIT", "HOU", "IND", "JAX", "TEN",
+    "DEN", "KC", "LV", "LAC", "DAL", "NYG", "PHI", "WAS", "CHI", "DET", "GB", "MIN",
+    "ATL", "CAR", "NO", "TB", "ARI", "LAR", "SF", "SEA"
+]
+EXPERT_COUNT = 15
+FIXTURE_SEED = 2025
+FIXTURE_DATE = datetime(2025, 12, 1)
+
+
+@dataclass
+class Fixture:
+    """A prepared benchmark body plus the number of items it processes per call"""
+    run: Callable[[], Any]
+    items: int
+    teardown: Optional[Callable[[], None]] = None
+
+
+@dataclass
+class BenchmarkCase:
+    """A named hot path with a fixture builder taking (scale, rng)"""
+    name: str
+    kind: str  # 'micro' or 'macro'
+    description: str
+    build: Callable[[int, np.random.Generator], Fixture]
+
+
+# Fixtures
+
+def _season_games(scale: int, rng: np.random.Generator) -> List[Dict[str, Any]]:
+    games = []
+    for i in range(SEASON_GAMES * scale):
+        home, away = rng.choice(len(TEAMS), size=2, replace=False)
+        games.append({
+            "game_id": f"g{i:06d}",
+            "home_team": TEAMS[home],
+            "away_team": TEAMS[away],
+            "week": int(i % 18) + 1,
+            "season": 2025 - i // SEASON_GAMES,
+            "spread": float(np.round(rng.normal(0, 6) * 2) / 2),
+            "total": float(np.round(rng.normal(45, 5) * 2) / 2),
+        })
+    return games
+
+
+def build_memory_retrieval(scale: int, rng: np.random.Generator) -> Fixture:
+    from training.expert_configuration import ExpertType, ExpertConfigurationManager
+    from training.temporal_decay_calculator import TemporalDecayCalculator
+    from training.memory_retrieval_system import MemoryRetrievalSystem, GameMemory
+
+    config_manager = ExpertConfigurationManager()
+    system = MemoryRetrievalSystem(config_manager, TemporalDecayCalculator(config_manager))
+    memory_types = ["reasoning", "contextual", "market", "learning"]
+    conditions = ["clear", "rain", "snow", "wind"]
+
+    for i, game in enumerate(_season_games(scale, rng)):
+        context = dict(game)
+        context["weather"] = {
+            "temperature": int(rng.integers(5, 95)),
+            "wind_speed": int(rng.integers(0, 30)),
+            "conditions": conditions[int(rng.integers(len(conditions)))],
+        }
+        context["line_movement"] = {"opening": game["spread"], "current": game["spread"] + float(rng.normal(0, 1))}
+        context["public_betting"] = {"home": int(rng.integers(20, 80))}
+        system.add_memory(GameMemory(
+            memory_id=f"mem_{i:06d}",
+            memory_type=memory_types[i % len(memory_types)],
+            content="Synthetic benchmark memory",
+            game_context=context,
+            outcome_data={"home_score": int(rng.integers(0, 45)), "away_score": int(rng.integers(0, 45))},
+            created_date=FIXTURE_DATE - timedelta(days=int(rng.integers(1, 3650))),
+            confidence_level=float(rng.random()),
+        ))
+
+    current = {
+        "home_team": "KC", "away_team": "BUF", "week": 14,
+        "weather": {"temperature": 28, "wind_speed": 14, "conditions": "snow"},
+        "line_movement": {"opening": -2.5, "current": -3.5},
+        "public_betting": {"home": 64},
+    }
+    loop = asyncio.new_event_loop()
+
+    def run():
+        return loop.run_until_complete(system.retrieve_memories_for_expert(
+            ExpertType.CONSERVATIVE_ANALYZER, current, current_date=FIXTURE_DATE
+        ))
+
+    return Fixture(run=run, items=SEASON_GAMES * scale, teardown=loop.close)
+
+
+def build_temporal_decay_rank(scale: int, rng: np.random.Generator) -> Fixture:
+    from src.services.temporal_decay_service import TemporalDecayService, ExpertType
+
+    service = TemporalDecayService()
+    categories = [None, "weather_patterns", "team_performance", "market_dynamics"]
+    memories = [
+        {
+            "id": f"mem_{i:06d}",
+            "similarity_score": float(rng.random()),
+            "created_at": FIXTURE_DATE - timedelta(days=int(rng.integers(1, 3650))),
+            "memory_category": categories[i % len(categories)],
+        }
+        for i in range(SEASON_GAMES * 10 * scale)
+    ]
+
+    def run():
+        return service.rank_memories_by_relevance(ExpertType.WEATHER_SPECIALIST, memories, FIXTURE_DATE)
+
+    return Fixture(run=run, items=len(memories))
+
+
+def build_consensus(scale: int, rng: np.random.Generator) -> Fixture:
+    from types import SimpleNamespace
+    from src.ml.expert_competition.voting_consensus import ConsensusBuilder
+
+    trends = ["improving", "stable", "declining"]
+    experts = [
+        SimpleNamespace(
+            expert_id=f"expert_{e}",
+            overall_accuracy=float(rng.uniform(0.45, 0.7)),
+            recent_trend=trends[int(rng.integers(len(trends)))],
+            council_appearances=int(rng.integers(1, 40)),
+        )
+        for e in range(EXPERT_COUNT)
+    ]
+    categories = ["winner_prediction", "exact_score_home", "exact_score_away",
+                  "margin_of_victory", "totals_over_under"]
+    predictions_by_game = {}
+    for game in _season_games(scale, rng):
+        predictions_by_game[game["game_id"]] = {
+            expert.expert_id: {
+                "winner_prediction": game["home_team"] if rng.random() < 0.55 else game["away_team"],
+                "exact_score_home": int(rng.integers(10, 38)),
+                "exact_score_away": int(rng.integers(7, 35)),
+                "margin_of_victory": float(rng.normal(3, 7)),
+                "totals_over_under": "over" if rng.random() < 0.5 else "under",
+            }
+            for expert in experts
+        }
+    builder = ConsensusBuilder()
+
+    def run():
+        return builder.build_batch_consensus(predictions_by_game, experts, categories, include_breakdown=False)
+
+    return Fixture(run=run, items=len(predictions_by_game))
+
+
+def build_feature_engineering(scale: int, rng: np.random.Generator) -> Fixture:
+    import pandas as pd
+    from src.ml.feature_engineering import AdvancedFeatureEngineer
+
+    rows = []
+    plays = []
+    for game in _season_games(scale, rng):
+        date = FIXTURE_DATE - timedelta(days=7 * (18 - game["week"]) + 365 * (2025 - game["season"]))
+        for team, opponent, is_home in ((game["home_team"], game["away_team"], True),
+                                        (game["away_team"], game["home_team"], False)):
+            rows.append({
+                "game_id": game["game_id"], "team": team, "opponent": opponent, "is_home": is_home,
+                "date": date, "week": game["week"],
+                "points_scored": int(rng.integers(0, 45)), "points_allowed": int(rng.integers(0, 45)),
+                "yards_gained": int(rng.integers(150, 550)), "yards_allowed": int(rng.integers(150, 550)),
+                "turnovers": int(rng.integers(0, 5)), "penalties": int(rng.integers(0, 12)),
+                "time_of_possession": float(rng.uniform(24, 36)),
+            })
+        n_plays = 130
+        plays.append(pd.DataFrame({
+            "game_id": game["game_id"],
+            "team": np.where(rng.random(n_plays) < 0.5, game["home_team"], game["away_team"]),
+            "down": rng.integers(1, 5, n_plays),
+            "yard_line": rng.integers(1, 100, n_plays),
+            "yards_to_go": rng.integers(1, 20, n_plays),
+            "yards_gained": rng.integers(-5, 25, n_plays),
+            "touchdown": rng.random(n_plays) < 0.03,
+            "safety": rng.random(n_plays) < 0.001,
+            "turnover": rng.random(n_plays) < 0.02,
+            "first_down": rng.random(n_plays) < 0.25,
+            "penalty": rng.random(n_plays) < 0.05,
+        }))
+    games_df = pd.DataFrame(rows)
+    plays_df = pd.concat(plays, ignore_index=True)
+    engineer = AdvancedFeatureEngineer()
+
+    def run():
+        enriched = engineer.play_engine.enrich(plays_df)
+        game_features = engineer._aggregate_plays_to_games(enriched)
+        features = engineer.engineer_advanced_features(games_df)
+        return features.merge(game_features, on=["game_id", "team"], how="left")
+
+    return Fixture(run=run, items=len(plays_df))
+
+
+def build_ensemble_predict_proba(scale: int, rng: np.random.Generator) -> Fixture:
+    import pandas as pd
+    from src.ml.ml_models import NFLGameWinnerModel
+
+    model = NFLGameWinnerModel()
+    columns = [
+        "home_team_rating", "away_team_rating", "home_offensive_rating", "away_offensive_rating",
+        "home_defensive_rating", "away_defensive_rating", "home_recent_form_3", "away_recent_form_3",
+        "home_rest_days", "away_rest_days", "weather_impact_score",
+        "home_epa_per_play", "away_epa_per_play", "home_success_rate", "away_success_rate",
+    ]
+
+    def frame(n: int) -> "pd.DataFrame":
+        return pd.DataFrame(rng.normal(size=(n, len(columns))), columns=columns)
+
+    train = frame(SEASON_GAMES * 2)
+    labels = (train["home_team_rating"] - train["away_team_rating"] + rng.normal(0, 1, len(train)) > 0).astype(int)
+    model.train(train, labels.to_numpy())
+    inputs = frame(SEASON_GAMES * scale)
+
+    return Fixture(run=lambda: model.predict_proba(inputs), items=len(inputs))
+
+
+def build_cache_get_set(scale: int, rng: np.random.Generator) -> Fixture:
+    from src.cache.enhanced_cache_strategy import EnhancedCacheManager, CacheKey
+
+    manager = EnhancedCacheManager()
+    games = _season_games(scale, rng)
+    states = {
+        CacheKey.game_state(game["game_id"]): {
+            **game,
+            "home_score": int(rng.integers(0, 45)), "away_score": int(rng.integers(0, 45)),
+            "quarter": int(rng.integers(1, 5)), "time_remaining": "07:42",
+        }
+        for game in games
+    }
+    keys = list(states)
+    # A week bundle exercises the codec round-trip that Redis reads and writes pay
+    week_bundle = {"week": 14, "games": games[:16], "odds": [
+        {"game_id": game["game_id"], "book": book, "home_ml": int(rng.integers(-300, 300))}
+        for game in games[:16] for book in range(8)
+    ]}
+    loop = asyncio.new_event_loop()
+
+    async def cycle():
+        await manager.set_multi(states)
+        await manager.get_multi(keys)
+        for key in keys[:64]:
+            await manager.get(key)
+        payload = await manager._serialize_value(week_bundle, "nfl:scores:2025:week14")
+        await manager._deserialize_value(payload, "nfl:scores:2025:week14")
+
+    def teardown():
+        manager._thread_pool.shutdown(wait=True)
+        loop.close()
+
+    return Fixture(run=lambda: loop.run_until_complete(cycle()), items=len(keys), teardown=teardown)
+
+
+def build_websocket_fanout(scale: int, rng: np.random.Generator) -> Fixture:
+    from src.websocket.websocket_manager import ConnectionManager, WebSocketConnection
+    from src.websocket.websocket_events import WebSocketMessage, WebSocketEventType
+
+    class NullWebSocket:
+        async def send_text(self, text: str):
+            pass
+
+        async def send_json(self, data: Dict[str, Any]):
+            pass
+
+    manager = ConnectionManager()
+    for i in range(500 * scale):
+        connection_id = f"conn_{i:06d}"
+        manager.connections[connection_id] = WebSocketConnection(NullWebSocket(), connection_id)
+        manager.channels.setdefault("games", set()).add(connection_id)
+
+    game = _season_games(1, rng)[0]
+    message = WebSocketMessage(
+        event_type=WebSocketEventType.GAME_UPDATE,
+        data={**game, "home_score": 17, "away_score": 14, "quarter": 3},
+        channel=f"game_{game['game_id']}",
+        timestamp=FIXTURE_DATE,
+    )
+    loop = asyncio.new_event_loop()
+
+    def run():
+        return loop.run_until_complete(manager.send_to_channel("games", message))
+
+    return Fixture(run=run, items=500 * scale, teardown=loop.close)
+
+
+def build_parlay_simulation(scale: int, rng: np.random.Generator) -> Fixture:
+    from src.analytics.betting_engine import BettingAnalyticsEngine
+
+    engine = BettingAnalyticsEngine()
+    parlays = [
+        [float(p) for p in rng.uniform(0.35, 0.75, size=int(rng.integers(2, 6)))]
+        for _ in range(10 * scale)
+    ]
+
+    def run():
+        np.random.seed(FIXTURE_SEED)
+        return [engine._simulate_parlay(legs, None, 10000) for legs in parlays]
+
+    return Fixture(run=run, items=len(parlays))
+
+
+CASES = [
+    BenchmarkCase("memory_retrieval", "macro",
+                  "MemoryRetrievalSystem.retrieve_memories_for_expert over a season of memories",
+                  build_memory_retrieval),
+    BenchmarkCase("temporal_decay_rank", "micro",
+                  "TemporalDecayService.rank_memories_by_relevance, 10 memories per game",
+                  build_temporal_decay_rank),
+    BenchmarkCase("consensus", "macro",
+                  "ConsensusBuilder.build_batch_consensus, 15 experts x 5 categories per game",
+                  build_consensus),
+    BenchmarkCase("feature_engineering", "macro",
+                  "Play enrichment, game aggregation and AdvancedFeatureEngineer features",
+                  build_feature_engineering),
+    BenchmarkCase("ensemble_predict_proba", "micro",
+                  "NFLGameWinnerModel.predict_proba, one row per game",
+                  build_ensemble_predict_proba),
+    BenchmarkCase("cache_get_set", "micro",
+                  "EnhancedCacheManager set_multi/get_multi/get plus a week-bundle codec round-trip",
+                  build_cache_get_set),
+    BenchmarkCase("websocket_fanout", "micro",
+                  "ConnectionManager.send_to_channel to 500 connections per scale unit",
+                  build_websocket_fanout),
+    BenchmarkCase("parlay_simulation", "micro",
+                  "Monte Carlo parlay simulation, 10 parlays x 10,000 trials per scale unit",
+                  build_parlay_simulation),
+]
+CASES_BY_NAME = {case.name: case for case in CASES}
+
+
+# Measurement
+
+class BenchmarkRunner:
+    """Time benchmark cases and persist the samples as JSON."""
+
+    def __init__(self, repeats: int = 7, min_sample_time: float = 0.05, max_case_time: float = 60.0):
+        self.repeats = repeats
+        self.min_sample_time = min_sample_time
+        self.max_case_time = max_case_time
+
+    def measure(self, case: BenchmarkCase, scale_name: str) -> Dict[str, Any]:
+        """Per-call timing samples and summary statistics for one case at one scale."""
+        rng = np.random.default_rng(FIXTURE_SEED + SCALES[scale_name])
+        try:
+            fixture = case.build(SCALES[scale_name], rng)
+        except ImportError as e:
+            return {"skipped": f"missing dependency: {e}"}
+
+        try:
+            # Warm-up call, also used to size the inner loop
+            start = time.perf_counter()
+            fixture.run()
+            first_call = time.perf_counter() - start
+            number = max(1, int(self.min_sample_time / max(first_call, 1e-9)))
+
+            samples = []
+            case_start = time.perf_counter()
+            while len(samples) < self.repeats:
+                start = time.perf_counter()
+                for _ in range(number):
+                    fixture.run()
+                samples.append((time.perf_counter() - start) / number)
+                if len(samples) >= 3 and time.perf_counter() - case_start > self.max_case_time:
+                    break
+        finally:
+            if fixture.teardown:
+                fixture.teardown()
+
+        median = statistics.median(samples)
+        return {
+            "kind": case.kind,
+            "items": fixture.items,
+            "number": number,
+            "samples": samples,
+            "median": median,
+            "mean": statistics.mean(samples),
+            "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+            "min": min(samples),
+            "max": max(samples),
+            "per_item_us": median / max(fixture.items, 1) * 1e6,
+        }
+
+    def run(self, case_names: List[str], scale_names: List[str]) -> Dict[str, Any]:
+        results = {
+            "created_at": datetime.now().isoformat(),
+            "git_commit": _git_commit(),
+            "system_info": _system_info(),
+            "config": {
+                "repeats": self.repeats,
+                "min_sample_time": self.min_sample_time,
+                "seed": FIXTURE_SEED,
+            },
+            "results": {},
+        }
+        for name in case_names:
+            case = CASES_BY_NAME[name]
+            for scale_name in scale_names:
+                key = f"{name}@{scale_name}"
+                print(f"Running {key} ({case.kind})...", flush=True)
+                result = self.measure(case, scale_name)
+                results["results"][key] = result
+                if "skipped" in result:
+                    print(f"  skipped: {result['skipped']}")
+                else:
+                    print(f"  median {result['median'] * 1000:.3f}ms "
+                          f"(±{result['stdev'] * 1000:.3f}ms, {result['per_item_us']:.2f}us/item)")
+        return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=10
+        ).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def _system_info() -> Dict[str, Any]:
+    return {
+        "cpu_count": os.cpu_count(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "python_version": sys.version,
+        "platform": sys.platform,
+        "numpy_version": np.__version__,
+    }
+
+
+# Comparison
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    tolerance: float = 0.10, alpha: float = 0.01) -> Dict[str, Any]:
+    """
+    Compare current results against a baseline.
+
+    A case regresses when its median is more than ``tolerance`` slower and a
+    one-sided Mann-Whitney U test on the samples rejects "not slower" at
+    ``alpha``. Improvements use the mirror-image test.
+    """
+    from scipy.stats import mannwhitneyu
+
+    comparison = {"passed": True, "regressions": [], "improvements": [], "unchanged": [], "missing": []}
+
+    for key, base in baseline.get("results", {}).items():
+        if "skipped" in base:
+            continue
+        cur = current.get("results", {}).get(key)
+        if cur is None or "skipped" in cur:
+            comparison["missing"].append(key)
+            continue
+
+        change = cur["median"] / base["median"] - 1
+        entry = {
+            "test": key,
+            "baseline": base["median"],
+            "current": cur["median"],
+            "change_percent": change * 100,
+        }
+        significant_slower = significant_faster = True
+        # Below 5 samples each the one-sided test cannot reach p < 0.01; use the tolerance alone
+        if len(base["samples"]) >= 5 and len(cur["samples"]) >= 5:
+            significant_slower = mannwhitneyu(cur["samples"], base["samples"], alternative="greater").pvalue < alpha
+            significant_faster = mannwhitneyu(cur["samples"], base["samples"], alternative="less").pvalue < alpha
+
+        if change > tolerance and significant_slower:
+            comparison["regressions"].append(entry)
+            comparison["passed"] = False
+        elif change < -tolerance and significant_faster:
+            comparison["improvements"].append(entry)
+        else:
+            comparison["unchanged"].append(entry)
+
+    return comparison
+
+
+def generate_report(comparison: Dict[str, Any]) -> str:
+    """Render a comparison in the same layout as performance_baseline.py."""
+    report = ["=" * 60, "HOT PATH BENCHMARK REPORT", "=" * 60]
+    status = "✅ PASSED" if comparison["passed"] else "❌ FAILED"
+    report.append(f"Overall Status: {status}")
+    report.append(f"Timestamp: {datetime.now().isoformat()}")
+    report.append("")
+
+    for title, entries in (("Performance Regressions:", comparison["regressions"]),
+                           ("Performance Improvements:", comparison["improvements"])):
+        if entries:
+            report.append(title)
+            report.append("-" * len(title))
+            for entry in entries:
+                report.append(
+                    f"  {entry['test']}: {entry['change_percent']:+.1f}% "
+                    f"({entry['baseline'] * 1000:.3f}ms → {entry['current'] * 1000:.3f}ms)"
+                )
+            report.append("")
+
+    if comparison["missing"]:
+        report.append(f"Missing from current run: {', '.join(comparison['missing'])}")
+        report.append("")
+
+    report.append(
+        f"Summary: {len(comparison['regressions'])} regressions, "
+        f"{len(comparison['improvements'])} improvements, {len(comparison['unchanged'])} unchanged"
+    )
+    return "\n".join(report)
+
+
+# Profiling
+
+def profile_case(case_name: str, scale_name: str, seconds: float) -> None:
+    """Run one case in a loop for the given time; the target of py-spy and cProfile."""
+    case = CASES_BY_NAME[case_name]
+    fixture = case.build(SCALES[scale_name], np.random.default_rng(FIXTURE_SEED + SCALES[scale_name]))
+    try:
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            fixture.run()
+    finally:
+        if fixture.teardown:
+            fixture.teardown()
+
+
+def write_flamegraph(key: str, output_dir: Path, seconds: float = 10.0) -> Optional[Path]:
+    """
+    Profile a regressed case. Produces an SVG flamegraph with py-spy when it
+    is installed, otherwise a cProfile dump (viewable with snakeviz/flameprof).
+    """
+    case_name, scale_name = key.split("@")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = output_dir / key.replace("@", "-")
+
+    if shutil.which("py-spy"):
+        svg = stem.with_suffix(".svg")
+        cmd = [
+            "py-spy", "record", "--format", "flamegraph", "--output", str(svg), "--",
+            sys.executable, str(Path(__file__).resolve()), "profile",
+            "--case", case_name, "--scale", scale_name, "--seconds", str(seconds),
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode == 0 and svg.exists():
+            return svg
+        print(f"py-spy failed for {key}: {result.stderr.strip()}")
+
+    prof = stem.with_suffix(".prof")
+    profiler = cProfile.Profile()
+    profiler.runcall(profile_case, case_name, scale_name, seconds)
+    profiler.dump_stats(str(prof))
+    return prof
+
+
+def _load(path: Path) -> Dict[str, Any]:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _save(data: Dict[str, Any], path: Path) -> None:
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def _comma_list(value: str, choices: List[str]) -> List[str]:
+    items = [item.strip() for item in value.split(",") if item.strip()]
+    unknown = [item for item in items if item not in choices]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown: {', '.join(unknown)} (choose from {', '.join(choices)})")
+    return items
+
+
+def main():
+    """Main entry point for hot-path benchmarks."""
+    parser = argparse.ArgumentParser(description="Hot-path benchmarks with regression gates")
+    parser.add_argument(
+        "action",
+        choices=["list", "run", "baseline", "compare", "check", "profile"],
+        help="Action to perform"
+    )
+    parser.add_argument("--cases", default=",".join(CASES_BY_NAME),
+                        help="Comma-separated cases (default: all)")
+    parser.add_argument("--scales", default="1x,10x",
+                        help="Comma-separated season scales from 1x,10x,100x (default: 1x,10x)")
+    parser.add_argument("--repeats", type=int, default=7, help="Timing samples per case")
+    parser.add_argument("--baseline-file", type=Path, default=Path("hot-path-baseline.json"),
+                        help="Baseline file path")
+    parser.add_argument("--output", type=Path, default=Path("hot-path-results.json"),
+                        help="Where run/check write current results")
+    parser.add_argument("--current", type=Path, help="Current results file (for compare)")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="Allowed median slowdown before a regression (default: 10%%)")
+    parser.add_argument("--alpha", type=float, default=0.01,
+                        help="Significance level for the Mann-Whitney U test (default: 0.01)")
+    parser.add_argument("--flamegraph-dir", type=Path, default=Path("perf-flamegraphs"),
+                        help="Where flamegraphs for regressed cases are written")
+    parser.add_argument("--no-flamegraph", action="store_true", help="Skip profiling regressed cases")
+    parser.add_argument("--case", help="Case to profile")
+    parser.add_argument("--scale", default="1x", choices=list(SCALES), help="Scale to profile")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Profiling duration")
+
+    args = parser.parse_args()
+    case_names = _comma_list(args.cases, list(CASES_BY_NAME))
+    scale_names = _comma_list(args.scales, list(SCALES))
+
+    if args.action == "list":
+        for case in CASES:
+            print(f"  {case.name:<24} {case.kind:<6} {case.description}")
+        return
+
+    if args.action == "profile":
+        if args.case not in CASES_BY_NAME:
+            print(f"❌ --case must be one of: {', '.join(CASES_BY_NAME)}")
+            sys.exit(1)
+        profile_case(args.case, args.scale, args.seconds)
+        return
+
+    if args.action == "compare":
+        if not args.current or not args.current.exists():
+            print("❌ Current results file required for comparison")
+            sys.exit(1)
+        current = _load(args.current)
+    else:
+        current = BenchmarkRunner(repeats=args.repeats).run(case_names, scale_names)
+
+    if args.action == "run":
+        _save(current, args.output)
+        print(f"✅ Results written to {args.output}")
+        return
+
+    if args.action == "baseline":
+        _save(current, args.baseline_file)
+        print(f"✅ Baseline written to {args.baseline_file} with {len(current['results'])} measurements")
+        return
+
+    if args.action == "check":
+        _save(current, args.output)
+        if not args.baseline_file.exists():
+            _save(current, args.baseline_file)
+            print(f"No baseline found; wrote {args.baseline_file} from this run")
+            return
+
+    if not args.baseline_file.exists():
+        print(f"❌ Baseline file not found: {args.baseline_file}")
+        sys.exit(1)
+
+    comparison = compare_results(_load(args.baseline_file), current, args.tolerance, args.alpha)
+    print(generate_report(comparison))
+
+    if not comparison["passed"]:
+        if not args.no_flamegraph:
+            for regression in comparison["regressions"]:
+                path = write_flamegraph(regression["test"], args.flamegraph_dir, args.seconds)
+                if path:
+                    print(f"Profile for {regression['test']}: {path}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
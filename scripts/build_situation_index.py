@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Build the historical situation index used by the AI Game Narrator
+
+Reads historical play-by-play (CSV or Parquet, nflfastR column names accepted)
+and writes models/situation_index.npz for offline lookups.
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+import pandas as pd
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ml.situation_index import SituationIndex, DEFAULT_INDEX_PATH
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def load_plays(paths):
+    frames = []
+    for path in paths:
+        if path.endswith('.parquet'):
+            frames.append(pd.read_parquet(path))
+        else:
+            frames.append(pd.read_csv(path, low_memory=False))
+        logger.info(f"Loaded {len(frames[-1])} plays from {path}")
+    return pd.concat(frames, ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the narrator situation index")
+    parser.add_argument('inputs', nargs='+', help="Play-by-play CSV/Parquet files")
+    parser.add_argument('--output', default=DEFAULT_INDEX_PATH)
+    parser.add_argument('--min-support', type=int, default=30)
+    parser.add_argument('--neighbors', type=int, default=16)
+    args = parser.parse_args()
+
+    plays = load_plays(args.inputs)
+    index = SituationIndex.build(plays, min_support=args.min_support, n_neighbors=args.neighbors)
+    index.save(args.output)
+    logger.info(f"Wrote situation index to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
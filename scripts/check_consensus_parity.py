@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Check that batch consensus matches the per-game builder
+
+Builds randomized council predictions (small label sets and repeated
+confidences, so tied votes are common) and compares
+ConsensusBuilder.build_batch_consensus against build_consensus for every
+game and category. Exits non-zero on any mismatch.
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ml.expert_competition.voting_consensus import ConsensusBuilder
+
+CATEGORIES = ['winner_prediction', 'totals_over_under', 'margin_of_victory']
+EXPERT_POOL = [f"expert_{i}" for i in range(8)]
+
+
+def random_week(rng: random.Random, games: int):
+    """game_id -> expert_id -> prediction, each game listing its experts in its own order"""
+    week = {}
+    for g in range(games):
+        expert_ids = rng.sample(EXPERT_POOL, rng.randint(0, len(EXPERT_POOL)))
+        predictions = {}
+        for expert_id in expert_ids:
+            prediction = {}
+            if rng.random() < 0.9:
+                prediction['winner_prediction'] = rng.choice(['home', 'away', 'tie'])
+            if rng.random() < 0.9:
+                prediction['totals_over_under'] = rng.choice(['over', 'under'])
+            if rng.random() < 0.9:
+                prediction['margin_of_victory'] = rng.choice([-3.0, 3.0, 7.0])
+            if rng.random() < 0.3:
+                prediction = SimpleNamespace(confidence_overall=rng.choice([0.5, 0.7]), **prediction)
+            predictions[expert_id] = prediction
+        week[f"game_{g}"] = predictions
+    return week
+
+
+def same(a, b) -> bool:
+    if isinstance(a, float) and isinstance(b, float):
+        return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+    return a == b
+
+
+def check(weeks: int, games: int, seed: int) -> int:
+    rng = random.Random(seed)
+    builder = ConsensusBuilder()
+    # Council excludes two of the pool so the default 0.2 weight is exercised too
+    council = [
+        SimpleNamespace(
+            expert_id=expert_id,
+            overall_accuracy=rng.choice([0.5, 0.6]),
+            recent_trend=rng.choice(['improving', 'stable']),
+            council_appearances=rng.choice([1, 5])
+        )
+        for expert_id in EXPERT_POOL[:6]
+    ]
+
+    mismatches = 0
+    for _ in range(weeks):
+        week = random_week(rng, games)
+        batch = builder.build_batch_consensus(week, council, CATEGORIES)
+        for game_id, predictions in week.items():
+            for category in CATEGORIES:
+                expected = builder.build_consensus(predictions, council, category)
+                actual = batch[game_id][category]
+                fields = ('consensus_value', 'method_used', 'confidence_score',
+                          'agreement_level', 'participating_experts')
+                if all(same(getattr(expected, f), getattr(actual, f)) for f in fields):
+                    continue
+                mismatches += 1
+                print(f"❌ {game_id} {category}: per-game {expected.consensus_value!r} "
+                      f"({expected.method_used}), batch {actual.consensus_value!r} ({actual.method_used})")
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare batch and per-game consensus")
+    parser.add_argument("--weeks", type=int, default=200, help="Randomized weeks to check")
+    parser.add_argument("--games", type=int, default=16, help="Games per week")
+    parser.add_argument("--seed", type=int, default=2025, help="Random seed")
+    args = parser.parse_args()
+
+    mismatches = check(args.weeks, args.games, args.seed)
+    total = args.weeks * args.games * len(CATEGORIES)
+    if mismatches:
+        print(f"❌ {mismatches} of {total} consensus results differ")
+        sys.exit(1)
+    print(f"✅ {total} consensus results match")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,8 +18,9 @@ import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Any
 
-# Add src to path for imports
+# Add src to path for imports; the repo root too, for modules that only load inside the src package
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(1, str(Path(__file__).parent.parent))
 
 try:
     from ml.continuous_learner import ContinuousLearner
@@ -28,7 +29,7 @@ try:
     from ml.episodic_memory_manager import EpisodicMemoryManager
     from ml.expert_memory_service import ExpertMemoryService
     from monitoring.prediction_monitor import PredictionMonitor
-    from services.enhanced_data_fetcher import EnhancedDataFetcher
+    from src.services.enhanced_data_fetcher import EnhancedDataFetcher
 except ImportError as e:
     print(f"Warning: Could not import some modules: {e}")
     print("Running in standalone mode...")
@@ -8,7 +8,7 @@ from datetime import datetime
 from decimal import Decimal
 from sqlalchemy import (
     Column, String, Integer, DateTime, Boolean, DECIMAL, 
-    ForeignKey, Index, UniqueConstraint, Text, JSONB
+    ForeignKey, Index, UniqueConstraint, Text
 )
 from sqlalchemy.dialects.postgresql import UUID, INET
 from sqlalchemy.sql import func
@@ -55,8 +55,9 @@ class PredictionResult(Base):
         Index('idx_prediction_results_week_season', 'week', 'season'),
         Index('idx_prediction_results_game_date', 'game_date'),
         Index('idx_prediction_results_status', 'game_status'),
-    )c
-lass PredictionMatch(Base):
+    )
+
+class PredictionMatch(Base):
     """Links predictions to actual results for accuracy calculation"""
     __tablename__ = 'prediction_matches'
     
@@ -140,8 +141,50 @@ class PerformanceHistory(Base):
         Index('idx_performance_history_season_week', 'season', 'week'),
         Index('idx_performance_history_type', 'prediction_type'),
         UniqueConstraint('period_type', 'period_start', 'prediction_type', name='uq_performance_period'),
-    )class 
-AccuracySnapshot(Base):
+    )
+
+class AccuracyRollup(Base):
+    """Pre-aggregated accuracy per day/week/season bucket, prediction type and confidence band"""
+    __tablename__ = 'accuracy_rollups'
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    
+    # Bucket
+    bucket_type = Column(String(10), nullable=False)  # 'day', 'week', 'season'
+    bucket_start = Column(DateTime, nullable=False)   # Naive UTC, inclusive
+    bucket_end = Column(DateTime, nullable=False)     # Naive UTC, exclusive
+    season = Column(Integer, nullable=False)
+    week = Column(Integer)
+    prediction_type = Column(String(20), nullable=False)  # 'game', 'ats', 'total', 'prop', 'all'
+    confidence_band = Column(String(10), nullable=False)  # 'high', 'medium', 'low', 'all'
+    
+    # Additive metrics
+    total_predictions = Column(Integer, nullable=False, default=0)
+    correct_predictions = Column(Integer, nullable=False, default=0)
+    confidence_sum = Column(DECIMAL(12, 4), default=0)
+    correct_confidence_sum = Column(DECIMAL(12, 4), default=0)
+    roi_sum = Column(DECIMAL(14, 3), default=0)
+    
+    # Mergeable streak state (only maintained on 'all' band rows)
+    streak_first_correct = Column(Boolean)
+    streak_prefix_length = Column(Integer, default=0)
+    streak_last_correct = Column(Boolean)
+    streak_suffix_length = Column(Integer, default=0)
+    longest_win_streak = Column(Integer, default=0)
+    longest_loss_streak = Column(Integer, default=0)
+    
+    # Metadata
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    # Indexes
+    __table_args__ = (
+        Index('idx_accuracy_rollups_lookup', 'bucket_type', 'prediction_type', 'bucket_start'),
+        Index('idx_accuracy_rollups_season_week', 'season', 'week'),
+        UniqueConstraint('bucket_type', 'bucket_start', 'prediction_type', 'confidence_band',
+                         name='uq_accuracy_rollup_bucket'),
+    )
+
+class AccuracySnapshot(Base):
     """Real-time accuracy snapshots for dashboard display"""
     __tablename__ = 'accuracy_snapshots'
     
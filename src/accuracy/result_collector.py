@@ -6,14 +6,14 @@ Fetches live game results and updates prediction accuracy
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 
 from .models import PredictionResult
 from .calculation_engine import accuracy_engine
 from ..database.models import Prediction
-from ..database.connection import get_db
+from ..database.async_connection import async_db
 from ..api.espn_api_client import ESPNAPIClient
 from ..api.nfl_api_client import NFLAPIClient
 
@@ -45,8 +45,14 @@ class ResultCollectionService:
                     else:
                         continue
                     
-                    for game in games:
-                        result = await self._process_game_result(game, source)
+                    # Each game is stored in its own session, so they can share the pool concurrently.
+                    # A feed can list a game twice; concurrent upserts of one game_id would race, so
+                    # keep its last entry only.
+                    unique_games = {game['game_id']: game for game in games}.values()
+                    results = await asyncio.gather(
+                        *(self._process_game_result(game, source) for game in unique_games)
+                    )
+                    for result in results:
                         if result['success']:
                             results_collected.append(result['game_id'])
                         else:
@@ -139,65 +145,67 @@ class ResultCollectionService:
     
     async def _process_game_result(self, game_data: Dict, source: str) -> Dict:
         """Process and store a single game result"""
-        with get_db() as db:
-            try:
-                game_id = game_data['game_id']
-                
-                # Check if result already exists
-                existing_result = db.query(PredictionResult).filter_by(game_id=game_id).first()
-                
-                if existing_result:
-                    # Update existing result
-                    result = existing_result
-                else:
-                    # Create new result
-                    result = PredictionResult(game_id=game_id)
-                    db.add(result)
-                
-                # Update result data
-                result.home_team = game_data['home_team']
-                result.away_team = game_data['away_team']
-                result.home_score = game_data['home_score']
-                result.away_score = game_data['away_score']
-                result.game_status = 'final'
-                result.result_source = source
-                result.game_date = datetime.fromisoformat(game_data['game_date'].replace('Z', '+00:00'))
-                
-                # Set betting lines if available
-                if game_data.get('spread_line'):
-                    result.spread_line = float(game_data['spread_line'])
-                if game_data.get('total_line'):
-                    result.total_line = float(game_data['total_line'])
-                
-                # Calculate derived results
-                result.winner = self._determine_winner(game_data['home_score'], game_data['away_score'])
-                
-                if result.spread_line:
-                    result.ats_winner = self._determine_ats_winner(
-                        game_data['home_score'], game_data['away_score'], result.spread_line
-                    )
-                
-                if result.total_line:
-                    total_score = game_data['home_score'] + game_data['away_score']
-                    result.total_result = self._determine_total_result(total_score, result.total_line)
-                
-                db.commit()
-                
-                return {
-                    'success': True,
-                    'game_id': game_id,
-                    'result_id': str(result.id)
-                }
-                
-            except Exception as e:
-                db.rollback()
-                logger.error(f"Error processing game result: {e}")
-                return {
-                    'success': False,
-                    'game_id': game_data.get('game_id', 'unknown'),
-                    'error': str(e)
-                }
-    
+        return await async_db.run_sync(self._store_game_result, game_data, source)
+
+    def _store_game_result(self, db: Session, game_data: Dict, source: str) -> Dict:
+        try:
+            game_id = game_data['game_id']
+            
+            # Check if result already exists
+            existing_result = db.query(PredictionResult).filter_by(game_id=game_id).first()
+            
+            if existing_result:
+                # Update existing result
+                result = existing_result
+            else:
+                # Create new result
+                result = PredictionResult(game_id=game_id)
+                db.add(result)
+            
+            # Update result data
+            result.home_team = game_data['home_team']
+            result.away_team = game_data['away_team']
+            result.home_score = game_data['home_score']
+            result.away_score = game_data['away_score']
+            result.game_status = 'final'
+            result.result_source = source
+            result.game_date = datetime.fromisoformat(game_data['game_date'].replace('Z', '+00:00'))
+            
+            # Set betting lines if available
+            if game_data.get('spread_line'):
+                result.spread_line = float(game_data['spread_line'])
+            if game_data.get('total_line'):
+                result.total_line = float(game_data['total_line'])
+            
+            # Calculate derived results
+            result.winner = self._determine_winner(game_data['home_score'], game_data['away_score'])
+            
+            if result.spread_line:
+                result.ats_winner = self._determine_ats_winner(
+                    game_data['home_score'], game_data['away_score'], result.spread_line
+                )
+            
+            if result.total_line:
+                total_score = game_data['home_score'] + game_data['away_score']
+                result.total_result = self._determine_total_result(total_score, result.total_line)
+            
+            db.commit()
+            
+            return {
+                'success': True,
+                'game_id': game_id,
+                'result_id': str(result.id)
+            }
+            
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error processing game result: {e}")
+            return {
+                'success': False,
+                'game_id': game_data.get('game_id', 'unknown'),
+                'error': str(e)
+            }
+
     def _determine_winner(self, home_score: int, away_score: int) -> str:
         """Determine the straight-up winner"""
         if home_score > away_score:
@@ -230,54 +238,45 @@ class ResultCollectionService:
     
     async def _update_prediction_accuracy(self, season: int, week: int) -> Dict:
         """Update prediction accuracy for all predictions with new results"""
-        with get_db() as db:
+        async with async_db.get_session() as db:
             try:
-                # Get all predictions for this week that don't have accuracy calculated
-                predictions = db.query(Prediction).filter(
-                    and_(
-                        Prediction.season == season,
-                        Prediction.week == week,
-                        Prediction.is_correct.is_(None)
-                    )
-                ).all()
+                # Get all predictions for this week that don't have accuracy calculated,
+                # paired with their matching results
+                pending = await db.run_sync(self._find_pending_predictions, season, week)
                 
                 updates_made = 0
                 errors = []
                 
-                for prediction in predictions:
+                for prediction, result in pending:
                     try:
-                        # Find matching result
-                        result = self._find_matching_result(db, prediction)
+                        # Calculate accuracy
+                        accuracy_result = await accuracy_engine.calculate_prediction_accuracy(
+                            str(prediction.id), str(result.id)
+                        )
                         
-                        if result:
-                            # Calculate accuracy
-                            accuracy_result = accuracy_engine.calculate_prediction_accuracy(
-                                str(prediction.id), str(result.id)
-                            )
-                            
-                            if accuracy_result['success']:
-                                # Update prediction with result
-                                prediction.is_correct = accuracy_result['is_correct']
-                                prediction.actual_result = {
-                                    'winner': result.winner,
-                                    'ats_winner': result.ats_winner,
-                                    'total_result': result.total_result,
-                                    'home_score': result.home_score,
-                                    'away_score': result.away_score
-                                }
-                                prediction.result_updated_at = datetime.utcnow()
-                                updates_made += 1
-                            else:
-                                errors.append(f"Prediction {prediction.id}: {accuracy_result['error']}")
+                        if accuracy_result['success']:
+                            # Update prediction with result
+                            prediction.is_correct = accuracy_result['is_correct']
+                            prediction.actual_result = {
+                                'winner': result.winner,
+                                'ats_winner': result.ats_winner,
+                                'total_result': result.total_result,
+                                'home_score': result.home_score,
+                                'away_score': result.away_score
+                            }
+                            prediction.result_updated_at = datetime.utcnow()
+                            updates_made += 1
+                        else:
+                            errors.append(f"Prediction {prediction.id}: {accuracy_result['error']}")
                     
                     except Exception as e:
                         errors.append(f"Prediction {prediction.id}: {str(e)}")
                         continue
                 
-                db.commit()
+                await db.commit()
                 
                 # Update performance history
-                history_update = accuracy_engine.update_performance_history('weekly', season, week)
+                history_update = await accuracy_engine.update_performance_history('weekly', season, week)
                 
                 return {
                     'predictions_updated': updates_made,
@@ -286,7 +285,7 @@ class ResultCollectionService:
                 }
                 
             except Exception as e:
-                db.rollback()
+                await db.rollback()
                 logger.error(f"Error updating prediction accuracy: {e}")
                 return {
                     'predictions_updated': 0,
@@ -294,6 +293,23 @@ class ResultCollectionService:
                     'performance_history_updated': False
                 }
     
+    def _find_pending_predictions(self, db: Session, season: int, week: int) -> List[Tuple[Prediction, PredictionResult]]:
+        """Unscored predictions for a week that have a final result"""
+        predictions = db.query(Prediction).filter(
+            and_(
+                Prediction.season == season,
+                Prediction.week == week,
+                Prediction.is_correct.is_(None)
+            )
+        ).all()
+        
+        pending = []
+        for prediction in predictions:
+            result = self._find_matching_result(db, prediction)
+            if result:
+                pending.append((prediction, result))
+        return pending
+    
     def _find_matching_result(self, db: Session, prediction: Prediction) -> Optional[PredictionResult]:
         """Find the matching game result for a prediction"""
         try:
@@ -0,0 +1,480 @@
+"""
+Accuracy Rollups
+Incrementally maintained per-day, per-week and per-season accuracy aggregates
+so period queries combine a handful of pre-aggregated rows instead of
+re-scanning every PredictionMatch
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .models import PredictionMatch, AccuracyRollup
+from ..database.models import Prediction
+
+logger = logging.getLogger(__name__)
+
+ALL = 'all'
+BUCKET_TYPES = ('day', 'week', 'season')
+CONFIDENCE_BANDS = ('high', 'medium', 'low')
+
+
+def to_utc_naive(value: datetime) -> datetime:
+    """Normalize a datetime to naive UTC for bucket arithmetic"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _midnight(value: datetime) -> datetime:
+    return datetime(value.year, value.month, value.day)
+
+
+def _season_start(day: datetime) -> datetime:
+    """Seasons run from September 1st, matching the engine's week/season dates"""
+    start = datetime(day.year, 9, 1)
+    return start if day >= start else datetime(day.year - 1, 9, 1)
+
+
+def bucket_bounds(bucket_type: str, when: datetime) -> Tuple[datetime, datetime, int, Optional[int]]:
+    """Return (start, end_exclusive, season, week) of the bucket containing `when`"""
+    day = _midnight(to_utc_naive(when))
+    season_start = _season_start(day)
+    season_end = datetime(season_start.year + 1, 9, 1)
+    week_index = (day - season_start).days // 7
+
+    if bucket_type == 'day':
+        return day, day + timedelta(days=1), season_start.year, week_index + 1
+    if bucket_type == 'week':
+        start = season_start + timedelta(weeks=week_index)
+        return start, min(start + timedelta(weeks=1), season_end), season_start.year, week_index + 1
+    if bucket_type == 'season':
+        return season_start, season_end, season_start.year, None
+    raise ValueError(f"Invalid bucket type: {bucket_type}")
+
+
+@dataclass
+class StreakSegment:
+    """Mergeable summary of a chronological run of outcomes"""
+    length: int = 0
+    first_correct: bool = False
+    prefix_length: int = 0
+    last_correct: bool = False
+    suffix_length: int = 0
+    longest_win_streak: int = 0
+    longest_loss_streak: int = 0
+
+    def append(self, is_correct: bool):
+        if self.length == 0:
+            self.first_correct = self.last_correct = is_correct
+            self.prefix_length = self.suffix_length = 1
+        else:
+            if self.prefix_length == self.length and is_correct == self.first_correct:
+                self.prefix_length += 1
+            if is_correct == self.last_correct:
+                self.suffix_length += 1
+            else:
+                self.last_correct = is_correct
+                self.suffix_length = 1
+        self.length += 1
+        self._update_longest(self.last_correct, self.suffix_length)
+
+    def merge(self, later: 'StreakSegment') -> 'StreakSegment':
+        """Append a later segment to this one in place"""
+        if later.length == 0:
+            return self
+        if self.length == 0:
+            self.__dict__.update(later.__dict__)
+            return self
+
+        joined = self.last_correct == later.first_correct
+        bridge = self.suffix_length + later.prefix_length if joined else 0
+        if self.prefix_length == self.length and joined:
+            self.prefix_length += later.prefix_length
+        if later.suffix_length == later.length and joined:
+            self.suffix_length += later.length
+        else:
+            self.suffix_length = later.suffix_length
+        self.last_correct = later.last_correct
+        self.length += later.length
+        self.longest_win_streak = max(self.longest_win_streak, later.longest_win_streak)
+        self.longest_loss_streak = max(self.longest_loss_streak, later.longest_loss_streak)
+        if bridge:
+            self._update_longest(later.first_correct, bridge)
+        return self
+
+    def _update_longest(self, is_correct: bool, run: int):
+        if is_correct:
+            self.longest_win_streak = max(self.longest_win_streak, run)
+        else:
+            self.longest_loss_streak = max(self.longest_loss_streak, run)
+
+    @property
+    def current_streak(self) -> int:
+        """Positive for wins, negative for losses, as in _calculate_streaks"""
+        if self.length == 0:
+            return 0
+        return self.suffix_length if self.last_correct else -self.suffix_length
+
+
+def streak_from_row(row: AccuracyRollup) -> StreakSegment:
+    return StreakSegment(
+        length=row.total_predictions or 0,
+        first_correct=bool(row.streak_first_correct),
+        prefix_length=row.streak_prefix_length or 0,
+        last_correct=bool(row.streak_last_correct),
+        suffix_length=row.streak_suffix_length or 0,
+        longest_win_streak=row.longest_win_streak or 0,
+        longest_loss_streak=row.longest_loss_streak or 0
+    )
+
+
+@dataclass
+class RollupAccumulator:
+    """In-memory aggregate that mirrors one or more AccuracyRollup rows"""
+    total_predictions: int = 0
+    correct_predictions: int = 0
+    confidence_sum: Decimal = Decimal('0')
+    correct_confidence_sum: Decimal = Decimal('0')
+    roi_sum: Decimal = Decimal('0')
+    bands: Dict[str, List[int]] = field(default_factory=lambda: {b: [0, 0] for b in CONFIDENCE_BANDS})
+    streak: StreakSegment = field(default_factory=StreakSegment)
+
+    def add(self, is_correct: bool, confidence: Decimal, roi_percentage: Decimal, band: str):
+        self.total_predictions += 1
+        self.confidence_sum += confidence
+        self.roi_sum += roi_percentage
+        self.bands[band][0] += 1
+        if is_correct:
+            self.correct_predictions += 1
+            self.correct_confidence_sum += confidence
+            self.bands[band][1] += 1
+        self.streak.append(is_correct)
+
+    def merge_row(self, row: AccuracyRollup):
+        """Append a persisted rollup row; only 'all'-band rows carry streak state"""
+        self.total_predictions += row.total_predictions or 0
+        self.correct_predictions += row.correct_predictions or 0
+        self.confidence_sum += Decimal(row.confidence_sum or 0)
+        self.correct_confidence_sum += Decimal(row.correct_confidence_sum or 0)
+        self.roi_sum += Decimal(row.roi_sum or 0)
+        if row.confidence_band == ALL:
+            self.streak.merge(streak_from_row(row))
+        else:
+            self.add_band_row(row)
+
+    def add_band_row(self, row: AccuracyRollup):
+        """Count a confidence-band row towards the breakdown only"""
+        self.bands[row.confidence_band][0] += row.total_predictions or 0
+        self.bands[row.confidence_band][1] += row.correct_predictions or 0
+
+    def to_period_data(self) -> Dict:
+        """Render in the calculate_period_accuracy result format"""
+        total = self.total_predictions
+        accuracy = (self.correct_predictions / total) * 100 if total else 0.0
+        weighted = (
+            float(self.correct_confidence_sum / self.confidence_sum) * 100
+            if self.confidence_sum > 0 else 0
+        )
+        breakdown = {}
+        for band in CONFIDENCE_BANDS:
+            band_total, band_correct = self.bands[band]
+            breakdown[f'{band}_confidence'] = {
+                'total': band_total,
+                'correct': band_correct,
+                'accuracy': round((band_correct / band_total) * 100, 2) if band_total else 0.0
+            }
+
+        return {
+            'total_predictions': total,
+            'correct_predictions': self.correct_predictions,
+            'accuracy_percentage': round(accuracy, 2),
+            'confidence_weighted_accuracy': round(weighted, 2),
+            'roi_percentage': round(float(self.roi_sum) / total, 3) if total else 0.0,
+            'confidence_breakdown': breakdown,
+            'streak_data': {
+                'current_streak': self.streak.current_streak,
+                'longest_win_streak': self.streak.longest_win_streak,
+                'longest_loss_streak': self.streak.longest_loss_streak
+            }
+        }
+
+
+class AccuracyRollupManager:
+    """Maintains AccuracyRollup rows and answers period queries from them
+
+    Every scored prediction updates its day, week and season buckets for its
+    own prediction type and for 'all', both per confidence band and for the
+    'all' band, which also carries mergeable streak state. Streaks follow
+    prediction creation time, the order buckets merge in; an outcome scored
+    after a later prediction in its season triggers a rebuild instead of an
+    append. Rows are updated under row locks, so concurrent scorings
+    serialize per season.
+    """
+
+    def __init__(self, confidence_thresholds: Dict[str, Decimal]):
+        self.confidence_thresholds = confidence_thresholds
+
+    def confidence_band(self, confidence: Optional[Decimal]) -> str:
+        confidence = confidence or Decimal('0')
+        if confidence >= self.confidence_thresholds['high']:
+            return 'high'
+        elif confidence >= self.confidence_thresholds['medium']:
+            return 'medium'
+        return 'low'
+
+    def record_outcome(self, db: Session, prediction: Prediction, is_correct: bool,
+                       confidence: Optional[Decimal], roi_percentage: Optional[Decimal]):
+        """Apply one newly scored prediction to its rollup rows (12 rows, O(1))"""
+        created_at = prediction.created_at or datetime.utcnow()
+        confidence = Decimal(confidence or 0)
+        roi_percentage = Decimal(roi_percentage or 0)
+        band = self.confidence_band(confidence)
+        rows = self._get_or_create_rows(db, created_at, [prediction.prediction_type, ALL], [band, ALL])
+
+        if self._has_later_outcomes(db, prediction, created_at):
+            # Appending would put this outcome after later ones in the streak order
+            db.flush()
+            self.rebuild_buckets(db, created_at)
+            return
+
+        for row in rows:
+            row.total_predictions = (row.total_predictions or 0) + 1
+            row.confidence_sum = Decimal(row.confidence_sum or 0) + confidence
+            row.roi_sum = Decimal(row.roi_sum or 0) + roi_percentage
+            if is_correct:
+                row.correct_predictions = (row.correct_predictions or 0) + 1
+                row.correct_confidence_sum = Decimal(row.correct_confidence_sum or 0) + confidence
+            if row.confidence_band == ALL:
+                segment = streak_from_row(row)
+                segment.length -= 1  # total_predictions was already incremented
+                segment.append(is_correct)
+                self._store_streak(row, segment)
+            row.updated_at = datetime.utcnow()
+
+    def rebuild_buckets(self, db: Session, when: datetime):
+        """Recompute the day containing `when` from raw matches, then its week and season
+
+        Used when an already scored prediction is re-scored, since its old
+        contribution to streak state cannot be subtracted.
+        """
+        # Lock the season's rows so concurrent scorings wait for the rebuild
+        self._get_or_create_rows(db, when, [ALL], [ALL])
+
+        day_start, day_end, _, _ = bucket_bounds('day', when)
+        matches = self._load_matches(db, day_start, day_end, None, end_inclusive=False)
+
+        per_key: Dict[Tuple[str, str], RollupAccumulator] = {}
+        for match, prediction in matches:
+            band = self.confidence_band(match.confidence_score)
+            for pred_type in (prediction.prediction_type, ALL):
+                per_key.setdefault((pred_type, ALL), RollupAccumulator()).add(
+                    bool(match.is_correct), Decimal(match.confidence_score or 0),
+                    Decimal(match.roi_percentage or 0), band
+                )
+                per_key.setdefault((pred_type, band), RollupAccumulator()).add(
+                    bool(match.is_correct), Decimal(match.confidence_score or 0),
+                    Decimal(match.roi_percentage or 0), band
+                )
+
+        db.query(AccuracyRollup).filter_by(bucket_type='day', bucket_start=day_start).delete()
+        for (pred_type, band), acc in per_key.items():
+            row = self._new_row('day', day_start, pred_type, band)
+            self._store_accumulator(row, acc)
+            db.add(row)
+        db.flush()
+
+        for bucket_type in ('week', 'season'):
+            self._recompose_from_days(db, bucket_type, when)
+
+    def rebuild_range(self, db: Session, start_date: datetime, end_date: datetime):
+        """Backfill rollups for every day in [start_date, end_date]"""
+        day = _midnight(to_utc_naive(start_date))
+        end = to_utc_naive(end_date)
+        while day <= end:
+            self.rebuild_buckets(db, day)
+            day += timedelta(days=1)
+
+    def period_summary(self, db: Session, start_date: datetime, end_date: datetime,
+                       prediction_type: Optional[str] = None) -> Dict:
+        """Aggregate [start_date, end_date] from the coarsest rollups that fit
+
+        Partial days at either edge are read from raw matches so results stay
+        exact for arbitrary datetimes.
+        """
+        start = to_utc_naive(start_date)
+        end = to_utc_naive(end_date)
+        pred_type = prediction_type or ALL
+        full_start = _midnight(start) if start == _midnight(start) else _midnight(start) + timedelta(days=1)
+        full_end = _midnight(end + timedelta(microseconds=1))
+
+        result = RollupAccumulator()
+        if full_start >= full_end:
+            self._merge_raw(db, result, start, end, prediction_type, end_inclusive=True)
+            return result.to_period_data()
+
+        if start < full_start:
+            self._merge_raw(db, result, start, full_start, prediction_type, end_inclusive=False)
+
+        buckets = self._cover(full_start, full_end)
+        if buckets:
+            clauses = []
+            for bucket_type in BUCKET_TYPES:
+                starts = [s for t, s in buckets if t == bucket_type]
+                if starts:
+                    clauses.append(and_(AccuracyRollup.bucket_type == bucket_type,
+                                        AccuracyRollup.bucket_start.in_(starts)))
+            rows = db.query(AccuracyRollup).filter(
+                AccuracyRollup.prediction_type == pred_type, or_(*clauses)
+            ).order_by(AccuracyRollup.bucket_start).all()
+            for row in rows:
+                if row.confidence_band == ALL:
+                    result.merge_row(row)
+                else:
+                    result.add_band_row(row)
+
+        if full_end <= end:
+            self._merge_raw(db, result, full_end, end, prediction_type, end_inclusive=True)
+
+        return result.to_period_data()
+
+    def _cover(self, full_start: datetime, full_end: datetime) -> List[Tuple[str, datetime]]:
+        """Greedy cover of [full_start, full_end) with season, week and day buckets"""
+        buckets = []
+        day = full_start
+        while day < full_end:
+            for bucket_type in ('season', 'week', 'day'):
+                start, end, _, _ = bucket_bounds(bucket_type, day)
+                if start == day and end <= full_end:
+                    buckets.append((bucket_type, start))
+                    day = end
+                    break
+        return buckets
+
+    def _merge_raw(self, db: Session, result: RollupAccumulator, start: datetime, end: datetime,
+                   prediction_type: Optional[str], end_inclusive: bool):
+        for match, _ in self._load_matches(db, start, end, prediction_type, end_inclusive):
+            result.add(bool(match.is_correct), Decimal(match.confidence_score or 0),
+                       Decimal(match.roi_percentage or 0), self.confidence_band(match.confidence_score))
+
+    def _load_matches(self, db: Session, start: datetime, end: datetime,
+                      prediction_type: Optional[str], end_inclusive: bool):
+        upper = Prediction.created_at <= end if end_inclusive else Prediction.created_at < end
+        query = db.query(PredictionMatch, Prediction).join(Prediction).filter(
+            and_(
+                Prediction.created_at >= start,
+                upper,
+                PredictionMatch.is_correct.isnot(None)
+            )
+        )
+        if prediction_type:
+            query = query.filter(Prediction.prediction_type == prediction_type)
+        return query.order_by(Prediction.created_at, PredictionMatch.matched_at).all()
+
+    def _recompose_from_days(self, db: Session, bucket_type: str, when: datetime):
+        start, end, _, _ = bucket_bounds(bucket_type, when)
+        day_rows = db.query(AccuracyRollup).filter(
+            AccuracyRollup.bucket_type == 'day',
+            AccuracyRollup.bucket_start >= start,
+            AccuracyRollup.bucket_start < end
+        ).order_by(AccuracyRollup.bucket_start).all()
+
+        per_key: Dict[Tuple[str, str], RollupAccumulator] = {}
+        for row in day_rows:
+            per_key.setdefault((row.prediction_type, row.confidence_band), RollupAccumulator()).merge_row(row)
+
+        db.query(AccuracyRollup).filter_by(bucket_type=bucket_type, bucket_start=start).delete()
+        for (pred_type, band), acc in per_key.items():
+            row = self._new_row(bucket_type, start, pred_type, band)
+            self._store_accumulator(row, acc)
+            db.add(row)
+        db.flush()
+
+    def _has_later_outcomes(self, db: Session, prediction: Prediction, created_at: datetime) -> bool:
+        """Whether a prediction created after this one in the same season is already scored"""
+        _, season_end, _, _ = bucket_bounds('season', created_at)
+        later = db.query(PredictionMatch.id).join(Prediction).filter(
+            Prediction.created_at > created_at,
+            Prediction.created_at < season_end,
+            Prediction.id != prediction.id,
+            PredictionMatch.is_correct.isnot(None)
+        ).first()
+        return later is not None
+
+    def _get_or_create_rows(self, db: Session, when: datetime, prediction_types: List[str],
+                            bands: List[str]) -> List[AccuracyRollup]:
+        """Rollup rows for every bucket containing `when`, locked for update"""
+        bounds = {bucket_type: bucket_bounds(bucket_type, when)[0] for bucket_type in BUCKET_TYPES}
+        keys = [(bucket_type, pred_type, band)
+                for bucket_type in bounds for pred_type in prediction_types for band in bands]
+
+        by_key = self._lock_rows(db, bounds, prediction_types, bands)
+        missing = [key for key in keys if key not in by_key]
+        if missing:
+            for bucket_type, pred_type, band in missing:
+                try:
+                    with db.begin_nested():
+                        db.add(self._new_row(bucket_type, bounds[bucket_type], pred_type, band))
+                except IntegrityError:
+                    pass  # created by a concurrent scoring; picked up below
+            by_key = self._lock_rows(db, bounds, prediction_types, bands)
+
+        return [by_key[key] for key in keys]
+
+    @staticmethod
+    def _lock_rows(db: Session, bounds: Dict[str, datetime], prediction_types: List[str],
+                   bands: List[str]) -> Dict[Tuple[str, str, str], AccuracyRollup]:
+        rows = db.query(AccuracyRollup).filter(
+            or_(*[and_(AccuracyRollup.bucket_type == t, AccuracyRollup.bucket_start == s)
+                  for t, s in bounds.items()]),
+            AccuracyRollup.prediction_type.in_(prediction_types),
+            AccuracyRollup.confidence_band.in_(bands)
+        ).with_for_update().populate_existing().all()
+        return {(r.bucket_type, r.prediction_type, r.confidence_band): r for r in rows}
+
+    @staticmethod
+    def _new_row(bucket_type: str, when: datetime, prediction_type: str, band: str) -> AccuracyRollup:
+        start, end, season, week = bucket_bounds(bucket_type, when)
+        return AccuracyRollup(
+            bucket_type=bucket_type,
+            bucket_start=start,
+            bucket_end=end,
+            season=season,
+            week=week if bucket_type != 'season' else None,
+            prediction_type=prediction_type,
+            confidence_band=band,
+            total_predictions=0,
+            correct_predictions=0,
+            confidence_sum=Decimal('0'),
+            correct_confidence_sum=Decimal('0'),
+            roi_sum=Decimal('0'),
+            streak_prefix_length=0,
+            streak_suffix_length=0,
+            longest_win_streak=0,
+            longest_loss_streak=0
+        )
+
+    def _store_accumulator(self, row: AccuracyRollup, acc: RollupAccumulator):
+        row.total_predictions = acc.total_predictions
+        row.correct_predictions = acc.correct_predictions
+        row.confidence_sum = acc.confidence_sum
+        row.correct_confidence_sum = acc.correct_confidence_sum
+        row.roi_sum = acc.roi_sum
+        if row.confidence_band == ALL:
+            self._store_streak(row, acc.streak)
+        row.updated_at = datetime.utcnow()
+
+    @staticmethod
+    def _store_streak(row: AccuracyRollup, segment: StreakSegment):
+        row.streak_first_correct = segment.first_correct
+        row.streak_prefix_length = segment.prefix_length
+        row.streak_last_correct = segment.last_correct
+        row.streak_suffix_length = segment.suffix_length
+        row.longest_win_streak = segment.longest_win_streak
+        row.longest_loss_streak = segment.longest_loss_streak
@@ -5,6 +5,7 @@ A comprehensive betting analytics system providing:
 - Value bet identification using Kelly Criterion
 - Arbitrage opportunity detection
 - Line movement analysis and sharp money tracking
+- Columnar line history store for ingested odds
 - Public betting vs money percentage analysis
 - Historical ROI tracking by bet type
 - Bankroll management recommendations
@@ -23,6 +24,13 @@ from .betting_engine import (
     RiskLevel
 )
 
+from .line_history import (
+    LineHistoryStore,
+    LineHistoryArchive,
+    LineMovementFrame,
+    LineSignals
+)
+
 from .notification_system import (
     NotificationSystem,
     NotificationConfig,
@@ -44,6 +52,10 @@ __all__ = [
     "LineMovement",
     "BetType",
     "RiskLevel",
+    "LineHistoryStore",
+    "LineHistoryArchive",
+    "LineMovementFrame",
+    "LineSignals",
     "NotificationConfig",
     "Alert",
     "AlertPriority",
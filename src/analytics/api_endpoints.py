@@ -130,6 +130,7 @@ class LineMovementResponse(BaseModel):
     money_percentage: Optional[float]
     reverse_line_movement: bool
     steam_move: bool
+    sportsbook: Optional[str] = None
 
 # Authentication dependency
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
@@ -281,7 +282,8 @@ async def analyze_line_movement(
                 public_percentage=move.public_percentage,
                 money_percentage=move.money_percentage,
                 reverse_line_movement=move.reverse_line_movement,
-                steam_move=move.steam_move
+                steam_move=move.steam_move,
+                sportsbook=move.sportsbook
             ) for move in movements
         ]
 
@@ -622,8 +624,8 @@ async def monitor_live_opportunities(games: List[str], thresholds: Dict, user_id
                 await notification_system.bulk_send_alerts(all_alerts)
                 logger.info(f"Sent {len(all_alerts)} live alerts")
 
-            # Wait before next check
-            await asyncio.sleep(60)  # Check every minute
+            # Wait before the next full-market scan
+            await asyncio.sleep(analytics_engine.live_scan_interval)
 
         except Exception as e:
             logger.error(f"Error in live monitoring: {e}")
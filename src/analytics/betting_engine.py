@@ -25,6 +25,14 @@ from concurrent.futures import ThreadPoolExecutor
 import redis
 import json
 
+from .line_history import (
+    LineHistoryStore,
+    LineMovementFrame,
+    LineSignals,
+    detect_line_signals,
+    epoch_seconds
+)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -102,6 +110,253 @@ class LineMovement:
     money_percentage: Optional[float]
     reverse_line_movement: bool
     steam_move: bool
+    sportsbook: Optional[str] = None
+
+@dataclass
+class MarketSnapshot:
+    """Columnar books x markets x outcomes quotes for a slate of games"""
+    game_ids: np.ndarray          # (N,) object
+    bet_types: np.ndarray         # (N,) object, BetType values
+    selections: np.ndarray        # (N,) object
+    sportsbooks: np.ndarray       # (N,) object
+    odds: np.ndarray              # (N,) odds as quoted
+    decimal_odds: np.ndarray      # (N,)
+    true_probability: np.ndarray  # (N,) model probability, NaN when unknown
+    market: np.ndarray            # (N,) code per (game, bet type)
+    market_selection: np.ndarray  # (N,) code per (game, bet type, selection)
+    book_market: np.ndarray       # (N,) code per (game, bet type, sportsbook)
+
+    @classmethod
+    def from_quotes(cls,
+                    quotes: List[Dict],
+                    true_probabilities: Optional[Dict[str, Dict[str, float]]] = None,
+                    odds_format: str = "american") -> "MarketSnapshot":
+        """
+        Build a snapshot from flat quote rows
+
+        Args:
+            quotes: Rows with game_id, bet_type, selection, sportsbook and odds
+            true_probabilities: game_id -> selection -> model probability
+            odds_format: 'american', 'decimal', or 'auto' (|odds| >= 100 is American)
+        """
+        true_probabilities = true_probabilities or {}
+        game_ids = np.array([q['game_id'] for q in quotes], dtype=object)
+        bet_types = np.array([q.get('bet_type', BetType.MONEYLINE.value) for q in quotes], dtype=object)
+        selections = np.array([q['selection'] for q in quotes], dtype=object)
+        sportsbooks = np.array([q['sportsbook'] for q in quotes], dtype=object)
+        quoted = [q['odds'] for q in quotes]
+        odds = np.array(quoted, dtype=np.float64)
+        true_prob = np.array([
+            true_probabilities.get(q['game_id'], {}).get(q['selection'], np.nan) for q in quotes
+        ], dtype=np.float64)
+
+        if odds_format == "decimal":
+            decimal_odds = odds.copy()
+        elif odds_format == "auto":
+            decimal_odds = np.where(np.abs(odds) >= 100, american_to_decimal_array(odds), odds)
+        else:
+            decimal_odds = american_to_decimal_array(odds)
+
+        return cls.from_arrays(game_ids, bet_types, selections, sportsbooks, quoted, decimal_odds, true_prob)
+
+    @classmethod
+    def from_arrays(cls, game_ids, bet_types, selections, sportsbooks, odds, decimal_odds, true_probability) -> "MarketSnapshot":
+        """Build a snapshot from aligned columns, deriving the grouping codes"""
+        game_ids, bet_types, selections, sportsbooks = (
+            np.array(column, dtype=object) for column in (game_ids, bet_types, selections, sportsbooks)
+        )
+        game_codes, _ = pd.factorize(game_ids)
+        bet_codes, bet_uniques = pd.factorize(bet_types)
+        selection_codes, selection_uniques = pd.factorize(selections)
+        book_codes, book_uniques = pd.factorize(sportsbooks)
+
+        # Codes keep first-appearance order, so markets and selections list as quoted
+        market, _ = pd.factorize(game_codes * max(len(bet_uniques), 1) + bet_codes)
+        market_selection, _ = pd.factorize(market * max(len(selection_uniques), 1) + selection_codes)
+        book_market, _ = pd.factorize(market * max(len(book_uniques), 1) + book_codes)
+
+        return cls(
+            game_ids=game_ids,
+            bet_types=bet_types,
+            selections=selections,
+            sportsbooks=sportsbooks,
+            odds=np.array(odds, dtype=object),
+            decimal_odds=np.asarray(decimal_odds, dtype=np.float64),
+            true_probability=np.asarray(true_probability, dtype=np.float64),
+            market=market,
+            market_selection=market_selection,
+            book_market=book_market
+        )
+
+    def __len__(self) -> int:
+        return len(self.decimal_odds)
+
+
+def american_to_decimal_array(american_odds: np.ndarray) -> np.ndarray:
+    """Vectorized American to decimal odds conversion"""
+    american_odds = np.asarray(american_odds, dtype=np.float64)
+    with np.errstate(divide='ignore'):
+        return np.where(american_odds > 0, american_odds / 100 + 1, 100 / np.abs(american_odds) + 1)
+
+
+@dataclass
+class MarketPricing:
+    """Per-quote pricing for a MarketSnapshot"""
+    implied_probability: np.ndarray  # 1 / decimal odds
+    fair_probability: np.ndarray     # implied probability with the book's vig removed
+    overround: np.ndarray            # book's total implied probability for the market
+    expected_value: np.ndarray       # per unit staked, NaN without a model probability
+    kelly_fraction: np.ndarray       # capped Kelly fraction, 0 without an edge
+
+
+class MarketScanner:
+    """Prices a whole slate of quotes in one vectorized pass"""
+
+    def __init__(self,
+                 min_kelly_threshold: float = 0.01,
+                 max_kelly_fraction: float = 0.25,
+                 min_arbitrage_profit: float = 0.01,
+                 max_stake_fraction: float = 0.05):
+        self.min_kelly_threshold = min_kelly_threshold
+        self.max_kelly_fraction = max_kelly_fraction
+        self.min_arbitrage_profit = min_arbitrage_profit
+        self.max_stake_fraction = max_stake_fraction
+
+    def price(self, snapshot: MarketSnapshot) -> MarketPricing:
+        """Implied and vig-free probabilities, EV and Kelly for every quote"""
+        decimal_odds = snapshot.decimal_odds
+        p = snapshot.true_probability
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            implied = 1 / decimal_odds
+
+            # Multiplicative vig removal within each book's market
+            overround = np.bincount(snapshot.book_market, weights=implied)[snapshot.book_market]
+            outcomes = np.bincount(snapshot.book_market)[snapshot.book_market]
+            fair = np.where(outcomes > 1, implied / overround, np.nan)
+
+            expected_value = p * (decimal_odds - 1) - (1 - p)
+
+            b = decimal_odds - 1
+            kelly = (b * p - (1 - p)) / b
+            valid = (p > 0) & (p < 1) & (b > 0)
+            kelly = np.where(valid, np.clip(kelly, 0, self.max_kelly_fraction), 0.0)
+
+        return MarketPricing(
+            implied_probability=implied,
+            fair_probability=fair,
+            overround=overround,
+            expected_value=expected_value,
+            kelly_fraction=kelly
+        )
+
+    def value_bets(self,
+                   snapshot: MarketSnapshot,
+                   bankroll: float = 10000,
+                   pricing: Optional[MarketPricing] = None) -> List[ValueBet]:
+        """Quotes whose model probability beats the implied probability, sorted by edge"""
+        pricing = pricing or self.price(snapshot)
+        p = snapshot.true_probability
+        implied = pricing.implied_probability
+        kelly = pricing.kelly_fraction
+
+        with np.errstate(invalid='ignore'):
+            candidate = (p > 0) & (p < 1) & (p > implied) & (kelly >= self.min_kelly_threshold)
+        rows = np.nonzero(candidate)[0]
+        rows = rows[np.argsort(-pricing.expected_value[rows], kind='stable')]
+
+        max_stake = bankroll * self.max_stake_fraction
+        value_bets = []
+        for i in rows:
+            kelly_fraction = float(kelly[i])
+            if kelly_fraction < 0.05:
+                risk_level = RiskLevel.LOW
+            elif kelly_fraction < 0.10:
+                risk_level = RiskLevel.MEDIUM
+            elif kelly_fraction < 0.20:
+                risk_level = RiskLevel.HIGH
+            else:
+                risk_level = RiskLevel.EXTREME
+
+            value_bets.append(ValueBet(
+                game_id=snapshot.game_ids[i],
+                bet_type=BetType(snapshot.bet_types[i]),
+                selection=snapshot.selections[i],
+                true_probability=float(p[i]),
+                implied_probability=float(implied[i]),
+                odds=snapshot.odds[i],
+                kelly_fraction=kelly_fraction,
+                expected_value=float(pricing.expected_value[i]),
+                confidence=float((p[i] - implied[i]) / implied[i]),
+                risk_level=risk_level,
+                recommended_stake=min(bankroll * kelly_fraction, max_stake),
+                max_stake=max_stake,
+                sportsbook=snapshot.sportsbooks[i]
+            ))
+
+        return value_bets
+
+    def arbitrage(self,
+                  snapshot: MarketSnapshot,
+                  total_stake: float = 1000) -> List[ArbitrageOpportunity]:
+        """Cross-book arbitrage per (game, bet type) market, sorted by profit margin"""
+        n = len(snapshot)
+        if n == 0:
+            return []
+
+        decimal_odds = snapshot.decimal_odds
+        group = snapshot.market_selection
+        n_groups = group.max() + 1
+
+        # Best price per selection; ties go to the first quote, as max() does
+        best = np.full(n_groups, -np.inf)
+        np.maximum.at(best, group, decimal_odds)
+        is_best = decimal_odds == best[group]
+        best_row = np.full(n_groups, n)
+        np.minimum.at(best_row, group[is_best], np.nonzero(is_best)[0])
+
+        group_market = snapshot.market[best_row]
+        with np.errstate(divide='ignore'):
+            group_implied = 1 / best
+        total_implied = np.bincount(group_market, weights=group_implied)
+        selection_count = np.bincount(group_market)
+
+        with np.errstate(divide='ignore'):
+            margin = 1 / total_implied - 1
+        arbitrage_markets = np.nonzero(
+            (selection_count >= 2) & (total_implied < 1.0) & (margin >= self.min_arbitrage_profit)
+        )[0]
+        arbitrage_markets = arbitrage_markets[np.argsort(-margin[arbitrage_markets], kind='stable')]
+
+        opportunities = []
+        for m in arbitrage_markets:
+            groups = np.nonzero(group_market == m)[0]
+            rows = best_row[groups]
+            implied_probs = group_implied[groups]
+            profit_margin = float(margin[m])
+
+            if profit_margin > 0.05:
+                risk_level = RiskLevel.LOW
+            elif profit_margin > 0.02:
+                risk_level = RiskLevel.MEDIUM
+            else:
+                risk_level = RiskLevel.HIGH
+
+            opportunities.append(ArbitrageOpportunity(
+                game_id=snapshot.game_ids[rows[0]],
+                bet_type=BetType(snapshot.bet_types[rows[0]]),
+                selections=list(snapshot.selections[rows]),
+                odds=[float(o) for o in decimal_odds[rows]],
+                sportsbooks=list(snapshot.sportsbooks[rows]),
+                profit_margin=profit_margin,
+                total_stake=total_stake,
+                stakes=[float(total_stake * (prob / total_implied[m])) for prob in implied_probs],
+                guaranteed_profit=total_stake * profit_margin,
+                risk_level=risk_level
+            ))
+
+        return opportunities
+
 
 class BettingAnalyticsEngine:
     """Main betting analytics engine"""
@@ -112,7 +367,14 @@ class BettingAnalyticsEngine:
         self.min_kelly_threshold = 0.01  # Minimum Kelly fraction to consider
         self.max_kelly_fraction = 0.25   # Maximum Kelly fraction for safety
         self.min_arbitrage_profit = 0.01 # Minimum 1% profit for arbitrage
+        self.live_scan_interval = 5      # Seconds between full-market live scans
         self.executor = ThreadPoolExecutor(max_workers=10)
+        self.market_scanner = MarketScanner(
+            min_kelly_threshold=self.min_kelly_threshold,
+            max_kelly_fraction=self.max_kelly_fraction,
+            min_arbitrage_profit=self.min_arbitrage_profit
+        )
+        self.line_signals = LineSignals()  # steam, reverse line movement and sharp money thresholds
 
     def _cache_key(self, prefix: str, *args) -> str:
         """Generate cache key"""
@@ -194,70 +456,21 @@ class BettingAnalyticsEngine:
         Returns:
             List of ValueBet objects
         """
-        cache_key = self._cache_key("value_bets", game_id, hash(str(true_probabilities)))
-        cached = self._get_cached(cache_key)
-        if cached:
-            return [ValueBet(**bet) for bet in cached]
-
-        value_bets = []
-
-        for odds in odds_data:
-            for selection, true_prob in true_probabilities.items():
-                if true_prob <= 0 or true_prob >= 1:
-                    continue
-
-                decimal_odds = self.american_to_decimal(odds.odds) if odds.odds > 0 or odds.odds < 0 else odds.odds
-                implied_prob = self.decimal_to_probability(decimal_odds)
-
-                # Only consider if true probability is higher than implied
-                if true_prob <= implied_prob:
-                    continue
-
-                kelly_fraction = self.kelly_criterion(true_prob, decimal_odds)
-
-                if kelly_fraction < self.min_kelly_threshold:
-                    continue
-
-                expected_value = self.calculate_expected_value(true_prob, decimal_odds)
-                confidence = (true_prob - implied_prob) / implied_prob
-
-                # Determine risk level
-                if kelly_fraction < 0.05:
-                    risk_level = RiskLevel.LOW
-                elif kelly_fraction < 0.10:
-                    risk_level = RiskLevel.MEDIUM
-                elif kelly_fraction < 0.20:
-                    risk_level = RiskLevel.HIGH
-                else:
-                    risk_level = RiskLevel.EXTREME
-
-                # Calculate recommended stakes
-                recommended_stake = bankroll * kelly_fraction
-                max_stake = bankroll * 0.05  # Never bet more than 5% of bankroll
-                recommended_stake = min(recommended_stake, max_stake)
-
-                value_bet = ValueBet(
-                    game_id=game_id,
-                    bet_type=BetType.MONEYLINE,  # This would be determined by context
-                    selection=selection,
-                    true_probability=true_prob,
-                    implied_probability=implied_prob,
-                    odds=odds.odds,
-                    kelly_fraction=kelly_fraction,
-                    expected_value=expected_value,
-                    confidence=confidence,
-                    risk_level=risk_level,
-                    recommended_stake=recommended_stake,
-                    max_stake=max_stake,
-                    sportsbook=odds.sportsbook
-                )
-
-                value_bets.append(value_bet)
-
-        # Cache results
-        self._set_cached(cache_key, [asdict(bet) for bet in value_bets])
+        # Every quote is priced against every selection, as one snapshot
+        rows = [(odds, selection, true_prob) for odds in odds_data for selection, true_prob in true_probabilities.items()]
+        quoted = np.array([odds.odds for odds, _, _ in rows], dtype=np.float64)
+
+        snapshot = MarketSnapshot.from_arrays(
+            game_ids=[game_id] * len(rows),
+            bet_types=[BetType.MONEYLINE.value] * len(rows),  # This would be determined by context
+            selections=[selection for _, selection, _ in rows],
+            sportsbooks=[odds.sportsbook for odds, _, _ in rows],
+            odds=[odds.odds for odds, _, _ in rows],
+            decimal_odds=np.where(quoted != 0, american_to_decimal_array(quoted), quoted),
+            true_probability=[true_prob for _, _, true_prob in rows]
+        )
 
-        return sorted(value_bets, key=lambda x: x.expected_value, reverse=True)
+        return self.market_scanner.value_bets(snapshot, bankroll)
 
     def detect_arbitrage_opportunities(self,
                                      game_id: str,
@@ -272,72 +485,49 @@ class BettingAnalyticsEngine:
         Returns:
             List of ArbitrageOpportunity objects
         """
-        cache_key = self._cache_key("arbitrage", game_id)
-        cached = self._get_cached(cache_key)
-        if cached:
-            return [ArbitrageOpportunity(**arb) for arb in cached]
-
-        arbitrage_opportunities = []
-
-        selections = list(odds_matrix.keys())
-        if len(selections) < 2:
-            return arbitrage_opportunities
-
-        # Find best odds for each selection
-        best_odds = {}
-        best_books = {}
-
-        for selection, odds_list in odds_matrix.items():
-            best_odd = max(odds_list, key=lambda x: x.odds)
-            decimal_odds = self.american_to_decimal(best_odd.odds) if isinstance(best_odd.odds, int) else best_odd.odds
-            best_odds[selection] = decimal_odds
-            best_books[selection] = best_odd.sportsbook
-
-        # Check for arbitrage opportunity
-        implied_probs = [self.decimal_to_probability(odds) for odds in best_odds.values()]
-        total_implied_prob = sum(implied_probs)
-
-        if total_implied_prob < 1.0:  # Arbitrage opportunity exists
-            profit_margin = (1 / total_implied_prob) - 1
-
-            if profit_margin >= self.min_arbitrage_profit:
-                # Calculate optimal stakes
-                total_stake = 1000  # Base stake amount
-                stakes = []
+        if len(odds_matrix) < 2:
+            return []
+
+        rows = [(selection, odds) for selection, odds_list in odds_matrix.items() for odds in odds_list]
+        quoted = np.array([odds.odds for _, odds in rows], dtype=np.float64)
+        is_american = np.array([isinstance(odds.odds, int) for _, odds in rows], dtype=bool)
+
+        snapshot = MarketSnapshot.from_arrays(
+            game_ids=[game_id] * len(rows),
+            bet_types=[BetType.MONEYLINE.value] * len(rows),  # Would be determined by context
+            selections=[selection for selection, _ in rows],
+            sportsbooks=[odds.sportsbook for _, odds in rows],
+            odds=[odds.odds for _, odds in rows],
+            decimal_odds=np.where(is_american, american_to_decimal_array(quoted), quoted),
+            true_probability=np.full(len(rows), np.nan)
+        )
 
-                for prob in implied_probs:
-                    stake = total_stake * (prob / total_implied_prob)
-                    stakes.append(stake)
+        return self.market_scanner.arbitrage(snapshot)
 
-                guaranteed_profit = total_stake * profit_margin
+    def scan_market(self,
+                    quotes: List[Dict],
+                    true_probabilities: Dict[str, Dict[str, float]],
+                    bankroll: float = 10000,
+                    odds_format: str = "american") -> Dict[str, List]:
+        """
+        Scan every book, market and outcome of a slate in one pass
 
-                # Determine risk level based on profit margin and book reliability
-                if profit_margin > 0.05:
-                    risk_level = RiskLevel.LOW
-                elif profit_margin > 0.02:
-                    risk_level = RiskLevel.MEDIUM
-                else:
-                    risk_level = RiskLevel.HIGH
-
-                arbitrage = ArbitrageOpportunity(
-                    game_id=game_id,
-                    bet_type=BetType.MONEYLINE,  # Would be determined by context
-                    selections=selections,
-                    odds=list(best_odds.values()),
-                    sportsbooks=list(best_books.values()),
-                    profit_margin=profit_margin,
-                    total_stake=total_stake,
-                    stakes=stakes,
-                    guaranteed_profit=guaranteed_profit,
-                    risk_level=risk_level
-                )
-
-                arbitrage_opportunities.append(arbitrage)
+        Args:
+            quotes: Flat quote rows with game_id, bet_type, selection, sportsbook and odds
+            true_probabilities: game_id -> selection -> model probability
+            bankroll: Total bankroll for stake calculations
+            odds_format: 'american', 'decimal' or 'auto'
 
-        # Cache results
-        self._set_cached(cache_key, [asdict(arb) for arb in arbitrage_opportunities])
+        Returns:
+            Dict with value_bets sorted by expected value and arbitrage sorted by margin
+        """
+        snapshot = MarketSnapshot.from_quotes(quotes, true_probabilities, odds_format)
+        pricing = self.market_scanner.price(snapshot)
 
-        return arbitrage_opportunities
+        return {
+            'value_bets': self.market_scanner.value_bets(snapshot, bankroll, pricing),
+            'arbitrage': self.market_scanner.arbitrage(snapshot)
+        }
 
     def analyze_line_movement(self,
                             game_id: str,
@@ -357,115 +547,77 @@ class BettingAnalyticsEngine:
         if cached:
             return [LineMovement(**move) for move in cached]
 
-        movements = []
-
-        # Group odds by selection and bet type
-        grouped_odds = {}
-        for odds_point in historical_odds:
-            key = f"{odds_point['selection']}_{odds_point['bet_type']}"
-            if key not in grouped_odds:
-                grouped_odds[key] = []
-            grouped_odds[key].append(odds_point)
-
-        for key, odds_history in grouped_odds.items():
-            if len(odds_history) < 2:
-                continue
-
-            # Sort by timestamp
-            odds_history.sort(key=lambda x: x['timestamp'])
-
-            opening_line = odds_history[0]['line']
-            current_line = odds_history[-1]['line']
-
-            movement = current_line - opening_line
-            movement_percentage = (movement / abs(opening_line)) * 100 if opening_line != 0 else 0
-
-            # Detect sharp money indicators
-            sharp_money_indicator = self._detect_sharp_money(odds_history)
-
-            # Detect reverse line movement
-            reverse_line_movement = self._detect_reverse_line_movement(odds_history)
-
-            # Detect steam moves (rapid line movement)
-            steam_move = self._detect_steam_move(odds_history)
-
-            selection, bet_type = key.split('_', 1)
-
-            line_movement = LineMovement(
-                game_id=game_id,
-                bet_type=BetType(bet_type),
-                selection=selection,
-                opening_line=opening_line,
-                current_line=current_line,
-                movement=movement,
-                movement_percentage=movement_percentage,
-                sharp_money_indicator=sharp_money_indicator,
-                public_percentage=odds_history[-1].get('public_percentage'),
-                money_percentage=odds_history[-1].get('money_percentage'),
-                reverse_line_movement=reverse_line_movement,
-                steam_move=steam_move
-            )
-
-            movements.append(line_movement)
+        store = LineHistoryStore(initial_capacity=max(len(historical_odds), 1))
+        store.append_records(historical_odds, game_id=game_id)
+        movements = self._line_movements_from_frame(store.line_movements(signals=self.line_signals))
 
         # Cache results
         self._set_cached(cache_key, [asdict(move) for move in movements])
 
         return movements
 
-    def _detect_sharp_money(self, odds_history: List[Dict]) -> bool:
-        """Detect if sharp money is moving the line"""
-        if len(odds_history) < 3:
-            return False
+    def analyze_market_line_movement(self,
+                                     store: LineHistoryStore,
+                                     game_ids: Optional[List[str]] = None) -> List[LineMovement]:
+        """
+        Line movement for every game in a line history store in one pass
 
-        # Look for line movement against public betting percentage
-        recent_data = odds_history[-3:]
+        Args:
+            store: Quote history, e.g. one season of an OddsAPIClient line_history archive
+            game_ids: Restrict to these games
 
-        for data in recent_data:
-            public_pct = data.get('public_percentage', 50)
-            money_pct = data.get('money_percentage', 50)
+        Returns:
+            List of LineMovement objects
+        """
+        frame = store.line_movements(game_ids=game_ids, signals=self.line_signals)
+        return self._line_movements_from_frame(frame)
 
-            # If public is heavily on one side but money is on the other
-            if abs(public_pct - money_pct) > 20:
-                return True
+    @staticmethod
+    def _line_movements_from_frame(frame: LineMovementFrame) -> List[LineMovement]:
+        bet_types = {bet_type.value for bet_type in BetType}
+        movements = []
+        for i in np.flatnonzero(frame.quotes >= 2):
+            if frame.markets[i] not in bet_types:
+                continue
+            public_pct, money_pct = frame.public_percentage[i], frame.money_percentage[i]
+            movements.append(LineMovement(
+                game_id=frame.game_ids[i],
+                bet_type=BetType(frame.markets[i]),
+                selection=frame.outcomes[i],
+                opening_line=float(frame.opening_line[i]),
+                current_line=float(frame.current_line[i]),
+                movement=float(frame.movement[i]),
+                movement_percentage=float(frame.movement_percentage[i]),
+                sharp_money_indicator=bool(frame.sharp_money[i]),
+                public_percentage=None if np.isnan(public_pct) else float(public_pct),
+                money_percentage=None if np.isnan(money_pct) else float(money_pct),
+                reverse_line_movement=bool(frame.reverse_line_movement[i]),
+                steam_move=bool(frame.steam_move[i]),
+                sportsbook=frame.books[i] or None
+            ))
+        return movements
 
-        return False
+    def _history_signals(self, odds_history: List[Dict]) -> Tuple[bool, bool, bool]:
+        """Sharp money, reverse line movement and steam flags for one time-ordered history"""
+        line = np.array([data['line'] for data in odds_history], dtype=np.float64)
+        timestamp = np.array([epoch_seconds(data['timestamp']) for data in odds_history], dtype=np.float64)
+        public_pct = np.array([data.get('public_percentage', np.nan) for data in odds_history], dtype=np.float64)
+        money_pct = np.array([data.get('money_percentage', np.nan) for data in odds_history], dtype=np.float64)
+        bounds = np.array([0]), np.array([len(odds_history)])
+        sharp, rlm, steam = detect_line_signals(line, timestamp, public_pct, money_pct, *bounds, self.line_signals)
+        return bool(sharp[0]), bool(rlm[0]), bool(steam[0])
+
+    def _detect_sharp_money(self, odds_history: List[Dict]) -> bool:
+        """Detect if sharp money is moving the line"""
+        return bool(odds_history) and self._history_signals(odds_history)[0]
 
     def _detect_reverse_line_movement(self, odds_history: List[Dict]) -> bool:
         """Detect reverse line movement (line moves opposite to public betting)"""
-        if len(odds_history) < 2:
-            return False
-
-        latest = odds_history[-1]
-        previous = odds_history[-2]
-
-        public_pct = latest.get('public_percentage', 50)
-        line_movement = latest['line'] - previous['line']
-
-        # If public is betting one way but line moves the other way
-        if public_pct > 60 and line_movement < 0:  # Public on favorite, line moves away
-            return True
-        elif public_pct < 40 and line_movement > 0:  # Public on underdog, line moves away
-            return True
-
-        return False
+        return bool(odds_history) and self._history_signals(odds_history)[1]
 
     def _detect_steam_move(self, odds_history: List[Dict]) -> bool:
         """Detect steam moves (rapid significant line movement)"""
-        if len(odds_history) < 2:
-            return False
-
-        # Check for rapid movement in short time period
-        recent_window = odds_history[-5:] if len(odds_history) >= 5 else odds_history
-
-        if len(recent_window) < 2:
-            return False
-
-        total_movement = abs(recent_window[-1]['line'] - recent_window[0]['line'])
-        time_span = (recent_window[-1]['timestamp'] - recent_window[0]['timestamp']).total_seconds() / 3600
-
-        # Steam move criteria: significant movement in short time
-        return total_movement > 2 and time_span < 1  # 2+ point move in under 1 hour
+        return bool(odds_history) and self._history_signals(odds_history)[2]
 
     def analyze_public_vs_money(self,
                               betting_data: List[Dict]) -> Dict[str, Dict]:
@@ -912,6 +1064,9 @@ class BettingAnalyticsEngine:
         """
         Generate live betting opportunity alerts
 
+        Value bets and arbitrage come from one scan of every monitored game,
+        so the whole market can be rescanned every live_scan_interval seconds.
+
         Args:
             monitoring_games: List of game IDs to monitor
             alert_thresholds: Thresholds for different alert types
@@ -921,15 +1076,14 @@ class BettingAnalyticsEngine:
         """
         alerts = []
 
-        for game_id in monitoring_games:
-            # Check for value bet opportunities
-            value_alerts = await self._check_value_bet_alerts(game_id, alert_thresholds)
-            alerts.extend(value_alerts)
+        quotes, true_probabilities = await self._get_live_market(monitoring_games)
+        scan = self.scan_market(quotes, true_probabilities)
 
-            # Check for arbitrage opportunities
-            arb_alerts = await self._check_arbitrage_alerts(game_id, alert_thresholds)
-            alerts.extend(arb_alerts)
+        # Check for value bet and arbitrage opportunities across the slate
+        alerts.extend(self._value_bet_alerts(scan['value_bets'], alert_thresholds))
+        alerts.extend(self._arbitrage_alerts(scan['arbitrage'], alert_thresholds))
 
+        for game_id in monitoring_games:
             # Check for line movement alerts
             movement_alerts = await self._check_line_movement_alerts(game_id, alert_thresholds)
             alerts.extend(movement_alerts)
@@ -943,11 +1097,8 @@ class BettingAnalyticsEngine:
 
         return alerts
 
-    async def _check_value_bet_alerts(self, game_id: str, thresholds: Dict) -> List[Dict]:
-        """Check for value bet alerts"""
-        # This would integrate with live odds feeds
-        alerts = []
-
+    async def _get_live_market(self, game_ids: List[str]) -> Tuple[List[Dict], Dict[str, Dict[str, float]]]:
+        """Load current quotes and model probabilities for every monitored game"""
         # Mock implementation - would connect to real odds APIs
         mock_odds = [
             OddsData("DraftKings", -110),
@@ -957,49 +1108,60 @@ class BettingAnalyticsEngine:
 
         mock_true_probs = {"Team A": 0.58, "Team B": 0.42}
 
-        value_bets = self.identify_value_bets(game_id, mock_true_probs, mock_odds)
+        quotes = [
+            {
+                'game_id': game_id,
+                'bet_type': BetType.MONEYLINE.value,
+                'selection': selection,
+                'sportsbook': odds.sportsbook,
+                'odds': odds.odds
+            }
+            for game_id in game_ids
+            for odds in mock_odds
+            for selection in mock_true_probs
+        ]
+
+        return quotes, {game_id: mock_true_probs for game_id in game_ids}
+
+    def _value_bet_alerts(self, value_bets: List[ValueBet], thresholds: Dict) -> List[Dict]:
+        """Build value bet alerts from scanned value bets"""
+        alerts = []
+        now = datetime.utcnow()
 
         for bet in value_bets:
             if bet.expected_value > thresholds.get('min_expected_value', 0.05):
                 alert = {
                     'type': 'value_bet',
-                    'game_id': game_id,
+                    'game_id': bet.game_id,
                     'selection': bet.selection,
                     'sportsbook': bet.sportsbook,
                     'odds': bet.odds,
                     'expected_value': bet.expected_value,
                     'kelly_fraction': bet.kelly_fraction,
                     'priority': min(10, int(bet.expected_value * 100)),
-                    'timestamp': datetime.utcnow(),
+                    'timestamp': now,
                     'message': f"Value bet alert: {bet.selection} at {bet.odds} (EV: {bet.expected_value:.3f})"
                 }
                 alerts.append(alert)
 
         return alerts
 
-    async def _check_arbitrage_alerts(self, game_id: str, thresholds: Dict) -> List[Dict]:
-        """Check for arbitrage opportunity alerts"""
+    def _arbitrage_alerts(self, arbitrage_ops: List[ArbitrageOpportunity], thresholds: Dict) -> List[Dict]:
+        """Build arbitrage alerts from scanned opportunities"""
         alerts = []
-
-        # Mock implementation
-        mock_odds_matrix = {
-            "Team A": [OddsData("Book1", 1.95), OddsData("Book2", 2.10)],
-            "Team B": [OddsData("Book1", 1.90), OddsData("Book2", 1.85)]
-        }
-
-        arbitrage_ops = self.detect_arbitrage_opportunities(game_id, mock_odds_matrix)
+        now = datetime.utcnow()
 
         for arb in arbitrage_ops:
             if arb.profit_margin > thresholds.get('min_arbitrage_profit', 0.01):
                 alert = {
                     'type': 'arbitrage',
-                    'game_id': game_id,
+                    'game_id': arb.game_id,
                     'selections': arb.selections,
                     'sportsbooks': arb.sportsbooks,
                     'profit_margin': arb.profit_margin,
                     'guaranteed_profit': arb.guaranteed_profit,
                     'priority': min(10, int(arb.profit_margin * 200)),
-                    'timestamp': datetime.utcnow(),
+                    'timestamp': now,
                     'message': f"Arbitrage opportunity: {arb.profit_margin:.2%} profit guaranteed"
                 }
                 alerts.append(alert)
@@ -0,0 +1,476 @@
+"""
+Columnar Line History
+
+Append-only store of every quote seen -- (game, book, market, outcome, price,
+point, timestamp) plus public/money percentages when known -- held as typed
+NumPy columns. String fields are dictionary-encoded to integer codes. A store
+can live in memory or be memory-mapped from one directory per season, and Odds
+API payloads are parsed directly into its column buffers.
+
+Line movement signals (steam moves, reverse line movement, sharp money) are
+computed for every (game, book, market, outcome) series at once as window queries
+over the time-ordered columns.
+"""
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..utils.team_index import team_abbreviation
+
+logger = logging.getLogger(__name__)
+
+# Column name -> dtype. Categorical columns hold dictionary codes.
+COLUMNS: Dict[str, np.dtype] = {
+    'game': np.dtype(np.int32),
+    'book': np.dtype(np.int16),
+    'market': np.dtype(np.int16),
+    'outcome': np.dtype(np.int32),
+    'price': np.dtype(np.float64),
+    'point': np.dtype(np.float64),       # NaN for markets without a line, e.g. moneyline
+    'timestamp': np.dtype(np.float64),   # epoch seconds
+    'public_pct': np.dtype(np.float64),  # NaN when unknown
+    'money_pct': np.dtype(np.float64),
+}
+CATEGORICAL = ('game', 'book', 'market', 'outcome')
+
+# Odds API market keys -> BetType values
+ODDS_API_MARKETS = {
+    'h2h': 'moneyline',
+    'spreads': 'spread',
+    'totals': 'total',
+}
+
+
+def epoch_seconds(value: Any) -> float:
+    """Epoch seconds from a datetime, ISO-8601 string or number"""
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return float(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class _Dictionary:
+    """String <-> integer code mapping for one categorical column"""
+
+    def __init__(self, values: Sequence[str] = ()):
+        self.values: List[str] = list(values)
+        self.codes: Dict[str, int] = {value: code for code, value in enumerate(self.values)}
+
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def lookup(self, value: str) -> Optional[int]:
+        return self.codes.get(value)
+
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        values = np.empty(len(self.values), dtype=object)
+        values[:] = self.values
+        return values[codes]
+
+
+@dataclass
+class LineSignals:
+    """Thresholds for line movement signals"""
+    steam_points: float = 2.0         # minimum move within the steam window
+    steam_seconds: float = 3600.0     # ...made in under this long
+    steam_window: int = 5             # most recent quotes considered
+    sharp_window: int = 3             # most recent quotes checked for a public/money split
+    sharp_split: float = 20.0         # percentage-point gap between public and money
+    rlm_public_high: float = 60.0     # public on one side above this...
+    rlm_public_low: float = 40.0      # ...or below this, while the line moves the other way
+    default_percentage: float = 50.0  # used where public/money percentages are unknown
+
+
+@dataclass
+class LineMovementFrame:
+    """Per-series line movement summary; one row per (game, book, market, outcome)"""
+    game_ids: np.ndarray
+    books: np.ndarray
+    markets: np.ndarray
+    outcomes: np.ndarray
+    quotes: np.ndarray
+    opening_line: np.ndarray
+    current_line: np.ndarray
+    movement: np.ndarray
+    movement_percentage: np.ndarray
+    public_percentage: np.ndarray  # latest, NaN when unknown
+    money_percentage: np.ndarray
+    sharp_money: np.ndarray
+    reverse_line_movement: np.ndarray
+    steam_move: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.quotes)
+
+
+def series_bounds(group: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Start and end (exclusive) of each run of equal codes in a sorted array"""
+    if len(group) == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    starts = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+    ends = np.r_[starts[1:], len(group)]
+    return starts, ends
+
+
+def detect_line_signals(line: np.ndarray,
+                        timestamp: np.ndarray,
+                        public_pct: np.ndarray,
+                        money_pct: np.ndarray,
+                        starts: np.ndarray,
+                        ends: np.ndarray,
+                        signals: Optional[LineSignals] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sharp money, reverse line movement and steam flags for time-ordered series
+
+    Rows between starts[i] and ends[i] form series i, oldest first.
+    Returns (sharp_money, reverse_line_movement, steam_move) boolean arrays.
+    """
+    signals = signals or LineSignals()
+    counts = ends - starts
+    last = ends - 1
+    public = np.where(np.isnan(public_pct), signals.default_percentage, public_pct)
+    money = np.where(np.isnan(money_pct), signals.default_percentage, money_pct)
+
+    # Sharp money: public and money split widely on any of the latest quotes
+    split = np.abs(public - money) > signals.sharp_split
+    sharp = np.zeros(len(starts), dtype=bool)
+    for back in range(signals.sharp_window):
+        rows = last - back
+        sharp |= (rows >= starts) & split[np.maximum(rows, 0)]
+    sharp &= counts >= signals.sharp_window
+
+    # Reverse line movement: latest move goes against the public side
+    has_previous = counts >= 2
+    previous = np.where(has_previous, last - 1, last)
+    step = line[last] - line[previous]
+    latest_public = public[last]
+    rlm = has_previous & (
+        ((latest_public > signals.rlm_public_high) & (step < 0)) |
+        ((latest_public < signals.rlm_public_low) & (step > 0))
+    )
+
+    # Steam: a large move inside the recent window, made quickly
+    window_start = np.maximum(starts, ends - signals.steam_window)
+    with np.errstate(invalid='ignore'):
+        steam = has_previous & (
+            (np.abs(line[last] - line[window_start]) > signals.steam_points) &
+            (timestamp[last] - timestamp[window_start] < signals.steam_seconds)
+        )
+
+    return sharp, rlm, steam
+
+
+class LineHistoryStore:
+    """
+    Append-only columnar quote history.
+
+    With a path, columns are memory-mapped .npy files that grow by doubling,
+    and the dictionaries and row count live in meta.json. Without one, the
+    same columns are plain in-memory arrays.
+    """
+
+    META_FILE = 'meta.json'
+
+    def __init__(self, path: Optional[str] = None, initial_capacity: int = 65536):
+        self.path = path
+        self.length = 0
+        self.dictionaries: Dict[str, _Dictionary] = {name: _Dictionary() for name in CATEGORICAL}
+        self._columns: Dict[str, np.ndarray] = {}
+
+        capacity = initial_capacity
+        if path:
+            os.makedirs(path, exist_ok=True)
+            meta_path = os.path.join(path, self.META_FILE)
+            if os.path.exists(meta_path):
+                with open(meta_path) as f:
+                    meta = json.load(f)
+                self.length = meta['length']
+                capacity = max(meta['capacity'], initial_capacity)
+                self.dictionaries = {
+                    name: _Dictionary(meta['dictionaries'].get(name, [])) for name in CATEGORICAL
+                }
+        self._allocate(capacity)
+
+    # Storage
+
+    @property
+    def capacity(self) -> int:
+        return len(self._columns['timestamp'])
+
+    def _column_path(self, name: str) -> str:
+        return os.path.join(self.path, f"{name}.npy")
+
+    def _allocate(self, capacity: int):
+        """Create or grow every column to capacity, keeping existing rows"""
+        for name, dtype in COLUMNS.items():
+            old = self._columns.get(name)
+            if not self.path:
+                column = np.empty(capacity, dtype=dtype)
+                if old is not None:
+                    column[:self.length] = old[:self.length]
+                self._columns[name] = column
+                continue
+
+            file_path = self._column_path(name)
+            if old is None and os.path.exists(file_path):
+                existing = np.load(file_path, mmap_mode='r+')
+                if len(existing) >= capacity and existing.dtype == dtype:
+                    self._columns[name] = existing
+                    continue
+                old = existing
+
+            if old is None:
+                self._columns[name] = np.lib.format.open_memmap(file_path, mode='w+', dtype=dtype, shape=(capacity,))
+                continue
+
+            # Grow into a new file, then swap it in
+            tmp_path = f"{file_path}.tmp"
+            column = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=dtype, shape=(capacity,))
+            column[:self.length] = old[:self.length]
+            column.flush()
+            del old
+            self._columns.pop(name, None)
+            os.replace(tmp_path, file_path)
+            self._columns[name] = np.load(file_path, mmap_mode='r+')
+
+    def _reserve(self, rows: int):
+        needed = self.length + rows
+        if needed > self.capacity:
+            capacity = self.capacity
+            while capacity < needed:
+                capacity *= 2
+            if self.path:
+                logger.info(f"Growing line history {self.path} to {capacity} rows")
+            self._allocate(capacity)
+
+    def flush(self):
+        """Persist column data, dictionaries and row count"""
+        if not self.path:
+            return
+        for column in self._columns.values():
+            column.flush()
+        meta = {
+            'length': self.length,
+            'capacity': self.capacity,
+            'dictionaries': {name: d.values for name, d in self.dictionaries.items()}
+        }
+        tmp_path = os.path.join(self.path, f"{self.META_FILE}.tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, os.path.join(self.path, self.META_FILE))
+
+    # Appends
+
+    def append_columns(self,
+                       game: Sequence[int],
+                       book: Sequence[int],
+                       market: Sequence[int],
+                       outcome: Sequence[int],
+                       price: Sequence[float],
+                       point: Sequence[float],
+                       timestamp: Sequence[float],
+                       public_pct: Optional[Sequence[float]] = None,
+                       money_pct: Optional[Sequence[float]] = None) -> int:
+        """Append already-encoded rows; returns the number appended"""
+        rows = len(timestamp)
+        if rows == 0:
+            return 0
+        self._reserve(rows)
+        start, end = self.length, self.length + rows
+        values = {
+            'game': game, 'book': book, 'market': market, 'outcome': outcome,
+            'price': price, 'point': point, 'timestamp': timestamp,
+            'public_pct': np.nan if public_pct is None else public_pct,
+            'money_pct': np.nan if money_pct is None else money_pct,
+        }
+        for name, value in values.items():
+            self._columns[name][start:end] = value
+        self.length = end
+        return rows
+
+    def append_records(self, records: Iterable[Dict[str, Any]], game_id: Optional[str] = None) -> int:
+        """
+        Append quote dicts in the analytics format: selection, bet_type, line,
+        timestamp and optionally game_id, sportsbook, odds, public_percentage
+        and money_percentage
+        """
+        encode = {name: d.encode for name, d in self.dictionaries.items()}
+        columns = {name: [] for name in COLUMNS}
+        for record in records:
+            line = record.get('line')
+            columns['game'].append(encode['game'](str(record.get('game_id', game_id))))
+            columns['book'].append(encode['book'](record.get('sportsbook') or ''))
+            columns['market'].append(encode['market'](record['bet_type']))
+            columns['outcome'].append(encode['outcome'](record['selection']))
+            columns['price'].append(record.get('odds', np.nan))
+            columns['point'].append(np.nan if line is None else line)
+            columns['timestamp'].append(epoch_seconds(record['timestamp']))
+            columns['public_pct'].append(record.get('public_percentage', np.nan))
+            columns['money_pct'].append(record.get('money_percentage', np.nan))
+        return self.append_columns(**{name: np.array(values, dtype=COLUMNS[name])
+                                      for name, values in columns.items()})
+
+    def ingest_odds_api(self, events: List[Dict[str, Any]], fetched_at: Optional[datetime] = None) -> int:
+        """
+        Parse an Odds API /odds payload straight into the columns.
+
+        Spread and moneyline outcomes are keyed by team abbreviation, totals by
+        Over/Under. Each quote is stamped with its market's last_update, falling
+        back to the bookmaker's, then to fetched_at.
+        """
+        fallback = epoch_seconds(fetched_at or datetime.now(timezone.utc))
+        encode_game = self.dictionaries['game'].encode
+        encode_book = self.dictionaries['book'].encode
+        encode_market = self.dictionaries['market'].encode
+        encode_outcome = self.dictionaries['outcome'].encode
+
+        game, book, market, outcome, price, point, timestamp = [], [], [], [], [], [], []
+        for event in events:
+            game_id = event.get('id') or f"{event.get('away_team', '')}@{event.get('home_team', '')}"
+            game_code = encode_game(game_id)
+            for bookmaker in event.get('bookmakers', ()):
+                book_code = encode_book(bookmaker.get('key') or bookmaker.get('title', ''))
+                book_updated = bookmaker.get('last_update')
+                for market_data in bookmaker.get('markets', ()):
+                    market_key = market_data.get('key', '')
+                    market_code = encode_market(ODDS_API_MARKETS.get(market_key, market_key))
+                    updated = market_data.get('last_update') or book_updated
+                    quoted_at = epoch_seconds(updated) if updated else fallback
+                    for quote in market_data.get('outcomes', ()):
+                        name = quote.get('name', '')
+                        if market_key != 'totals':
+                            name = team_abbreviation(name, default=name)
+                        game.append(game_code)
+                        book.append(book_code)
+                        market.append(market_code)
+                        outcome.append(encode_outcome(name))
+                        price.append(quote.get('price', np.nan))
+                        point.append(quote.get('point', np.nan))
+                        timestamp.append(quoted_at)
+
+        return self.append_columns(game, book, market, outcome, price, point, timestamp)
+
+    # Queries
+
+    def column(self, name: str) -> np.ndarray:
+        """Live view of a column's rows (no copy)"""
+        return self._columns[name][:self.length]
+
+    def select(self,
+               game_ids: Optional[Sequence[str]] = None,
+               markets: Optional[Sequence[str]] = None,
+               since: Optional[Any] = None) -> np.ndarray:
+        """Row indices matching the filters"""
+        mask = np.ones(self.length, dtype=bool)
+        for name, values in (('game', game_ids), ('market', markets)):
+            if values is not None:
+                lookup = self.dictionaries[name].lookup
+                codes = [code for code in (lookup(value) for value in values) if code is not None]
+                mask &= np.isin(self.column(name), codes)
+        if since is not None:
+            mask &= self.column('timestamp') >= epoch_seconds(since)
+        return np.flatnonzero(mask)
+
+    def line_movements(self,
+                       game_ids: Optional[Sequence[str]] = None,
+                       markets: Optional[Sequence[str]] = None,
+                       signals: Optional[LineSignals] = None) -> LineMovementFrame:
+        """
+        Opening/current line, movement and signals for every (game, book,
+        market, outcome) series, in order of each series' first quote. Books
+        are kept apart so a move is never read from one book's quote to another's.
+        """
+        rows = self.select(game_ids, markets) if (game_ids is not None or markets is not None) \
+            else np.arange(self.length)
+
+        game = self.column('game')[rows]
+        book = self.column('book')[rows]
+        market = self.column('market')[rows]
+        outcome = self.column('outcome')[rows]
+        timestamp = self.column('timestamp')[rows]
+        point = self.column('point')[rows]
+        # The line is the point where the market has one, otherwise the price
+        line = np.where(np.isnan(point), self.column('price')[rows], point)
+
+        # Mixed-radix key over the dictionary sizes, so no field can spill into another
+        book_count, market_count, outcome_count = (
+            len(self.dictionaries[name].values) or 1 for name in ('book', 'market', 'outcome'))
+        series_key = ((game.astype(np.int64) * book_count + book) * market_count + market) * outcome_count + outcome
+        series, _ = pd.factorize(series_key)  # numbered by first appearance
+        order = np.lexsort((timestamp, series))
+
+        series = series[order]
+        line, timestamp = line[order], timestamp[order]
+        public_pct = self.column('public_pct')[rows][order]
+        money_pct = self.column('money_pct')[rows][order]
+        starts, ends = series_bounds(series)
+        first, last = starts, ends - 1
+
+        sharp, rlm, steam = detect_line_signals(line, timestamp, public_pct, money_pct, starts, ends, signals)
+
+        opening, current = line[first], line[last]
+        movement = current - opening
+        with np.errstate(divide='ignore', invalid='ignore'):
+            movement_percentage = np.where(opening != 0, movement / np.abs(opening) * 100, 0.0)
+
+        return LineMovementFrame(
+            game_ids=self.dictionaries['game'].decode(game[order][first]),
+            books=self.dictionaries['book'].decode(book[order][first]),
+            markets=self.dictionaries['market'].decode(market[order][first]),
+            outcomes=self.dictionaries['outcome'].decode(outcome[order][first]),
+            quotes=ends - starts,
+            opening_line=opening,
+            current_line=current,
+            movement=movement,
+            movement_percentage=movement_percentage,
+            public_percentage=public_pct[last],
+            money_percentage=money_pct[last],
+            sharp_money=sharp,
+            reverse_line_movement=rlm,
+            steam_move=steam
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'rows': self.length,
+            'capacity': self.capacity,
+            'memory_mapped': bool(self.path),
+            'games': len(self.dictionaries['game'].values),
+            'books': len(self.dictionaries['book'].values)
+        }
+
+
+class LineHistoryArchive:
+    """One memory-mapped LineHistoryStore per season under base_dir"""
+
+    def __init__(self, base_dir: str = 'data/line_history', initial_capacity: int = 65536):
+        self.base_dir = base_dir
+        self.initial_capacity = initial_capacity
+        self._stores: Dict[int, LineHistoryStore] = {}
+
+    def season(self, season: int) -> LineHistoryStore:
+        store = self._stores.get(season)
+        if store is None:
+            store = self._stores[season] = LineHistoryStore(
+                os.path.join(self.base_dir, str(season)), self.initial_capacity
+            )
+        return store
+
+    def flush(self):
+        for store in self._stores.values():
+            store.flush()
@@ -12,8 +12,8 @@ Handles various notification channels including:
 import asyncio
 import aiohttp
 import smtplib
-from email.mime.text import MimeText
-from email.mime.multipart import MimeMultipart
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
 from typing import Dict, List, Optional, Union
 from dataclasses import dataclass
 from datetime import datetime
@@ -164,14 +164,14 @@ class NotificationSystem:
                 return False
 
             # Create email
-            msg = MimeMultipart()
+            msg = MIMEMultipart()
             msg['From'] = self.smtp_username
             msg['To'] = ', '.join(recipients)
             msg['Subject'] = f"[{alert.priority.name}] {alert.title}"
 
             # Email body
             body = self._format_email_body(alert)
-            msg.attach(MimeText(body, 'html'))
+            msg.attach(MIMEText(body, 'html'))
 
             # Send email
             with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
@@ -6,6 +6,7 @@ Provides real-time accuracy metrics and performance analytics
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
+import asyncio
 import logging
 
 from ..auth.middleware import get_current_user
@@ -13,6 +14,7 @@ from ..auth.access_control import require_feature, rate_limit, SubscriptionTier
 from ..accuracy.calculation_engine import accuracy_engine
 from ..accuracy.result_collector import result_collector
 from ..accuracy.models import AccuracySnapshot, PerformanceHistory
+from ..database.async_connection import async_db
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +28,7 @@ async def get_live_accuracy(current_user: dict = Depends(get_current_user)):
     """
     try:
         # Create live accuracy snapshot
-        snapshot_result = accuracy_engine.create_accuracy_snapshot('live')
+        snapshot_result = await accuracy_engine.create_accuracy_snapshot('live')
         
         if not snapshot_result['success']:
             raise HTTPException(status_code=500, detail="Failed to generate accuracy snapshot")
@@ -72,20 +74,14 @@ async def get_weekly_accuracy(
         start_date = datetime(season, 9, 1) + timedelta(weeks=week-1)
         end_date = start_date + timedelta(days=6)
         
-        # Get accuracy for each prediction type
-        accuracy_data = {}
+        # Get accuracy for each prediction type and overall, concurrently on the read pool
         prediction_types = ['game', 'ats', 'total', 'prop']
-        
-        for pred_type in prediction_types:
-            type_accuracy = accuracy_engine.calculate_period_accuracy(
-                'weekly', start_date, end_date, pred_type
-            )
-            accuracy_data[pred_type] = type_accuracy
-        
-        # Get overall weekly accuracy
-        overall_accuracy = accuracy_engine.calculate_period_accuracy(
-            'weekly', start_date, end_date
+        *type_accuracies, overall_accuracy = await asyncio.gather(
+            *(accuracy_engine.calculate_period_accuracy('weekly', start_date, end_date, pred_type)
+              for pred_type in prediction_types),
+            accuracy_engine.calculate_period_accuracy('weekly', start_date, end_date)
         )
+        accuracy_data = dict(zip(prediction_types, type_accuracies))
         
         return {
             "success": True,
@@ -124,7 +120,7 @@ async def get_advanced_analytics(
         start_date = end_date - timedelta(days=days)
         
         # Get detailed accuracy analysis
-        accuracy_data = accuracy_engine.calculate_period_accuracy(
+        accuracy_data = await accuracy_engine.calculate_period_accuracy(
             'monthly', start_date, end_date, prediction_type
         )
         
@@ -200,15 +196,19 @@ async def get_performance_history(
         performance_data = []
         
         if period_type == "weekly":
-            for week in range(max(1, 18 - limit + 1), 19):
-                # Calculate weekly performance
+            weeks = range(max(1, 18 - limit + 1), 19)
+            week_dates = []
+            for week in weeks:
                 start_date = datetime(season, 9, 1) + timedelta(weeks=week-1)
-                end_date = start_date + timedelta(days=6)
-                
-                weekly_data = accuracy_engine.calculate_period_accuracy(
-                    'weekly', start_date, end_date
-                )
-                
+                week_dates.append((start_date, start_date + timedelta(days=6)))
+            
+            # Calculate weekly performance concurrently on the read pool
+            weekly_results = await asyncio.gather(*(
+                accuracy_engine.calculate_period_accuracy('weekly', start_date, end_date)
+                for start_date, end_date in week_dates
+            ))
+            
+            for week, (start_date, end_date), weekly_data in zip(weeks, week_dates, weekly_results):
                 performance_data.append({
                     "period": f"Week {week}",
                     "start_date": start_date.isoformat(),
@@ -292,6 +292,17 @@ async def get_roi_analysis(
         logger.error(f"Error getting ROI analysis: {e}")
         raise HTTPException(status_code=500, detail="Failed to retrieve ROI analysis")
 
+@router.get("/pool-metrics")
+async def get_pool_metrics(current_user: dict = Depends(get_current_user)):
+    """
+    Get accuracy database pool occupancy and connection wait times
+    """
+    return {
+        "success": True,
+        "pools": async_db.get_pool_metrics(),
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
 # Helper functions
 async def _get_trend_analysis(days: int, prediction_type: Optional[str]) -> Dict:
     """Get trend analysis for the specified period"""
@@ -19,9 +19,11 @@ from performance_endpoints import router as performance_router
 from clean_predictions_endpoints import router as predictions_router
 
 # Import performance optimization services
-from performance.optimized_prediction_service import get_optimized_service
-from performance.database_optimizer import get_database_optimizer
-from performance.performance_monitor import get_performance_monitor
+from src.performance.optimized_prediction_service import get_optimized_service
+from src.performance.database_optimizer import get_database_optimizer
+from src.performance.performance_monitor import get_performance_monitor
+from src.performance.http_pool import http_registry
+from src.database.async_connection import async_db
 
 # Import automated learning system
 from services.automated_learning_system import AutomatedLearningSystem
@@ -125,6 +127,11 @@ async def lifespan(app: FastAPI):
         monitor = await get_performance_monitor()
         await monitor.stop_monitoring()
 
+        await http_registry.close()
+        http_registry.close_sync()
+
+        await async_db.dispose()
+
         logger.info("✅ Performance services shutdown complete")
 
     except Exception as e:
@@ -12,9 +12,13 @@ from datetime import datetime, timedelta
 import aiohttp
 import json
 import os
+import time
 
 from ..cache.cache_manager import CacheManager
 from ..cache.health_monitor import CacheHealthMonitor
+from ..performance.tracing import traced, annotate
+from ..performance.http_pool import get_http_session
+from .hedging import HedgeConfig, SourceLatencyTracker, hedged_race
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -87,7 +91,8 @@ class APIClientManager:
     Includes cache integration for improved performance and reduced API calls.
     """
     
-    def __init__(self, cache_manager: Optional[CacheManager] = None):
+    def __init__(self, cache_manager: Optional[CacheManager] = None,
+                 hedge_config: Optional[HedgeConfig] = None):
         self.configs: Dict[DataSource, APIConfig] = {}
         self.clients: Dict[DataSource, aiohttp.ClientSession] = {}
         self.last_request_times: Dict[DataSource, datetime] = {}
@@ -95,6 +100,7 @@ class APIClientManager:
         self.circuit_breaker: Dict[DataSource, datetime] = {}
         self.cache_manager = cache_manager or CacheManager()
         self.cache_health_monitor = CacheHealthMonitor(self.cache_manager)
+        self.latency_tracker = SourceLatencyTracker(hedge_config)
         self._load_configuration()
     
     def _load_configuration(self):
@@ -158,7 +164,6 @@ class APIClientManager:
             if not config:
                 continue
                 
-            timeout = aiohttp.ClientTimeout(total=config.timeout)
             headers = {"User-Agent": "NFL-Predictor/1.0"}
             
             # Add API key headers based on source
@@ -170,15 +175,15 @@ class APIClientManager:
                 headers["X-RapidAPI-Key"] = config.api_key
                 headers["X-RapidAPI-Host"] = "api-american-football.p.rapidapi.com"
             
-            self.clients[source] = aiohttp.ClientSession(
-                timeout=timeout,
-                headers=headers
+            # Sessions share the process-wide connection pool
+            self.clients[source] = get_http_session(
+                f"api_client:{source.value}",
+                headers=headers,
+                timeout=config.timeout
             )
     
     async def _close_clients(self):
-        """Close all HTTP client sessions"""
-        for client in self.clients.values():
-            await client.close()
+        """Release HTTP client sessions (the shared registry owns them)"""
         self.clients.clear()
     
     def _is_rate_limited(self, source: DataSource) -> bool:
@@ -255,6 +260,7 @@ class APIClientManager:
         config = self.configs[source]
         client = self.clients[source]
         url = f"{config.base_url}/{endpoint.lstrip('/')}"
+        started = time.monotonic()
         
         try:
             async with client.get(url, params=params) as response:
@@ -272,6 +278,9 @@ class APIClientManager:
                 
                 data = await response.json()
                 self._record_success(source)
+                # Only successes feed the latency percentiles; failures are often
+                # fast and cancelled hedges are censored, so both would skew them
+                self.latency_tracker.record(source, time.monotonic() - started)
                 return data
                 
         except aiohttp.ClientError as e:
@@ -281,6 +290,7 @@ class APIClientManager:
             self._record_error(source, ErrorType.INVALID_DATA)
             raise Exception(f"Invalid JSON from {source.value}: {str(e)}")
     
+    @traced("api.fetch_with_cache", stage="api")
     async def fetch_with_cache(
         self,
         source: DataSource,
@@ -302,6 +312,7 @@ class APIClientManager:
         
         # Add source and endpoint to cache key for uniqueness
         cache_key = f"{cache_key}:{source.value}:{endpoint.replace('/', '_')}"
+        annotate(source=source.value, endpoint=endpoint)
         
         # Check if cache should be used based on health
         if not self.cache_health_monitor.should_use_cache():
@@ -314,6 +325,8 @@ class APIClientManager:
         cached_data = self.cache_manager.get(cache_key)
         cache_response_time = (datetime.utcnow() - start_time).total_seconds()
         
+        annotate(cache_hit=bool(cached_data))
+        
         if cached_data:
             self.cache_health_monitor.record_cache_hit(cache_response_time)
             logger.info(f"Cache hit for {source.value} - age: {cached_data['age_minutes']:.1f} minutes")
@@ -445,34 +458,37 @@ class APIClientManager:
     ) -> APIResponse:
         """
         Fetch data with primary sources first, then fallback sources.
-        Uses cache-first strategy for improved performance.
+        Uses cache-first strategy for improved performance. A slow source is
+        hedged with the next one after its latency percentile, and the first
+        response wins.
         """
         all_sources = primary_sources + fallback_sources
-        errors = []
         
-        for source in all_sources:
-            try:
-                logger.info(f"Attempting to fetch from {source.value}")
-                response = await self.fetch_with_cache(
-                    source, endpoint, params, week, cache_key_prefix
-                )
-                
-                # Add notification if using fallback source
-                if source in fallback_sources:
-                    response.notifications.append({
-                        "type": "info",
-                        "message": f"Using fallback data source: {source.value}",
-                        "source": source.value,
-                        "retryable": False
-                    })
-                
-                return response
-                
-            except Exception as e:
-                error_msg = f"{source.value}: {str(e)}"
-                errors.append(error_msg)
-                logger.error(f"Failed to fetch from {source.value}: {str(e)}")
-                continue
+        def log_result(source: DataSource, ok: bool, elapsed: float, result: Any):
+            if not ok:
+                logger.error(f"Failed to fetch from {source.value}: {str(result)}")
+        
+        outcome = await hedged_race(
+            self.latency_tracker.rank(primary_sources) + self.latency_tracker.rank(fallback_sources),
+            lambda source: self.fetch_with_cache(source, endpoint, params, week, cache_key_prefix),
+            self.latency_tracker,
+            on_result=log_result
+        )
+        errors = outcome.errors
+        
+        if outcome.succeeded:
+            response = outcome.value
+            
+            # Add notification if using fallback source
+            if outcome.source in fallback_sources:
+                response.notifications.append({
+                    "type": "info",
+                    "message": f"Using fallback data source: {outcome.source.value}",
+                    "source": outcome.source.value,
+                    "retryable": False
+                })
+            
+            return response
         
         # All sources failed - try to get any cached data as last resort
         cache_key = self.cache_manager.get_cache_key_for_predictions(
@@ -621,5 +637,6 @@ class APIClientManager:
         
         # Add cache status
         status["cache"] = self.get_cache_status()
+        status["latency"] = self.latency_tracker.get_stats()
         
         return status
\ No newline at end of file
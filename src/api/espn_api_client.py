@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass
 
 from .client_manager import APIClientManager, DataSource, APIResponse
+from ..utils.team_index import team_abbreviation
 
 logger = logging.getLogger(__name__)
 
@@ -60,83 +61,12 @@ class ESPNAPIClient:
         return self._parse_team_from_name(display_name)
     
     def _standardize_team_abbreviation(self, abbr: str) -> str:
-        """Standardize ESPN team abbreviations to our format"""
-        abbr_mapping = {
-            "NE": "NE",
-            "NYJ": "NYJ",
-            "BUF": "BUF", 
-            "MIA": "MIA",
-            "PIT": "PIT",
-            "CLE": "CLE",
-            "BAL": "BAL",
-            "CIN": "CIN",
-            "HOU": "HOU",
-            "IND": "IND",
-            "JAX": "JAX",
-            "TEN": "TEN",
-            "KC": "KC",
-            "LV": "LV",
-            "LAC": "LAC",
-            "DEN": "DEN",
-            "DAL": "DAL",
-            "NYG": "NYG",
-            "PHI": "PHI",
-            "WSH": "WAS",  # ESPN uses WSH, we use WAS
-            "WAS": "WAS",
-            "CHI": "CHI",
-            "DET": "DET",
-            "GB": "GB",
-            "MIN": "MIN",
-            "ATL": "ATL",
-            "CAR": "CAR",
-            "NO": "NO",
-            "TB": "TB",
-            "ARI": "ARI",
-            "LAR": "LAR",
-            "SF": "SF",
-            "SEA": "SEA"
-        }
-        
-        return abbr_mapping.get(abbr.upper(), abbr.upper())
+        """Standardize ESPN team abbreviations to our format (e.g. ESPN uses WSH, we use WAS)"""
+        return team_abbreviation(abbr, default=abbr.upper())
     
     def _parse_team_from_name(self, team_name: str) -> str:
         """Parse team abbreviation from full team name"""
-        name_mapping = {
-            "Buffalo Bills": "BUF",
-            "Miami Dolphins": "MIA",
-            "New England Patriots": "NE",
-            "New York Jets": "NYJ",
-            "Baltimore Ravens": "BAL",
-            "Cincinnati Bengals": "CIN",
-            "Cleveland Browns": "CLE",
-            "Pittsburgh Steelers": "PIT",
-            "Houston Texans": "HOU",
-            "Indianapolis Colts": "IND",
-            "Jacksonville Jaguars": "JAX",
-            "Tennessee Titans": "TEN",
-            "Denver Broncos": "DEN",
-            "Kansas City Chiefs": "KC",
-            "Las Vegas Raiders": "LV",
-            "Los Angeles Chargers": "LAC",
-            "Dallas Cowboys": "DAL",
-            "New York Giants": "NYG",
-            "Philadelphia Eagles": "PHI",
-            "Washington Commanders": "WAS",
-            "Chicago Bears": "CHI",
-            "Detroit Lions": "DET",
-            "Green Bay Packers": "GB",
-            "Minnesota Vikings": "MIN",
-            "Atlanta Falcons": "ATL",
-            "Carolina Panthers": "CAR",
-            "New Orleans Saints": "NO",
-            "Tampa Bay Buccaneers": "TB",
-            "Arizona Cardinals": "ARI",
-            "Los Angeles Rams": "LAR",
-            "San Francisco 49ers": "SF",
-            "Seattle Seahawks": "SEA"
-        }
-        
-        return name_mapping.get(team_name, team_name[:3].upper())
+        return team_abbreviation(team_name, default=team_name[:3].upper())
     
     def _parse_game_status(self, status_data: Dict[str, Any]) -> tuple[str, bool]:
         """
@@ -0,0 +1,171 @@
+"""
+Hedged requests across redundant data sources.
+Starts the preferred source, fires the next one if it has not answered within
+that source's latency percentile, and returns the first valid response while
+cancelling the rest. Per-source latency windows drive both the hedge delay and
+the ordering of equally-ranked sources.
+"""
+
+import asyncio
+import logging
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HedgeConfig:
+    """Configuration for hedged fan-out"""
+    enabled: bool = True
+    delay_percentile: float = 95.0  # hedge once the source is slower than this percentile
+    min_delay: float = 0.05  # seconds
+    max_delay: float = 5.0  # seconds
+    default_delay: float = 1.0  # used until a source has min_samples
+    min_samples: int = 10
+    max_in_flight: int = 2  # paid sources are quota-limited, so cap concurrent attempts
+    window_size: int = 200
+
+
+@dataclass
+class HedgeOutcome:
+    """Result of a hedged race"""
+    source: Optional[Hashable] = None
+    value: Any = None
+    index: int = -1  # position of the winning source in the candidate order
+    launched: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> bool:
+        return self.source is not None
+
+
+class SourceLatencyTracker:
+    """Rolling per-source latency windows of successful attempts"""
+
+    def __init__(self, config: Optional[HedgeConfig] = None):
+        self.config = config or HedgeConfig()
+        self._samples: Dict[Hashable, Deque[float]] = {}
+
+    def record(self, source: Hashable, seconds: float):
+        samples = self._samples.get(source)
+        if samples is None:
+            samples = self._samples[source] = deque(maxlen=self.config.window_size)
+        samples.append(seconds)
+
+    def percentile(self, source: Hashable, q: float) -> Optional[float]:
+        samples = self._samples.get(source)
+        if not samples or len(samples) < self.config.min_samples:
+            return None
+        return float(np.percentile(np.fromiter(samples, dtype=np.float64, count=len(samples)), q))
+
+    def hedge_delay(self, source: Hashable) -> float:
+        """Seconds to wait on a source before hedging to the next one"""
+        delay = self.percentile(source, self.config.delay_percentile)
+        if delay is None:
+            return self.config.default_delay
+        return min(max(delay, self.config.min_delay), self.config.max_delay)
+
+    def rank(self, sources: Sequence[Hashable], tier: Optional[Callable[[Hashable], Any]] = None) -> List[Hashable]:
+        """Order sources by tier, then by median latency; unmeasured sources keep their place"""
+        def key(item):
+            position, source = item
+            median = self.percentile(source, 50)
+            return (
+                tier(source) if tier else 0,
+                median if median is not None else math.inf,
+                position
+            )
+        return [source for _, source in sorted(enumerate(sources), key=key)]
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        stats = {}
+        for source, samples in self._samples.items():
+            name = getattr(source, 'value', source)
+            stats[str(name)] = {
+                'samples': len(samples),
+                'p50': self.percentile(source, 50),
+                'p95': self.percentile(source, 95),
+                'p99': self.percentile(source, 99),
+                'hedge_delay': self.hedge_delay(source)
+            }
+        return stats
+
+
+async def hedged_race(
+    sources: Sequence[Hashable],
+    attempt: Callable[[Hashable], Awaitable[Any]],
+    tracker: SourceLatencyTracker,
+    is_valid: Callable[[Any], bool] = lambda value: value is not None,
+    on_result: Optional[Callable[[Hashable, bool, float, Any], None]] = None
+) -> HedgeOutcome:
+    """
+    Try sources in order with hedging and return the first valid response.
+
+    A source that fails or returns an invalid value hands off to the next one
+    immediately; one that is merely slow gets a hedge after its delay. At most
+    max_in_flight attempts run at once, and losers are cancelled. on_result is
+    called as (source, ok, seconds, value_or_exception) for every attempt that
+    completes.
+    """
+    config = tracker.config
+    max_in_flight = max(config.max_in_flight, 1) if config.enabled else 1
+    loop = asyncio.get_running_loop()
+    pending: Dict[asyncio.Future, tuple] = {}
+    outcome = HedgeOutcome()
+
+    def launch():
+        index = outcome.launched
+        source = sources[index]
+        task = asyncio.ensure_future(attempt(source))
+        pending[task] = (index, source, loop.time())
+        outcome.launched += 1
+
+    if not sources:
+        return outcome
+
+    try:
+        launch()
+        while pending:
+            timeout = None
+            if outcome.launched < len(sources) and len(pending) < max_in_flight:
+                # The hedge clock runs from the most recent launch
+                index, source, started = max(pending.values(), key=lambda p: p[0])
+                timeout = max(tracker.hedge_delay(source) - (loop.time() - started), 0.0)
+
+            done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                logger.info(f"Hedging to {getattr(sources[outcome.launched], 'value', sources[outcome.launched])}")
+                launch()
+                continue
+
+            for task in sorted(done, key=lambda t: pending[t][0]):
+                index, source, started = pending.pop(task)
+                elapsed = loop.time() - started
+                try:
+                    value, error = task.result(), None
+                except Exception as e:
+                    value, error = None, e
+                ok = error is None and is_valid(value)
+                if on_result:
+                    on_result(source, ok, elapsed, value if error is None else error)
+                if ok:
+                    outcome.source, outcome.value, outcome.index = source, value, index
+                    return outcome
+                name = getattr(source, 'value', source)
+                outcome.errors.append(f"{name}: {error if error is not None else 'invalid response'}")
+
+            # Failures hand off immediately rather than waiting out a hedge delay
+            if not pending and outcome.launched < len(sources):
+                launch()
+
+        return outcome
+
+    finally:
+        for task in pending:
+            task.cancel()
@@ -11,8 +11,12 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass
 import json
 import os
+import time
 from enum import Enum
 
+from .hedging import HedgeConfig, SourceLatencyTracker, hedged_race
+from ..performance.http_pool import get_http_session
+
 logger = logging.getLogger(__name__)
 
 class DataSource(Enum):
@@ -49,7 +53,7 @@ class LiveDataManager:
     Fallback: Public APIs (ESPN, NFL.com)
     """
     
-    def __init__(self):
+    def __init__(self, hedge_config: Optional[HedgeConfig] = None):
         self.session: Optional[aiohttp.ClientSession] = None
         
         # API Configuration - Paid APIs First
@@ -113,19 +117,17 @@ class LiveDataManager:
         # Track API usage and health
         self.api_health = {}
         self.api_usage = {}
+        self.latency_tracker = SourceLatencyTracker(hedge_config)
         
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers={'User-Agent': 'NFL-Predictor-API/1.0'}
-        )
+        # Shared pool session; the registry owns it, so it is released rather than closed
+        self.session = get_http_session('live_data_manager', timeout=30)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        self.session = None
     
     async def get_live_data(self, data_type: DataType, week: int, season: int = 2024) -> APIResponse:
         """
@@ -141,39 +143,44 @@ class LiveDataManager:
                 logger.info(f"📦 Using cached {data_type.value} data")
                 return cached_response
             
-            # Get prioritized API sources for this data type
-            sources = self._get_prioritized_sources(data_type)
+            # Get prioritized API sources for this data type, skipping unhealthy ones
+            sources = dict(self._get_prioritized_sources(data_type))
+            for api_name in list(sources):
+                if not self._is_api_healthy(api_name):
+                    logger.warning(f"⚠️ Skipping unhealthy API: {api_name}")
+                    del sources[api_name]
             
-            # Try each source in priority order
-            for api_name, config in sources:
-                try:
-                    logger.info(f"🎯 Trying {api_name} ({config['source'].value}) for {data_type.value}")
-                    
-                    # Check if API is healthy and within rate limits
-                    if not self._is_api_healthy(api_name):
-                        logger.warning(f"⚠️ Skipping unhealthy API: {api_name}")
-                        continue
-                    
-                    # Make API call
-                    response = await self._fetch_from_source(api_name, config, data_type, week, season)
-                    
-                    if response.success:
-                        # Cache successful response
-                        self._cache_response(cache_key, response, data_type)
-                        
-                        # Update API health
-                        self._update_api_health(api_name, True)
-                        
-                        logger.info(f"✅ Successfully fetched {data_type.value} from {api_name}")
-                        return response
-                    else:
-                        logger.warning(f"❌ Failed to fetch from {api_name}: {response.error}")
-                        self._update_api_health(api_name, False)
-                        
-                except Exception as e:
-                    logger.error(f"❌ Error with {api_name}: {e}")
-                    self._update_api_health(api_name, False)
-                    continue
+            async def attempt(api_name: str) -> APIResponse:
+                config = sources[api_name]
+                logger.info(f"🎯 Trying {api_name} ({config['source'].value}) for {data_type.value}")
+                started = time.monotonic()
+                response = await self._fetch_from_source(api_name, config, data_type, week, season)
+                # Only successes feed the latency percentiles; failures are often
+                # fast and cancelled hedges are censored, so both would skew them
+                if response.success:
+                    self.latency_tracker.record(api_name, time.monotonic() - started)
+                return response
+            
+            def record(api_name: str, success: bool, elapsed: float, result: Any):
+                self._update_api_health(api_name, success)
+                if not success:
+                    error = result.error if isinstance(result, APIResponse) else result
+                    logger.warning(f"❌ Failed to fetch from {api_name}: {error}")
+            
+            # Hedge slow sources with the next one; the fastest healthy response wins
+            outcome = await hedged_race(
+                list(sources),
+                attempt,
+                self.latency_tracker,
+                is_valid=lambda response: response.success,
+                on_result=record
+            )
+            
+            if outcome.succeeded:
+                response = outcome.value
+                self._cache_response(cache_key, response, data_type)
+                logger.info(f"✅ Successfully fetched {data_type.value} from {outcome.source}")
+                return response
             
             # All sources failed
             logger.error(f"❌ All sources failed for {data_type.value}")
@@ -199,10 +206,13 @@ class LiveDataManager:
             if data_type in config['supports']:
                 sources.append((api_name, config))
         
-        # Sort by priority (lower number = higher priority)
-        sources.sort(key=lambda x: x[1]['priority'])
+        # Sort by priority (lower number = higher priority), faster sources first within a priority
+        ranked = self.latency_tracker.rank(
+            [api_name for api_name, _ in sources],
+            tier=lambda api_name: self.api_configs[api_name]['priority']
+        )
         
-        return sources
+        return [(api_name, self.api_configs[api_name]) for api_name in ranked]
     
     async def _fetch_from_source(self, api_name: str, config: Dict, 
                                 data_type: DataType, week: int, season: int) -> APIResponse:
@@ -594,7 +604,8 @@ class LiveDataManager:
                 'healthy': health['healthy'],
                 'last_check': health['last_check'].isoformat() if health['last_check'] else None,
                 'supports': [dt.value for dt in config['supports']],
-                'has_key': bool(config['key'])
+                'has_key': bool(config['key']),
+                'latency': self.latency_tracker.get_stats().get(api_name)
             }
         
         return status
@@ -9,6 +9,8 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass
 
 from .client_manager import APIClientManager, DataSource, APIResponse
+from ..utils.team_index import team_abbreviation
+from ..analytics.line_history import LineHistoryArchive
 
 logger = logging.getLogger(__name__)
 
@@ -32,8 +34,9 @@ class OddsAPIClient:
     Fetches NFL game odds, spreads, totals, and moneylines.
     """
     
-    def __init__(self, client_manager: APIClientManager):
+    def __init__(self, client_manager: APIClientManager, line_history: Optional[LineHistoryArchive] = None):
         self.client_manager = client_manager
+        self.line_history = line_history  # per-season quote history fed from fresh responses
         self.sport = "americanfootball_nfl"
         self.regions = "us"
         self.markets = "h2h,spreads,totals"  # moneyline, spreads, totals
@@ -67,57 +70,7 @@ class OddsAPIClient:
         Convert full team names to standard abbreviations.
         The Odds API returns full team names, we need abbreviations.
         """
-        team_mapping = {
-            # AFC East
-            "Buffalo Bills": "BUF",
-            "Miami Dolphins": "MIA", 
-            "New England Patriots": "NE",
-            "New York Jets": "NYJ",
-            
-            # AFC North
-            "Baltimore Ravens": "BAL",
-            "Cincinnati Bengals": "CIN",
-            "Cleveland Browns": "CLE",
-            "Pittsburgh Steelers": "PIT",
-            
-            # AFC South
-            "Houston Texans": "HOU",
-            "Indianapolis Colts": "IND",
-            "Jacksonville Jaguars": "JAX",
-            "Tennessee Titans": "TEN",
-            
-            # AFC West
-            "Denver Broncos": "DEN",
-            "Kansas City Chiefs": "KC",
-            "Las Vegas Raiders": "LV",
-            "Los Angeles Chargers": "LAC",
-            
-            # NFC East
-            "Dallas Cowboys": "DAL",
-            "New York Giants": "NYG",
-            "Philadelphia Eagles": "PHI",
-            "Washington Commanders": "WAS",
-            
-            # NFC North
-            "Chicago Bears": "CHI",
-            "Detroit Lions": "DET",
-            "Green Bay Packers": "GB",
-            "Minnesota Vikings": "MIN",
-            
-            # NFC South
-            "Atlanta Falcons": "ATL",
-            "Carolina Panthers": "CAR",
-            "New Orleans Saints": "NO",
-            "Tampa Bay Buccaneers": "TB",
-            
-            # NFC West
-            "Arizona Cardinals": "ARI",
-            "Los Angeles Rams": "LAR",
-            "San Francisco 49ers": "SF",
-            "Seattle Seahawks": "SEA"
-        }
-        
-        return team_mapping.get(team_name, team_name)
+        return team_abbreviation(team_name, default=team_name)
     
     def _extract_odds_data(self, game_data: Dict[str, Any]) -> GameOdds:
         """Extract and structure odds data from API response"""
@@ -191,6 +144,18 @@ class OddsAPIClient:
             moneylines=moneylines
         )
     
+    def _record_line_history(self, response: APIResponse, year: int):
+        """Append freshly fetched quotes to the season's line history"""
+        if self.line_history is None or response.cached:
+            return
+        try:
+            store = self.line_history.season(year)
+            rows = store.ingest_odds_api(response.data, fetched_at=response.timestamp)
+            store.flush()
+            logger.debug(f"Recorded {rows} quotes in {year} line history")
+        except Exception as e:
+            logger.warning(f"Failed to record line history: {str(e)}")
+
     def _validate_response(self, data: Any) -> bool:
         """Validate API response structure and content"""
         if not isinstance(data, list):
@@ -256,6 +221,8 @@ class OddsAPIClient:
             if not self._validate_response(response.data):
                 raise ValueError("Invalid response structure from Odds API")
             
+            self._record_line_history(response, year)
+            
             # Parse and structure the data
             structured_games = []
             for game_data in response.data:
@@ -308,6 +275,8 @@ class OddsAPIClient:
             if not self._validate_response(response.data):
                 raise ValueError("Invalid spreads response from Odds API")
             
+            self._record_line_history(response, year)
+            
             # Extract only spread data
             spread_games = []
             for game_data in response.data:
@@ -352,6 +321,8 @@ class OddsAPIClient:
             if not self._validate_response(response.data):
                 raise ValueError("Invalid totals response from Odds API")
             
+            self._record_line_history(response, year)
+            
             # Extract only totals data
             totals_games = []
             for game_data in response.data:
@@ -21,7 +21,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from performance.optimized_prediction_service import (
+from src.performance.optimized_prediction_service import (
     OptimizedPredictionService,
     PredictionRequest,
     PredictionResponse,
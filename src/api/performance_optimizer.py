@@ -14,6 +14,10 @@ import json
 import hashlib
 from functools import wraps
 
+from ..performance.tracing import tracer
+from ..performance.http_pool import http_registry
+from ..database.async_connection import async_db
+
 logger = logging.getLogger(__name__)
 
 class PredictionCache:
@@ -257,6 +261,9 @@ class PerformanceMonitor:
                 "cache_stats": prediction_cache.get_stats()
             },
             "endpoints": endpoint_summaries,
+            "stages": tracer.histograms.summary(),
+            "http_pool": http_registry.get_metrics(),
+            "db_pool": async_db.get_pool_metrics(),
             "errors": dict(self.error_counts)
         }
 
@@ -286,7 +293,9 @@ def performance_tracked(endpoint_name: str):
             success = True
 
             try:
-                result = await func(*args, **kwargs)
+                # Root span for the request; cache, DB, model and LLM spans nest under it
+                with tracer.span(endpoint_name, stage="request", root=True):
+                    result = await func(*args, **kwargs)
                 return result
             except Exception as e:
                 success = False
@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 from .client_manager import APIClientManager, DataSource, APIResponse, ErrorType
+from .hedging import hedged_race
 from ..notifications.notification_service import NotificationService
 
 logger = logging.getLogger(__name__)
@@ -303,9 +304,13 @@ class SourceSwitcher:
             
             available_sources.append((source, combined_score))
         
-        # Sort by combined score (descending) and return sources
+        # Sort by combined score (descending), faster sources first within a score
         available_sources.sort(key=lambda x: x[1], reverse=True)
-        return [source for source, _ in available_sources]
+        scores = dict(available_sources)
+        return self.client_manager.latency_tracker.rank(
+            [source for source, _ in available_sources],
+            tier=lambda source: -scores[source]
+        )
     
     async def fetch_with_intelligent_fallback(
         self,
@@ -336,59 +341,52 @@ class SourceSwitcher:
                 }]
             )
         
-        errors = []
+        async def attempt(source: DataSource) -> APIResponse:
+            logger.info(f"Attempting {data_type} from {source.value} (priority {sources.index(source)+1}/{len(sources)})")
+            return await self.client_manager.fetch_with_cache(
+                source=source,
+                endpoint=endpoint,
+                params=params,
+                week=week,
+                cache_key_prefix=cache_key_prefix
+            )
+        
+        def record(source: DataSource, success: bool, response_time: float, result: Any):
+            # Cancelled hedges never complete, so only finished attempts count toward health
+            self._update_source_metrics(source, success=success, response_time=response_time)
+            if not success:
+                logger.warning(f"Failed to fetch {data_type} from {source.value}: {str(result)}")
+        
+        # Slow sources are hedged with the next one; the first response wins
+        outcome = await hedged_race(
+            sources, attempt, self.client_manager.latency_tracker, on_result=record
+        )
+        errors = outcome.errors
         
-        for i, source in enumerate(sources):
-            start_time = datetime.utcnow()
+        if outcome.succeeded:
+            source, response = outcome.source, outcome.value
             
-            try:
-                logger.info(f"Attempting {data_type} from {source.value} (priority {i+1}/{len(sources)})")
-                
-                response = await self.client_manager.fetch_with_cache(
-                    source=source,
-                    endpoint=endpoint,
-                    params=params,
-                    week=week,
-                    cache_key_prefix=cache_key_prefix
-                )
-                
-                # Record successful request
-                response_time = (datetime.utcnow() - start_time).total_seconds()
-                self._update_source_metrics(source, success=True, response_time=response_time)
-                
-                # Add notification if using fallback source
-                if i > 0:  # Not the first (primary) source
-                    source_name = source.value.replace('_', ' ').title()
+            # Add notification if using fallback source
+            if outcome.index > 0:  # Not the first (primary) source
+                source_name = source.value.replace('_', ' ').title()
+                response.notifications.append({
+                    "type": "info",
+                    "message": f"Using {source_name} as backup data source",
+                    "source": source.value,
+                    "retryable": False
+                })
+            
+            # Add data quality notification for fallback sources
+            if source in [DataSource.ESPN_API, DataSource.NFL_API]:
+                if data_type in ["ats_predictions", "totals_predictions"]:
                     response.notifications.append({
-                        "type": "info",
-                        "message": f"Using {source_name} as backup data source",
+                        "type": "warning",
+                        "message": f"Using calculated {data_type.replace('_', ' ')} - betting lines not available from {source.value.replace('_', ' ').title()}",
                         "source": source.value,
                         "retryable": False
                     })
-                
-                # Add data quality notification for fallback sources
-                if source in [DataSource.ESPN_API, DataSource.NFL_API]:
-                    if data_type in ["ats_predictions", "totals_predictions"]:
-                        response.notifications.append({
-                            "type": "warning",
-                            "message": f"Using calculated {data_type.replace('_', ' ')} - betting lines not available from {source.value.replace('_', ' ').title()}",
-                            "source": source.value,
-                            "retryable": False
-                        })
-                
-                return response
-                
-            except Exception as e:
-                # Record failed request
-                response_time = (datetime.utcnow() - start_time).total_seconds()
-                self._update_source_metrics(source, success=False, response_time=response_time)
-                
-                error_msg = f"{source.value}: {str(e)}"
-                errors.append(error_msg)
-                logger.warning(f"Failed to fetch {data_type} from {source.value}: {str(e)}")
-                
-                # Continue to next source
-                continue
+            
+            return response
         
         # All sources failed - try emergency cache fallback
         logger.error(f"All sources failed for {data_type}. Errors: {'; '.join(errors)}")
@@ -0,0 +1,343 @@
+"""
+Cache Codecs
+
+Self-describing serialization for cached values. Every payload starts with a
+header byte naming its format and compression, so reads dispatch directly
+instead of probing with try/except. Values written before the header existed
+(raw or gzipped pickle) are still recognised.
+
+Header byte layout: ``0b01FFFCCC`` - two marker bits, three format bits and
+three compression bits. The marker keeps headers clear of the pickle (0x80)
+and gzip (0x1f) magic bytes.
+
+orjson, msgpack, zstandard and lz4 are listed in the requirements files but
+stay optional: without them, formats fall back to pickle and compression to
+zlib. Payloads are still decoded by header, so a reader missing zstandard or
+lz4 raises CodecError on values another process compressed with them.
+"""
+
+import gzip
+import logging
+import pickle
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+HEADER_MARKER = 0x40
+HEADER_MARKER_MASK = 0xC0
+
+FORMAT_PICKLE = 0
+FORMAT_JSON = 1
+FORMAT_MSGPACK = 2
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_ZSTD = 2
+COMPRESSION_LZ4 = 3
+
+FORMAT_NAMES = {FORMAT_PICKLE: 'pickle', FORMAT_JSON: 'json', FORMAT_MSGPACK: 'msgpack'}
+COMPRESSION_NAMES = {
+    COMPRESSION_NONE: 'none', COMPRESSION_ZLIB: 'zlib',
+    COMPRESSION_ZSTD: 'zstd', COMPRESSION_LZ4: 'lz4'
+}
+
+# Non-native types must reach the strict default hook instead of being coerced
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_SUBCLASS
+    if ORJSON_AVAILABLE else 0
+)
+
+
+class CodecError(Exception):
+    """Raised when a cached payload cannot be decoded"""
+    pass
+
+
+def _reject(value: Any) -> Any:
+    raise TypeError(f"{type(value).__name__} is not plain data")
+
+
+def make_header(fmt: int, compression: int) -> int:
+    return HEADER_MARKER | (fmt << 3) | compression
+
+
+def parse_header(header: int) -> Optional[Tuple[int, int]]:
+    """Return (format, compression) for a codec header, or None for legacy payloads"""
+    if header & HEADER_MARKER_MASK != HEADER_MARKER:
+        return None
+    return (header >> 3) & 0x07, header & 0x07
+
+
+def namespace_of(key: Optional[str]) -> Optional[str]:
+    """Namespace segment of a CacheKey-style key (nfl:<namespace>:...)"""
+    if not key:
+        return None
+    parts = key.split(':', 2)
+    return parts[1] if len(parts) > 1 else None
+
+
+def default_compression() -> int:
+    """Fastest compressor installed: zstd, then lz4, then zlib"""
+    if ZSTD_AVAILABLE:
+        return COMPRESSION_ZSTD
+    if LZ4_AVAILABLE:
+        return COMPRESSION_LZ4
+    return COMPRESSION_ZLIB
+
+
+@dataclass
+class CodecStats:
+    """Size and latency totals for one format+compression pair"""
+    encodes: int = 0
+    decodes: int = 0
+    raw_bytes: int = 0
+    encoded_bytes: int = 0
+    encode_seconds: float = 0.0
+    decode_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'encodes': self.encodes,
+            'decodes': self.decodes,
+            'raw_bytes': self.raw_bytes,
+            'encoded_bytes': self.encoded_bytes,
+            'compression_ratio': self.raw_bytes / self.encoded_bytes if self.encoded_bytes else 0.0,
+            'avg_encode_ms': self.encode_seconds / self.encodes * 1000 if self.encodes else 0.0,
+            'avg_decode_ms': self.decode_seconds / self.decodes * 1000 if self.decodes else 0.0
+        }
+
+
+class CacheCodec:
+    """
+    Encodes and decodes cache payloads
+
+    Pickle is the default format since it round-trips any Python value
+    exactly. Namespaces known to hold plain JSON-like data can opt into
+    ``json`` (orjson) or ``msgpack``; values those formats cannot represent
+    fall back to pickle (tuples still come back as lists and non-finite
+    floats as None under json). Bodies above the compression threshold are
+    compressed with zstd, lz4 or zlib, and zstd can use a trained dictionary
+    per namespace.
+    """
+
+    def __init__(
+        self,
+        compression_threshold: int = 1024,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+        namespace_formats: Optional[Dict[str, str]] = None
+    ):
+        self.compression_threshold = compression_threshold
+        self.compression = self._resolve_compression(compression)
+        self.compression_level = compression_level
+        self.namespace_formats = {
+            namespace: self._resolve_format(name)
+            for namespace, name in (namespace_formats or {}).items()
+        }
+
+        # Trained zstd dictionaries by namespace, and by dictionary id for decoding
+        self._dictionaries: Dict[str, Any] = {}
+        self._dictionaries_by_id: Dict[int, Any] = {}
+
+        self._stats: Dict[str, CodecStats] = {}
+        self._stats_lock = threading.Lock()
+
+    def _resolve_compression(self, name: Optional[str]) -> int:
+        if name in (None, 'auto'):
+            return default_compression()
+        codes = {v: k for k, v in COMPRESSION_NAMES.items()}
+        if name not in codes:
+            raise ValueError(f"Unknown compression codec: {name}")
+        code = codes[name]
+        if (code == COMPRESSION_ZSTD and not ZSTD_AVAILABLE) or (code == COMPRESSION_LZ4 and not LZ4_AVAILABLE):
+            logger.warning(f"Compression codec {name} not installed, using {COMPRESSION_NAMES[default_compression()]}")
+            return default_compression()
+        return code
+
+    def _resolve_format(self, name: str) -> int:
+        codes = {v: k for k, v in FORMAT_NAMES.items()}
+        if name not in codes:
+            raise ValueError(f"Unknown serialization format: {name}")
+        code = codes[name]
+        if (code == FORMAT_JSON and not ORJSON_AVAILABLE) or (code == FORMAT_MSGPACK and not MSGPACK_AVAILABLE):
+            logger.warning(f"Serialization format {name} not installed, using pickle")
+            return FORMAT_PICKLE
+        return code
+
+    # Serialization
+
+    def dump(self, value: Any, namespace: Optional[str] = None) -> Tuple[int, bytes]:
+        """Serialize a value with its namespace's format, falling back to pickle"""
+        fmt = self.namespace_formats.get(namespace, FORMAT_PICKLE)
+        try:
+            if fmt == FORMAT_JSON:
+                return fmt, orjson.dumps(value, default=_reject, option=_ORJSON_OPTIONS)
+            if fmt == FORMAT_MSGPACK:
+                return fmt, msgpack.packb(value, default=_reject)
+        except (TypeError, ValueError, OverflowError):
+            pass
+        return FORMAT_PICKLE, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def pack(self, fmt: int, body: bytes, namespace: Optional[str] = None,
+             started: Optional[float] = None) -> bytes:
+        """
+        Compress a serialized body if it is large enough and prefix the header
+
+        ``started`` is the perf_counter() reading taken before dump(), so the
+        recorded encode latency covers both steps even when they run on
+        different threads.
+        """
+        started = time.perf_counter() if started is None else started
+        compression = COMPRESSION_NONE
+        raw_size = len(body)
+        if raw_size > self.compression_threshold:
+            compression = self.compression
+            body = self._compress(compression, body, namespace)
+        payload = bytes((make_header(fmt, compression),)) + body
+        self._record(payload[0], raw_size, len(payload), time.perf_counter() - started, encode=True)
+        return payload
+
+    def encode(self, value: Any, namespace: Optional[str] = None) -> bytes:
+        started = time.perf_counter()
+        fmt, body = self.dump(value, namespace)
+        return self.pack(fmt, body, namespace, started)
+
+    def decode(self, payload: bytes) -> Any:
+        start = time.perf_counter()
+        parsed = parse_header(payload[0]) if payload else None
+        if parsed is None:
+            return self._decode_legacy(payload)
+
+        fmt, compression = parsed
+        body = memoryview(payload)[1:]
+        if compression != COMPRESSION_NONE:
+            body = self._decompress(compression, body)
+
+        if fmt == FORMAT_PICKLE:
+            value = pickle.loads(body)
+        elif fmt == FORMAT_JSON:
+            value = orjson.loads(body)
+        elif fmt == FORMAT_MSGPACK:
+            value = msgpack.unpackb(body)
+        else:
+            raise CodecError(f"Unknown payload format {fmt}")
+
+        self._record(payload[0], len(body), len(payload), time.perf_counter() - start, encode=False)
+        return value
+
+    def _decode_legacy(self, payload: bytes) -> Any:
+        """Pre-header payloads: gzipped pickle or raw pickle"""
+        if payload[:2] == b'\x1f\x8b':
+            return pickle.loads(gzip.decompress(payload))
+        return pickle.loads(payload)
+
+    # Compression
+
+    def _compress(self, compression: int, body: bytes, namespace: Optional[str]) -> bytes:
+        if compression == COMPRESSION_ZSTD:
+            level = self.compression_level or 3
+            dictionary = self._dictionaries.get(namespace)
+            # Compressor objects are not thread-safe; they are cheap to build per call
+            if dictionary is not None:
+                return zstandard.ZstdCompressor(level=level, dict_data=dictionary).compress(body)
+            return zstandard.ZstdCompressor(level=level).compress(body)
+        if compression == COMPRESSION_LZ4:
+            return lz4.frame.compress(body, compression_level=self.compression_level or 0)
+        return zlib.compress(body, self.compression_level or 1)
+
+    def _decompress(self, compression: int, body: memoryview) -> bytes:
+        if compression == COMPRESSION_ZSTD:
+            if not ZSTD_AVAILABLE:
+                raise CodecError("Payload is zstd-compressed but zstandard is not installed")
+            dict_id = zstandard.get_frame_parameters(body).dict_id
+            if dict_id:
+                dictionary = self._dictionaries_by_id.get(dict_id)
+                if dictionary is None:
+                    raise CodecError(f"Missing zstd dictionary {dict_id}")
+                return zstandard.ZstdDecompressor(dict_data=dictionary).decompress(body)
+            return zstandard.ZstdDecompressor().decompress(body)
+        if compression == COMPRESSION_LZ4:
+            if not LZ4_AVAILABLE:
+                raise CodecError("Payload is lz4-compressed but lz4 is not installed")
+            return lz4.frame.decompress(body)
+        if compression == COMPRESSION_ZLIB:
+            return zlib.decompress(body)
+        raise CodecError(f"Unknown payload compression {compression}")
+
+    # Dictionaries
+
+    def train_dictionary(self, namespace: str, samples: List[Any], dict_size: int = 16 * 1024) -> bytes:
+        """
+        Train a zstd dictionary from sample values of one namespace
+
+        Returns the raw dictionary so it can be persisted and handed to
+        load_dictionary() in other processes that read the same keys.
+        """
+        if not ZSTD_AVAILABLE:
+            raise CodecError("Dictionary training requires zstandard")
+        bodies = [self.dump(sample, namespace)[1] for sample in samples]
+        dictionary = zstandard.train_dictionary(dict_size, bodies)
+        self._register_dictionary(namespace, dictionary)
+        return dictionary.as_bytes()
+
+    def load_dictionary(self, namespace: str, dict_bytes: bytes):
+        """Register a previously trained dictionary for a namespace"""
+        if not ZSTD_AVAILABLE:
+            raise CodecError("Dictionaries require zstandard")
+        self._register_dictionary(namespace, zstandard.ZstdCompressionDict(dict_bytes))
+
+    def _register_dictionary(self, namespace: str, dictionary: Any):
+        self._dictionaries[namespace] = dictionary
+        self._dictionaries_by_id[dictionary.dict_id()] = dictionary
+        logger.info(f"Registered zstd dictionary {dictionary.dict_id()} for namespace {namespace}")
+
+    # Metrics
+
+    def _record(self, header: int, raw_bytes: int, encoded_bytes: int, seconds: float, encode: bool):
+        fmt, compression = parse_header(header)
+        name = f"{FORMAT_NAMES.get(fmt, fmt)}+{COMPRESSION_NAMES.get(compression, compression)}"
+        with self._stats_lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = CodecStats()
+            if encode:
+                stats.encodes += 1
+                stats.encode_seconds += seconds
+            else:
+                stats.decodes += 1
+                stats.decode_seconds += seconds
+            stats.raw_bytes += raw_bytes
+            stats.encoded_bytes += encoded_bytes
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-codec size and latency stats"""
+        with self._stats_lock:
+            return {name: stats.to_dict() for name, stats in self._stats.items()}
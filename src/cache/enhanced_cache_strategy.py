@@ -8,7 +8,7 @@ cache warming, and performance monitoring for real-time data scenarios.
 import asyncio
 import logging
 import json
-import pickle
+import time
 from typing import Dict, List, Optional, Any, Callable, Union, Set
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
@@ -20,6 +20,10 @@ from concurrent.futures import ThreadPoolExecutor
 import redis.asyncio as redis
 from redis.exceptions import ConnectionError, TimeoutError
 
+from .codecs import CacheCodec, CodecError, namespace_of
+
+from ..performance.tracing import traced, annotate
+
 logger = logging.getLogger(__name__)
 
 
@@ -87,6 +91,12 @@ class CacheConfiguration:
     compression_threshold: int = 1024  # bytes
     batch_size: int = 100
 
+    # Codec settings
+    compression_codec: str = "auto"  # auto, zstd, lz4 or zlib
+    compression_level: Optional[int] = None
+    namespace_formats: Dict[str, str] = field(default_factory=dict)  # e.g. {"api": "json"}
+    offload_threshold: int = 256 * 1024  # bytes; larger payloads are coded off the event loop
+
     # Refresh settings
     refresh_threshold: float = 0.8  # Refresh when 80% of TTL elapsed
     refresh_concurrency: int = 5
@@ -187,6 +197,14 @@ class EnhancedCacheManager:
         # Thread pool for CPU-intensive operations
         self._thread_pool = ThreadPoolExecutor(max_workers=4)
 
+        # Payload codec
+        self.codec = CacheCodec(
+            compression_threshold=self.config.compression_threshold,
+            compression=self.config.compression_codec,
+            compression_level=self.config.compression_level,
+            namespace_formats=self.config.namespace_formats
+        )
+
         # Event handlers
         self._event_handlers: Dict[CacheEvent, List[Callable]] = {
             event: [] for event in CacheEvent
@@ -257,6 +275,7 @@ class EnhancedCacheManager:
             logger.warning(f"Redis connection failed: {e}")
             self._redis_healthy = False
 
+    @traced("cache.get", stage="cache")
     async def get(
         self,
         key: str,
@@ -282,16 +301,19 @@ class EnhancedCacheManager:
                 value = await self._redis_get(key)
                 if value is not None:
                     self._record_event(CacheEvent.HIT, key)
+                    annotate(tier="redis")
                     return value
 
             # Try memory cache
             value = self._memory_get(key)
             if value is not None:
                 self._record_event(CacheEvent.HIT, key)
+                annotate(tier="memory")
                 return value
 
             # Cache miss
             self._record_event(CacheEvent.MISS, key)
+            annotate(tier="miss")
 
             # Handle read-through strategy
             if strategy == CacheStrategy.READ_THROUGH and fallback_func:
@@ -334,7 +356,7 @@ class EnhancedCacheManager:
             success = False
 
             # Serialize and compress if needed
-            serialized_value = await self._serialize_value(value)
+            serialized_value = await self._serialize_value(value, key)
 
             # Write to Redis
             if self._redis_healthy and self._redis_client:
@@ -451,7 +473,7 @@ class EnhancedCacheManager:
             # Serialize all values
             serialized_data = {}
             for key, value in data.items():
-                serialized_data[key] = await self._serialize_value(value)
+                serialized_data[key] = await self._serialize_value(value, key)
 
             # Set in Redis using pipeline
             if self._redis_healthy and self._redis_client:
@@ -580,7 +602,12 @@ class EnhancedCacheManager:
             if serialized_value is None:
                 return None
 
-            return await self._deserialize_value(serialized_value)
+            return await self._deserialize_value(serialized_value, key)
+
+        except CodecError as e:
+            # Undecodable payload (e.g. missing dictionary); treat as a miss, Redis is fine
+            logger.warning(f"Undecodable cache payload for key {key}: {e}")
+            return None
 
         except Exception as e:
             logger.warning(f"Redis get error for key {key}: {e}")
@@ -616,7 +643,7 @@ class EnhancedCacheManager:
             for key, raw_value in zip(keys, raw_results):
                 if raw_value is not None:
                     try:
-                        results[key] = await self._deserialize_value(raw_value)
+                        results[key] = await self._deserialize_value(raw_value, key)
                     except Exception as e:
                         logger.warning(f"Error deserializing key {key}: {e}")
 
@@ -699,39 +726,40 @@ class EnhancedCacheManager:
                 del self._memory_cache[key]
                 del self._memory_timestamps[key]
 
-    async def _serialize_value(self, value: Any) -> bytes:
-        """Serialize value with optional compression"""
+    async def _serialize_value(self, value: Any, key: Optional[str] = None) -> bytes:
+        """Serialize value with the key's namespace codec, compressing large bodies off the event loop"""
         try:
-            # Use pickle for Python objects
-            serialized = pickle.dumps(value)
+            started = time.perf_counter()
+            namespace = namespace_of(key)
+            fmt, body = self.codec.dump(value, namespace)
 
-            # Compress if above threshold
-            if len(serialized) > self.config.compression_threshold:
-                import gzip
-                serialized = gzip.compress(serialized)
-
-            return serialized
+            if len(body) > self.config.offload_threshold:
+                return await asyncio.get_event_loop().run_in_executor(
+                    self._thread_pool, self.codec.pack, fmt, body, namespace, started
+                )
+            return self.codec.pack(fmt, body, namespace, started)
 
         except Exception as e:
             logger.error(f"Serialization error: {e}")
             raise
 
-    async def _deserialize_value(self, serialized_value: bytes) -> Any:
-        """Deserialize value with decompression"""
+    async def _deserialize_value(self, serialized_value: bytes, key: Optional[str] = None) -> Any:
+        """Deserialize value by its codec header, decoding large payloads off the event loop"""
         try:
-            # Try decompression first
-            try:
-                import gzip
-                decompressed = gzip.decompress(serialized_value)
-                return pickle.loads(decompressed)
-            except:
-                # Not compressed, try direct pickle
-                return pickle.loads(serialized_value)
+            if len(serialized_value) > self.config.offload_threshold:
+                return await asyncio.get_event_loop().run_in_executor(
+                    self._thread_pool, self.codec.decode, serialized_value
+                )
+            return self.codec.decode(serialized_value)
 
         except Exception as e:
-            logger.error(f"Deserialization error: {e}")
+            logger.error(f"Deserialization error for key {key}: {e}")
             raise
 
+    def train_codec_dictionary(self, namespace: str, samples: List[Any]) -> bytes:
+        """Train a zstd dictionary for a namespace from sample values; returns it for persistence"""
+        return self.codec.train_dictionary(namespace, samples)
+
     def _get_default_ttl(self, key: str) -> int:
         """Get default TTL based on key pattern"""
         if ":game:" in key and ":state" in key:
@@ -906,6 +934,7 @@ class EnhancedCacheManager:
                 'memory_cache_size': len(self._memory_cache),
                 'redis_healthy': self._redis_healthy
             },
+            'codecs': self.codec.get_stats(),
             'history': self._metric_history[-60:] if self._metric_history else []  # Last hour
         }
 
@@ -19,6 +19,8 @@ import random
 from aiohttp import ClientSession, ClientTimeout, ClientError
 from aiohttp.client_exceptions import ClientConnectionError, ClientResponseError
 
+from ..performance.http_pool import get_http_session, http_registry
+
 logger = logging.getLogger(__name__)
 
 
@@ -345,9 +347,8 @@ class ResilientConnection:
                 except asyncio.CancelledError:
                     pass
 
-            # Close HTTP session
-            if self.session and not self.session.closed:
-                await self.session.close()
+            # Release the shared HTTP session (the registry owns it)
+            self.session = None
 
             logger.info(f"Resilient connection to {self.service_name} shutdown")
 
@@ -411,16 +412,14 @@ class ResilientConnection:
         return await self.request("POST", endpoint, **kwargs)
 
     async def _create_session(self):
-        """Create new HTTP session"""
-        if self.session and not self.session.closed:
-            await self.session.close()
-
-        self.session = ClientSession(
-            timeout=self.timeout,
-            headers={
-                'User-Agent': 'NFL-Predictor-ResilientClient/1.0'
-            }
-        )
+        """Attach to the shared HTTP session for this service, replacing any previous one"""
+        name = f"resilient:{self.service_name}"
+        headers = {'User-Agent': 'NFL-Predictor-ResilientClient/1.0'}
+        if self.session is None:
+            self.session = get_http_session(name, headers=headers, timeout=self.timeout)
+        else:
+            # Reconnecting: a cached session would hand back the same object
+            self.session = await http_registry.reset_session(name, headers=headers, timeout=self.timeout)
 
     async def _health_check_loop(self):
         """Background health check loop"""
@@ -239,8 +239,8 @@ class PipelineIntegration:
         """Data validation handler for pipeline"""
         try:
             if 'games' in data:
-                for game in data['games']:
-                    validation_result = data_validator.validate_game_data(game)
+                reports = data_validator.validate_game_batch(data['games'])
+                for game, validation_result in zip(data['games'], reports):
                     if not validation_result.is_valid:
                         logger.warning(f"Game data validation failed: {validation_result.issues}")
                     elif validation_result.sanitized_data:
@@ -12,10 +12,13 @@ import logging
 from dataclasses import dataclass, asdict
 import json
 import math
+import os
 from enum import Enum
 
 from .ensemble_predictor import AdvancedEnsemblePredictor
 from .enhanced_game_models import EnhancedGamePredictor
+from .situation_index import SituationIndex, DEFAULT_INDEX_PATH
+from .decision_tables import DecisionTables
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -64,6 +67,11 @@ class GameState:
     week: int
     season: int
 
+    @property
+    def yards_to_goal(self) -> int:
+        """Yards between the possession team and the end zone it is attacking"""
+        return 100 - self.yard_line if self.possession == "away" else self.yard_line
+
 
 @dataclass
 class PredictionConfidence:
@@ -143,58 +151,76 @@ class NarratorInsight:
 class HistoricalComparator:
     """Compares current situations to historical games"""
 
-    def __init__(self):
-        self.historical_database = {}
-        self.situation_patterns = {}
+    # Situation -> outcome tracked by the situation index
+    SITUATION_OUTCOMES = {
+        GameSituation.FOURTH_DOWN: 'converted',
+        GameSituation.CRITICAL_THIRD_DOWN: 'converted',
+        GameSituation.RED_ZONE: 'touchdown',
+        GameSituation.GOAL_LINE: 'touchdown',
+        GameSituation.HAIL_MARY: 'touchdown',
+        GameSituation.TWO_MINUTE_WARNING: 'scored',
+        GameSituation.COMEBACK_ATTEMPT: 'won'
+    }
+
+    # Used only when no historical index is available
+    BASE_SUCCESS_RATES = {
+        GameSituation.FOURTH_DOWN: 0.45,
+        GameSituation.RED_ZONE: 0.67,
+        GameSituation.TWO_MINUTE_WARNING: 0.32,
+        GameSituation.GOAL_LINE: 0.78,
+        GameSituation.CRITICAL_THIRD_DOWN: 0.42,
+        GameSituation.COMEBACK_ATTEMPT: 0.23,
+        GameSituation.HAIL_MARY: 0.03
+    }
+
+    def __init__(self, situation_index: Optional[SituationIndex] = None,
+                 index_path: str = DEFAULT_INDEX_PATH):
+        self.situation_index = situation_index
+        if self.situation_index is None and os.path.exists(index_path):
+            try:
+                self.situation_index = SituationIndex.load(index_path)
+                logger.info(f"Loaded historical situation index from {index_path}")
+            except Exception as e:
+                logger.warning(f"Failed to load situation index from {index_path}: {e}")
+
+        if self.situation_index is None:
+            logger.warning("No historical situation index available - using base situation rates")
+
+    @staticmethod
+    def _state_features(game_state: GameState) -> Tuple[int, int, int, int, int, int]:
+        """Index features from the possession team's perspective"""
+        parts = game_state.time_remaining.split(':')
+        seconds_remaining = int(parts[0]) * 60 + int(parts[1])
+        score_diff = game_state.home_score - game_state.away_score
+        if game_state.possession == "away":
+            score_diff = -score_diff
+
+        # The index counts yards to the opponent's goal line (yardline_100)
+        return (game_state.down, game_state.yards_to_go, game_state.yards_to_goal,
+                score_diff, game_state.quarter, seconds_remaining)
 
     def find_similar_situations(self, game_state: GameState, limit: int = 5) -> List[Dict[str, Any]]:
         """Find historically similar situations"""
+        if self.situation_index is None:
+            return []
 
-        # Mock historical comparisons - in production, query historical database
-        similar_situations = [
-            {
-                "game_id": "2023_week15_chiefs_patriots",
-                "similarity_score": 0.92,
-                "context": "4th quarter comeback attempt, similar field position",
-                "outcome": "Successful drive, touchdown with 1:47 remaining",
-                "key_factors": ["elite quarterback", "home crowd", "weather conditions"],
-                "final_result": "Home team victory by 3 points"
-            },
-            {
-                "game_id": "2022_week8_bills_packers",
-                "similarity_score": 0.87,
-                "context": "Red zone possession, similar down and distance",
-                "outcome": "Field goal attempt, successful",
-                "key_factors": ["strong defense", "kicking conditions", "pressure situation"],
-                "final_result": "Away team victory by 1 point"
-            },
-            {
-                "game_id": "2023_week3_cowboys_giants",
-                "similarity_score": 0.83,
-                "context": "Two-minute warning, trailing by similar margin",
-                "outcome": "Turnover on downs, game over",
-                "key_factors": ["elite defense", "quarterback pressure", "crowd noise"],
-                "final_result": "Home team victory by 7 points"
-            }
-        ]
-
-        return similar_situations[:limit]
+        return self.situation_index.similar_situations(*self._state_features(game_state), limit=limit)
 
-    def calculate_situation_success_rate(self, situation_type: GameSituation, context: Dict[str, Any]) -> float:
+    def calculate_situation_success_rate(self, situation_type: GameSituation, context: Dict[str, Any],
+                                         game_state: Optional[GameState] = None) -> float:
         """Calculate success rate for similar historical situations"""
 
-        # Mock calculation - in production, analyze historical database
-        base_success_rates = {
-            GameSituation.FOURTH_DOWN: 0.45,
-            GameSituation.RED_ZONE: 0.67,
-            GameSituation.TWO_MINUTE_WARNING: 0.32,
-            GameSituation.GOAL_LINE: 0.78,
-            GameSituation.CRITICAL_THIRD_DOWN: 0.42,
-            GameSituation.COMEBACK_ATTEMPT: 0.23,
-            GameSituation.HAIL_MARY: 0.03
-        }
+        base_rate = None
+        outcome = self.SITUATION_OUTCOMES.get(situation_type)
+
+        if self.situation_index is not None and outcome is not None:
+            if game_state is not None:
+                base_rate = self.situation_index.outcome_rate(outcome, *self._state_features(game_state))
+            if base_rate is None and situation_type.value in self.situation_index.situation_rates:
+                base_rate = self.situation_index.situation_rates[situation_type.value][0]
 
-        base_rate = base_success_rates.get(situation_type, 0.50)
+        if base_rate is None:
+            base_rate = self.BASE_SUCCESS_RATES.get(situation_type, 0.50)
 
         # Adjust based on context factors
         adjustments = 0.0
@@ -250,9 +276,9 @@ class SituationAnalyzer:
             situations.append(GameSituation.CRITICAL_THIRD_DOWN)
 
         # Field position situations
-        if game_state.yard_line <= 20:
+        if game_state.yards_to_goal <= 20:
             situations.append(GameSituation.RED_ZONE)
-        if game_state.yard_line <= 5:
+        if game_state.yards_to_goal <= 5:
             situations.append(GameSituation.GOAL_LINE)
 
         # Score differential situations
@@ -401,8 +427,9 @@ class WeatherImpactAnalyzer:
 class DecisionEngine:
     """Makes 4th down and critical decision recommendations"""
 
-    def __init__(self):
+    def __init__(self, tables: Optional[DecisionTables] = None):
         self.decision_matrix = self._build_decision_matrix()
+        self.tables = tables if tables is not None else DecisionTables.load_or_build()
 
     def _build_decision_matrix(self) -> Dict[str, Dict[str, float]]:
         """Build decision success probability matrix"""
@@ -433,7 +460,7 @@ class DecisionEngine:
         if game_state.down != 4:
             return None
 
-        yard_line = game_state.yard_line
+        yard_line = game_state.yards_to_goal
         yards_to_go = game_state.yards_to_go
         time_remaining = self._parse_time_remaining(game_state.time_remaining)
         score_diff = game_state.home_score - game_state.away_score
@@ -502,107 +529,33 @@ class DecisionEngine:
     def _calculate_fg_success_probability(self, distance: int, context: Dict[str, Any]) -> float:
         """Calculate field goal success probability"""
 
-        # Base success rate by distance
-        if distance <= 30:
-            base_success = 0.95
-        elif distance <= 40:
-            base_success = 0.90
-        elif distance <= 50:
-            base_success = 0.80
-        else:
-            base_success = max(0.40, 0.90 - (distance - 30) * 0.03)
-
-        # Adjust for conditions
+        # Base success rate by distance is precomputed per yard line
         weather_impact = context.get('weather_impact', 0)
         pressure_impact = context.get('pressure_level', 0) * 0.1
 
-        return max(0.1, base_success - weather_impact - pressure_impact)
+        return self.tables.fg_success_probability(117 - distance, weather_impact, pressure_impact)
 
     def _calculate_conversion_probability(self, yards_to_go: int, field_position: int, context: Dict[str, Any]) -> float:
         """Calculate 4th down conversion probability"""
 
-        # Base success rates by distance
-        if yards_to_go == 1:
-            base_success = 0.65
-        elif yards_to_go <= 3:
-            base_success = 0.50
-        elif yards_to_go <= 6:
-            base_success = 0.35
-        else:
-            base_success = max(0.15, 0.50 - (yards_to_go - 3) * 0.05)
-
-        # Adjust for field position (easier in red zone)
-        if field_position <= 10:
-            base_success += 0.1
-        elif field_position <= 20:
-            base_success += 0.05
-
-        # Adjust for context
         offensive_strength = context.get('offensive_rating', 0.5)
         defensive_strength = context.get('defensive_rating', 0.5)
 
         strength_adjustment = (offensive_strength - defensive_strength) * 0.2
 
-        return max(0.05, min(0.95, base_success + strength_adjustment))
+        return self.tables.conversion_probability(yards_to_go, field_position, strength_adjustment)
 
     def _calculate_punt_value(self, field_position: int, time_remaining: int) -> float:
         """Calculate expected value of punting"""
-
-        # Expected field position for opponent
-        expected_opponent_position = max(20, field_position - 40)
-
-        # Value based on field position gained
-        field_position_value = (expected_opponent_position - 20) / 80
-
-        # Time factor (more valuable with more time remaining)
-        time_factor = min(1.0, time_remaining / 900)  # Normalize to 15 minutes
-
-        return field_position_value * 0.7 + time_factor * 0.3
+        return self.tables.punt_expected_value(field_position, time_remaining)
 
     def _calculate_fg_value(self, success_prob: float, score_diff: int, time_remaining: int) -> float:
         """Calculate expected value of field goal attempt"""
-
-        # Points value
-        points_value = success_prob * 3
-
-        # Situational adjustments
-        if score_diff <= -3:  # Trailing, need points
-            points_value *= 1.3
-        elif score_diff >= 7:  # Leading, less critical
-            points_value *= 0.8
-
-        # Time factor
-        if time_remaining < 120:  # Last 2 minutes
-            points_value *= 1.2
-
-        return points_value / 7  # Normalize to 0-1 scale (touchdown = 1)
+        return self.tables.fg_expected_value(success_prob, score_diff, time_remaining)
 
     def _calculate_go_for_it_value(self, success_prob: float, field_position: int, score_diff: int, time_remaining: int) -> float:
         """Calculate expected value of going for it"""
-
-        # Expected points if successful (varies by field position)
-        if field_position <= 10:
-            expected_points = 6.5  # High TD probability
-        elif field_position <= 20:
-            expected_points = 5.5
-        elif field_position <= 40:
-            expected_points = 4.0
-        else:
-            expected_points = 3.0
-
-        # Calculate value
-        success_value = success_prob * expected_points
-        failure_cost = (1 - success_prob) * 2  # Cost of giving opponent good field position
-
-        net_value = success_value - failure_cost
-
-        # Situational adjustments
-        if score_diff <= -7:  # Trailing significantly, need to be aggressive
-            net_value *= 1.4
-        elif time_remaining < 300 and score_diff < 0:  # Trailing with little time
-            net_value *= 1.6
-
-        return max(0, net_value / 7)  # Normalize to 0-1 scale
+        return self.tables.go_for_it_expected_value(success_prob, field_position, score_diff, time_remaining)
 
 
 class AIGameNarrator:
@@ -681,51 +634,16 @@ class AIGameNarrator:
         """Calculate next scoring probability"""
 
         possessing_team = game_state.possession
-        field_position = game_state.yard_line
+        field_position = game_state.yards_to_goal
         down = game_state.down
         yards_to_go = game_state.yards_to_go
 
-        # Base probabilities by field position
-        if field_position <= 10:
-            td_prob = 0.75
-            fg_prob = 0.20
-            no_score_prob = 0.05
-        elif field_position <= 20:
-            td_prob = 0.60
-            fg_prob = 0.30
-            no_score_prob = 0.10
-        elif field_position <= 40:
-            td_prob = 0.35
-            fg_prob = 0.45
-            no_score_prob = 0.20
-        else:
-            td_prob = 0.25
-            fg_prob = 0.35
-            no_score_prob = 0.40
-
-        # Adjust for down and distance
-        if down == 4:
-            if yards_to_go > 3:
-                td_prob *= 0.6
-                fg_prob *= 0.8
-                no_score_prob = 1 - td_prob - fg_prob
-        elif down == 3 and yards_to_go > 8:
-            td_prob *= 0.8
-            fg_prob *= 0.9
-
-        # Adjust for situations
-        if GameSituation.RED_ZONE in situations:
-            td_prob *= 1.2
-            fg_prob *= 1.1
-        if GameSituation.GOAL_LINE in situations:
-            td_prob *= 1.5
-            fg_prob *= 0.8
-
-        # Normalize probabilities
-        total = td_prob + fg_prob + no_score_prob
-        td_prob /= total
-        fg_prob /= total
-        no_score_prob /= total
+        # Field position, down/distance and situation adjustments are precomputed
+        td_prob, fg_prob, no_score_prob = self.decision_engine.tables.scoring_probabilities(
+            down, yards_to_go, field_position,
+            GameSituation.RED_ZONE in situations,
+            GameSituation.GOAL_LINE in situations
+        )
 
         # Determine most likely outcome
         if td_prob > fg_prob and td_prob > no_score_prob:
@@ -780,37 +698,7 @@ class AIGameNarrator:
         total_time_left = time_remaining + (4 - quarter) * 900 if quarter < 4 else time_remaining
 
         # Base win probabilities based on score and time
-        if score_diff > 0:  # Home team leading
-            if score_diff >= 21 and total_time_left < 900:  # 3+ TD lead with < 15 min
-                home_win_prob = 0.95
-            elif score_diff >= 14 and total_time_left < 600:  # 2+ TD lead with < 10 min
-                home_win_prob = 0.88
-            elif score_diff >= 7 and total_time_left < 300:  # 1+ TD lead with < 5 min
-                home_win_prob = 0.78
-            else:
-                # Use exponential decay model
-                time_factor = math.exp(-total_time_left / 1800)  # 30-minute half-life
-                score_factor = 1 / (1 + math.exp(-score_diff / 7))  # Sigmoid function
-                home_win_prob = 0.5 + (score_factor - 0.5) * (0.5 + time_factor * 0.5)
-        else:  # Away team leading or tied
-            score_diff = abs(score_diff)
-            if score_diff >= 21 and total_time_left < 900:
-                away_win_prob = 0.95
-            elif score_diff >= 14 and total_time_left < 600:
-                away_win_prob = 0.88
-            elif score_diff >= 7 and total_time_left < 300:
-                away_win_prob = 0.78
-            else:
-                time_factor = math.exp(-total_time_left / 1800)
-                score_factor = 1 / (1 + math.exp(-score_diff / 7))
-                away_win_prob = 0.5 + (score_factor - 0.5) * (0.5 + time_factor * 0.5)
-                home_win_prob = 1 - away_win_prob
-
-        if score_diff == 0:  # Tied game
-            home_win_prob = 0.52  # Slight home field advantage
-            away_win_prob = 0.48
-        elif 'away_win_prob' not in locals():
-            away_win_prob = 1 - home_win_prob
+        home_win_prob, away_win_prob = self.decision_engine.tables.win_probability(score_diff, total_time_left)
 
         # Tie probability (very rare in NFL)
         tie_prob = 0.002 if quarter >= 4 and abs(score_diff) <= 3 else 0.0
@@ -880,7 +768,7 @@ class AIGameNarrator:
         for situation in situations:
             if situation == GameSituation.RED_ZONE:
                 success_rate = self.historical_comparator.calculate_situation_success_rate(
-                    situation, context
+                    situation, context, game_state
                 )
                 insight = ContextualInsight(
                     insight_type="situation_analysis",
@@ -892,11 +780,14 @@ class AIGameNarrator:
                 insights.append(insight)
 
             elif situation == GameSituation.FOURTH_DOWN:
+                success_rate = self.historical_comparator.calculate_situation_success_rate(
+                    situation, context, game_state
+                )
                 insight = ContextualInsight(
                     insight_type="critical_decision",
-                    message=f"4th down decisions in this field position are successful {self.historical_comparator.calculate_situation_success_rate(situation, context):.1%} of the time. Coaches typically favor conservative play calling here.",
+                    message=f"4th down decisions in this field position are successful {success_rate:.1%} of the time. Coaches typically favor conservative play calling here.",
                     historical_comparison=None,
-                    statistical_backing={"fourth_down_success": self.historical_comparator.calculate_situation_success_rate(situation, context)},
+                    statistical_backing={"fourth_down_success": success_rate},
                     relevance_score=0.90
                 )
                 insights.append(insight)
@@ -12,12 +12,14 @@ from typing import Dict, List, Tuple, Optional, Any
 import logging
 from dataclasses import dataclass, asdict
 from sklearn.base import BaseEstimator
-from sklearn.metrics import accuracy_score, log_loss, brier_score_loss
+from collections import deque
 import pickle
 import json
 import sqlite3
 from pathlib import Path
 
+from .drift_detectors import ADWINBank, DDMBank, OutcomeWindow, PageHinkleyBank, PSISketch
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -56,9 +58,9 @@ class OnlineLearner:
     def __init__(self, learning_rate: float = 0.01, window_size: int = 50):
         self.learning_rate = learning_rate
         self.window_size = window_size
-        self.prediction_buffer = []
-        self.outcome_buffer = []
-        self.feature_buffer = []
+        self.prediction_buffer = deque(maxlen=window_size)
+        self.outcome_buffer = deque(maxlen=window_size)
+        self.feature_buffer = deque(maxlen=window_size)
         self.weights_history = []
 
     def update_weights(self, prediction: float, actual: float, features: np.ndarray,
@@ -68,17 +70,11 @@ class OnlineLearner:
             # Calculate prediction error
             error = actual - prediction
 
-            # Store in buffers
+            # Store in buffers (bounded to the most recent window)
             self.prediction_buffer.append(prediction)
             self.outcome_buffer.append(actual)
             self.feature_buffer.append(features)
 
-            # Keep only recent observations
-            if len(self.prediction_buffer) > self.window_size:
-                self.prediction_buffer.pop(0)
-                self.outcome_buffer.pop(0)
-                self.feature_buffer.pop(0)
-
             # Online gradient update for compatible models
             if hasattr(model, 'partial_fit'):
                 model.partial_fit(features.reshape(1, -1), [actual])
@@ -99,176 +95,174 @@ class OnlineLearner:
             return model
 
 class DriftDetector:
-    """Detects concept drift in prediction patterns"""
+    """Streaming concept drift detection across every registered model.
 
-    def __init__(self, window_size: int = 100, threshold: float = 0.1):
+    Each model owns one row in banked ADWIN, Page-Hinkley and DDM detectors
+    over its error stream and a fixed-bin PSI sketch over its predictions;
+    the shared game features feed one PSI sketch whose bins are fitted on the
+    first ``window_size`` outcomes. A call to ``update`` advances all of them
+    for every model in the outcome with one vectorized pass.
+    """
+
+    def __init__(self, window_size: int = 100, threshold: float = 0.1,
+                 n_bins: int = 10, history_size: int = 1000):
         self.window_size = window_size
         self.threshold = threshold
-        self.reference_window = []
-        self.current_window = []
-        self.drift_history = []
+        self.n_bins = n_bins
+        self.model_rows: Dict[str, int] = {}
+        self.drift_history = deque(maxlen=history_size)
+
+        block_size = max(1, -(-window_size // 8))
+        self.adwin = ADWINBank(n_blocks=8, block_size=block_size)
+        self.page_hinkley = PageHinkleyBank()
+        self.ddm = DDMBank()
+        self.prediction_sketch = PSISketch(
+            np.linspace(0.0, 1.0, n_bins + 1)[1:-1], reference_size=window_size
+        )
+        self.performance_window = OutcomeWindow(window=10)
+        self.latest_scores = np.zeros(self.adwin.capacity)
+
+        # Feature bins are fitted once on a warm-up sample, then fixed
+        self.feature_sketch: Optional[PSISketch] = None
+        self._feature_warmup: List[np.ndarray] = []
+
+    def register_model(self, model_id: str) -> int:
+        """Allocate detector rows for a model, returning its row index"""
+        row = self.model_rows.get(model_id)
+        if row is None:
+            row = self.adwin.add_row()
+            for bank in (self.page_hinkley, self.ddm, self.prediction_sketch, self.performance_window):
+                bank.add_row()
+            if row >= len(self.latest_scores):
+                self.latest_scores = np.concatenate([self.latest_scores, np.zeros(len(self.latest_scores))])
+            self.latest_scores[row] = 0.0
+            self.model_rows[model_id] = row
+        return row
+
+    def rows_for(self, model_ids: List[str]) -> np.ndarray:
+        return np.array([self.register_model(model_id) for model_id in model_ids], dtype=np.intp)
+
+    def latest_score(self, model_id: str) -> float:
+        row = self.model_rows.get(model_id)
+        return float(self.latest_scores[row]) if row is not None else 0.0
+
+    def update(self, model_ids: List[str], predictions: np.ndarray, actuals: np.ndarray,
+               features: np.ndarray) -> Dict[str, DriftDetection]:
+        """Advance every detector by one outcome for the given models"""
+        rows = self.rows_for(model_ids)
+        predictions = np.asarray(predictions, dtype=np.float64)
+        actuals = np.asarray(actuals, dtype=np.float64)
+
+        errors = np.abs(predictions - actuals)
+        misses = ((predictions > 0.5) != (actuals > 0.5)).astype(np.float64)
+
+        adwin_shift, adwin_alarm = self.adwin.update(rows, errors)
+        ph_statistic, ph_alarm = self.page_hinkley.update(rows, errors)
+        ddm_excess, ddm_warning, ddm_drift = self.ddm.update(rows, misses)
+        prediction_drift = self.prediction_sketch.update(rows, predictions[:, None])[:, 0]
+        self.performance_window.update(rows, predictions, actuals)
+        feature_psi = self._update_features(features)
+
+        # Performance drift is an increase in the error stream
+        performance_drift = np.maximum(np.maximum(adwin_shift, 0.0), ddm_excess)
+        feature_drift = float(feature_psi.mean()) if feature_psi is not None else 0.0
+        combined = (performance_drift + feature_drift + prediction_drift) / 3
+        alarm = ph_alarm | ddm_drift | (adwin_alarm & (adwin_shift > 0))
+        is_drift = (combined > self.threshold) | alarm
+        self.latest_scores[rows] = combined
+
+        affected = self._affected_features(feature_psi)
+        timestamp = datetime.now()
+        results = {}
+        for position, model_id in enumerate(model_ids):
+            score = float(combined[position])
+            if ph_alarm[position] or ddm_drift[position]:
+                drift_type = 'sudden'
+            elif adwin_alarm[position] or ddm_warning[position]:
+                drift_type = 'gradual'
+            else:
+                drift_type = 'seasonal'
+
+            results[model_id] = DriftDetection(
+                is_drift=bool(is_drift[position]),
+                drift_score=score,
+                drift_type=drift_type,
+                affected_features=affected,
+                recommendation=self._generate_recommendation(
+                    max(score, self.threshold) if alarm[position] else score, drift_type
+                ),
+                confidence=min(max(score * 2, float(alarm[position])), 1.0)
+            )
+            self.drift_history.append({
+                'timestamp': timestamp,
+                'model_id': model_id,
+                'drift_score': score,
+                'is_drift': bool(is_drift[position])
+            })
+
+        # Detected shifts become the new reference so they are reported once
+        if is_drift.any():
+            self.prediction_sketch.rebase(rows[is_drift])
+            if feature_drift > self.threshold:
+                self.feature_sketch.rebase(np.zeros(1, dtype=np.intp))
+        return results
 
     def detect_drift(self, predictions: List[float], actuals: List[float],
                     features: np.ndarray) -> DriftDetection:
-        """Detect concept drift using multiple methods"""
+        """Replay a batch of outcomes through a fresh single-stream detector"""
         try:
             if len(predictions) < self.window_size:
                 return DriftDetection(False, 0.0, 'none', [], 'Insufficient data', 0.0)
 
-            # Performance-based drift detection
-            performance_drift = self._detect_performance_drift(predictions, actuals)
-
-            # Feature distribution drift
-            feature_drift = self._detect_feature_drift(features)
-
-            # Prediction distribution drift
-            prediction_drift = self._detect_prediction_drift(predictions)
-
-            # Combine drift scores
-            combined_score = (performance_drift + feature_drift + prediction_drift) / 3
-            is_drift = combined_score > self.threshold
-
-            # Determine drift type
-            drift_type = self._classify_drift_type(predictions, actuals)
-
-            # Generate recommendation
-            recommendation = self._generate_recommendation(combined_score, drift_type)
-
-            drift_result = DriftDetection(
-                is_drift=is_drift,
-                drift_score=combined_score,
-                drift_type=drift_type,
-                affected_features=self._identify_affected_features(features),
-                recommendation=recommendation,
-                confidence=min(combined_score * 2, 1.0)
-            )
-
-            self.drift_history.append({
-                'timestamp': datetime.now(),
-                'drift_score': combined_score,
-                'is_drift': is_drift
-            })
-
-            logger.info(f"Drift detection: {drift_result.drift_type} drift (score: {combined_score:.4f})")
-            return drift_result
+            replay = DriftDetector(self.window_size, self.threshold, self.n_bins)
+            features = np.atleast_2d(np.asarray(features, dtype=np.float64))
+            result = None
+            detected = None
+            for prediction, actual, row in zip(predictions, actuals, features):
+                result = replay.update(['batch'], np.array([prediction]), np.array([actual]), row)['batch']
+                if result.is_drift:
+                    detected = result
+            return detected or result
 
         except Exception as e:
             logger.error(f"Error detecting drift: {e}")
             return DriftDetection(False, 0.0, 'error', [], f'Error: {e}', 0.0)
 
-    def _detect_performance_drift(self, predictions: List[float], actuals: List[float]) -> float:
-        """Detect drift based on performance degradation"""
-        if len(predictions) < self.window_size * 2:
-            return 0.0
-
-        # Split into reference and current windows
-        mid_point = len(predictions) // 2
-        ref_pred = predictions[:mid_point]
-        ref_actual = actuals[:mid_point]
-        cur_pred = predictions[mid_point:]
-        cur_actual = actuals[mid_point:]
-
-        # Calculate accuracy for both windows
-        ref_accuracy = accuracy_score([1 if a > 0.5 else 0 for a in ref_actual],
-                                     [1 if p > 0.5 else 0 for p in ref_pred])
-        cur_accuracy = accuracy_score([1 if a > 0.5 else 0 for a in cur_actual],
-                                     [1 if p > 0.5 else 0 for p in cur_pred])
-
-        # Return normalized performance difference
-        return max(0, ref_accuracy - cur_accuracy)
-
-    def _detect_feature_drift(self, features: np.ndarray) -> float:
-        """Detect drift in feature distributions"""
-        if len(features) < self.window_size * 2:
-            return 0.0
-
-        # Split features into reference and current windows
-        mid_point = len(features) // 2
-        ref_features = features[:mid_point]
-        cur_features = features[mid_point:]
-
-        # Calculate distribution differences using Kolmogorov-Smirnov test approximation
-        drift_scores = []
-        for i in range(features.shape[1]):
-            ref_col = ref_features[:, i]
-            cur_col = cur_features[:, i]
-
-            # Simple distribution comparison
-            ref_mean, ref_std = np.mean(ref_col), np.std(ref_col)
-            cur_mean, cur_std = np.mean(cur_col), np.std(cur_col)
-
-            if ref_std > 0 and cur_std > 0:
-                mean_diff = abs(ref_mean - cur_mean) / ref_std
-                std_diff = abs(ref_std - cur_std) / ref_std
-                drift_scores.append((mean_diff + std_diff) / 2)
-
-        return np.mean(drift_scores) if drift_scores else 0.0
-
-    def _detect_prediction_drift(self, predictions: List[float]) -> float:
-        """Detect drift in prediction distributions"""
-        if len(predictions) < self.window_size * 2:
-            return 0.0
-
-        # Split predictions
-        mid_point = len(predictions) // 2
-        ref_pred = predictions[:mid_point]
-        cur_pred = predictions[mid_point:]
-
-        # Compare prediction distributions
-        ref_mean = np.mean(ref_pred)
-        cur_mean = np.mean(cur_pred)
-        ref_std = np.std(ref_pred)
-        cur_std = np.std(cur_pred)
-
-        if ref_std > 0:
-            mean_diff = abs(ref_mean - cur_mean) / ref_std
-            std_diff = abs(ref_std - cur_std) / max(ref_std, 0.001)
-            return (mean_diff + std_diff) / 2
-
-        return 0.0
-
-    def _classify_drift_type(self, predictions: List[float], actuals: List[float]) -> str:
-        """Classify type of drift detected"""
-        if len(predictions) < self.window_size:
-            return 'none'
-
-        # Analyze trend over time
-        recent_errors = [abs(p - a) for p, a in zip(predictions[-20:], actuals[-20:])]
-        older_errors = [abs(p - a) for p, a in zip(predictions[-40:-20], actuals[-40:-20])]
-
-        if len(recent_errors) < 10 or len(older_errors) < 10:
-            return 'gradual'
-
-        recent_avg = np.mean(recent_errors)
-        older_avg = np.mean(older_errors)
-
-        if recent_avg > older_avg * 1.5:
-            return 'sudden'
-        elif recent_avg > older_avg * 1.2:
-            return 'gradual'
-        else:
-            return 'seasonal'
-
-    def _identify_affected_features(self, features: np.ndarray) -> List[str]:
-        """Identify which features are most affected by drift"""
-        # This would require feature names - for now return generic indices
-        if len(features) < self.window_size:
+    def _update_features(self, features: np.ndarray) -> Optional[np.ndarray]:
+        """Feed the shared feature vector to the PSI sketch, fitting bins on warm-up"""
+        features = np.asarray(features, dtype=np.float64).ravel()
+        row = np.zeros(1, dtype=np.intp)
+
+        if self.feature_sketch is None:
+            self._feature_warmup.append(features)
+            if len(self._feature_warmup) < self.window_size:
+                return None
+            sample = np.vstack(self._feature_warmup)
+            self._feature_warmup = []
+            self.feature_sketch = PSISketch.from_sample(
+                sample, n_bins=self.n_bins, reference_size=self.window_size
+            )
+            self.feature_sketch.add_row()
+            for warm in sample:
+                self.feature_sketch.update(row, warm[None, :])
+            return None
+
+        if features.shape[0] != self.feature_sketch.n_dims:
+            logger.warning("Feature vector width changed - refitting feature drift bins")
+            self.feature_sketch = None
+            self._feature_warmup = [features]
+            return None
+
+        return self.feature_sketch.update(row, features[None, :])[0]
+
+    @staticmethod
+    def _affected_features(feature_psi: Optional[np.ndarray], limit: int = 5) -> List[str]:
+        """Features whose PSI indicates a significant shift, largest first"""
+        if feature_psi is None:
             return []
-
-        # Simple feature importance based on variance change
-        mid_point = len(features) // 2
-        ref_features = features[:mid_point]
-        cur_features = features[mid_point:]
-
-        affected = []
-        for i in range(features.shape[1]):
-            ref_var = np.var(ref_features[:, i])
-            cur_var = np.var(cur_features[:, i])
-
-            if ref_var > 0 and abs(ref_var - cur_var) / ref_var > 0.5:
-                affected.append(f'feature_{i}')
-
-        return affected[:5]  # Return top 5 affected features
+        shifted = np.flatnonzero(feature_psi > 0.25)
+        shifted = shifted[np.argsort(-feature_psi[shifted], kind='stable')]
+        return [f'feature_{i}' for i in shifted[:limit]]
 
     def _generate_recommendation(self, drift_score: float, drift_type: str) -> str:
         """Generate recommendation based on drift detection"""
@@ -342,6 +336,7 @@ class ContinuousLearner:
     def register_model(self, model_id: str, model: BaseEstimator):
         """Register a model for continuous learning"""
         self.models[model_id] = model
+        self.drift_detector.register_model(model_id)
         logger.info(f"Registered model {model_id} for continuous learning")
 
     def process_game_outcome(self, game_id: str, predictions: Dict[str, float],
@@ -352,51 +347,49 @@ class ContinuousLearner:
 
         try:
             timestamp = datetime.now()
+            model_ids = [model_id for model_id in predictions if model_id in self.models]
+            if not model_ids:
+                return
 
-            for model_id, prediction in predictions.items():
-                if model_id in self.models:
-                    actual = actual_results.get(model_id, 0.0)
-                    error = abs(prediction - actual)
-
-                    # Update model weights
-                    updated_model = self.online_learner.update_weights(
-                        prediction, actual, features, self.models[model_id]
-                    )
-                    self.models[model_id] = updated_model
+            predicted = np.array([predictions[model_id] for model_id in model_ids], dtype=np.float64)
+            actual = np.array([actual_results.get(model_id, 0.0) for model_id in model_ids], dtype=np.float64)
 
-                    # Log learning event
-                    self._log_learning_event(timestamp, game_id, prediction, actual,
-                                           error, True, self.online_learner.learning_rate)
+            learning_events = []
+            for model_id, prediction, outcome in zip(model_ids, predicted, actual):
+                # Update model weights
+                self.models[model_id] = self.online_learner.update_weights(
+                    prediction, outcome, features, self.models[model_id]
+                )
+                learning_events.append((
+                    timestamp.isoformat(), game_id, float(prediction), float(outcome),
+                    float(abs(prediction - outcome)), True, self.online_learner.learning_rate
+                ))
 
-                    # Check for drift
-                    if len(self.online_learner.prediction_buffer) >= 20:
-                        drift_result = self.drift_detector.detect_drift(
-                            self.online_learner.prediction_buffer,
-                            self.online_learner.outcome_buffer,
-                            np.array(self.online_learner.feature_buffer)
-                        )
+            # One vectorized detector update covers every model in the outcome
+            drift_results = self.drift_detector.update(model_ids, predicted, actual, features)
 
-                        if drift_result.is_drift:
-                            self._handle_drift(model_id, drift_result, timestamp)
+            performance = self._update_performance_tracking(model_ids, timestamp)
+            self._store_outcome(learning_events, performance)
 
-                    # Update performance tracking
-                    self._update_performance_tracking(model_id, timestamp)
+            drifted = {model_id: result for model_id, result in drift_results.items() if result.is_drift}
+            if drifted:
+                self._handle_drift(drifted, timestamp)
 
             logger.info(f"Processed game {game_id} outcomes for continuous learning")
 
         except Exception as e:
             logger.error(f"Error processing game outcome: {e}")
 
-    def _handle_drift(self, model_id: str, drift_result: DriftDetection, timestamp: datetime):
-        """Handle detected concept drift"""
+    def _handle_drift(self, drift_results: Dict[str, DriftDetection], timestamp: datetime):
+        """Handle concept drift detected for one or more models"""
         try:
-            # Log drift event
+            # Log drift events
             with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
+                conn.executemany("""
                     INSERT INTO drift_events
                     (timestamp, model_id, drift_type, drift_score, affected_features, recommendation, action_taken)
                     VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
+                """, [(
                     timestamp.isoformat(),
                     model_id,
                     drift_result.drift_type,
@@ -404,17 +397,18 @@ class ContinuousLearner:
                     json.dumps(drift_result.affected_features),
                     drift_result.recommendation,
                     'weights_adjusted'
-                ))
+                ) for model_id, drift_result in drift_results.items()])
 
-            # Adjust learning rate based on drift severity
-            if drift_result.drift_score > 0.3:
-                self.online_learner.learning_rate *= 1.5  # Increase learning rate
-            elif drift_result.drift_score > 0.5:
-                # Trigger retraining flag
-                self._trigger_retraining(model_id, drift_result)
+            for model_id, drift_result in drift_results.items():
+                # Adjust learning rate based on drift severity
+                if drift_result.drift_score > 0.3:
+                    self.online_learner.learning_rate *= 1.5  # Increase learning rate
+                elif drift_result.drift_score > 0.5:
+                    # Trigger retraining flag
+                    self._trigger_retraining(model_id, drift_result)
 
-            logger.warning(f"Drift detected for {model_id}: {drift_result.drift_type} "
-                          f"(score: {drift_result.drift_score:.4f})")
+                logger.warning(f"Drift detected for {model_id}: {drift_result.drift_type} "
+                              f"(score: {drift_result.drift_score:.4f})")
 
         except Exception as e:
             logger.error(f"Error handling drift: {e}")
@@ -440,86 +434,67 @@ class ContinuousLearner:
         except Exception as e:
             logger.error(f"Error triggering retraining: {e}")
 
-    def _update_performance_tracking(self, model_id: str, timestamp: datetime):
-        """Update performance tracking metrics"""
+    def _update_performance_tracking(self, model_ids: List[str],
+                                     timestamp: datetime) -> List[ModelPerformance]:
+        """Update performance tracking metrics from the per-model outcome windows"""
         try:
-            if len(self.online_learner.prediction_buffer) < 10:
-                return
-
-            recent_predictions = self.online_learner.prediction_buffer[-10:]
-            recent_actuals = self.online_learner.outcome_buffer[-10:]
-
-            # Calculate metrics
-            binary_predictions = [1 if p > 0.5 else 0 for p in recent_predictions]
-            binary_actuals = [1 if a > 0.5 else 0 for a in recent_actuals]
-
-            accuracy = accuracy_score(binary_actuals, binary_predictions)
-            log_loss_val = log_loss(binary_actuals, recent_predictions, eps=1e-15)
-            brier_score = brier_score_loss(binary_actuals, recent_predictions)
-
-            # Confidence calibration (simplified)
-            confidence_calibration = 1.0 - abs(np.mean(recent_predictions) - np.mean(recent_actuals))
-
-            # Get latest drift score
-            drift_score = self.drift_detector.drift_history[-1]['drift_score'] if self.drift_detector.drift_history else 0.0
-
-            performance = ModelPerformance(
-                model_id=model_id,
-                timestamp=timestamp,
-                accuracy=accuracy,
-                log_loss=log_loss_val,
-                brier_score=brier_score,
-                prediction_count=len(recent_predictions),
-                correct_predictions=sum(1 for p, a in zip(binary_predictions, binary_actuals) if p == a),
-                confidence_calibration=confidence_calibration,
-                drift_score=drift_score
-            )
-
-            # Store in database
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT INTO model_performance
-                    (model_id, timestamp, accuracy, log_loss, brier_score,
-                     prediction_count, correct_predictions, confidence_calibration, drift_score)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    performance.model_id,
-                    performance.timestamp.isoformat(),
-                    performance.accuracy,
-                    performance.log_loss,
-                    performance.brier_score,
-                    performance.prediction_count,
-                    performance.correct_predictions,
-                    performance.confidence_calibration,
-                    performance.drift_score
+            window = self.drift_detector.performance_window
+            metrics = window.metrics(self.drift_detector.rows_for(model_ids))
+            if metrics is None:
+                return []
+
+            row_models = {row: model_id for model_id, row in self.drift_detector.model_rows.items()}
+            performance = []
+            for position, row in enumerate(metrics['rows']):
+                model_id = row_models[row]
+                performance.append(ModelPerformance(
+                    model_id=model_id,
+                    timestamp=timestamp,
+                    accuracy=float(metrics['accuracy'][position]),
+                    log_loss=float(metrics['log_loss'][position]),
+                    brier_score=float(metrics['brier_score'][position]),
+                    prediction_count=window.window,
+                    correct_predictions=int(metrics['correct_predictions'][position]),
+                    confidence_calibration=float(metrics['confidence_calibration'][position]),
+                    drift_score=self.drift_detector.latest_score(model_id)
                 ))
 
-            self.performance_history.append(performance)
+            self.performance_history.extend(performance)
+            return performance
 
         except Exception as e:
             logger.error(f"Error updating performance tracking: {e}")
+            return []
 
-    def _log_learning_event(self, timestamp: datetime, game_id: str, prediction: float,
-                           actual: float, error: float, model_updated: bool, learning_rate: float):
-        """Log individual learning events"""
+    def _store_outcome(self, learning_events: List[Tuple], performance: List[ModelPerformance]):
+        """Write an outcome's learning events and performance rows in one transaction"""
         try:
             with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
+                conn.executemany("""
                     INSERT INTO learning_events
                     (timestamp, game_id, prediction, actual, error, model_updated, learning_rate)
                     VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    timestamp.isoformat(),
-                    game_id,
-                    prediction,
-                    actual,
-                    error,
-                    model_updated,
-                    learning_rate
-                ))
+                """, learning_events)
+
+                conn.executemany("""
+                    INSERT INTO model_performance
+                    (model_id, timestamp, accuracy, log_loss, brier_score,
+                     prediction_count, correct_predictions, confidence_calibration, drift_score)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, [(
+                    p.model_id,
+                    p.timestamp.isoformat(),
+                    p.accuracy,
+                    p.log_loss,
+                    p.brier_score,
+                    p.prediction_count,
+                    p.correct_predictions,
+                    p.confidence_calibration,
+                    p.drift_score
+                ) for p in performance])
 
         except Exception as e:
-            logger.error(f"Error logging learning event: {e}")
+            logger.error(f"Error logging learning events: {e}")
 
     def get_performance_metrics(self, model_id: Optional[str] = None, days: int = 30) -> List[Dict]:
         """Get performance metrics for analysis"""
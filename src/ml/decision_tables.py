@@ -0,0 +1,301 @@
+"""
+Precomputed Decision Tables for the AI Game Narrator
+Dense NumPy lookup tables for fourth-down decisions, next-score and win probabilities
+"""
+
+import json
+import logging
+import math
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TABLES_VERSION = 1
+DEFAULT_TABLES_DIR = "models/decision_tables"
+
+MAX_YARD_LINE = 100
+MAX_QUARTER_SECONDS = 900
+MAX_GAME_SECONDS = 3600
+MAX_SCORE_DIFF = 50
+
+# Every threshold in the decision formulas sits inside these clamps, so clamped
+# lookups are exact
+MAX_CONVERSION_DISTANCE = 10
+MAX_SCORING_DISTANCE = 9
+DECISION_SCORE_CLAMP = 7
+
+FOURTH_DOWN_OPTIONS = ('punt', 'field_goal', 'go_for_it')
+SCORING_OUTCOMES = ('touchdown', 'field_goal', 'none')
+
+
+# ----------------------------------------------------------------------
+# Vectorized builders
+# ----------------------------------------------------------------------
+def _fg_base_success(yard_line: np.ndarray) -> np.ndarray:
+    distance = 17 + (100 - yard_line)
+    return np.select(
+        [distance <= 30, distance <= 40, distance <= 50],
+        [0.95, 0.90, 0.80],
+        default=np.maximum(0.40, 0.90 - (distance - 30) * 0.03)
+    )
+
+
+def _conversion_base(yards_to_go: np.ndarray, yard_line: np.ndarray) -> np.ndarray:
+    base = np.select(
+        [yards_to_go == 1, yards_to_go <= 3, yards_to_go <= 6],
+        [0.65, 0.50, 0.35],
+        default=np.maximum(0.15, 0.50 - (yards_to_go - 3) * 0.05)
+    )
+    return base + np.select([yard_line <= 10, yard_line <= 20], [0.1, 0.05], default=0.0)
+
+
+def _punt_value(yard_line: np.ndarray, seconds: np.ndarray) -> np.ndarray:
+    expected_opponent_position = np.maximum(20, yard_line - 40)
+    field_position_value = (expected_opponent_position - 20) / 80
+    time_factor = np.minimum(1.0, seconds / 900)
+    return field_position_value * 0.7 + time_factor * 0.3
+
+
+def _go_for_it_points(yard_line: np.ndarray) -> np.ndarray:
+    return np.select([yard_line <= 10, yard_line <= 20, yard_line <= 40], [6.5, 5.5, 4.0], default=3.0)
+
+
+def _scoring_probabilities(down_class: np.ndarray, yards_to_go: np.ndarray, yard_line: np.ndarray,
+                           red_zone: np.ndarray, goal_line: np.ndarray) -> np.ndarray:
+    """Next-score (td, fg, none) probabilities; down_class is 2 for 4th, 1 for 3rd, else 0"""
+    td = np.select([yard_line <= 10, yard_line <= 20, yard_line <= 40], [0.75, 0.60, 0.35], default=0.25)
+    fg = np.select([yard_line <= 10, yard_line <= 20, yard_line <= 40], [0.20, 0.30, 0.45], default=0.35)
+    none = np.select([yard_line <= 10, yard_line <= 20, yard_line <= 40], [0.05, 0.10, 0.20], default=0.40)
+
+    long_fourth = (down_class == 2) & (yards_to_go > 3)
+    long_third = (down_class == 1) & (yards_to_go > 8)
+    td = np.where(long_fourth, td * 0.6, np.where(long_third, td * 0.8, td))
+    fg = np.where(long_fourth, fg * 0.8, np.where(long_third, fg * 0.9, fg))
+    none = np.where(long_fourth, 1 - td - fg, none)
+
+    td = np.where(red_zone, td * 1.2, td)
+    fg = np.where(red_zone, fg * 1.1, fg)
+    td = np.where(goal_line, td * 1.5, td)
+    fg = np.where(goal_line, fg * 0.8, fg)
+
+    total = td + fg + none
+    return np.stack([td / total, fg / total, none / total], axis=-1)
+
+
+def win_probabilities(score_diff: np.ndarray, total_time_left: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Pre-tie (home, away) win probabilities from the home score differential"""
+    score_diff = np.asarray(score_diff, dtype=np.float64)
+    total_time_left = np.asarray(total_time_left, dtype=np.float64)
+    margin = np.abs(score_diff)
+
+    time_factor = np.exp(-total_time_left / 1800)  # 30-minute half-life
+    score_factor = 1 / (1 + np.exp(-margin / 7))
+    leader_prob = np.select(
+        [(margin >= 21) & (total_time_left < 900),
+         (margin >= 14) & (total_time_left < 600),
+         (margin >= 7) & (total_time_left < 300)],
+        [0.95, 0.88, 0.78],
+        default=0.5 + (score_factor - 0.5) * (0.5 + time_factor * 0.5)
+    )
+
+    home = np.where(score_diff > 0, leader_prob, 1 - leader_prob)
+    away = np.where(score_diff > 0, 1 - leader_prob, leader_prob)
+    home = np.where(score_diff == 0, 0.52, home)
+    away = np.where(score_diff == 0, 0.48, away)
+    return home, away
+
+
+def build_tables() -> Dict[str, np.ndarray]:
+    yard = np.arange(MAX_YARD_LINE + 1, dtype=np.float64)
+    seconds = np.arange(MAX_QUARTER_SECONDS + 1, dtype=np.float64)
+    distance = np.arange(MAX_CONVERSION_DISTANCE + 1, dtype=np.float64)
+    score = np.arange(-DECISION_SCORE_CLAMP, DECISION_SCORE_CLAMP + 1, dtype=np.float64)
+
+    # Score/time multipliers: column 0 is the normal clock, column 1 the late clock
+    fg_score_mult = np.select([score <= -3, score >= 7], [1.3, 0.8], default=1.0)
+    go_late = np.where(score <= -7, 1.4, np.where(score < 0, 1.6, 1.0))
+    go_mult = np.stack([np.where(score <= -7, 1.4, 1.0), go_late], axis=1)
+
+    scoring_grid = np.meshgrid(
+        np.arange(3), np.arange(MAX_SCORING_DISTANCE + 1), yard, [False, True], [False, True],
+        indexing='ij'
+    )
+
+    game_seconds = np.arange(MAX_GAME_SECONDS + 1, dtype=np.float64)
+    win_score = np.arange(-MAX_SCORE_DIFF, MAX_SCORE_DIFF + 1, dtype=np.float64)
+    home_wp, away_wp = win_probabilities(win_score[:, None], game_seconds[None, :])
+
+    return {
+        'fg_success': _fg_base_success(yard),
+        'conversion': _conversion_base(distance[:, None], yard[None, :]),
+        'punt_value': _punt_value(yard[:, None], seconds[None, :]),
+        'go_points': _go_for_it_points(yard),
+        'fg_score_mult': fg_score_mult,
+        'go_mult': go_mult,
+        'scoring': _scoring_probabilities(*scoring_grid),
+        'home_win': home_wp,
+        'away_win': away_wp,
+    }
+
+
+# ----------------------------------------------------------------------
+# Lookup tables
+# ----------------------------------------------------------------------
+class DecisionTables:
+    """Memory-mapped decision tables with scalar and batch lookups.
+
+    Context (weather, pressure, team strength) enters as additive deltas on the
+    precomputed base probabilities, so a live query is a handful of array reads.
+    """
+
+    def __init__(self, tables: Dict[str, np.ndarray]):
+        self.tables = tables
+        self.fg_success = tables['fg_success']
+        self.conversion = tables['conversion']
+        self.punt_value = tables['punt_value']
+        self.go_points = tables['go_points']
+        self.fg_score_mult = tables['fg_score_mult']
+        self.go_mult = tables['go_mult']
+        self.scoring = tables['scoring']
+        self.home_win = tables['home_win']
+        self.away_win = tables['away_win']
+
+    @classmethod
+    def load_or_build(cls, tables_dir: Union[str, Path] = DEFAULT_TABLES_DIR) -> 'DecisionTables':
+        """Memory-map tables from disk, building and saving them first if missing or stale"""
+        tables_dir = Path(tables_dir)
+        meta_path = tables_dir / 'meta.json'
+
+        try:
+            if meta_path.exists() and json.loads(meta_path.read_text()).get('version') == TABLES_VERSION:
+                tables = {
+                    path.stem: np.load(path, mmap_mode='r')
+                    for path in tables_dir.glob('*.npy')
+                }
+                return cls(tables)
+        except Exception as e:
+            logger.warning(f"Failed to load decision tables from {tables_dir}: {e}")
+
+        tables = build_tables()
+        try:
+            tables_dir.mkdir(parents=True, exist_ok=True)
+            for name, array in tables.items():
+                np.save(tables_dir / f"{name}.npy", array)
+            meta_path.write_text(json.dumps({'version': TABLES_VERSION}))
+            logger.info(f"Built decision tables in {tables_dir}")
+        except OSError as e:
+            logger.warning(f"Could not persist decision tables to {tables_dir}: {e}")
+
+        return cls(tables)
+
+    @staticmethod
+    def _clamp(value: int, low: int, high: int) -> int:
+        return low if value < low else high if value > high else value
+
+    # Fourth down -------------------------------------------------------
+    def fg_success_probability(self, yard_line: int, weather_impact: float = 0.0,
+                               pressure_impact: float = 0.0) -> float:
+        base = float(self.fg_success[self._clamp(yard_line, 0, MAX_YARD_LINE)])
+        return max(0.1, base - weather_impact - pressure_impact)
+
+    def conversion_probability(self, yards_to_go: int, yard_line: int, strength_delta: float = 0.0) -> float:
+        base = float(self.conversion[self._clamp(yards_to_go, 0, MAX_CONVERSION_DISTANCE),
+                                     self._clamp(yard_line, 0, MAX_YARD_LINE)])
+        return max(0.05, min(0.95, base + strength_delta))
+
+    def punt_expected_value(self, yard_line: int, seconds_remaining: int) -> float:
+        return float(self.punt_value[self._clamp(yard_line, 0, MAX_YARD_LINE),
+                                     self._clamp(seconds_remaining, 0, MAX_QUARTER_SECONDS)])
+
+    def fg_expected_value(self, success_prob: float, score_diff: int, seconds_remaining: int) -> float:
+        points_value = success_prob * 3
+        points_value *= float(self.fg_score_mult[self._clamp(score_diff, -DECISION_SCORE_CLAMP, DECISION_SCORE_CLAMP)
+                                                 + DECISION_SCORE_CLAMP])
+        if seconds_remaining < 120:  # Last 2 minutes
+            points_value *= 1.2
+        return points_value / 7
+
+    def go_for_it_expected_value(self, success_prob: float, yard_line: int, score_diff: int,
+                                 seconds_remaining: int) -> float:
+        expected_points = float(self.go_points[self._clamp(yard_line, 0, MAX_YARD_LINE)])
+        net_value = success_prob * expected_points - (1 - success_prob) * 2
+        late = 1 if seconds_remaining < 300 else 0
+        net_value *= float(self.go_mult[self._clamp(score_diff, -DECISION_SCORE_CLAMP, DECISION_SCORE_CLAMP)
+                                        + DECISION_SCORE_CLAMP, late])
+        return max(0, net_value / 7)
+
+    def fourth_down_batch(self, yards_to_go: np.ndarray, yard_line: np.ndarray, score_diff: np.ndarray,
+                          seconds_remaining: np.ndarray, weather_impact: Any = 0.0,
+                          pressure_impact: Any = 0.0, strength_delta: Any = 0.0) -> Dict[str, np.ndarray]:
+        """Vectorized fourth-down evaluation for many game states at once.
+
+        Returns per-option success probabilities and expected values (NaN where
+        an option is unavailable) plus the index of the best option into
+        FOURTH_DOWN_OPTIONS.
+        """
+        yards_to_go = np.asarray(yards_to_go, dtype=np.int64)
+        yard_line = np.asarray(yard_line, dtype=np.int64)
+        score_diff = np.asarray(score_diff, dtype=np.int64)
+        seconds_remaining = np.asarray(seconds_remaining, dtype=np.int64)
+
+        yard_idx = np.clip(yard_line, 0, MAX_YARD_LINE)
+        score_idx = np.clip(score_diff, -DECISION_SCORE_CLAMP, DECISION_SCORE_CLAMP) + DECISION_SCORE_CLAMP
+
+        punt_value = self.punt_value[yard_idx, np.clip(seconds_remaining, 0, MAX_QUARTER_SECONDS)]
+        fg_success = np.maximum(0.1, self.fg_success[yard_idx] - weather_impact - pressure_impact)
+        fg_value = fg_success * 3 * self.fg_score_mult[score_idx]
+        fg_value = np.where(seconds_remaining < 120, fg_value * 1.2, fg_value) / 7
+
+        go_success = np.clip(
+            self.conversion[np.clip(yards_to_go, 0, MAX_CONVERSION_DISTANCE), yard_idx] + strength_delta,
+            0.05, 0.95
+        )
+        go_net = go_success * self.go_points[yard_idx] - (1 - go_success) * 2
+        go_net = go_net * self.go_mult[score_idx, (seconds_remaining < 300).astype(np.intp)]
+        go_value = np.maximum(0, go_net / 7)
+
+        values = np.stack([
+            np.where(yard_line > 35, punt_value, np.nan),
+            np.where(yard_line <= 45, fg_value, np.nan),
+            go_value
+        ], axis=1)
+        success = np.stack([
+            np.where(yard_line > 35, 0.95, np.nan),
+            np.where(yard_line <= 45, fg_success, np.nan),
+            go_success
+        ], axis=1)
+
+        return {
+            'expected_values': values,
+            'success_probabilities': success,
+            'best_option': np.nanargmax(values, axis=1),
+        }
+
+    # Next score and win probability ------------------------------------
+    def scoring_probabilities(self, down: int, yards_to_go: int, yard_line: int,
+                              red_zone: bool, goal_line: bool) -> Tuple[float, float, float]:
+        down_class = 2 if down == 4 else 1 if down == 3 else 0
+        row = self.scoring[down_class,
+                           self._clamp(yards_to_go, 0, MAX_SCORING_DISTANCE),
+                           self._clamp(yard_line, 0, MAX_YARD_LINE),
+                           int(bool(red_zone)), int(bool(goal_line))]
+        return float(row[0]), float(row[1]), float(row[2])
+
+    def win_probability(self, score_diff: int, total_time_left: float) -> Tuple[float, float]:
+        """Pre-tie (home, away) win probabilities, interpolating fractional clocks"""
+        if not (-MAX_SCORE_DIFF <= score_diff <= MAX_SCORE_DIFF and 0 <= total_time_left <= MAX_GAME_SECONDS):
+            home, away = win_probabilities(score_diff, total_time_left)
+            return float(home), float(away)
+
+        score_idx = int(score_diff) + MAX_SCORE_DIFF
+        lower = int(math.floor(total_time_left))
+        fraction = total_time_left - lower
+        if fraction == 0 or lower >= MAX_GAME_SECONDS:
+            return float(self.home_win[score_idx, lower]), float(self.away_win[score_idx, lower])
+
+        home = (1 - fraction) * self.home_win[score_idx, lower] + fraction * self.home_win[score_idx, lower + 1]
+        away = (1 - fraction) * self.away_win[score_idx, lower] + fraction * self.away_win[score_idx, lower + 1]
+        return float(home), float(away)
@@ -0,0 +1,395 @@
+"""
+Streaming Drift Detectors
+Constant-time-per-sample ADWIN, Page-Hinkley and DDM detectors plus fixed-bin
+PSI sketches, banked so that one vectorized update covers every model
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Pseudo-count added to every histogram bin so empty bins do not dominate PSI
+PSI_PSEUDOCOUNT = 0.5
+
+
+class DetectorBank(ABC):
+    """Growable row storage shared by the banked detectors.
+
+    Each registered stream (model) owns one row; updates take an array of row
+    indices plus one value per row, so a whole outcome is a single NumPy pass.
+    """
+
+    def __init__(self, capacity: int = 8):
+        self.capacity = max(1, capacity)
+        self.size = 0
+
+    @abstractmethod
+    def _allocate(self, capacity: int) -> None:
+        """Grow every per-row array to capacity"""
+
+    def _grow_array(self, array: np.ndarray, capacity: int, fill) -> np.ndarray:
+        grown = np.full((capacity,) + array.shape[1:], fill, dtype=array.dtype)
+        grown[:array.shape[0]] = array
+        return grown
+
+    def add_row(self) -> int:
+        """Reserve a row for a new stream and return its index"""
+        if self.size >= self.capacity:
+            self.capacity *= 2
+            self._allocate(self.capacity)
+        row = self.size
+        self.size += 1
+        self.reset_rows(np.array([row], dtype=np.intp))
+        return row
+
+    @abstractmethod
+    def reset_rows(self, rows: np.ndarray) -> None:
+        """Return the given rows to their initial state"""
+
+
+class PageHinkleyBank(DetectorBank):
+    """Page-Hinkley test for an upward shift in the mean of each stream"""
+
+    def __init__(self, delta: float = 0.005, threshold: float = 3.0,
+                 alpha: float = 0.9999, min_instances: int = 30, capacity: int = 8):
+        super().__init__(capacity)
+        self.delta = delta
+        self.threshold = threshold
+        self.alpha = alpha
+        self.min_instances = min_instances
+        self.n = np.zeros(self.capacity)
+        self.mean = np.zeros(self.capacity)
+        self.cumulative = np.zeros(self.capacity)
+        self.minimum = np.zeros(self.capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        self.n = self._grow_array(self.n, capacity, 0.0)
+        self.mean = self._grow_array(self.mean, capacity, 0.0)
+        self.cumulative = self._grow_array(self.cumulative, capacity, 0.0)
+        self.minimum = self._grow_array(self.minimum, capacity, 0.0)
+
+    def reset_rows(self, rows: np.ndarray) -> None:
+        self.n[rows] = 0.0
+        self.mean[rows] = 0.0
+        self.cumulative[rows] = 0.0
+        self.minimum[rows] = 0.0
+
+    def update(self, rows: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Add one value per row; returns (statistic / threshold, alarm)"""
+        n = self.n[rows] + 1.0
+        mean = self.mean[rows] + (values - self.mean[rows]) / n
+        cumulative = self.alpha * self.cumulative[rows] + (values - mean - self.delta)
+        minimum = np.minimum(self.minimum[rows], cumulative)
+
+        self.n[rows] = n
+        self.mean[rows] = mean
+        self.cumulative[rows] = cumulative
+        self.minimum[rows] = minimum
+
+        statistic = (cumulative - minimum) / self.threshold
+        alarm = (n >= self.min_instances) & (statistic > 1.0)
+        if alarm.any():
+            self.reset_rows(rows[alarm])
+        return statistic, alarm
+
+
+class DDMBank(DetectorBank):
+    """Drift Detection Method (Gama et al.) over binary error streams"""
+
+    def __init__(self, min_instances: int = 30, warning_level: float = 2.0,
+                 drift_level: float = 3.0, capacity: int = 8):
+        super().__init__(capacity)
+        self.min_instances = min_instances
+        self.warning_level = warning_level
+        self.drift_level = drift_level
+        self.n = np.zeros(self.capacity)
+        self.error_rate = np.zeros(self.capacity)
+        self.p_min = np.full(self.capacity, np.inf)
+        self.s_min = np.full(self.capacity, np.inf)
+
+    def _allocate(self, capacity: int) -> None:
+        self.n = self._grow_array(self.n, capacity, 0.0)
+        self.error_rate = self._grow_array(self.error_rate, capacity, 0.0)
+        self.p_min = self._grow_array(self.p_min, capacity, np.inf)
+        self.s_min = self._grow_array(self.s_min, capacity, np.inf)
+
+    def reset_rows(self, rows: np.ndarray) -> None:
+        self.n[rows] = 0.0
+        self.error_rate[rows] = 0.0
+        self.p_min[rows] = np.inf
+        self.s_min[rows] = np.inf
+
+    def update(self, rows: np.ndarray, errors: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Add one 0/1 error per row; returns (error-rate excess, warning, drift)"""
+        n = self.n[rows] + 1.0
+        p = self.error_rate[rows] + (errors - self.error_rate[rows]) / n
+        s = np.sqrt(p * (1.0 - p) / n)
+
+        ready = n >= self.min_instances
+        p_min = self.p_min[rows]
+        s_min = self.s_min[rows]
+        improved = ready & (p + s < p_min + s_min)
+        p_min = np.where(improved, p, p_min)
+        s_min = np.where(improved, s, s_min)
+
+        self.n[rows] = n
+        self.error_rate[rows] = p
+        self.p_min[rows] = p_min
+        self.s_min[rows] = s_min
+
+        with np.errstate(invalid='ignore'):
+            warning = ready & (p + s >= p_min + self.warning_level * s_min)
+            drift = ready & (p + s >= p_min + self.drift_level * s_min)
+            excess = np.where(ready & np.isfinite(p_min), np.maximum(0.0, (p + s) - (p_min + s_min)), 0.0)
+
+        if drift.any():
+            self.reset_rows(rows[drift])
+        return excess, warning & ~drift, drift
+
+
+class ADWINBank(DetectorBank):
+    """ADWIN adaptive windowing evaluated at block granularity.
+
+    The window is held as a ring of ``n_blocks`` fixed-size blocks of running
+    sums per row, so the Hoeffding cut test over every block boundary costs
+    O(n_blocks) per sample regardless of how long the stream has run. When a
+    cut is significant the blocks older than it are dropped.
+    """
+
+    def __init__(self, delta: float = 0.002, n_blocks: int = 8, block_size: int = 16,
+                 capacity: int = 8):
+        super().__init__(capacity)
+        self.delta = delta
+        self.n_blocks = n_blocks
+        self.block_size = block_size
+        self.sums = np.zeros((self.capacity, n_blocks))
+        self.counts = np.zeros((self.capacity, n_blocks))
+        self.head = np.zeros(self.capacity, dtype=np.intp)
+        # Offsets that rotate a row's ring into oldest -> newest order
+        self._order = np.arange(1, n_blocks + 1)
+
+    def _allocate(self, capacity: int) -> None:
+        self.sums = self._grow_array(self.sums, capacity, 0.0)
+        self.counts = self._grow_array(self.counts, capacity, 0.0)
+        self.head = self._grow_array(self.head, capacity, 0)
+
+    def reset_rows(self, rows: np.ndarray) -> None:
+        self.sums[rows] = 0.0
+        self.counts[rows] = 0.0
+        self.head[rows] = 0
+
+    def width(self, rows: np.ndarray) -> np.ndarray:
+        return self.counts[rows].sum(axis=1)
+
+    def update(self, rows: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Add one value per row; returns (mean shift at the cut, alarm)"""
+        head = self.head[rows]
+        self.sums[rows, head] += values
+        self.counts[rows, head] += 1.0
+
+        order = (head[:, None] + self._order[None, :]) % self.n_blocks
+        sums = np.take_along_axis(self.sums[rows], order, axis=1)
+        counts = np.take_along_axis(self.counts[rows], order, axis=1)
+
+        # Older side of every block boundary vs the newer remainder
+        left_n = np.cumsum(counts, axis=1)[:, :-1]
+        left_s = np.cumsum(sums, axis=1)[:, :-1]
+        total_n = counts.sum(axis=1, keepdims=True)
+        total_s = sums.sum(axis=1, keepdims=True)
+        right_n = total_n - left_n
+        right_s = total_s - left_s
+
+        valid = (left_n > 0) & (right_n > 0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            shift = np.where(valid, right_s / right_n - left_s / left_n, 0.0)
+            harmonic = np.where(valid, 1.0 / (1.0 / left_n + 1.0 / right_n), 1.0)
+            log_term = np.log(4.0 * np.maximum(total_n, 1.0) / self.delta)
+            epsilon = np.sqrt(log_term / (2.0 * harmonic))
+        significant = valid & (np.abs(shift) > epsilon)
+
+        alarm = significant.any(axis=1)
+        # ADWIN keeps shrinking until no cut holds, i.e. drop up to the newest one
+        cut = np.where(alarm, self.n_blocks - 2 - np.argmax(significant[:, ::-1], axis=1), -1)
+        row_shift = np.where(alarm, shift[np.arange(len(rows)), np.maximum(cut, 0)], 0.0)
+
+        if alarm.any():
+            stale = np.arange(self.n_blocks)[None, :] <= cut[:, None]
+            drop = np.zeros_like(stale)
+            np.put_along_axis(drop, order, stale, axis=1)
+            for position in np.flatnonzero(alarm):
+                row = rows[position]
+                self.sums[row, drop[position]] = 0.0
+                self.counts[row, drop[position]] = 0.0
+
+        # Advance rows whose current block is full, evicting the oldest block
+        full = self.counts[rows, head] >= self.block_size
+        if full.any():
+            full_rows = rows[full]
+            new_head = (head[full] + 1) % self.n_blocks
+            self.head[full_rows] = new_head
+            self.sums[full_rows, new_head] = 0.0
+            self.counts[full_rows, new_head] = 0.0
+
+        return row_shift, alarm
+
+
+class PSISketch(DetectorBank):
+    """Fixed-bin reference/current histograms with Population Stability Index.
+
+    Each row freezes a reference histogram over its first ``reference_size``
+    samples; afterwards an exponentially decayed current histogram is kept,
+    so PSI per dimension is available in O(dims * bins) per sample. PSI is
+    reported net of its small-sample bias, roughly (bins - 1) * (1/n_ref +
+    1/n_cur), so that sampling noise alone does not read as drift.
+    """
+
+    def __init__(self, edges: np.ndarray, reference_size: int = 100,
+                 decay: float = 0.98, min_current: float = 50.0, capacity: int = 8):
+        super().__init__(capacity)
+        self.edges = np.atleast_2d(np.asarray(edges, dtype=np.float64))
+        self.n_dims, n_inner = self.edges.shape
+        self.n_bins = n_inner + 1
+        self.reference_size = reference_size
+        self.decay = decay
+        self.min_current = min_current
+        shape = (self.capacity, self.n_dims, self.n_bins)
+        self.reference = np.zeros(shape)
+        self.current = np.zeros(shape)
+        self.reference_n = np.zeros(self.capacity)
+        self.current_n = np.zeros(self.capacity)
+        self.current_sq = np.zeros(self.capacity)
+
+    @classmethod
+    def from_sample(cls, sample: np.ndarray, n_bins: int = 10, **kwargs) -> "PSISketch":
+        """Quantile bin edges per column of a warm-up sample"""
+        sample = np.atleast_2d(np.asarray(sample, dtype=np.float64))
+        quantiles = np.linspace(0.0, 1.0, n_bins + 1)[1:-1]
+        edges = np.nanquantile(sample, quantiles, axis=0).T
+        return cls(edges, **kwargs)
+
+    def _allocate(self, capacity: int) -> None:
+        self.reference = self._grow_array(self.reference, capacity, 0.0)
+        self.current = self._grow_array(self.current, capacity, 0.0)
+        self.reference_n = self._grow_array(self.reference_n, capacity, 0.0)
+        self.current_n = self._grow_array(self.current_n, capacity, 0.0)
+        self.current_sq = self._grow_array(self.current_sq, capacity, 0.0)
+
+    def reset_rows(self, rows: np.ndarray) -> None:
+        self.reference[rows] = 0.0
+        self.current[rows] = 0.0
+        self.reference_n[rows] = 0.0
+        self.current_n[rows] = 0.0
+        self.current_sq[rows] = 0.0
+
+    def rebase(self, rows: np.ndarray) -> None:
+        """Promote the current histogram to the reference after a handled drift"""
+        rows = rows[self.effective_current(rows) >= self.min_current]
+        self.reference[rows] = self.current[rows]
+        self.reference_n[rows] = self.effective_current(rows)
+        self.current[rows] = 0.0
+        self.current_n[rows] = 0.0
+        self.current_sq[rows] = 0.0
+
+    def bin_index(self, values: np.ndarray) -> np.ndarray:
+        """Bin of each value; values has shape (rows, dims)"""
+        return (values[:, :, None] > self.edges[None, :, :]).sum(axis=2)
+
+    def update(self, rows: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Add one (dims,) sample per row; returns PSI with shape (rows, dims)"""
+        values = np.asarray(values, dtype=np.float64).reshape(len(rows), self.n_dims)
+        onehot = np.zeros((len(rows), self.n_dims, self.n_bins))
+        np.put_along_axis(onehot, self.bin_index(values)[:, :, None], 1.0, axis=2)
+        # NaN inputs carry no bin mass
+        onehot[np.isnan(values)] = 0.0
+
+        in_reference = self.reference_n[rows] < self.reference_size
+        if in_reference.any():
+            reference_rows = rows[in_reference]
+            self.reference[reference_rows] += onehot[in_reference]
+            self.reference_n[reference_rows] += 1.0
+
+        tracking = ~in_reference
+        if tracking.any():
+            current_rows = rows[tracking]
+            self.current[current_rows] = self.current[current_rows] * self.decay + onehot[tracking]
+            self.current_n[current_rows] = self.current_n[current_rows] * self.decay + 1.0
+            self.current_sq[current_rows] = self.current_sq[current_rows] * self.decay ** 2 + 1.0
+
+        return self.psi(rows)
+
+    def effective_current(self, rows: np.ndarray) -> np.ndarray:
+        """Effective sample size of the decayed histogram, (sum w)^2 / sum w^2"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.current_sq[rows] > 0, self.current_n[rows] ** 2 / self.current_sq[rows], 0.0)
+
+    def psi(self, rows: np.ndarray) -> np.ndarray:
+        reference = self.reference[rows] + PSI_PSEUDOCOUNT
+        current = self.current[rows] + PSI_PSEUDOCOUNT
+        reference /= reference.sum(axis=2, keepdims=True)
+        current /= current.sum(axis=2, keepdims=True)
+        psi = ((current - reference) * np.log(current / reference)).sum(axis=2)
+
+        effective = self.effective_current(rows)
+        ready = effective >= self.min_current
+        with np.errstate(divide='ignore'):
+            bias = (self.n_bins - 1) * (1.0 / np.maximum(self.reference_n[rows], 1.0)
+                                        + 1.0 / np.maximum(effective, 1.0))
+        return np.where(ready[:, None], np.maximum(psi - bias[:, None], 0.0), 0.0)
+
+
+class OutcomeWindow(DetectorBank):
+    """Ring buffer of the most recent (prediction, actual) pairs per row"""
+
+    def __init__(self, window: int = 10, capacity: int = 8):
+        super().__init__(capacity)
+        self.window = window
+        self.predictions = np.zeros((self.capacity, window))
+        self.actuals = np.zeros((self.capacity, window))
+        self.count = np.zeros(self.capacity, dtype=np.int64)
+
+    def _allocate(self, capacity: int) -> None:
+        self.predictions = self._grow_array(self.predictions, capacity, 0.0)
+        self.actuals = self._grow_array(self.actuals, capacity, 0.0)
+        self.count = self._grow_array(self.count, capacity, 0)
+
+    def reset_rows(self, rows: np.ndarray) -> None:
+        self.predictions[rows] = 0.0
+        self.actuals[rows] = 0.0
+        self.count[rows] = 0
+
+    def update(self, rows: np.ndarray, predictions: np.ndarray, actuals: np.ndarray) -> None:
+        slot = self.count[rows] % self.window
+        self.predictions[rows, slot] = predictions
+        self.actuals[rows, slot] = actuals
+        self.count[rows] += 1
+
+    def metrics(self, rows: np.ndarray, eps: float = 1e-15) -> Optional[dict]:
+        """Accuracy, log loss, Brier score and calibration over full windows.
+
+        Rows whose window has not filled yet are left out; returns None when no
+        requested row has a full window.
+        """
+        rows = rows[self.count[rows] >= self.window]
+        if len(rows) == 0:
+            return None
+
+        predictions = self.predictions[rows]
+        actuals = self.actuals[rows]
+        binary_predictions = predictions > 0.5
+        binary_actuals = actuals > 0.5
+        clipped = np.clip(predictions, eps, 1 - eps)
+
+        correct = (binary_predictions == binary_actuals).sum(axis=1)
+        log_loss = -np.where(binary_actuals, np.log(clipped), np.log(1 - clipped)).mean(axis=1)
+        return {
+            'rows': rows,
+            'accuracy': correct / self.window,
+            'correct_predictions': correct,
+            'log_loss': log_loss,
+            'brier_score': ((predictions - binary_actuals) ** 2).mean(axis=1),
+            'confidence_calibration': 1.0 - np.abs(predictions.mean(axis=1) - actuals.mean(axis=1)),
+        }
@@ -0,0 +1,316 @@
+"""
+Expert Battle Analysis
+Columnar per-week analysis of expert disagreement, confidence and upset risk
+"""
+
+from typing import List, Dict, Any
+from dataclasses import dataclass
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Pick codes for the categorical columns; OTHER marks a set but unrecognised pick
+PICK_NONE, PICK_HOME, PICK_AWAY, PICK_PUSH, PICK_OTHER = 0, 1, 2, 3, 4
+TOTAL_NONE, TOTAL_OVER, TOTAL_UNDER, TOTAL_OTHER = 0, 1, 2, 3
+
+SPREAD_CODES = {'home': PICK_HOME, 'away': PICK_AWAY, 'push': PICK_PUSH}
+TOTALS_CODES = {'over': TOTAL_OVER, 'under': TOTAL_UNDER}
+
+
+def personality_label(expert: Any) -> Any:
+    """Hashable personality type for grouping; profiles group by decision style"""
+    personality = getattr(expert, 'personality', 'unknown')
+    return getattr(personality, 'decision_style', personality)
+
+
+@dataclass
+class BattleMatrix:
+    """Aligned (game, expert) prediction arrays for a batch of games"""
+    game_ids: List[str]
+    expert_ids: List[str]
+    present: np.ndarray          # (G, E) expert predicted this game
+    position: np.ndarray         # (G, E) order of the prediction within its game
+    confidence: np.ndarray       # (G, E)
+    picks_home: np.ndarray       # (G, E) winner_prediction == 'home'
+    total_score: np.ndarray      # (G, E) home + away score, NaN when missing
+    score_margin: np.ndarray     # (G, E) home - away score, NaN when missing
+    spread_pick: np.ndarray      # (G, E) SPREAD codes
+    totals_pick: np.ndarray      # (G, E) TOTALS codes
+    in_council: np.ndarray       # (E,)
+    known_expert: np.ndarray     # (E,) expert is registered with the framework
+    contrarian: np.ndarray       # (E,) contrarian_tendency > 0.7
+    personality_index: np.ndarray  # (E,) index into personalities, -1 if unknown expert
+    personalities: List[Any]
+
+
+def _masked_mean(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    count = mask.sum(axis=1)
+    total = np.where(mask, values, 0.0).sum(axis=1)
+    return np.where(count > 0, total / np.maximum(count, 1), 0.0)
+
+
+def _masked_std(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Population standard deviation per row, matching np.std"""
+    mean = _masked_mean(values, mask)
+    deviation = np.where(mask, values - mean[:, None], 0.0)
+    count = np.maximum(mask.sum(axis=1), 1)
+    return np.sqrt((deviation * deviation).sum(axis=1) / count)
+
+
+class BattleAnalysisEngine:
+    """Computes every battle analysis for every game of a week in one pass
+
+    Mirrors the per-game analysis methods of ExpertCompetitionFramework,
+    including their insufficient-data messages.
+    """
+
+    def build_matrix(
+        self,
+        predictions_by_game: Dict[str, Dict[str, Any]],  # game_id -> expert_id -> prediction
+        experts: Dict[str, Any],
+        council: List[str]
+    ) -> BattleMatrix:
+        """Pack prediction objects and per-expert traits into aligned arrays"""
+        game_ids = list(predictions_by_game)
+        expert_ids = list(dict.fromkeys(e for preds in predictions_by_game.values() for e in preds))
+        expert_index = {e: i for i, e in enumerate(expert_ids)}
+        shape = (len(game_ids), len(expert_ids))
+
+        present = np.zeros(shape, dtype=bool)
+        position = np.zeros(shape, dtype=np.int32)
+        confidence = np.zeros(shape)
+        picks_home = np.zeros(shape, dtype=bool)
+        total_score = np.full(shape, np.nan)
+        score_margin = np.full(shape, np.nan)
+        spread_pick = np.zeros(shape, dtype=np.int8)
+        totals_pick = np.zeros(shape, dtype=np.int8)
+
+        for g, game_id in enumerate(game_ids):
+            for order, (expert_id, prediction) in enumerate(predictions_by_game[game_id].items()):
+                e = expert_index[expert_id]
+                present[g, e] = True
+                position[g, e] = order
+                confidence[g, e] = prediction.confidence_overall
+                picks_home[g, e] = prediction.winner_prediction == 'home'
+
+                if prediction.exact_score_home is not None and prediction.exact_score_away is not None:
+                    total_score[g, e] = prediction.exact_score_home + prediction.exact_score_away
+                    score_margin[g, e] = prediction.exact_score_home - prediction.exact_score_away
+
+                if prediction.against_the_spread:
+                    spread_pick[g, e] = SPREAD_CODES.get(prediction.against_the_spread, PICK_OTHER)
+                if prediction.totals_over_under:
+                    totals_pick[g, e] = TOTALS_CODES.get(prediction.totals_over_under, TOTAL_OTHER)
+
+        # Expert traits are looked up once per week rather than once per game
+        council_set = set(council)
+        in_council = np.array([e in council_set for e in expert_ids], dtype=bool)
+        known_expert = np.array([e in experts for e in expert_ids], dtype=bool)
+        contrarian = np.zeros(len(expert_ids), dtype=bool)
+        personality_index = np.full(len(expert_ids), -1, dtype=np.int32)
+        personality_lookup: Dict[Any, int] = {}
+
+        for e, expert_id in enumerate(expert_ids):
+            if expert_id not in experts:
+                continue
+            expert = experts[expert_id]
+
+            personality = personality_label(expert)
+            personality_index[e] = personality_lookup.setdefault(personality, len(personality_lookup))
+
+            tendency = getattr(expert, 'personality_traits', {}).get('contrarian_tendency', 0.5)
+            if hasattr(tendency, 'value'):
+                tendency = tendency.value
+            contrarian[e] = tendency > 0.7
+
+        return BattleMatrix(
+            game_ids=game_ids,
+            expert_ids=expert_ids,
+            present=present,
+            position=position,
+            confidence=confidence,
+            picks_home=picks_home,
+            total_score=total_score,
+            score_margin=score_margin,
+            spread_pick=spread_pick,
+            totals_pick=totals_pick,
+            in_council=in_council,
+            known_expert=known_expert,
+            contrarian=contrarian,
+            personality_index=personality_index,
+            personalities=list(personality_lookup)
+        )
+
+    def analyze(self, matrix: BattleMatrix) -> Dict[str, Dict[str, Any]]:
+        """Return the per-game analysis sections keyed by game_id"""
+        present = matrix.present
+        n = present.sum(axis=1)
+        home_votes = (present & matrix.picks_home).sum(axis=1)
+        minority_rate = np.minimum(home_votes, n - home_votes) / np.maximum(n, 1)
+
+        conf_mask = present
+        conf_mean = _masked_mean(matrix.confidence, conf_mask)
+        conf_std = _masked_std(matrix.confidence, conf_mask)
+        conf_max = np.where(present, matrix.confidence, -np.inf).max(axis=1, initial=-np.inf)
+        conf_min = np.where(present, matrix.confidence, np.inf).min(axis=1, initial=np.inf)
+        high_conf = (present & (matrix.confidence > 0.7)).sum(axis=1)
+        low_conf = (present & (matrix.confidence < 0.4)).sum(axis=1)
+
+        score_mask = present & ~np.isnan(matrix.total_score)
+        score_count = score_mask.sum(axis=1)
+        score_mean = _masked_mean(matrix.total_score, score_mask)
+        score_std = np.where(score_count > 1, _masked_std(matrix.total_score, score_mask), 0.0)
+
+        # Controversy: coefficient of variation of confidence and total score
+        with np.errstate(invalid='ignore', divide='ignore'):
+            confidence_cv = np.where(conf_mean > 0, conf_std / conf_mean, 0.0)
+            score_cv = np.where((score_count > 1) & (score_mean > 0), score_std / score_mean, 0.0)
+        controversy = np.minimum(1.0, minority_rate * 0.5 + confidence_cv * 0.3 + score_cv * 0.2)
+
+        # Council consensus
+        council_mask = present & matrix.in_council[None, :]
+        council_n = council_mask.sum(axis=1)
+        council_home = (council_mask & matrix.picks_home).sum(axis=1)
+        council_conf = _masked_mean(matrix.confidence, council_mask)
+        margin_mask = council_mask & ~np.isnan(matrix.score_margin)
+        council_spread = _masked_mean(matrix.score_margin, margin_mask)
+
+        # Category picks
+        spread_counts = {
+            code: (present & (matrix.spread_pick == code)).sum(axis=1)
+            for code in (PICK_HOME, PICK_AWAY, PICK_PUSH)
+        }
+        has_spread = (present & (matrix.spread_pick != PICK_NONE)).any(axis=1)
+        over_picks = (present & (matrix.totals_pick == TOTAL_OVER)).sum(axis=1)
+        under_picks = (present & (matrix.totals_pick == TOTAL_UNDER)).sum(axis=1)
+        has_totals = (present & (matrix.totals_pick != TOTAL_NONE)).any(axis=1)
+
+        # Upset indicators only count registered experts
+        known = present & matrix.known_expert[None, :]
+        contrarian_picks = (known & matrix.contrarian[None, :]).sum(axis=1)
+        low_conf_picks = (known & (matrix.confidence < 0.6)).sum(axis=1)
+        contrarian_pct = contrarian_picks / np.maximum(n, 1)
+        low_conf_pct = low_conf_picks / np.maximum(n, 1)
+        upset_score = contrarian_pct * 0.6 + low_conf_pct * 0.4
+
+        # Personality confidence: (G, P) sums plus first appearance for tie order
+        n_personalities = len(matrix.personalities)
+        personality_sum = np.zeros((len(matrix.game_ids), n_personalities))
+        personality_count = np.zeros((len(matrix.game_ids), n_personalities))
+        personality_first = np.full((len(matrix.game_ids), n_personalities), np.iinfo(np.int32).max)
+        if n_personalities:
+            game_rows, expert_cols = np.nonzero(known)
+            bins = matrix.personality_index[expert_cols]
+            np.add.at(personality_sum, (game_rows, bins), matrix.confidence[game_rows, expert_cols])
+            np.add.at(personality_count, (game_rows, bins), 1)
+            np.minimum.at(personality_first, (game_rows, bins), matrix.position[game_rows, expert_cols])
+
+        results = {}
+        for g, game_id in enumerate(matrix.game_ids):
+            total = int(n[g])
+            home = int(home_votes[g])
+
+            if council_n[g]:
+                c_home = int(council_home[g])
+                c_away = int(council_n[g]) - c_home
+                council_consensus = {
+                    'consensus_winner': 'home' if c_home > c_away else 'away',
+                    'consensus_strength': max(c_home, c_away) / int(council_n[g]),
+                    'home_votes': c_home,
+                    'away_votes': c_away,
+                    'average_confidence': float(council_conf[g]),
+                    'consensus_spread': float(council_spread[g]) if margin_mask[g].any() else 0,
+                    'council_size': int(council_n[g])
+                }
+            else:
+                council_consensus = {'consensus': 'No council predictions available'}
+
+            if total < 2:
+                disagreements = {'disagreements': 'Insufficient predictions for analysis'}
+            else:
+                disagreements = {
+                    'winner_disagreement_rate': float(minority_rate[g]),
+                    'home_predictions': home,
+                    'away_predictions': total - home,
+                    'score_variance': float(score_std[g]) if score_count[g] > 1 else 0,
+                    'confidence_variance': float(conf_std[g]),
+                    'total_predictions': total
+                }
+
+            if not total:
+                unavailable = 'No predictions available'
+                results[game_id] = {
+                    'council_consensus': council_consensus,
+                    'expert_disagreements': disagreements,
+                    'confidence_analysis': {'confidence_analysis': unavailable},
+                    'category_analysis': {'category_analysis': unavailable},
+                    'specialization_relevance': {'specialization_relevance': unavailable},
+                    'controversy_score': 0.0,
+                    'upset_potential': {'upset_potential': unavailable}
+                }
+                continue
+
+            confidence_analysis = {
+                'average_confidence': float(conf_mean[g]),
+                'confidence_std': float(conf_std[g]),
+                'max_confidence': float(conf_max[g]),
+                'min_confidence': float(conf_min[g]),
+                'high_confidence_experts': int(high_conf[g]),
+                'low_confidence_experts': int(low_conf[g]),
+                'total_experts': total
+            }
+
+            category_analysis = {}
+            if has_spread[g]:
+                home_spread = int(spread_counts[PICK_HOME][g])
+                away_spread = int(spread_counts[PICK_AWAY][g])
+                category_analysis['spread'] = {
+                    'home_picks': home_spread,
+                    'away_picks': away_spread,
+                    'push_picks': int(spread_counts[PICK_PUSH][g]),
+                    'consensus': 'home' if home_spread > away_spread else 'away'
+                }
+            if has_totals[g]:
+                over = int(over_picks[g])
+                under = int(under_picks[g])
+                category_analysis['totals'] = {
+                    'over_picks': over,
+                    'under_picks': under,
+                    'consensus': 'over' if over > under else 'under'
+                }
+
+            seen = np.nonzero(personality_count[g])[0]
+            averages = personality_sum[g, seen] / personality_count[g, seen]
+            order = sorted(range(len(seen)), key=lambda i: (-averages[i], personality_first[g, seen[i]]))
+            personality_relevance = {
+                matrix.personalities[seen[i]]: float(averages[i]) for i in order
+            }
+            specialization_relevance = {
+                'personality_relevance': personality_relevance,
+                'most_relevant_personality': matrix.personalities[seen[order[0]]] if order else 'unknown',
+                'confidence_spread': float(averages.max() - averages.min()) if len(seen) else 0
+            }
+
+            upset = float(upset_score[g])
+            upset_potential = {
+                'contrarian_experts': int(contrarian_picks[g]),
+                'low_confidence_experts': int(low_conf_picks[g]),
+                'total_experts': total,
+                'contrarian_percentage': float(contrarian_pct[g]),
+                'low_confidence_percentage': float(low_conf_pct[g]),
+                'upset_potential_score': upset,
+                'upset_risk': 'high' if upset > 0.6 else 'medium' if upset > 0.3 else 'low'
+            }
+
+            results[game_id] = {
+                'council_consensus': council_consensus,
+                'expert_disagreements': disagreements,
+                'confidence_analysis': confidence_analysis,
+                'category_analysis': category_analysis,
+                'specialization_relevance': specialization_relevance,
+                'controversy_score': float(controversy[g]) if total >= 2 else 0.0,
+                'upset_potential': upset_potential
+            }
+
+        return results
@@ -4,6 +4,7 @@ Manages 15 competing experts with dynamic ranking and council selection
 """
 
 from typing import List, Dict, Optional, Any, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
@@ -14,6 +15,7 @@ import numpy as np
 # Import prediction engine components
 from ..prediction_engine.comprehensive_prediction_categories import ExpertPrediction
 from ..prediction_engine.category_specific_algorithms import CategorySpecificPredictor
+from .battle_analysis import BattleAnalysisEngine, personality_label
 
 # Supabase client
 try:
@@ -71,12 +73,14 @@ class ExpertCompetitionFramework:
         
         self.ranking_system = ExpertRankingSystem()
         self.council_selector = AICouncilSelector()
-        self.performance_evaluator = PerformanceEvaluator()
+        # Graded outcomes feed the incremental ranking state as rounds are evaluated
+        self.performance_evaluator = PerformanceEvaluator(outcome_listener=self.ranking_system.record_outcome)
         
         # Initialize AI Council voting components
         self.vote_weight_calculator = VoteWeightCalculator()
         self.consensus_builder = ConsensusBuilder(self.vote_weight_calculator)
         self.explanation_generator = ExplanationGenerator()
+        self.battle_engine = BattleAnalysisEngine()
         
         # Initialize prediction engine
         self.category_predictor = CategorySpecificPredictor()
@@ -85,6 +89,11 @@ class ExpertCompetitionFramework:
         self.current_round: Optional[CompetitionRound] = None
         self.leaderboard: List[ExpertPerformanceMetrics] = []
         self.ai_council: List[str] = []
+        self.council_version = 0
+        
+        # Battle analyses cached per (week, council version), most recently used last
+        self._battle_cache: 'OrderedDict[Tuple[Any, int], Dict[str, Dict[str, Any]]]' = OrderedDict()
+        self.battle_cache_weeks = 8
         
         # Initialize experts
         self._initialize_15_experts()
@@ -214,6 +223,8 @@ class ExpertCompetitionFramework:
             # Identify promotions and demotions
             promoted = [expert_id for expert_id in council_members if expert_id not in previous_council]
             demoted = [expert_id for expert_id in previous_council if expert_id not in council_members]
+            if promoted or demoted:
+                self.council_version += 1
             
             # Update database
             if self.supabase:
@@ -243,6 +254,10 @@ class ExpertCompetitionFramework:
         try:
             rankings = await self.ranking_system.calculate_rankings(self.experts)
             
+            # Nothing changed since the last refresh - leaderboard is already current
+            if rankings is self.leaderboard and rankings:
+                return rankings
+            
             # Update leaderboard
             self.leaderboard = rankings
             
@@ -371,37 +386,92 @@ class ExpertCompetitionFramework:
             logger.error(f"Failed to generate expert predictions: {e}")
             return {}
     
+    # Categories the AI Council builds consensus for
+    COUNCIL_CONSENSUS_CATEGORIES = [
+        'winner_prediction', 'exact_score_home', 'exact_score_away',
+        'margin_of_victory', 'against_the_spread', 'totals_over_under',
+        'first_half_winner', 'qb_passing_yards', 'qb_touchdowns'
+    ]
+    
     async def generate_ai_council_consensus(self, game_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate AI Council consensus predictions with explanations"""
+        game_id = game_data.get('game_id', 'unknown')
+        results = await self.generate_week_council_consensus([game_data])
+        return results.get(game_id, {
+            'game_id': game_id,
+            'error': 'No council predictions available',
+            'consensus': {},
+            'explanations': {}
+        })
+    
+    async def generate_week_council_consensus(self, games_data: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Generate AI Council consensus for a whole slate with one batched consensus pass"""
         try:
-            game_id = game_data.get('game_id', 'unknown')
-            
             # Ensure we have an AI Council selected
             if not self.ai_council:
                 await self.select_ai_council()
             
-            # Generate predictions from all council members
-            council_predictions = {}
-            council_experts = []
+            council_experts = [self.experts[expert_id] for expert_id in self.ai_council if expert_id in self.experts]
             
-            for expert_id in self.ai_council:
-                if expert_id in self.experts:
-                    expert = self.experts[expert_id]
-                    council_experts.append(expert)
-                    
-                    # Generate prediction for this expert
-                    prediction = self.category_predictor.generate_comprehensive_prediction(
-                        expert, game_data
-                    )
-                    council_predictions[expert_id] = prediction
+            # Generate predictions from all council members for every game
+            predictions_by_game = {}
+            for game_data in games_data:
+                predictions_by_game[game_data.get('game_id', 'unknown')] = {
+                    expert.expert_id: self.category_predictor.generate_comprehensive_prediction(expert, game_data)
+                    for expert in council_experts
+                }
             
-            if not council_predictions:
-                return {
-                    'game_id': game_id,
-                    'error': 'No council predictions available',
+            # Build consensus for all categories of all games at once
+            consensus_by_game = self.consensus_builder.build_batch_consensus(
+                {game_id: preds for game_id, preds in predictions_by_game.items() if preds},
+                council_experts,
+                self.COUNCIL_CONSENSUS_CATEGORIES
+            )
+            
+            results = {}
+            for game_data in games_data:
+                game_id = game_data.get('game_id', 'unknown')
+                council_predictions = predictions_by_game[game_id]
+                
+                if not council_predictions:
+                    results[game_id] = {
+                        'game_id': game_id,
+                        'error': 'No council predictions available',
+                        'consensus': {},
+                        'explanations': {}
+                    }
+                    continue
+                
+                results[game_id] = await self._assemble_council_consensus(
+                    game_data, council_experts, council_predictions, consensus_by_game[game_id]
+                )
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Failed to generate AI Council consensus: {e}")
+            import traceback
+            traceback.print_exc()
+            return {
+                game_data.get('game_id', 'unknown'): {
+                    'game_id': game_data.get('game_id', 'unknown'),
+                    'error': str(e),
                     'consensus': {},
                     'explanations': {}
                 }
+                for game_data in games_data
+            }
+    
+    async def _assemble_council_consensus(
+        self,
+        game_data: Dict[str, Any],
+        council_experts: List[Any],
+        council_predictions: Dict[str, ExpertPrediction],
+        consensus_results: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Attach vote weights and explanations to one game's consensus"""
+        try:
+            game_id = game_data.get('game_id', 'unknown')
             
             # Calculate vote weights
             expert_confidences = {
@@ -415,20 +485,6 @@ class ExpertCompetitionFramework:
             
             expert_weights = {vw.expert_id: vw.normalized_weight for vw in vote_weights}
             
-            # Build consensus for key prediction categories
-            consensus_categories = [
-                'winner_prediction', 'exact_score_home', 'exact_score_away',
-                'margin_of_victory', 'against_the_spread', 'totals_over_under',
-                'first_half_winner', 'qb_passing_yards', 'qb_touchdowns'
-            ]
-            
-            consensus_results = {}
-            for category in consensus_categories:
-                consensus = self.consensus_builder.build_consensus(
-                    council_predictions, council_experts, category
-                )
-                consensus_results[category] = consensus
-            
             # Generate explanations
             from .explanation_generator import ExplanationContext
             
@@ -499,7 +555,72 @@ class ExpertCompetitionFramework:
                 'consensus': {},
                 'explanations': {}
             }
+    
+    async def get_expert_battle_analysis(self, game_id: str) -> Dict[str, Any]:
         """Get detailed expert battle analysis for a specific game"""
+        results = await self.get_week_battle_analysis([game_id])
+        return results.get(game_id, {'game_id': game_id, 'error': 'No analysis available'})
+    
+    async def get_week_battle_analysis(self, game_ids: List[str], week: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """Get expert battle analysis for every game of a week.
+        
+        Predictions for all games are loaded in one query and every analysis is
+        computed in one columnar pass. With a week given, results are cached per
+        (week, council version) so repeated page loads skip the work.
+        """
+        cache_key = (week, self.council_version)
+        if week is not None:
+            cached = self._battle_cache.get(cache_key)
+            if cached is not None and all(game_id in cached for game_id in game_ids):
+                self._battle_cache.move_to_end(cache_key)
+                return {game_id: cached[game_id] for game_id in game_ids}
+        
+        try:
+            predictions_by_game = await self._get_expert_predictions_for_games(game_ids)
+            
+            matrix = self.battle_engine.build_matrix(predictions_by_game, self.experts, self.ai_council)
+            analyses = self.battle_engine.analyze(matrix)
+            historical = await asyncio.gather(
+                *(self._get_historical_performance_context(game_id) for game_id in game_ids)
+            )
+            
+            results = {}
+            for game_id, history in zip(game_ids, historical):
+                analysis = analyses[game_id]
+                results[game_id] = {
+                    'game_id': game_id,
+                    'total_experts': len(predictions_by_game[game_id]),
+                    'council_consensus': analysis['council_consensus'],
+                    'expert_disagreements': analysis['expert_disagreements'],
+                    'confidence_analysis': analysis['confidence_analysis'],
+                    'category_analysis': analysis['category_analysis'],
+                    'specialization_relevance': analysis['specialization_relevance'],
+                    'historical_performance': history,
+                    'controversy_score': analysis['controversy_score'],
+                    'upset_potential': analysis['upset_potential']
+                }
+            
+        except Exception as e:
+            # Fallback results are not cached, so the batched pass is retried next time
+            logger.error(f"Failed to generate batched battle analysis, falling back to per-game: {e}")
+            games = await asyncio.gather(*(self._analyze_game_battle(game_id) for game_id in game_ids))
+            return dict(zip(game_ids, games))
+        
+        if week is not None:
+            self._cache_battle_analyses(cache_key, results)
+        return results
+    
+    def _cache_battle_analyses(self, cache_key: Tuple[Any, int], results: Dict[str, Dict[str, Any]]) -> None:
+        """Store analyses for a week, dropping stale council versions and the least recently used weeks"""
+        for key in [key for key in self._battle_cache if key[1] != self.council_version]:
+            del self._battle_cache[key]
+        self._battle_cache.setdefault(cache_key, {}).update(results)
+        self._battle_cache.move_to_end(cache_key)
+        while len(self._battle_cache) > self.battle_cache_weeks:
+            self._battle_cache.popitem(last=False)
+    
+    async def _analyze_game_battle(self, game_id: str) -> Dict[str, Any]:
+        """Per-game battle analysis, used when the batched pass fails"""
         try:
             # Get all expert predictions for this game
             expert_predictions = await self._get_expert_predictions_for_game(game_id)
@@ -650,6 +771,9 @@ class ExpertCompetitionFramework:
                 'key_factors': prediction.key_factors
             }).execute()
             
+            # Cached battle analyses no longer reflect the stored predictions
+            self._battle_cache.clear()
+            
             logger.debug(f"Stored prediction for {prediction.expert_name} on game {prediction.game_id}")
             
         except Exception as e:
@@ -657,16 +781,21 @@ class ExpertCompetitionFramework:
     
     async def _get_expert_predictions_for_game(self, game_id: str) -> Dict[str, ExpertPrediction]:
         """Get all expert predictions for a specific game"""
+        predictions_by_game = await self._get_expert_predictions_for_games([game_id])
+        return predictions_by_game[game_id]
+    
+    async def _get_expert_predictions_for_games(self, game_ids: List[str]) -> Dict[str, Dict[str, ExpertPrediction]]:
+        """Get all expert predictions for a batch of games in one query"""
+        predictions_by_game: Dict[str, Dict[str, ExpertPrediction]] = {game_id: {} for game_id in game_ids}
         try:
-            if not self.supabase:
-                return {}
+            if not self.supabase or not game_ids:
+                return predictions_by_game
             
             result = self.supabase.table('expert_predictions_enhanced') \
                 .select('*') \
-                .eq('game_id', game_id) \
+                .in_('game_id', list(game_ids)) \
                 .execute()
             
-            predictions = {}
             for row in result.data:
                 prediction_data = row['prediction_data']
                 prediction = ExpertPrediction(
@@ -683,13 +812,14 @@ class ExpertCompetitionFramework:
                     if hasattr(prediction, field):
                         setattr(prediction, field, value)
                 
-                predictions[row['expert_id']] = prediction
+                predictions_by_game.setdefault(row['game_id'], {})[row['expert_id']] = prediction
             
-            return predictions
+            return predictions_by_game
             
         except Exception as e:
-            logger.error(f"Failed to get expert predictions for game {game_id}: {e}")
-            return {}
+            logger.error(f"Failed to get expert predictions for games: {e}")
+            return predictions_by_game
+    
     async def _update_ai_council_in_db(self, council_members: List[str], promoted: List[str], demoted: List[str]) -> None:
         """Update AI Council membership in database"""
         try:
@@ -997,8 +1127,7 @@ class ExpertCompetitionFramework:
             personality_confidence = {}
             for expert_id, prediction in predictions.items():
                 if expert_id in self.experts:
-                    expert = self.experts[expert_id]
-                    personality = getattr(expert, 'personality', 'unknown')
+                    personality = personality_label(self.experts[expert_id])
                     
                     if personality not in personality_confidence:
                         personality_confidence[personality] = []
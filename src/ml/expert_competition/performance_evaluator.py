@@ -3,7 +3,7 @@ Performance Evaluator
 Evaluates expert performance for competition rounds and overall tracking
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Callable, Optional
 from datetime import datetime
 import logging
 import numpy as np
@@ -13,8 +13,10 @@ logger = logging.getLogger(__name__)
 class PerformanceEvaluator:
     """Evaluates expert performance across different metrics and time periods"""
     
-    def __init__(self):
+    def __init__(self, outcome_listener: Optional[Callable[..., None]] = None):
         self.evaluation_history: List[Dict[str, Any]] = []
+        # Called as (expert, category, is_correct, confidence, counts_overall) per graded outcome
+        self.outcome_listener = outcome_listener
         self.scoring_weights = {
             'accuracy': 0.4,        # 40% - Raw prediction accuracy
             'confidence': 0.25,     # 25% - Confidence calibration
@@ -80,6 +82,11 @@ class PerformanceEvaluator:
             consistency_metrics['consistency_score'] * self.scoring_weights['consistency']
         )
         
+        # Report outcomes before the cumulative counters include them
+        if self.outcome_listener:
+            for category, is_correct, confidence, counts_overall in accuracy_metrics['outcomes']:
+                self.outcome_listener(expert, category, is_correct, confidence, counts_overall)
+        
         # Update expert's cumulative performance
         await self._update_expert_cumulative_performance(expert, accuracy_metrics, confidence_metrics)
         
@@ -155,12 +162,14 @@ class PerformanceEvaluator:
                 'overall_accuracy': 0.5,
                 'correct_count': 0,
                 'total_count': 0,
-                'category_accuracies': {}
+                'category_accuracies': {},
+                'outcomes': []
             }
         
         correct_predictions = 0
         category_correct = {}
         category_total = {}
+        outcomes = []  # (category, is_correct, confidence, counts_overall)
         
         for prediction in predictions:
             game_id = prediction['game_id']
@@ -168,6 +177,7 @@ class PerformanceEvaluator:
             
             # Get actual result (mock if not available)
             actual_result = results.get(game_id, self._generate_mock_result())
+            confidence = pred_data.get('confidence_overall', 0.5)
             
             # Evaluate winner prediction
             if 'winner_prediction' in pred_data:
@@ -176,6 +186,7 @@ class PerformanceEvaluator:
                     correct_predictions += 1
                     category_correct['winner'] = category_correct.get('winner', 0) + 1
                 category_total['winner'] = category_total.get('winner', 0) + 1
+                outcomes.append(('winner', is_correct, confidence, True))
             
             # Evaluate spread prediction
             if 'spread_prediction' in pred_data and 'actual_spread' in actual_result:
@@ -184,6 +195,7 @@ class PerformanceEvaluator:
                 if is_correct:
                     category_correct['spread'] = category_correct.get('spread', 0) + 1
                 category_total['spread'] = category_total.get('spread', 0) + 1
+                outcomes.append(('spread', is_correct, confidence, False))
             
             # Evaluate total prediction
             if 'total_prediction' in pred_data and 'actual_total' in actual_result:
@@ -192,6 +204,7 @@ class PerformanceEvaluator:
                 if is_correct:
                     category_correct['total'] = category_correct.get('total', 0) + 1
                 category_total['total'] = category_total.get('total', 0) + 1
+                outcomes.append(('total', is_correct, confidence, False))
         
         # Calculate category accuracies
         category_accuracies = {}
@@ -205,7 +218,8 @@ class PerformanceEvaluator:
             'overall_accuracy': overall_accuracy,
             'correct_count': correct_predictions,
             'total_count': len(predictions),
-            'category_accuracies': category_accuracies
+            'category_accuracies': category_accuracies,
+            'outcomes': outcomes
         }
     
     def _calculate_confidence_metrics(
@@ -3,11 +3,12 @@ Expert Ranking System
 Multi-dimensional ranking algorithm for expert competition
 """
 
-from typing import Dict, List, Any
-from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
 import numpy as np
 from datetime import datetime, timedelta
 import logging
+import math
 
 logger = logging.getLogger(__name__)
 
@@ -20,71 +21,383 @@ class RankingWeights:
     confidence_calibration: float = 0.10 # 10% - How well confidence predicts success
     specialization_strength: float = 0.10 # 10% - Strength in specialized areas
 
+@dataclass
+class ExpertScoreState:
+    """Running sums behind an expert's ranking components, updated per outcome"""
+    specialization_weights: Dict[str, int] = field(default_factory=dict)
+    recent_window: int = 64
+    total: int = 0
+    correct: int = 0
+    category_counts: Dict[str, List[float]] = field(default_factory=dict)  # category -> [correct, total]
+    category_sum: float = 0.0
+    category_sq_sum: float = 0.0
+    specialization_sum: float = 0.0
+    specialization_count: int = 0
+    calibration_error_sum: float = 0.0
+    recent_outcomes: Optional[np.ndarray] = None
+    recent_correct: int = 0
+    recent_count: int = 0
+    version: int = 0
+
+    def __post_init__(self):
+        if self.recent_outcomes is None:
+            self.recent_outcomes = np.zeros(self.recent_window, dtype=np.int8)
+
+    def seed(self, total: int, correct: int, category_accuracies: Dict[str, float],
+             calibration: float = 0.5) -> None:
+        """Start from an expert's existing counters instead of from zero.
+
+        Only per-category accuracies are stored on experts, so each category
+        is seeded with an equal share of the prediction count.
+        """
+        self.total = total
+        self.correct = correct
+        self.calibration_error_sum = (1.0 - calibration) * total
+        share = total / len(category_accuracies) if total and category_accuracies else 1.0
+        for category, accuracy in category_accuracies.items():
+            self._set_category(category, [accuracy * share, share])
+        self.version += 1
+
+    def record(self, category: str, is_correct: bool, confidence: float,
+               counts_overall: bool = True) -> None:
+        """Fold one outcome into every component in O(1).
+
+        Outcomes with counts_overall=False (secondary categories of a
+        prediction) only update the category and specialization sums.
+        """
+        hit = 1 if is_correct else 0
+        if counts_overall:
+            self.total += 1
+            self.correct += hit
+            self.calibration_error_sum += abs(confidence - hit)
+
+            # Recent performance ring buffer
+            slot = self.recent_count % self.recent_window
+            if self.recent_count >= self.recent_window:
+                self.recent_correct -= int(self.recent_outcomes[slot])
+            self.recent_outcomes[slot] = hit
+            self.recent_correct += hit
+            self.recent_count += 1
+
+        counts = self.category_counts.get(category) or [0, 0]
+        self._set_category(category, [counts[0] + hit, counts[1] + 1])
+        self.version += 1
+
+    def _set_category(self, category: str, counts: List[float]) -> None:
+        """Swap this category's old accuracy for the new one in the running sums"""
+        old_counts = self.category_counts.get(category)
+        multiplicity = self.specialization_weights.get(category, 0)
+        if old_counts is None:
+            self.specialization_count += multiplicity
+        else:
+            old = old_counts[0] / old_counts[1]
+            self.category_sum -= old
+            self.category_sq_sum -= old * old
+            self.specialization_sum -= multiplicity * old
+        self.category_counts[category] = counts
+        new = counts[0] / counts[1]
+        self.category_sum += new
+        self.category_sq_sum += new * new
+        self.specialization_sum += multiplicity * new
+
+    def components(self, min_trend_outcomes: int = 10) -> Dict[str, Any]:
+        overall = self.correct / self.total if self.total else 0.5
+        recent_n = min(self.recent_count, self.recent_window)
+        recent = self.recent_correct / recent_n if recent_n else overall
+
+        n_categories = len(self.category_counts)
+        if n_categories == 0:
+            consistency = 0.5
+        elif n_categories == 1:
+            consistency = 1.0
+        else:
+            mean = self.category_sum / n_categories
+            std_dev = math.sqrt(max(0.0, self.category_sq_sum / n_categories - mean * mean))
+            consistency = max(0, 1 - (std_dev * 2))
+
+        calibration = max(0.0, 1.0 - self.calibration_error_sum / self.total) if self.total else 0.5
+
+        if not self.specialization_weights or not self.specialization_count:
+            specialization = 0.5
+        else:
+            boost = self.specialization_sum / self.specialization_count - overall
+            specialization = max(0, min(1, 0.5 + boost))
+
+        if recent_n < min_trend_outcomes:
+            trend = 'stable'
+        elif recent > overall + 0.05:
+            trend = 'improving'
+        elif recent < overall - 0.05:
+            trend = 'declining'
+        else:
+            trend = 'stable'
+
+        return {
+            'overall_accuracy': overall,
+            'recent_performance': recent,
+            'consistency': consistency,
+            'confidence_calibration': calibration,
+            'specialization_strength': specialization,
+            'category_accuracies': {c: k[0] / k[1] for c, k in self.category_counts.items()},
+            'trend': trend,
+        }
+
+
+class RankHistory:
+    """Fixed-capacity ring buffer of rank snapshots with running volatility sums"""
+
+    def __init__(self, capacity: int = 50):
+        self.capacity = capacity
+        self.expert_index: Dict[str, int] = {}
+        self.expert_ids: List[str] = []
+        self.ranks = np.full((capacity, 16), -1, dtype=np.int32)
+        self.scores = np.zeros((capacity, 16))
+        self.accuracies = np.zeros((capacity, 16))
+        self.orders: List[Optional[np.ndarray]] = [None] * capacity
+        self.timestamps: List[Optional[str]] = [None] * capacity
+        # Rank-change contribution of (previous snapshot, this snapshot) per slot
+        self.change_sum = np.zeros(capacity)
+        self.change_count = np.zeros(capacity, dtype=np.int64)
+        self.total_change = 0.0
+        self.total_pairs = 0
+        self.count = 0
+        self.head = -1
+        self.movers_up: List[Dict[str, Any]] = []
+        self.movers_down: List[Dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _column(self, expert_id: str) -> int:
+        column = self.expert_index.get(expert_id)
+        if column is None:
+            column = len(self.expert_ids)
+            if column >= self.ranks.shape[1]:
+                extra = self.ranks.shape[1]
+                self.ranks = np.hstack([self.ranks, np.full((self.capacity, extra), -1, dtype=np.int32)])
+                self.scores = np.hstack([self.scores, np.zeros((self.capacity, extra))])
+                self.accuracies = np.hstack([self.accuracies, np.zeros((self.capacity, extra))])
+            self.expert_index[expert_id] = column
+            self.expert_ids.append(expert_id)
+        return column
+
+    def push(self, rankings: List[Any]) -> None:
+        columns = np.array([self._column(r.expert_id) for r in rankings], dtype=np.intp)
+        ranks = np.array([r.current_rank for r in rankings], dtype=np.int32)
+
+        previous = self.head if self.count else None
+        self.head = (self.head + 1) % self.capacity
+        slot = self.head
+
+        if self.count == self.capacity:
+            # Slot is being overwritten; the next-oldest loses its predecessor pair
+            oldest = (slot + 1) % self.capacity
+            self.total_change -= self.change_sum[oldest]
+            self.total_pairs -= int(self.change_count[oldest])
+            self.change_sum[oldest] = 0.0
+            self.change_count[oldest] = 0
+            self.total_change -= self.change_sum[slot]
+            self.total_pairs -= int(self.change_count[slot])
+        else:
+            self.count += 1
+
+        self.ranks[slot] = -1
+        self.ranks[slot, columns] = ranks
+        self.scores[slot, columns] = [r.leaderboard_score for r in rankings]
+        self.accuracies[slot, columns] = [r.overall_accuracy for r in rankings]
+        self.orders[slot] = columns
+        self.timestamps[slot] = datetime.now().isoformat()
+
+        self.change_sum[slot] = 0.0
+        self.change_count[slot] = 0
+        movements = []
+        if previous is not None:
+            previous_ranks = self.ranks[previous, columns]
+            present = previous_ranks >= 0
+            changes = previous_ranks - ranks
+            self.change_sum[slot] = float(np.abs(changes[present]).sum())
+            self.change_count[slot] = int(present.sum())
+            self.total_change += self.change_sum[slot]
+            self.total_pairs += int(self.change_count[slot])
+
+            for position in np.flatnonzero(present):
+                movements.append({
+                    'expert_id': rankings[position].expert_id,
+                    'current_rank': int(ranks[position]),
+                    'previous_rank': int(previous_ranks[position]),
+                    'rank_change': int(changes[position])  # Positive = moved up
+                })
+
+        self.movers_up = sorted(movements, key=lambda x: x['rank_change'], reverse=True)
+        self.movers_down = sorted(movements, key=lambda x: x['rank_change'])
+
+    def snapshots(self) -> List[Dict[str, Any]]:
+        """Stored snapshots, oldest first, in the historical dict layout"""
+        history = []
+        for offset in range(self.count - 1, -1, -1):
+            slot = (self.head - offset) % self.capacity
+            history.append({
+                'timestamp': self.timestamps[slot],
+                'rankings': [
+                    {
+                        'expert_id': self.expert_ids[column],
+                        'rank': int(self.ranks[slot, column]),
+                        'score': float(self.scores[slot, column]),
+                        'accuracy': float(self.accuracies[slot, column])
+                    }
+                    for column in self.orders[slot]
+                ]
+            })
+        return history
+
 class ExpertRankingSystem:
     """Advanced ranking system for expert competition"""
     
-    def __init__(self, weights: RankingWeights = None):
+    def __init__(self, weights: RankingWeights = None, history_size: int = 50):
         self.weights = weights or RankingWeights()
-        self.ranking_history: List[Dict] = []
-    
+        self.history = RankHistory(capacity=history_size)
+
+        # Per-expert incremental state and the component cache it feeds
+        self.expert_states: Dict[str, ExpertScoreState] = {}
+        self._components: Dict[str, Dict[str, Any]] = {}
+        self._component_sources: Dict[str, Tuple] = {}
+        self._rankings: List[Any] = []
+        self._ranked_ids: Tuple[str, ...] = ()
+        self._rank_lookup: Dict[str, int] = {}
+
+    @property
+    def ranking_history(self) -> List[Dict]:
+        """Stored ranking snapshots, oldest first"""
+        return self.history.snapshots()
+
+    def record_outcome(
+        self,
+        expert: Any,
+        category: str,
+        is_correct: bool,
+        confidence: float = 0.5,
+        counts_overall: bool = True
+    ) -> None:
+        """Fold a graded prediction into the expert's ranking state in O(1)
+
+        The first outcome for an expert seeds its state from the expert's
+        current counters, so record outcomes before adding them to those counters.
+        """
+        expert_id = expert.expert_id
+        state = self.expert_states.get(expert_id)
+        if state is None:
+            weights: Dict[str, int] = {}
+            for spec in self._get_specializations(expert):
+                for category_name in self._map_specialization_to_categories(spec):
+                    weights[category_name] = weights.get(category_name, 0) + 1
+            state = self.expert_states[expert_id] = ExpertScoreState(specialization_weights=weights)
+            state.seed(
+                getattr(expert, 'total_predictions', 0) or 0,
+                getattr(expert, 'correct_predictions', 0) or 0,
+                dict(getattr(expert, 'category_accuracies', None) or {}),
+                getattr(expert, 'confidence_calibration', 0.5)
+            )
+        state.record(category, is_correct, confidence, counts_overall)
+
+    async def _refresh_components(self, expert_id: str, expert: Any) -> bool:
+        """Refresh cached components when their source changed; returns True if so"""
+        state = self.expert_states.get(expert_id)
+        if state is not None:
+            source = ('state', state.version)
+        else:
+            # Attribute-backed experts: recompute only when their counters change
+            category_accuracies = getattr(expert, 'category_accuracies', None) or {}
+            source = (
+                'attributes',
+                id(expert),
+                getattr(expert, 'total_predictions', 0),
+                getattr(expert, 'correct_predictions', 0),
+                tuple(sorted(category_accuracies.items()))
+            )
+
+        if self._component_sources.get(expert_id) == source:
+            return False
+
+        if state is not None:
+            components = state.components()
+            components['total_predictions'] = state.total
+            components['correct_predictions'] = state.correct
+        else:
+            components = await self._calculate_score_components(expert)
+            components['total_predictions'] = getattr(expert, 'total_predictions', 0)
+            components['correct_predictions'] = getattr(expert, 'correct_predictions', 0)
+        components['total_score'] = self._calculate_weighted_score(components)
+
+        self._components[expert_id] = components
+        self._component_sources[expert_id] = source
+        return True
+
     async def calculate_rankings(self, experts: Dict[str, Any]) -> List[Any]:
         """Calculate comprehensive rankings for all experts"""
         try:
-            expert_scores = {}
-            
+            changed = False
             for expert_id, expert in experts.items():
-                score_components = await self._calculate_score_components(expert)
-                total_score = self._calculate_weighted_score(score_components)
-                
-                expert_scores[expert_id] = {
-                    'expert_id': expert_id,
-                    'total_score': total_score,
-                    'components': score_components,
-                    'expert': expert
-                }
-            
+                if await self._refresh_components(expert_id, expert):
+                    changed = True
+
+            expert_ids = tuple(experts.keys())
+            if not changed and expert_ids == self._ranked_ids and self._rankings:
+                return self._rankings
+
             # Sort by total score (descending)
-            ranked_experts = sorted(
-                expert_scores.values(),
-                key=lambda x: x['total_score'],
+            ranked_ids = sorted(
+                expert_ids,
+                key=lambda expert_id: self._components[expert_id]['total_score'],
                 reverse=True
             )
-            
+
             # Assign ranks and create metrics objects
+            from .competition_framework import ExpertPerformanceMetrics
+
             rankings = []
-            for rank, expert_data in enumerate(ranked_experts, 1):
-                from .competition_framework import ExpertPerformanceMetrics
-                
+            now = datetime.now()
+            for rank, expert_id in enumerate(ranked_ids, 1):
+                components = self._components[expert_id]
+                expert = experts[expert_id]
+
                 metrics = ExpertPerformanceMetrics(
-                    expert_id=expert_data['expert_id'],
-                    overall_accuracy=expert_data['components']['overall_accuracy'],
-                    category_accuracies=expert_data['components']['category_accuracies'],
-                    confidence_calibration=expert_data['components']['confidence_calibration'],
-                    recent_trend=expert_data['components']['trend'],
-                    total_predictions=getattr(expert_data['expert'], 'total_predictions', 0),
-                    correct_predictions=getattr(expert_data['expert'], 'correct_predictions', 0),
-                    leaderboard_score=expert_data['total_score'],
+                    expert_id=expert_id,
+                    overall_accuracy=components['overall_accuracy'],
+                    category_accuracies=components['category_accuracies'],
+                    confidence_calibration=components['confidence_calibration'],
+                    recent_trend=components['trend'],
+                    total_predictions=components['total_predictions'],
+                    correct_predictions=components['correct_predictions'],
+                    leaderboard_score=components['total_score'],
                     current_rank=rank,
-                    peak_rank=min(getattr(expert_data['expert'], 'peak_rank', rank), rank),
-                    consistency_score=expert_data['components']['consistency'],
-                    specialization_strength=expert_data['components']['specialization_strength'],
-                    last_updated=datetime.now()
+                    peak_rank=min(getattr(expert, 'peak_rank', rank), rank),
+                    consistency_score=components['consistency'],
+                    specialization_strength=components['specialization_strength'],
+                    last_updated=now
                 )
                 rankings.append(metrics)
-            
+
             # Update peak ranks
             self._update_peak_ranks(rankings)
-            
+
             # Store ranking history
             self._store_ranking_snapshot(rankings)
-            
+
+            self._rankings = rankings
+            self._ranked_ids = expert_ids
+            self._rank_lookup = {metrics.expert_id: metrics.current_rank for metrics in rankings}
+
             logger.info(f"📊 Calculated rankings for {len(rankings)} experts")
             return rankings
-            
+
         except Exception as e:
             logger.error(f"Failed to calculate rankings: {e}")
             return []
-    
+
+    def get_expert_rank(self, expert_id: str) -> Optional[int]:
+        """Current rank of an expert from the latest rankings"""
+        return self._rank_lookup.get(expert_id)
+
     async def _calculate_score_components(self, expert: Any) -> Dict[str, Any]:
         """Calculate individual scoring components for an expert"""
         components = {}
@@ -168,13 +481,15 @@ class ExpertRankingSystem:
         
         return max(0, min(1, calibration))
     
+    def _get_specializations(self, expert: Any) -> List[str]:
+        if hasattr(expert, 'get_specializations'):
+            return expert.get_specializations()
+        return getattr(expert, 'specializations', [])
+
     def _calculate_specialization_strength(self, expert: Any) -> float:
         """Calculate strength in specialized areas"""
         # Get expert specializations
-        if hasattr(expert, 'get_specializations'):
-            specializations = expert.get_specializations()
-        else:
-            specializations = getattr(expert, 'specializations', [])
+        specializations = self._get_specializations(expert)
         
         if not specializations:
             return 0.5
@@ -276,81 +591,23 @@ class ExpertRankingSystem:
     
     def _store_ranking_snapshot(self, rankings: List[Any]) -> None:
         """Store ranking snapshot for historical analysis"""
-        snapshot = {
-            'timestamp': datetime.now().isoformat(),
-            'rankings': [
-                {
-                    'expert_id': r.expert_id,
-                    'rank': r.current_rank,
-                    'score': r.leaderboard_score,
-                    'accuracy': r.overall_accuracy
-                }
-                for r in rankings
-            ]
-        }
-        
-        self.ranking_history.append(snapshot)
-        
-        # Keep only last 50 snapshots to prevent memory issues
-        if len(self.ranking_history) > 50:
-            self.ranking_history = self.ranking_history[-50:]
+        # The ring buffer keeps only the last history_size snapshots
+        self.history.push(rankings)
     
     def get_ranking_volatility(self) -> float:
         """Calculate ranking volatility (how much rankings change)"""
-        if len(self.ranking_history) < 2:
+        if len(self.history) < 2 or self.history.total_pairs == 0:
             return 0.0
         
-        # Calculate average rank change between snapshots
-        total_changes = 0
-        total_experts = 0
-        
-        for i in range(1, len(self.ranking_history)):
-            prev_snapshot = self.ranking_history[i-1]
-            curr_snapshot = self.ranking_history[i]
-            
-            # Create rank lookup for previous snapshot
-            prev_ranks = {r['expert_id']: r['rank'] for r in prev_snapshot['rankings']}
-            
-            for curr_expert in curr_snapshot['rankings']:
-                expert_id = curr_expert['expert_id']
-                if expert_id in prev_ranks:
-                    rank_change = abs(curr_expert['rank'] - prev_ranks[expert_id])
-                    total_changes += rank_change
-                    total_experts += 1
-        
-        if total_experts == 0:
-            return 0.0
-        
-        average_rank_change = total_changes / total_experts
+        # Average rank change between consecutive snapshots, kept as running sums
+        average_rank_change = self.history.total_change / self.history.total_pairs
         return min(1.0, average_rank_change / 5.0)  # Normalize to 0-1 scale
     
     def get_top_movers(self, direction: str = 'up', limit: int = 3) -> List[Dict[str, Any]]:
         """Get experts with biggest rank movements"""
-        if len(self.ranking_history) < 2:
+        if len(self.history) < 2:
             return []
         
-        prev_snapshot = self.ranking_history[-2]
-        curr_snapshot = self.ranking_history[-1]
-        
-        # Create rank lookup for previous snapshot
-        prev_ranks = {r['expert_id']: r['rank'] for r in prev_snapshot['rankings']}
-        
-        movements = []
-        for curr_expert in curr_snapshot['rankings']:
-            expert_id = curr_expert['expert_id']
-            if expert_id in prev_ranks:
-                rank_change = prev_ranks[expert_id] - curr_expert['rank']  # Positive = moved up
-                movements.append({
-                    'expert_id': expert_id,
-                    'current_rank': curr_expert['rank'],
-                    'previous_rank': prev_ranks[expert_id],
-                    'rank_change': rank_change
-                })
-        
-        # Sort by rank change
-        if direction == 'up':
-            movements.sort(key=lambda x: x['rank_change'], reverse=True)
-        else:
-            movements.sort(key=lambda x: x['rank_change'])
-        
-        return movements[:limit]
\ No newline at end of file
+        # Movements between the last two snapshots are sorted when stored
+        movers = self.history.movers_up if direction == 'up' else self.history.movers_down
+        return movers[:limit]
@@ -11,6 +11,26 @@ import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Category name -> prediction attribute
+CATEGORY_ATTRIBUTES = {
+    'winner_prediction': 'winner_prediction',
+    'exact_score_home': 'exact_score_home',
+    'exact_score_away': 'exact_score_away',
+    'margin_of_victory': 'margin_of_victory',
+    'against_the_spread': 'against_the_spread',
+    'totals_over_under': 'totals_over_under',
+    'first_half_winner': 'first_half_winner',
+    'qb_passing_yards': 'qb_passing_yards',
+    'qb_touchdowns': 'qb_touchdowns',
+    'weather_impact_score': 'weather_impact_score',
+    'home_field_advantage': 'home_field_advantage'
+}
+
+TREND_SCORES = {'improving': 1.0, 'stable': 0.6, 'declining': 0.2}
+
+# Vote totals this close (relative) are a tie, so summation order can't pick the winner
+TIE_TOLERANCE = 1e-9
+
 @dataclass
 class VoteWeight:
     """Individual expert's vote weight breakdown"""
@@ -123,8 +143,7 @@ class VoteWeightCalculator:
             
             # Component 2: Recent Performance (30% of weight)
             recent_trend = getattr(expert, 'recent_trend', 'stable')
-            trend_scores = {'improving': 1.0, 'stable': 0.6, 'declining': 0.2}
-            recent_performance_component = trend_scores.get(recent_trend, 0.5) * self.recent_performance_weight
+            recent_performance_component = TREND_SCORES.get(recent_trend, 0.5) * self.recent_performance_weight
             
             # Component 3: Prediction Confidence (20% of weight)
             expert_confidence = prediction_confidence.get(expert_id, 0.5)
@@ -166,11 +185,339 @@ class VoteWeightCalculator:
                 normalized_weight=0.2
             )
 
+    def calculate_static_components(self, council_experts: List[Any]) -> np.ndarray:
+        """Accuracy + recent performance + tenure components per expert, shape (experts,)
+
+        These do not depend on the prediction, so the columnar consensus engine
+        computes them once and only adds the confidence component per vote.
+        """
+        accuracy = np.array([getattr(e, 'overall_accuracy', 0.5) for e in council_experts], dtype=np.float64)
+        trend = np.array([TREND_SCORES.get(getattr(e, 'recent_trend', 'stable'), 0.5) for e in council_experts])
+        appearances = np.array([getattr(e, 'council_appearances', 1) for e in council_experts], dtype=np.float64)
+        
+        return (
+            np.maximum(0.0, (accuracy - 0.5) * 2.0) * self.accuracy_weight +
+            trend * self.recent_performance_weight +
+            np.minimum(1.0, np.log(appearances + 1) / np.log(10)) * self.council_tenure_weight
+        )
+
+@dataclass
+class ConsensusMatrix:
+    """Columnar view of council predictions: games x experts x categories"""
+    game_ids: List[str]
+    expert_ids: List[str]
+    categories: List[str]
+    category_kinds: List[str]          # 'numeric', 'categorical' or 'generic'
+    numeric_values: np.ndarray         # (G, E, C) float, NaN where missing / not numeric
+    categorical_codes: np.ndarray      # (G, E, C) int, -1 where missing / not categorical
+    vocabularies: List[List[Any]]      # per category, labels indexed by code
+    confidences: np.ndarray            # (G, E, C)
+    present: np.ndarray                # (G, E) expert submitted a prediction for the game
+    submission_order: np.ndarray       # (G, E) position in the game's prediction dict, E where absent
+    predictions: Dict[str, Dict[str, Any]]  # original objects, for breakdowns and fallbacks
+
+class ColumnarConsensusEngine:
+    """Builds consensus for every category of every game in one vectorized pass
+
+    Mirrors ConsensusBuilder semantics: numeric categories use the weighted
+    mean, categorical ones weighted voting, anything else falls back to the
+    per-category builder.
+    """
+    
+    def __init__(self, weight_calculator: Optional[VoteWeightCalculator] = None):
+        self.weight_calculator = weight_calculator or VoteWeightCalculator()
+    
+    def build_matrix(
+        self,
+        predictions_by_game: Dict[str, Dict[str, Any]],  # game_id -> expert_id -> prediction
+        categories: List[str]
+    ) -> ConsensusMatrix:
+        """Pack prediction objects into aligned arrays"""
+        game_ids = list(predictions_by_game)
+        expert_ids = list(dict.fromkeys(e for preds in predictions_by_game.values() for e in preds))
+        expert_index = {e: i for i, e in enumerate(expert_ids)}
+        attributes = [CATEGORY_ATTRIBUTES.get(c, c) for c in categories]
+        shape = (len(game_ids), len(expert_ids), len(categories))
+        
+        numeric = np.full(shape, np.nan)
+        codes = np.full(shape, -1, dtype=np.int32)
+        confidences = np.full(shape, 0.5)
+        present = np.zeros(shape[:2], dtype=bool)
+        order = np.full(shape[:2], len(expert_ids), dtype=np.int32)
+        kinds: List[Optional[str]] = [None] * len(categories)
+        vocab_index: List[Dict[Any, int]] = [{} for _ in categories]
+        
+        for g, game_id in enumerate(game_ids):
+            for position, (expert_id, prediction) in enumerate(predictions_by_game[game_id].items()):
+                e = expert_index[expert_id]
+                present[g, e] = True
+                order[g, e] = position
+                
+                if hasattr(prediction, 'confidence_overall'):
+                    confidences[g, e, :] = prediction.confidence_overall
+                elif hasattr(prediction, 'confidence_by_category'):
+                    by_category = prediction.confidence_by_category
+                    confidences[g, e, :] = [by_category.get(c, 0.5) for c in categories]
+                
+                for c, attribute in enumerate(attributes):
+                    value = self._value(prediction, attribute, categories[c])
+                    if value is None:
+                        continue
+                    
+                    if kinds[c] is None:
+                        kinds[c] = ('numeric' if isinstance(value, (int, float))
+                                    else 'categorical' if isinstance(value, str) else 'generic')
+                    if kinds[c] == 'numeric' and isinstance(value, (int, float)):
+                        numeric[g, e, c] = float(value)
+                    elif kinds[c] == 'categorical' and isinstance(value, str):
+                        codes[g, e, c] = vocab_index[c].setdefault(value, len(vocab_index[c]))
+        
+        return ConsensusMatrix(
+            game_ids=game_ids,
+            expert_ids=expert_ids,
+            categories=list(categories),
+            category_kinds=[k or 'numeric' for k in kinds],
+            numeric_values=numeric,
+            categorical_codes=codes,
+            vocabularies=[list(v) for v in vocab_index],
+            confidences=confidences,
+            present=present,
+            submission_order=order,
+            predictions=predictions_by_game
+        )
+    
+    def calculate_vote_weights(self, matrix: ConsensusMatrix, council_experts: List[Any]) -> np.ndarray:
+        """Normalized vote weight for every (game, expert, category), shape (G, E, C)
+
+        Weights are normalized across the council, using 0.5 confidence for
+        council members without a prediction; predictors outside the council
+        get the default 0.2 weight, as in the per-category builder.
+        """
+        n_games, n_experts, n_categories = matrix.confidences.shape
+        weights = np.full((n_games, n_experts, n_categories), 0.2)
+        if not council_experts:
+            return weights
+        
+        council_ids = [e.expert_id for e in council_experts]
+        static = self.weight_calculator.calculate_static_components(council_experts)
+        expert_index = {e: i for i, e in enumerate(matrix.expert_ids)}
+        columns = np.array([expert_index.get(e, -1) for e in council_ids])
+        known = columns >= 0
+        
+        council_confidence = np.full((n_games, len(council_ids), n_categories), 0.5)
+        if known.any():
+            gathered = matrix.confidences[:, columns[known], :]
+            predicted = matrix.present[:, columns[known]][:, :, None]
+            council_confidence[:, known, :] = np.where(predicted, gathered, 0.5)
+        
+        overall = static[None, :, None] + council_confidence * self.weight_calculator.confidence_weight
+        total = overall.sum(axis=1, keepdims=True)
+        normalized = np.where(total > 0, overall / np.where(total > 0, total, 1.0), 1.0 / len(council_ids))
+        weights[:, columns[known], :] = normalized[:, known, :]
+        return weights
+    
+    def build(
+        self,
+        matrix: ConsensusMatrix,
+        council_experts: List[Any],
+        include_breakdown: bool = True
+    ) -> Dict[str, Dict[str, ConsensusResult]]:
+        """Consensus for every game and category: game_id -> category -> ConsensusResult"""
+        weights = self.calculate_vote_weights(matrix, council_experts)
+        results: Dict[str, Dict[str, ConsensusResult]] = {g: {} for g in matrix.game_ids}
+        kinds = np.array(matrix.category_kinds)
+        
+        numeric_cols = np.flatnonzero(kinds == 'numeric')
+        if len(numeric_cols):
+            self._numeric_pass(matrix, weights, numeric_cols, results, include_breakdown)
+        
+        categorical_cols = np.flatnonzero(kinds == 'categorical')
+        if len(categorical_cols):
+            self._categorical_pass(matrix, weights, categorical_cols, results, include_breakdown)
+        
+        generic_cols = np.flatnonzero(kinds == 'generic')
+        if len(generic_cols):
+            builder = ConsensusBuilder(self.weight_calculator)
+            for game_id in matrix.game_ids:
+                for c in generic_cols:
+                    category = matrix.categories[c]
+                    results[game_id][category] = builder.build_consensus(
+                        matrix.predictions[game_id], council_experts, category
+                    )
+        
+        return {g: {c: results[g][c] for c in matrix.categories if c in results[g]} for g in matrix.game_ids}
+    
+    def _numeric_pass(self, matrix, weights, cols, results, include_breakdown):
+        values = matrix.numeric_values[:, :, cols]
+        valid = ~np.isnan(values)
+        w = np.where(valid, weights[:, :, cols], 0.0)
+        v = np.where(valid, values, 0.0)
+        conf = matrix.confidences[:, :, cols]
+        
+        count = valid.sum(axis=1)                                     # (G, Cn)
+        total_weight = w.sum(axis=1)
+        safe_total = np.where(total_weight > 0, total_weight, 1.0)
+        weighted_mean = (v * w).sum(axis=1) / safe_total
+        confidence = (conf * w).sum(axis=1) / safe_total
+        
+        safe_count = np.maximum(count, 1)
+        mean = v.sum(axis=1) / safe_count
+        std = np.sqrt((np.where(valid, values - mean[:, None, :], 0.0) ** 2).sum(axis=1) / safe_count)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            agreement = np.where(mean != 0, 1.0 - std / np.where(mean != 0, mean, 1.0), 0.0)
+        agreement = np.where(count > 1, np.clip(agreement, 0.0, 1.0), 1.0)
+        
+        # Weighted median: sort along experts, first value whose cumulative weight reaches half
+        order = np.argsort(np.where(valid, values, np.inf), axis=1)
+        sorted_values = np.take_along_axis(values, order, axis=1)
+        cumulative = np.cumsum(np.take_along_axis(w, order, axis=1), axis=1)
+        median_index = np.argmax(cumulative >= (total_weight / 2)[:, None, :], axis=1)
+        weighted_median = np.take_along_axis(sorted_values, median_index[:, None, :], axis=1)[:, 0, :]
+        minimum = np.where(valid, values, np.inf).min(axis=1)
+        maximum = np.where(valid, values, -np.inf).max(axis=1)
+        
+        for g, game_id in enumerate(matrix.game_ids):
+            for j, c in enumerate(cols):
+                category = matrix.categories[c]
+                if count[g, j] == 0:
+                    # Nobody submitted this category, as in build_consensus
+                    results[game_id][category] = self._empty_result(category, "none", "No valid predictions")
+                    continue
+                if total_weight[g, j] == 0:
+                    results[game_id][category] = self._empty_result(
+                        category, "numeric_weighted_average", "No valid numeric predictions"
+                    )
+                    continue
+                breakdown = {"statistics": {
+                    "mean": float(mean[g, j]),
+                    "std_dev": float(std[g, j]),
+                    "min": float(minimum[g, j]),
+                    "max": float(maximum[g, j]),
+                    "weighted_median": float(weighted_median[g, j])
+                }}
+                if include_breakdown:
+                    breakdown["individual_predictions"] = self._individual(matrix, weights, g, c, valid[g, :, j])
+                results[game_id][category] = ConsensusResult(
+                    category=category,
+                    consensus_value=float(weighted_mean[g, j]),
+                    confidence_score=float(confidence[g, j]),
+                    agreement_level=float(agreement[g, j]),
+                    total_weight=float(total_weight[g, j]),
+                    participating_experts=int(count[g, j]),
+                    method_used="numeric_weighted_average",
+                    breakdown=breakdown
+                )
+    
+    def _categorical_pass(self, matrix, weights, cols, results, include_breakdown):
+        codes = matrix.categorical_codes[:, :, cols]                  # (G, E, Cc)
+        n_labels = max(1, max(len(matrix.vocabularies[c]) for c in cols))
+        one_hot = codes[..., None] == np.arange(n_labels)             # (G, E, Cc, K)
+        w = weights[:, :, cols][..., None] * one_hot
+        votes = w.sum(axis=1)                                          # (G, Cc, K)
+        confidence_votes = (matrix.confidences[:, :, cols][..., None] * w).sum(axis=1)
+        
+        count = (codes >= 0).sum(axis=1)
+        total_weight = votes.sum(axis=2)
+        # Ties go to the label the game saw first, as in _build_categorical_consensus
+        n_experts = matrix.submission_order.shape[1]
+        first_seen = np.where(one_hot, matrix.submission_order[:, :, None, None], n_experts).min(axis=1)
+        top = votes.max(axis=2, keepdims=True)
+        tied = votes >= top - TIE_TOLERANCE * top
+        winner = np.where(tied, first_seen, n_experts).argmin(axis=2)
+        winner_weight = np.take_along_axis(votes, winner[..., None], axis=2)[..., 0]
+        winner_confidence = np.take_along_axis(confidence_votes, winner[..., None], axis=2)[..., 0]
+        safe_total = np.where(total_weight > 0, total_weight, 1.0)
+        safe_winner = np.where(winner_weight > 0, winner_weight, 1.0)
+        agreement = np.where(total_weight > 0, winner_weight / safe_total, 0.0)
+        confidence = np.where(winner_weight > 0, winner_confidence / safe_winner, 0.0)
+        
+        for g, game_id in enumerate(matrix.game_ids):
+            for j, c in enumerate(cols):
+                category = matrix.categories[c]
+                if count[g, j] == 0:
+                    # Nobody submitted this category, as in build_consensus
+                    results[game_id][category] = self._empty_result(category, "none", "No valid predictions")
+                    continue
+                labels = matrix.vocabularies[c]
+                breakdown = {"vote_distribution": {
+                    labels[k]: float(votes[g, j, k]) for k in range(len(labels)) if votes[g, j, k] > 0
+                }}
+                if include_breakdown:
+                    breakdown["individual_votes"] = self._individual(matrix, weights, g, c, codes[g, :, j] >= 0)
+                results[game_id][category] = ConsensusResult(
+                    category=category,
+                    consensus_value=labels[winner[g, j]],
+                    confidence_score=float(confidence[g, j]),
+                    agreement_level=float(agreement[g, j]),
+                    total_weight=float(total_weight[g, j]),
+                    participating_experts=int(count[g, j]),
+                    method_used="categorical_weighted_voting",
+                    breakdown=breakdown
+                )
+    
+    @staticmethod
+    def _value(prediction: Any, attribute: str, category: str) -> Any:
+        if hasattr(prediction, attribute):
+            return getattr(prediction, attribute)
+        elif isinstance(prediction, dict):
+            return prediction.get(category)
+        return None
+    
+    def _individual(self, matrix, weights, g, c, mask) -> List[Dict[str, Any]]:
+        game_predictions = matrix.predictions[matrix.game_ids[g]]
+        category = matrix.categories[c]
+        attribute = CATEGORY_ATTRIBUTES.get(category, category)
+        return [
+            {
+                "expert_id": expert_id,
+                "value": self._value(game_predictions[expert_id], attribute, category),
+                "weight": float(weights[g, e, c]),
+                "confidence": float(matrix.confidences[g, e, c])
+            }
+            for e, expert_id in enumerate(matrix.expert_ids) if mask[e]
+        ]
+    
+    @staticmethod
+    def _empty_result(category: str, method: str, error: str) -> ConsensusResult:
+        return ConsensusResult(
+            category=category,
+            consensus_value=None,
+            confidence_score=0.0,
+            agreement_level=0.0,
+            total_weight=0.0,
+            participating_experts=0,
+            method_used=method,
+            breakdown={"error": error}
+        )
+
 class ConsensusBuilder:
     """Builds consensus predictions from weighted AI Council votes"""
     
     def __init__(self, weight_calculator: Optional[VoteWeightCalculator] = None):
         self.weight_calculator = weight_calculator or VoteWeightCalculator()
+        self.columnar_engine = ColumnarConsensusEngine(self.weight_calculator)
+    
+    def build_batch_consensus(
+        self,
+        predictions_by_game: Dict[str, Dict[str, Any]],  # game_id -> expert_id -> prediction
+        council_experts: List[Any],
+        prediction_categories: List[str],
+        include_breakdown: bool = True
+    ) -> Dict[str, Dict[str, ConsensusResult]]:
+        """Build consensus for every category of every game in one vectorized pass"""
+        try:
+            matrix = self.columnar_engine.build_matrix(predictions_by_game, prediction_categories)
+            return self.columnar_engine.build(matrix, council_experts, include_breakdown)
+            
+        except Exception as e:
+            logger.error(f"Failed to build batch consensus: {e}")
+            return {
+                game_id: {
+                    category: self.build_consensus(predictions, council_experts, category)
+                    for category in prediction_categories
+                }
+                for game_id, predictions in predictions_by_game.items()
+            }
     
     def build_consensus(
         self,
@@ -276,22 +623,7 @@ class ConsensusBuilder:
     def _get_prediction_value(self, prediction: Any, category: str) -> Any:
         """Extract prediction value for a specific category"""
         try:
-            # Map category names to prediction attributes
-            category_mapping = {
-                'winner_prediction': 'winner_prediction',
-                'exact_score_home': 'exact_score_home',
-                'exact_score_away': 'exact_score_away',
-                'margin_of_victory': 'margin_of_victory',
-                'against_the_spread': 'against_the_spread',
-                'totals_over_under': 'totals_over_under',
-                'first_half_winner': 'first_half_winner',
-                'qb_passing_yards': 'qb_passing_yards',
-                'qb_touchdowns': 'qb_touchdowns',
-                'weather_impact_score': 'weather_impact_score',
-                'home_field_advantage': 'home_field_advantage'
-            }
-            
-            attribute_name = category_mapping.get(category, category)
+            attribute_name = CATEGORY_ATTRIBUTES.get(category, category)
             
             if hasattr(prediction, attribute_name):
                 return getattr(prediction, attribute_name)
@@ -420,8 +752,9 @@ class ConsensusBuilder:
                     breakdown={"error": "No valid categorical predictions"}
                 )
             
-            # Find consensus value (highest weighted vote)
-            consensus_value = max(vote_weights.keys(), key=lambda k: vote_weights[k])
+            # Find consensus value (highest weighted vote, first seen on ties)
+            top = max(vote_weights.values())
+            consensus_value = next(k for k, w in vote_weights.items() if w >= top - TIE_TOLERANCE * top)
             consensus_weight = vote_weights[consensus_value]
             total_weight = sum(vote_weights.values())
             
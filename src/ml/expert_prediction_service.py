@@ -7,22 +7,17 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 import json
-import sys
-import os
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from ml.personality_driven_experts import (
+from .personality_driven_experts import (
     ConservativeAnalyzer, RiskTakingGambler, ContrarianRebel, ValueHunter, MomentumRider,
     FundamentalistScholar, ChaosTheoryBeliever, GutInstinctExpert, StatisticsPurist,
     TrendReversalSpecialist, PopularNarrativeFader, SharpMoneyFollower, UnderdogChampion,
     ConsensusFollower, MarketInefficiencyExploiter, UniversalGameData
 )
-from ml.expert_models import ExpertPrediction  # Keep for data structure
-from services.live_data_service import live_data_service
-from ml.supabase_historical_service import supabase_historical_service
-from utils.date_utils import DateUtils
+from .expert_models import ExpertPrediction  # Keep for data structure
+from ..services.live_data_service import live_data_service
+from .supabase_historical_service import supabase_historical_service
+from ..utils.date_utils import DateUtils
 
 logger = logging.getLogger(__name__)
 
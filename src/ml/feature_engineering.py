@@ -10,6 +10,8 @@ from datetime import datetime, timedelta
 import logging
 from dataclasses import dataclass
 
+from .play_by_play_engine import PlayByPlayEngine, PlayStore
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -27,9 +29,10 @@ class GameContext:
 class AdvancedFeatureEngineer:
     """Advanced feature engineering for NFL predictions"""
 
-    def __init__(self):
+    def __init__(self, play_store: Optional[PlayStore] = None):
         self.epa_values = self._initialize_epa_values()
         self.success_rate_thresholds = self._initialize_success_thresholds()
+        self.play_engine = PlayByPlayEngine(self.epa_values, self.success_rate_thresholds, play_store)
 
     def _initialize_epa_values(self) -> Dict[str, Dict[str, float]]:
         """Initialize Expected Points Added values by field position and down"""
@@ -63,64 +66,13 @@ class AdvancedFeatureEngineer:
     def calculate_epa(self, plays_df: pd.DataFrame) -> pd.DataFrame:
         """Calculate Expected Points Added for each play"""
         plays_df = plays_df.copy()
-
-        # Calculate EPA for each play
-        epa_values = []
-        for _, play in plays_df.iterrows():
-            down = play.get('down', 1)
-            yard_line = play.get('yard_line', 50)
-
-            # Get base EPA
-            base_epa = self.epa_values.get(down, {}).get(yard_line, 0)
-
-            # Adjust for play outcome
-            yards_gained = play.get('yards_gained', 0)
-            is_touchdown = play.get('touchdown', False)
-            is_turnover = play.get('turnover', False)
-            is_safety = play.get('safety', False)
-
-            if is_touchdown:
-                epa = 7.0 - base_epa  # Touchdown worth 7 points
-            elif is_safety:
-                epa = -2.0 - base_epa  # Safety worth -2 points
-            elif is_turnover:
-                epa = -base_epa - 1.0  # Turnover penalty
-            else:
-                # Regular play - calculate based on yards gained and new field position
-                new_yard_line = min(99, yard_line + yards_gained)
-                new_down = min(4, down + 1) if yards_gained < play.get('yards_to_go', 10) else 1
-
-                new_epa = self.epa_values.get(new_down, {}).get(new_yard_line, 0)
-                epa = new_epa - base_epa
-
-            epa_values.append(epa)
-
-        plays_df['epa'] = epa_values
+        plays_df['epa'] = self.play_engine.compute_epa(plays_df)
         return plays_df
 
     def calculate_success_rate(self, plays_df: pd.DataFrame) -> pd.DataFrame:
         """Calculate success rate for plays"""
         plays_df = plays_df.copy()
-
-        success_indicators = []
-        for _, play in plays_df.iterrows():
-            down = play.get('down', 1)
-            yards_gained = play.get('yards_gained', 0)
-            yards_to_go = play.get('yards_to_go', 10)
-
-            threshold = self.success_rate_thresholds.get(down, 1.0)
-            required_yards = yards_to_go * threshold
-
-            # Success criteria
-            is_success = (
-                yards_gained >= required_yards or
-                play.get('touchdown', False) or
-                play.get('first_down', False)
-            )
-
-            success_indicators.append(1 if is_success else 0)
-
-        plays_df['success'] = success_indicators
+        plays_df['success'] = self.play_engine.compute_success(plays_df)
         return plays_df
 
     def calculate_dvoa_style_metrics(self, team_plays: pd.DataFrame, opponent_plays: pd.DataFrame) -> Dict[str, float]:
@@ -164,65 +116,14 @@ class AdvancedFeatureEngineer:
         """Calculate rolling averages for various metrics"""
         team_stats = team_stats.copy().sort_values(['team', 'date'])
 
-        rolling_columns = []
         base_columns = ['points_scored', 'points_allowed', 'yards_gained', 'yards_allowed',
                        'turnovers', 'penalties', 'time_of_possession']
 
-        for window in windows:
-            for col in base_columns:
-                if col in team_stats.columns:
-                    new_col = f'{col}_avg_{window}'
-                    team_stats[new_col] = team_stats.groupby('team')[col].transform(
-                        lambda x: x.rolling(window=window, min_periods=1).mean()
-                    )
-                    rolling_columns.append(new_col)
-
-        return team_stats
+        return self.play_engine.rolling_averages(team_stats, base_columns, windows)
 
     def calculate_situational_stats(self, plays_df: pd.DataFrame) -> Dict[str, Dict[str, float]]:
         """Calculate situational statistics"""
-        situational_stats = {}
-
-        # Group by team
-        for team in plays_df['team'].unique():
-            team_plays = plays_df[plays_df['team'] == team]
-            team_stats = {}
-
-            # Red zone efficiency
-            red_zone_plays = team_plays[team_plays['yard_line'] <= 20]
-            if len(red_zone_plays) > 0:
-                team_stats['red_zone_efficiency'] = red_zone_plays['success'].mean()
-                team_stats['red_zone_td_rate'] = red_zone_plays['touchdown'].mean()
-            else:
-                team_stats['red_zone_efficiency'] = 0.5
-                team_stats['red_zone_td_rate'] = 0.3
-
-            # Third down efficiency
-            third_down_plays = team_plays[team_plays['down'] == 3]
-            if len(third_down_plays) > 0:
-                team_stats['third_down_rate'] = third_down_plays['success'].mean()
-            else:
-                team_stats['third_down_rate'] = 0.35
-
-            # Goal line efficiency (within 5 yards)
-            goal_line_plays = team_plays[team_plays['yard_line'] <= 5]
-            if len(goal_line_plays) > 0:
-                team_stats['goal_line_efficiency'] = goal_line_plays['touchdown'].mean()
-            else:
-                team_stats['goal_line_efficiency'] = 0.6
-
-            # Explosive play rate (20+ yards)
-            explosive_plays = team_plays[team_plays['yards_gained'] >= 20]
-            team_stats['explosive_play_rate'] = len(explosive_plays) / len(team_plays) if len(team_plays) > 0 else 0
-
-            # Turnover differential
-            turnovers_lost = team_plays['turnover'].sum()
-            turnovers_gained = 0  # This would need opponent data
-            team_stats['turnover_differential'] = turnovers_gained - turnovers_lost
-
-            situational_stats[team] = team_stats
-
-        return situational_stats
+        return self.play_engine.situational_stats(plays_df)
 
     def calculate_weather_impact(self, weather_data: Dict[str, Any]) -> float:
         """Calculate weather impact score"""
@@ -334,7 +235,8 @@ class AdvancedFeatureEngineer:
     def engineer_advanced_features(self,
                                  games_df: pd.DataFrame,
                                  plays_df: Optional[pd.DataFrame] = None,
-                                 weather_df: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+                                 weather_df: Optional[pd.DataFrame] = None,
+                                 plays_cache_key: Optional[str] = None) -> pd.DataFrame:
         """Engineer all advanced features for model training"""
 
         logger.info("Engineering advanced features...")
@@ -344,9 +246,8 @@ class AdvancedFeatureEngineer:
 
         # Add play-by-play derived features
         if plays_df is not None:
-            # Calculate EPA and success rate
-            plays_df = self.calculate_epa(plays_df)
-            plays_df = self.calculate_success_rate(plays_df)
+            # Calculate EPA and success rate in one columnar pass
+            plays_df = self.play_engine.enrich(plays_df, cache_key=plays_cache_key)
 
             # Aggregate play-by-play stats to game level
             game_features = self._aggregate_plays_to_games(plays_df)
@@ -375,27 +276,7 @@ class AdvancedFeatureEngineer:
 
     def _aggregate_plays_to_games(self, plays_df: pd.DataFrame) -> pd.DataFrame:
         """Aggregate play-by-play statistics to game level"""
-
-        game_stats = plays_df.groupby(['game_id', 'team']).agg({
-            'epa': ['mean', 'sum', 'std'],
-            'success': 'mean',
-            'yards_gained': ['mean', 'sum'],
-            'yards_to_go': 'mean',
-            'down': lambda x: (x == 3).mean(),  # Third down percentage
-            'turnover': 'sum',
-            'touchdown': 'sum',
-            'penalty': 'sum'
-        }).reset_index()
-
-        # Flatten column names
-        game_stats.columns = [
-            'game_id', 'team', 'epa_mean', 'epa_total', 'epa_std',
-            'success_rate', 'yards_per_play', 'total_yards',
-            'avg_yards_to_go', 'third_down_pct', 'turnovers',
-            'touchdowns', 'penalties'
-        ]
-
-        return game_stats
+        return self.play_engine.aggregate_to_games(plays_df)
 
     def _process_weather_features(self, weather_df: pd.DataFrame) -> pd.DataFrame:
         """Process weather data into features"""
@@ -15,6 +15,7 @@ import pandas as pd
 from collections import defaultdict, deque
 
 from .ai_game_narrator import AIGameNarrator, GameState, NarratorInsight
+from ..performance.http_pool import get_http_session, http_registry
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -63,15 +64,12 @@ class ESPNAPIClient:
         self.rate_limit_delay = 1.0  # Seconds between requests
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers={'User-Agent': 'NFL-Predictor-API/1.0'}
-        )
+        # Shared pool session; the registry owns it, so it is released rather than closed
+        self.session = get_http_session('espn_live', timeout=30)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        self.session = None
 
     async def get_live_games(self) -> List[Dict[str, Any]]:
         """Get list of live/current games"""
@@ -365,7 +363,7 @@ class GameStateTracker:
             significance += self.significance_thresholds['fourth_down']
 
         # Red zone entry
-        if current.yard_line <= 20 and previous.yard_line > 20:
+        if current.yards_to_goal <= 20 and previous.yards_to_goal > 20:
             significance += self.significance_thresholds['red_zone_entry']
 
         # Two minute warning
@@ -685,6 +683,8 @@ async def main():
     except KeyboardInterrupt:
         print("\nShutting down...")
         await processor.stop_live_processing()
+    finally:
+        await http_registry.close()
 
 
 if __name__ == "__main__":
@@ -17,6 +17,8 @@ from sklearn.metrics import accuracy_score, mean_squared_error, log_loss
 import xgboost as xgb
 import logging
 
+from ..performance.tracing import traced
+
 warnings.filterwarnings('ignore')
 
 logger = logging.getLogger(__name__)
@@ -123,6 +125,7 @@ class NFLGameWinnerModel:
         logger.info(f"Game Winner Model - Val Accuracy: {val_acc:.4f}, Val LogLoss: {val_logloss:.4f}")
         return metrics
 
+    @traced(stage="model")
     def predict_proba(self, X: pd.DataFrame) -> np.ndarray:
         """Predict probabilities"""
         if not self.is_trained:
@@ -233,6 +236,7 @@ class NFLTotalPointsModel:
         logger.info(f"Total Points Model - Val RMSE: {val_rmse:.4f}, Val MAE: {val_mae:.4f}")
         return metrics
 
+    @traced(stage="model")
     def predict(self, X: pd.DataFrame) -> np.ndarray:
         """Predict total points"""
         if not self.is_trained:
@@ -336,6 +340,7 @@ class NFLPlayerPropsModel:
         logger.info(f"Player Props Model - Val RMSE: {val_rmse:.4f}, Val MAE: {val_mae:.4f}")
         return metrics
 
+    @traced(stage="model")
     def predict(self, X: pd.DataFrame) -> np.ndarray:
         """Predict player props"""
         if not self.is_trained:
@@ -390,6 +395,7 @@ class NFLEnsembleModel:
 
         return all_metrics
 
+    @traced(stage="ensemble")
     def predict_game_outcome(self, X: pd.DataFrame) -> Dict[str, Any]:
         """Comprehensive game prediction"""
         if not self.is_trained:
@@ -9,9 +9,10 @@ from datetime import datetime, timedelta
 from enum import Enum
 import logging
 import numpy as np
-from scipy import stats
 import pandas as pd
 
+from .trend_engine import OutcomeSeries, batch_trend_statistics, pad_series, series_from_points
+
 logger = logging.getLogger(__name__)
 
 class TrendDirection(Enum):
@@ -100,6 +101,16 @@ class TrendAnalyzer:
         # Cached trend analyses
         self.trend_cache: Dict[str, Dict[str, TrendAnalysis]] = {}
         self.cache_expiry_hours = 6
+        self._cache_versions: Dict[str, Optional[int]] = {}
+
+        # Outcome series per (expert, category), fed incrementally from the tracker
+        self._series: Dict[Tuple[str, Optional[str]], OutcomeSeries] = {}
+        self._ingested: Dict[str, int] = {}
+
+        # Dashboard indexes over the cache, rebuilt only after it changes
+        self._index_dirty = True
+        self._by_direction: Dict[TrendDirection, List[TrendAnalysis]] = {}
+        self._summary: Optional[Dict[str, Any]] = None
     
     async def analyze_expert_trend(
         self,
@@ -111,37 +122,111 @@ class TrendAnalyzer:
         """Analyze performance trend for an expert (overall or category-specific)"""
         try:
             window_days = window_days or self.default_window_days
-            cache_key = f"{expert_id}_{category or 'overall'}_{window_days}"
-            
+            results = self._analyze_batch([(expert_id, category, window_days)], force_refresh)
+            return results.get((expert_id, category, window_days))
+
+        except Exception as e:
+            logger.error(f"Failed to analyze expert trend: {e}")
+            return None
+
+    def _analyze_batch(
+        self,
+        requests: List[Tuple[str, Optional[str], int]],
+        force_refresh: bool = False
+    ) -> Dict[Tuple[str, Optional[str], int], TrendAnalysis]:
+        """Analyze many (expert, category, window) series with one vectorized pass"""
+        now = datetime.now()
+        self._sync_outcomes()
+
+        results = {}
+        pending = []
+        for expert_id, category, window_days in requests:
+            cache_key = self._cache_key(expert_id, category, window_days)
+            series = self._series.get((expert_id, category)) if self.accuracy_tracker else None
+            version = series.version if series is not None else None
+
             # Check cache unless force refresh
-            if not force_refresh and self._is_cache_valid(cache_key):
-                return self.trend_cache.get(expert_id, {}).get(cache_key)
-            
-            # Get performance data
-            performance_data = await self._get_performance_data(expert_id, category, window_days)
-            
-            if len(performance_data) < self.min_data_points:
-                logger.warning(f"Insufficient data for trend analysis: {len(performance_data)} points")
-                return None
-            
-            # Perform trend analysis
-            trend_analysis = self._calculate_trend_analysis(
-                expert_id, category, performance_data, window_days
+            if not force_refresh and self._is_cache_valid(expert_id, cache_key, version, now):
+                results[(expert_id, category, window_days)] = self.trend_cache[expert_id][cache_key]
+                continue
+
+            points = self._get_performance_arrays(series, window_days, now)
+            if len(points[0]) < self.min_data_points:
+                logger.warning(f"Insufficient data for trend analysis: {len(points[0])} points")
+                continue
+            pending.append(((expert_id, category, window_days), cache_key, version, points))
+
+        if not pending:
+            return results
+
+        trend_stats = batch_trend_statistics(*pad_series([item[3] for item in pending]),
+                                             min_momentum_points=10)
+        for row, (request, cache_key, version, _) in enumerate(pending):
+            expert_id, category, window_days = request
+            trend_analysis = self._build_trend_analysis(
+                expert_id, category, window_days, trend_stats, row, now
             )
-            
+
             # Cache result
-            if expert_id not in self.trend_cache:
-                self.trend_cache[expert_id] = {}
-            self.trend_cache[expert_id][cache_key] = trend_analysis
-            
+            self.trend_cache.setdefault(expert_id, {})[cache_key] = trend_analysis
+            self._cache_versions[cache_key] = version
+            results[request] = trend_analysis
+
             logger.info(f"Analyzed trend for {expert_id}, category {category}: {trend_analysis.direction.value}")
-            
-            return trend_analysis
-            
-        except Exception as e:
-            logger.error(f"Failed to analyze expert trend: {e}")
-            return None
-    
+
+        self._index_dirty = True
+        return results
+
+    @staticmethod
+    def _cache_key(expert_id: str, category: Optional[str], window_days: int) -> str:
+        return f"{expert_id}_{category or 'overall'}_{window_days}"
+
+    def _sync_outcomes(self) -> None:
+        """Append outcomes recorded since the last sync to the per-expert series"""
+        if not self.accuracy_tracker:
+            return
+
+        for expert_id, outcomes in self.accuracy_tracker.prediction_outcomes.items():
+            seen = self._ingested.get(expert_id, 0)
+            if len(outcomes) < seen:
+                # Outcomes were cleared or replaced - rebuild this expert's series
+                for key in [k for k in self._series if k[0] == expert_id]:
+                    del self._series[key]
+                seen = 0
+
+            new_outcomes = outcomes[seen:]
+            if new_outcomes:
+                by_key: Dict[Tuple[str, Optional[str]], List] = {(expert_id, None): new_outcomes}
+                for outcome in new_outcomes:
+                    by_key.setdefault((expert_id, outcome.category), []).append(outcome)
+
+                for key, batch in by_key.items():
+                    series = self._series.get(key)
+                    if series is None:
+                        series = self._series[key] = OutcomeSeries()
+                    series.extend([o.prediction_timestamp for o in batch], [o.is_correct for o in batch])
+            self._ingested[expert_id] = len(outcomes)
+
+    def _get_performance_arrays(
+        self,
+        series: Optional[OutcomeSeries],
+        window_days: int,
+        now: datetime
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Trend points for one series as (days from start, value, weight) arrays"""
+        if not self.accuracy_tracker:
+            logger.warning("No accuracy tracker available, using mock data")
+            points = self._generate_mock_performance_data(window_days)
+            timestamps = np.array([p.timestamp.timestamp() for p in points])
+            values = np.array([p.value for p in points])
+            weights = np.array([p.weight for p in points])
+        elif series is None:
+            timestamps = values = weights = np.zeros(0)
+        else:
+            timestamps, values, weights = series.trend_points(window_days, now)
+
+        return series_from_points(timestamps, values, weights) or (np.zeros(0), np.zeros(0), np.zeros(0))
+
     async def _get_performance_data(
         self,
         expert_id: str,
@@ -150,53 +235,30 @@ class TrendAnalyzer:
     ) -> List[TrendPoint]:
         """Get performance data points for trend analysis"""
         try:
-            performance_data = []
-            
             if not self.accuracy_tracker:
                 logger.warning("No accuracy tracker available, using mock data")
                 return self._generate_mock_performance_data(window_days)
-            
-            # Get prediction outcomes from accuracy tracker
-            outcomes = self.accuracy_tracker.prediction_outcomes.get(expert_id, [])
-            
-            # Filter by category if specified
-            if category:
-                outcomes = [o for o in outcomes if o.category == category]
-            
-            # Filter by time window
-            cutoff_date = datetime.now() - timedelta(days=window_days)
-            outcomes = [o for o in outcomes if o.prediction_timestamp >= cutoff_date]
-            
-            if not outcomes:
+
+            self._sync_outcomes()
+            series = self._series.get((expert_id, category))
+            if series is None:
                 return []
-            
-            # Sort by timestamp
-            outcomes.sort(key=lambda x: x.prediction_timestamp)
-            
-            # Convert to trend points with rolling accuracy
-            window_size = max(5, len(outcomes) // 10)  # Adaptive window size
-            
-            for i in range(window_size, len(outcomes)):
-                window_outcomes = outcomes[i-window_size:i]
-                accuracy = sum(1 for o in window_outcomes if o.is_correct) / len(window_outcomes)
-                
-                # Weight recent outcomes more heavily
-                age_days = (datetime.now() - outcomes[i].prediction_timestamp).days
-                weight = max(0.1, 1.0 - (age_days / window_days))
-                
-                performance_data.append(TrendPoint(
-                    timestamp=outcomes[i].prediction_timestamp,
-                    value=accuracy,
-                    weight=weight,
+
+            timestamps, values, weights = series.trend_points(window_days, datetime.now())
+            return [
+                TrendPoint(
+                    timestamp=datetime.fromtimestamp(ts),
+                    value=float(value),
+                    weight=float(weight),
                     category=category
-                ))
-            
-            return performance_data
-            
+                )
+                for ts, value, weight in zip(timestamps, values, weights)
+            ]
+
         except Exception as e:
             logger.error(f"Failed to get performance data: {e}")
             return []
-    
+
     def _generate_mock_performance_data(self, window_days: int) -> List[TrendPoint]:
         """Generate mock performance data for testing"""
         try:
@@ -240,46 +302,17 @@ class TrendAnalyzer:
     ) -> TrendAnalysis:
         """Calculate comprehensive trend analysis"""
         try:
-            # Convert to numpy arrays for analysis
             timestamps = np.array([p.timestamp.timestamp() for p in performance_data])
             values = np.array([p.value for p in performance_data])
             weights = np.array([p.weight for p in performance_data])
-            
-            # Normalize timestamps to days from start
-            time_days = (timestamps - timestamps[0]) / (24 * 3600)
-            
-            # Weighted linear regression
-            slope, r_squared, p_value = self._weighted_linear_regression(
-                time_days, values, weights
+
+            trend_stats = batch_trend_statistics(
+                *pad_series([series_from_points(timestamps, values, weights)])
             )
-            
-            # Determine trend direction and strength
-            direction = self._classify_trend_direction(slope, r_squared)
-            confidence = self._assess_trend_confidence(r_squared, p_value, len(performance_data))
-            trend_strength = self._calculate_trend_strength(slope, r_squared)
-            
-            # Calculate momentum (recent acceleration/deceleration)
-            momentum_score = self._calculate_momentum_score(performance_data)
-            
-            # Calculate volatility
-            volatility = self._calculate_volatility(values, weights)
-            
-            return TrendAnalysis(
-                expert_id=expert_id,
-                category=category,
-                direction=direction,
-                confidence=confidence,
-                slope=slope,
-                r_squared=r_squared,
-                p_value=p_value,
-                trend_strength=trend_strength,
-                data_points=len(performance_data),
-                analysis_window_days=window_days,
-                momentum_score=momentum_score,
-                volatility=volatility,
-                last_updated=datetime.now()
+            return self._build_trend_analysis(
+                expert_id, category, window_days, trend_stats, 0, datetime.now()
             )
-            
+
         except Exception as e:
             logger.error(f"Failed to calculate trend analysis: {e}")
             # Return default analysis
@@ -298,45 +331,38 @@ class TrendAnalyzer:
                 volatility=0.0,
                 last_updated=datetime.now()
             )
-    
-    def _weighted_linear_regression(
+
+    def _build_trend_analysis(
         self,
-        x: np.ndarray,
-        y: np.ndarray,
-        weights: np.ndarray
-    ) -> Tuple[float, float, float]:
-        """Perform weighted linear regression"""
-        try:
-            # Weighted least squares
-            W = np.diag(weights)
-            X = np.column_stack([np.ones(len(x)), x])
-            
-            # Calculate coefficients: β = (X^T W X)^(-1) X^T W y
-            XTW = X.T @ W
-            beta = np.linalg.inv(XTW @ X) @ XTW @ y
-            
-            slope = beta[1]
-            
-            # Calculate R-squared
-            y_pred = X @ beta
-            ss_res = np.sum(weights * (y - y_pred) ** 2)
-            ss_tot = np.sum(weights * (y - np.average(y, weights=weights)) ** 2)
-            r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
-            
-            # Calculate p-value (simplified approximation)
-            n = len(x)
-            if n > 2:
-                t_stat = slope / (np.sqrt(ss_res / (n - 2)) / np.sqrt(np.sum(weights * (x - np.average(x, weights=weights)) ** 2)))
-                p_value = 2 * (1 - stats.t.cdf(abs(t_stat), n - 2))
-            else:
-                p_value = 1.0
-            
-            return slope, max(0, r_squared), max(0, min(1, p_value))
-            
-        except Exception as e:
-            logger.error(f"Failed to perform weighted linear regression: {e}")
-            return 0.0, 0.0, 1.0
-    
+        expert_id: str,
+        category: Optional[str],
+        window_days: int,
+        trend_stats,
+        row: int,
+        now: datetime
+    ) -> TrendAnalysis:
+        """Turn one row of batched trend statistics into a TrendAnalysis"""
+        slope = float(trend_stats.slope[row])
+        r_squared = float(trend_stats.r_squared[row])
+        p_value = float(trend_stats.p_value[row])
+        data_points = int(trend_stats.data_points[row])
+
+        return TrendAnalysis(
+            expert_id=expert_id,
+            category=category,
+            direction=self._classify_trend_direction(slope, r_squared),
+            confidence=self._assess_trend_confidence(r_squared, p_value, data_points),
+            slope=slope,
+            r_squared=r_squared,
+            p_value=p_value,
+            trend_strength=self._calculate_trend_strength(slope, r_squared),
+            data_points=data_points,
+            analysis_window_days=window_days,
+            momentum_score=float(trend_stats.momentum[row]),
+            volatility=float(trend_stats.volatility[row]),
+            last_updated=now
+        )
+
     def _classify_trend_direction(self, slope: float, r_squared: float) -> TrendDirection:
         """Classify trend direction based on slope and R-squared"""
         try:
@@ -411,86 +437,16 @@ class TrendAnalyzer:
             logger.error(f"Failed to calculate trend strength: {e}")
             return 0.0
     
-    def _calculate_momentum_score(self, performance_data: List[TrendPoint]) -> float:
-        """Calculate momentum score (recent acceleration/deceleration)"""
-        try:
-            if len(performance_data) < 10:
-                return 0.0
-            
-            # Split data into recent and earlier periods
-            split_point = len(performance_data) // 2
-            earlier_data = performance_data[:split_point]
-            recent_data = performance_data[split_point:]
-            
-            # Calculate slopes for each period
-            earlier_slope = self._calculate_period_slope(earlier_data)
-            recent_slope = self._calculate_period_slope(recent_data)
-            
-            # Momentum is the difference in slopes
-            momentum = recent_slope - earlier_slope
-            
-            # Normalize to -1 to 1 range
-            return max(-1.0, min(1.0, momentum * 10))
-            
-        except Exception as e:
-            logger.error(f"Failed to calculate momentum score: {e}")
-            return 0.0
-    
-    def _calculate_period_slope(self, data: List[TrendPoint]) -> float:
-        """Calculate slope for a specific period"""
-        try:
-            if len(data) < 2:
-                return 0.0
-            
-            timestamps = np.array([p.timestamp.timestamp() for p in data])
-            values = np.array([p.value for p in data])
-            
-            # Normalize timestamps
-            time_days = (timestamps - timestamps[0]) / (24 * 3600)
-            
-            # Simple linear regression
-            if len(set(time_days)) > 1:  # Avoid division by zero
-                slope = np.polyfit(time_days, values, 1)[0]
-                return slope
-            else:
-                return 0.0
-                
-        except Exception as e:
-            logger.error(f"Failed to calculate period slope: {e}")
-            return 0.0
-    
-    def _calculate_volatility(self, values: np.ndarray, weights: np.ndarray) -> float:
-        """Calculate weighted volatility of performance"""
-        try:
-            if len(values) < 2:
-                return 0.0
-            
-            # Weighted standard deviation
-            weighted_mean = np.average(values, weights=weights)
-            weighted_variance = np.average((values - weighted_mean) ** 2, weights=weights)
-            volatility = np.sqrt(weighted_variance)
-            
-            return min(1.0, volatility)  # Cap at 1.0
-            
-        except Exception as e:
-            logger.error(f"Failed to calculate volatility: {e}")
-            return 0.0
-    
-    def _is_cache_valid(self, cache_key: str) -> bool:
+    def _is_cache_valid(self, expert_id: str, cache_key: str,
+                        version: Optional[int], now: datetime) -> bool:
         """Check if cached trend analysis is still valid"""
-        try:
-            for expert_trends in self.trend_cache.values():
-                if cache_key in expert_trends:
-                    analysis = expert_trends[cache_key]
-                    age_hours = (datetime.now() - analysis.last_updated).total_seconds() / 3600
-                    return age_hours < self.cache_expiry_hours
-            
-            return False
-            
-        except Exception as e:
-            logger.error(f"Failed to check cache validity: {e}")
+        analysis = self.trend_cache.get(expert_id, {}).get(cache_key)
+        if analysis is None or self._cache_versions.get(cache_key) != version:
             return False
-    
+
+        age_hours = (now - analysis.last_updated).total_seconds() / 3600
+        return age_hours < self.cache_expiry_hours
+
     async def analyze_multiple_experts(
         self,
         expert_ids: List[str],
@@ -499,20 +455,67 @@ class TrendAnalyzer:
     ) -> Dict[str, TrendAnalysis]:
         """Analyze trends for multiple experts"""
         try:
-            results = {}
-            
-            for expert_id in expert_ids:
-                trend_analysis = await self.analyze_expert_trend(expert_id, category, window_days)
-                if trend_analysis:
-                    results[expert_id] = trend_analysis
-            
+            window_days = window_days or self.default_window_days
+            batch = self._analyze_batch([(expert_id, category, window_days) for expert_id in expert_ids])
+            results = {expert_id: analysis for (expert_id, _, _), analysis in batch.items()}
+
             logger.info(f"Analyzed trends for {len(results)} experts")
             return results
-            
+
         except Exception as e:
             logger.error(f"Failed to analyze multiple expert trends: {e}")
             return {}
-    
+
+    async def analyze_expert_windows(
+        self,
+        expert_ids: List[str],
+        windows: List[int],
+        category: Optional[str] = None
+    ) -> Dict[str, Dict[int, TrendAnalysis]]:
+        """Analyze every expert over several windows in one batched pass"""
+        try:
+            batch = self._analyze_batch([
+                (expert_id, category, window_days)
+                for expert_id in expert_ids
+                for window_days in windows
+            ])
+            results: Dict[str, Dict[int, TrendAnalysis]] = {}
+            for (expert_id, _, window_days), analysis in batch.items():
+                results.setdefault(expert_id, {})[window_days] = analysis
+            return results
+
+        except Exception as e:
+            logger.error(f"Failed to analyze expert trend windows: {e}")
+            return {}
+
+    def _refresh_indexes(self) -> None:
+        """Rebuild the direction index and summary aggregates after cache changes"""
+        all_analyses = [a for expert_trends in self.trend_cache.values() for a in expert_trends.values()]
+
+        by_direction: Dict[TrendDirection, List[TrendAnalysis]] = {d: [] for d in TrendDirection}
+        for analysis in all_analyses:
+            by_direction[analysis.direction].append(analysis)
+        for analyses in by_direction.values():
+            analyses.sort(key=lambda x: x.trend_strength, reverse=True)
+        self._by_direction = by_direction
+
+        if all_analyses:
+            count = len(all_analyses)
+            self._summary = {
+                'total_analyses': count,
+                'direction_distribution': {d.value: len(by_direction[d]) for d in TrendDirection},
+                'confidence_distribution': {
+                    c.value: sum(1 for a in all_analyses if a.confidence == c) for c in TrendConfidence
+                },
+                'average_trend_strength': sum(a.trend_strength for a in all_analyses) / count,
+                'average_r_squared': sum(a.r_squared for a in all_analyses) / count,
+                'average_volatility': sum(a.volatility for a in all_analyses) / count,
+            }
+        else:
+            self._summary = None
+
+        self._index_dirty = False
+
     async def get_trending_experts(
         self,
         direction: TrendDirection,
@@ -522,65 +525,37 @@ class TrendAnalyzer:
     ) -> List[TrendAnalysis]:
         """Get experts with specific trend characteristics"""
         try:
+            if self._index_dirty:
+                self._refresh_indexes()
+
+            # Analyses are pre-sorted by trend strength (descending)
             trending_experts = []
-            
-            # Search through cached analyses
-            for expert_id, expert_trends in self.trend_cache.items():
-                for analysis in expert_trends.values():
-                    if analysis.direction == direction:
-                        if confidence is None or analysis.confidence == confidence:
-                            if category is None or analysis.category == category:
-                                trending_experts.append(analysis)
-            
-            # Sort by trend strength (descending)
-            trending_experts.sort(key=lambda x: x.trend_strength, reverse=True)
-            
-            return trending_experts[:limit]
-            
+            for analysis in self._by_direction.get(direction, []):
+                if len(trending_experts) >= limit:
+                    break
+                if confidence is None or analysis.confidence == confidence:
+                    if category is None or analysis.category == category:
+                        trending_experts.append(analysis)
+
+            return trending_experts
+
         except Exception as e:
             logger.error(f"Failed to get trending experts: {e}")
             return []
-    
+
     async def get_trend_summary(self) -> Dict[str, Any]:
         """Get overall trend analysis summary"""
         try:
-            all_analyses = []
-            
-            for expert_trends in self.trend_cache.values():
-                all_analyses.extend(expert_trends.values())
-            
-            if not all_analyses:
+            if self._index_dirty:
+                self._refresh_indexes()
+
+            if self._summary is None:
                 return {'error': 'No trend analyses available'}
-            
-            # Count by direction
-            direction_counts = {}
-            for direction in TrendDirection:
-                direction_counts[direction.value] = sum(
-                    1 for a in all_analyses if a.direction == direction
-                )
-            
-            # Count by confidence
-            confidence_counts = {}
-            for confidence in TrendConfidence:
-                confidence_counts[confidence.value] = sum(
-                    1 for a in all_analyses if a.confidence == confidence
-                )
-            
-            # Calculate averages
-            avg_trend_strength = sum(a.trend_strength for a in all_analyses) / len(all_analyses)
-            avg_r_squared = sum(a.r_squared for a in all_analyses) / len(all_analyses)
-            avg_volatility = sum(a.volatility for a in all_analyses) / len(all_analyses)
-            
-            return {
-                'total_analyses': len(all_analyses),
-                'direction_distribution': direction_counts,
-                'confidence_distribution': confidence_counts,
-                'average_trend_strength': avg_trend_strength,
-                'average_r_squared': avg_r_squared,
-                'average_volatility': avg_volatility,
-                'last_updated': datetime.now().isoformat()
-            }
-            
+
+            summary = dict(self._summary)
+            summary['last_updated'] = datetime.now().isoformat()
+            return summary
+
         except Exception as e:
             logger.error(f"Failed to get trend summary: {e}")
             return {'error': str(e)}
@@ -0,0 +1,202 @@
+"""
+Trend Engine
+Closed-form weighted trend statistics for many expert series at once
+"""
+
+from typing import List, Optional, Tuple
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+import numpy as np
+from scipy import stats
+
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 24 * 3600
+
+
+@dataclass
+class TrendStatistics:
+    """Per-series trend statistics, one array entry per series"""
+    slope: np.ndarray
+    r_squared: np.ndarray
+    p_value: np.ndarray
+    volatility: np.ndarray
+    momentum: np.ndarray
+    data_points: np.ndarray
+
+
+def pad_series(series: List[Tuple[np.ndarray, np.ndarray, np.ndarray]]
+               ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Stack ragged (x, y, w) series into zero-padded (S, N) arrays plus a mask"""
+    width = max((len(x) for x, _, _ in series), default=0)
+    shape = (len(series), max(width, 1))
+    x_pad = np.zeros(shape)
+    y_pad = np.zeros(shape)
+    w_pad = np.zeros(shape)
+    mask = np.zeros(shape, dtype=bool)
+    for row, (x, y, w) in enumerate(series):
+        n = len(x)
+        x_pad[row, :n] = x
+        y_pad[row, :n] = y
+        w_pad[row, :n] = w
+        mask[row, :n] = True
+    return x_pad, y_pad, w_pad, mask
+
+
+def _centered_slope(x: np.ndarray, y: np.ndarray, w: np.ndarray
+                    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Weighted least-squares slope per row from centred sums; w is 0 on padding"""
+    total = w.sum(axis=1)
+    safe_total = np.where(total > 0, total, 1.0)
+    x_mean = (w * x).sum(axis=1) / safe_total
+    y_mean = (w * y).sum(axis=1) / safe_total
+    dx = np.where(w > 0, x - x_mean[:, None], 0.0)
+    dy = np.where(w > 0, y - y_mean[:, None], 0.0)
+    sxx = (w * dx * dx).sum(axis=1)
+    sxy = (w * dx * dy).sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        slope = np.where(sxx > 0, sxy / np.where(sxx > 0, sxx, 1.0), 0.0)
+    return slope, sxx, dx, dy
+
+
+def batch_trend_statistics(x: np.ndarray, y: np.ndarray, w: np.ndarray,
+                           mask: np.ndarray, min_momentum_points: int = 10) -> TrendStatistics:
+    """Weighted regression, volatility and momentum for every row of (S, N) arrays.
+
+    Each row is one series with ``x`` in days from its first point. Everything
+    is computed from per-row weighted sums, so memory stays O(S * N).
+    """
+    n = mask.sum(axis=1)
+    weights = np.where(mask, w, 0.0)
+
+    slope, sxx, dx, dy = _centered_slope(x, y, weights)
+    valid_fit = sxx > 0
+    total = weights.sum(axis=1)
+    safe_total = np.where(total > 0, total, 1.0)
+
+    # Residuals of the weighted fit around the weighted means
+    residual = dy - slope[:, None] * dx
+    ss_res = (weights * residual * residual).sum(axis=1)
+    ss_tot = (weights * dy * dy).sum(axis=1)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        r_squared = np.where(ss_tot > 0, 1 - ss_res / np.where(ss_tot > 0, ss_tot, 1.0), 0.0)
+        dof = np.maximum(n - 2, 1)
+        standard_error = np.sqrt(ss_res / dof) / np.sqrt(sxx)
+        t_stat = slope / standard_error
+        p_value = 2 * (1 - stats.t.cdf(np.abs(t_stat), dof))
+    p_value = np.where(np.isnan(p_value), 1.0, p_value)
+    p_value = np.where(n > 2, p_value, 1.0)
+
+    slope = np.where(valid_fit, slope, 0.0)
+    r_squared = np.where(valid_fit, np.maximum(0.0, r_squared), 0.0)
+    p_value = np.where(valid_fit, np.clip(p_value, 0.0, 1.0), 1.0)
+
+    volatility = np.where(n >= 2, np.minimum(1.0, np.sqrt(ss_tot / safe_total)), 0.0)
+
+    # Momentum: unweighted slope of the recent half minus the earlier half
+    position = np.arange(x.shape[1])[None, :]
+    split = (n // 2)[:, None]
+    earlier = (mask & (position < split)).astype(np.float64)
+    recent = (mask & (position >= split)).astype(np.float64)
+    earlier_slope = _centered_slope(x, y, earlier)[0]
+    recent_slope = _centered_slope(x, y, recent)[0]
+    momentum = np.clip((recent_slope - earlier_slope) * 10, -1.0, 1.0)
+    momentum = np.where(n >= min_momentum_points, momentum, 0.0)
+
+    return TrendStatistics(
+        slope=slope,
+        r_squared=r_squared,
+        p_value=p_value,
+        volatility=volatility,
+        momentum=momentum,
+        data_points=n
+    )
+
+
+class OutcomeSeries:
+    """Append-only, time-sorted (timestamp, correct) arrays for one expert series"""
+
+    def __init__(self, capacity: int = 64):
+        self.timestamps = np.zeros(capacity)
+        self.correct = np.zeros(capacity)
+        self.size = 0
+        self.version = 0
+
+    def append(self, timestamp: datetime, is_correct: bool) -> None:
+        if self.size == len(self.timestamps):
+            self.timestamps = np.concatenate([self.timestamps, np.zeros(self.size)])
+            self.correct = np.concatenate([self.correct, np.zeros(self.size)])
+
+        ts = timestamp.timestamp()
+        if self.size and ts < self.timestamps[self.size - 1]:
+            # Late arrival: insert after equal timestamps to keep a stable order
+            at = int(np.searchsorted(self.timestamps[:self.size], ts, side='right'))
+            self.timestamps[at + 1:self.size + 1] = self.timestamps[at:self.size]
+            self.correct[at + 1:self.size + 1] = self.correct[at:self.size]
+        else:
+            at = self.size
+        self.timestamps[at] = ts
+        self.correct[at] = 1.0 if is_correct else 0.0
+        self.size += 1
+        self.version += 1
+
+    def extend(self, timestamps: List[datetime], correct: List[bool]) -> None:
+        """Bulk append; a stable sort keeps earlier arrivals first on equal timestamps"""
+        if not timestamps:
+            return
+        new_ts = np.array([ts.timestamp() for ts in timestamps])
+        new_correct = np.array(correct, dtype=np.float64)
+        all_ts = np.concatenate([self.timestamps[:self.size], new_ts])
+        all_correct = np.concatenate([self.correct[:self.size], new_correct])
+        if (self.size and new_ts.min() < self.timestamps[self.size - 1]) or np.any(np.diff(new_ts) < 0):
+            order = np.argsort(all_ts, kind='stable')
+            all_ts = all_ts[order]
+            all_correct = all_correct[order]
+
+        capacity = max(len(self.timestamps), 1)
+        while capacity < len(all_ts):
+            capacity *= 2
+        self.timestamps = np.zeros(capacity)
+        self.correct = np.zeros(capacity)
+        self.timestamps[:len(all_ts)] = all_ts
+        self.correct[:len(all_ts)] = all_correct
+        self.size = len(all_ts)
+        self.version += 1
+
+    def trend_points(self, window_days: int, now: datetime
+                     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Rolling-accuracy trend points over the trailing window.
+
+        Mirrors the per-outcome construction: an adaptive rolling window of
+        max(5, n // 10) outcomes, weighted by age within the analysis window.
+        """
+        now_ts = now.timestamp()
+        cutoff = now_ts - window_days * SECONDS_PER_DAY
+        start = int(np.searchsorted(self.timestamps[:self.size], cutoff, side='left'))
+        timestamps = self.timestamps[start:self.size]
+        correct = self.correct[start:self.size]
+
+        n = len(timestamps)
+        window_size = max(5, n // 10)
+        if n <= window_size:
+            empty = np.zeros(0)
+            return empty, empty, empty
+
+        cumulative = np.concatenate([[0.0], np.cumsum(correct)])
+        index = np.arange(window_size, n)
+        accuracy = (cumulative[index] - cumulative[index - window_size]) / window_size
+        point_ts = timestamps[index]
+
+        age_days = np.floor((now_ts - point_ts) / SECONDS_PER_DAY)
+        weights = np.maximum(0.1, 1.0 - age_days / window_days)
+        return point_ts, accuracy, weights
+
+
+def series_from_points(timestamps: np.ndarray, values: np.ndarray, weights: np.ndarray
+                       ) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Convert absolute timestamps (seconds) into days from the series start"""
+    if len(timestamps) == 0:
+        return None
+    return (timestamps - timestamps[0]) / SECONDS_PER_DAY, values, weights
@@ -0,0 +1,291 @@
+"""
+Columnar Play-by-Play Analytics Engine
+Vectorized EPA, success rate, situational splits and per-game aggregates
+"""
+
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MAX_DOWN = 4
+MAX_YARD_LINE = 100
+
+# Defaults used when a play column is missing entirely
+PLAY_COLUMN_DEFAULTS = {
+    'down': 1,
+    'yard_line': 50,
+    'yards_gained': 0,
+    'yards_to_go': 10,
+    'touchdown': False,
+    'turnover': False,
+    'safety': False,
+    'first_down': False,
+}
+
+# Derived columns written back to the play frame and cached in the play store
+DERIVED_COLUMNS = ['epa', 'success']
+
+# Situational defaults used when a team has no plays in the split
+SITUATIONAL_DEFAULTS = {
+    'red_zone_efficiency': 0.5,
+    'red_zone_td_rate': 0.3,
+    'third_down_rate': 0.35,
+    'goal_line_efficiency': 0.6,
+}
+
+
+def build_epa_table(epa_values: Dict[int, Dict[int, float]]) -> np.ndarray:
+    """Convert the nested down -> yard line EPA dict into a dense lookup array.
+
+    Row 0 and column 0 are left at zero so that `table[down, yard_line]` can be
+    indexed directly with the on-field values.
+    """
+    table = np.zeros((MAX_DOWN + 1, MAX_YARD_LINE + 1), dtype=np.float64)
+    for down, by_yard in epa_values.items():
+        if not 1 <= down <= MAX_DOWN:
+            continue
+        for yard_line, value in by_yard.items():
+            if 1 <= yard_line <= MAX_YARD_LINE:
+                table[down, yard_line] = value
+    return table
+
+
+class PlayStore:
+    """Parquet cache for derived play-by-play columns.
+
+    Entries are keyed by a caller supplied key (for example ``"2023"`` for a
+    season) and store only the derived columns, aligned to the source frame.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path] = "data/cache/plays"):
+        self.cache_dir = Path(cache_dir)
+        self.enabled = PARQUET_AVAILABLE
+        if not self.enabled:
+            logger.warning("pyarrow not available - play store caching disabled")
+
+    def _path(self, key: str) -> Path:
+        safe_key = hashlib.md5(str(key).encode()).hexdigest()
+        return self.cache_dir / f"plays_{safe_key}.parquet"
+
+    def has(self, key: str) -> bool:
+        return self.enabled and self._path(key).exists()
+
+    def load(self, key: str, expected_rows: Optional[int] = None) -> Optional[pd.DataFrame]:
+        """Load cached derived columns, or None when missing or stale"""
+        if not self.has(key):
+            return None
+        try:
+            cached = pd.read_parquet(self._path(key))
+        except Exception as e:
+            logger.warning(f"Failed to read play store entry {key}: {e}")
+            return None
+
+        if expected_rows is not None and len(cached) != expected_rows:
+            logger.info(f"Play store entry {key} is stale ({len(cached)} != {expected_rows} rows)")
+            return None
+        return cached
+
+    def save(self, key: str, derived: pd.DataFrame) -> bool:
+        if not self.enabled:
+            return False
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            derived.reset_index(drop=True).to_parquet(self._path(key), index=False)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to write play store entry {key}: {e}")
+            return False
+
+    def invalidate(self, key: str) -> None:
+        path = self._path(key)
+        if path.exists():
+            path.unlink()
+
+
+class PlayByPlayEngine:
+    """Vectorized play-by-play analytics over a dense down x yard-line EPA table"""
+
+    def __init__(self,
+                 epa_values: Dict[int, Dict[int, float]],
+                 success_thresholds: Dict[int, float],
+                 play_store: Optional[PlayStore] = None):
+        self.epa_table = build_epa_table(epa_values)
+        self.threshold_table = np.ones(MAX_DOWN + 1, dtype=np.float64)
+        for down, threshold in success_thresholds.items():
+            if 1 <= down <= MAX_DOWN:
+                self.threshold_table[down] = threshold
+        self.play_store = play_store
+
+    @staticmethod
+    def _column(plays_df: pd.DataFrame, name: str) -> np.ndarray:
+        """Column as float64, using the row-loop default when absent"""
+        if name not in plays_df.columns:
+            return np.full(len(plays_df), float(PLAY_COLUMN_DEFAULTS[name]))
+        return pd.to_numeric(plays_df[name], errors='coerce').to_numpy(dtype=np.float64)
+
+    @staticmethod
+    def _flag(plays_df: pd.DataFrame, name: str) -> np.ndarray:
+        if name not in plays_df.columns:
+            return np.zeros(len(plays_df), dtype=bool)
+        return plays_df[name].astype(bool).to_numpy()
+
+    @staticmethod
+    def _valid_index(values: np.ndarray, upper: int) -> np.ndarray:
+        """Mask of values that are whole numbers in [1, upper]"""
+        with np.errstate(invalid='ignore'):
+            return (values >= 1) & (values <= upper) & (values == np.floor(values))
+
+    def lookup_epa(self, down: np.ndarray, yard_line: np.ndarray) -> np.ndarray:
+        """Gather EPA values; undefined situations map to 0 like the dict lookup"""
+        valid = self._valid_index(down, MAX_DOWN) & self._valid_index(yard_line, MAX_YARD_LINE)
+        down_idx = np.where(valid, down, 0).astype(np.intp)
+        yard_idx = np.where(valid, yard_line, 0).astype(np.intp)
+        return self.epa_table[down_idx, yard_idx]
+
+    def compute_epa(self, plays_df: pd.DataFrame) -> np.ndarray:
+        down = self._column(plays_df, 'down')
+        yard_line = self._column(plays_df, 'yard_line')
+        yards_gained = self._column(plays_df, 'yards_gained')
+        yards_to_go = self._column(plays_df, 'yards_to_go')
+
+        base_epa = self.lookup_epa(down, yard_line)
+
+        # fmin ignores NaN the same way the builtin min() did in the row loop
+        new_yard_line = np.fmin(99.0, yard_line + yards_gained)
+        with np.errstate(invalid='ignore'):
+            new_down = np.where(yards_gained < yards_to_go, np.minimum(4.0, down + 1), 1.0)
+        regular_epa = self.lookup_epa(new_down, new_yard_line) - base_epa
+
+        return np.select(
+            [self._flag(plays_df, 'touchdown'),
+             self._flag(plays_df, 'safety'),
+             self._flag(plays_df, 'turnover')],
+            [7.0 - base_epa, -2.0 - base_epa, -base_epa - 1.0],
+            default=regular_epa
+        )
+
+    def compute_success(self, plays_df: pd.DataFrame) -> np.ndarray:
+        down = self._column(plays_df, 'down')
+        yards_gained = self._column(plays_df, 'yards_gained')
+        yards_to_go = self._column(plays_df, 'yards_to_go')
+
+        valid_down = self._valid_index(down, MAX_DOWN)
+        threshold = self.threshold_table[np.where(valid_down, down, 0).astype(np.intp)]
+
+        with np.errstate(invalid='ignore'):
+            success = yards_gained >= yards_to_go * threshold
+        success |= self._flag(plays_df, 'touchdown')
+        success |= self._flag(plays_df, 'first_down')
+        return success.astype(np.int64)
+
+    def enrich(self, plays_df: pd.DataFrame, cache_key: Optional[str] = None) -> pd.DataFrame:
+        """Return a copy of the plays with EPA and success columns attached.
+
+        When a play store and cache key are given the derived columns are read
+        from (or written to) Parquet instead of being recomputed.
+        """
+        plays_df = plays_df.copy()
+
+        derived = None
+        if self.play_store is not None and cache_key is not None:
+            derived = self.play_store.load(cache_key, expected_rows=len(plays_df))
+
+        if derived is None:
+            derived = pd.DataFrame({
+                'epa': self.compute_epa(plays_df),
+                'success': self.compute_success(plays_df),
+            })
+            if self.play_store is not None and cache_key is not None:
+                self.play_store.save(cache_key, derived)
+
+        for column in DERIVED_COLUMNS:
+            plays_df[column] = derived[column].to_numpy()
+        return plays_df
+
+    def situational_stats(self, plays_df: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+        """Per-team situational splits in a single grouped pass"""
+        yard_line = plays_df['yard_line']
+        success = plays_df['success'].astype(float)
+        touchdown = plays_df['touchdown'].astype(float)
+        red_zone = (yard_line <= 20)
+        goal_line = (yard_line <= 5)
+        third_down = (plays_df['down'] == 3)
+
+        frame = pd.DataFrame({
+            'team': plays_df['team'],
+            'plays': 1,
+            'rz': red_zone.astype(int),
+            'rz_success': success.where(red_zone, 0.0),
+            'rz_td': touchdown.where(red_zone, 0.0),
+            'third': third_down.astype(int),
+            'third_success': success.where(third_down, 0.0),
+            'gl': goal_line.astype(int),
+            'gl_td': touchdown.where(goal_line, 0.0),
+            'explosive': (plays_df['yards_gained'] >= 20).astype(int),
+            'turnovers': plays_df['turnover'],
+        })
+        totals = frame.groupby('team', sort=False).sum()
+
+        def rate(numerator: pd.Series, denominator: pd.Series, default: float) -> np.ndarray:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                return np.where(denominator > 0, numerator / denominator.where(denominator > 0, 1), default)
+
+        columns = {
+            'red_zone_efficiency': rate(totals['rz_success'], totals['rz'], SITUATIONAL_DEFAULTS['red_zone_efficiency']),
+            'red_zone_td_rate': rate(totals['rz_td'], totals['rz'], SITUATIONAL_DEFAULTS['red_zone_td_rate']),
+            'third_down_rate': rate(totals['third_success'], totals['third'], SITUATIONAL_DEFAULTS['third_down_rate']),
+            'goal_line_efficiency': rate(totals['gl_td'], totals['gl'], SITUATIONAL_DEFAULTS['goal_line_efficiency']),
+            'explosive_play_rate': rate(totals['explosive'], totals['plays'], 0),
+            'turnover_differential': 0 - totals['turnovers'].to_numpy(),
+        }
+
+        situational_stats = {}
+        for position, team in enumerate(totals.index):
+            situational_stats[team] = {name: values[position] for name, values in columns.items()}
+        return situational_stats
+
+    def aggregate_to_games(self, plays_df: pd.DataFrame) -> pd.DataFrame:
+        """Aggregate play-level columns to one row per (game_id, team)"""
+        frame = plays_df[['game_id', 'team', 'epa', 'success', 'yards_gained',
+                          'yards_to_go', 'turnover', 'touchdown', 'penalty']].copy()
+        frame['is_third_down'] = (plays_df['down'] == 3)
+
+        grouped = frame.groupby(['game_id', 'team'])
+        game_stats = grouped.agg(
+            epa_mean=('epa', 'mean'),
+            epa_total=('epa', 'sum'),
+            epa_std=('epa', 'std'),
+            success_rate=('success', 'mean'),
+            yards_per_play=('yards_gained', 'mean'),
+            total_yards=('yards_gained', 'sum'),
+            avg_yards_to_go=('yards_to_go', 'mean'),
+            third_down_pct=('is_third_down', 'mean'),
+            turnovers=('turnover', 'sum'),
+            touchdowns=('touchdown', 'sum'),
+            penalties=('penalty', 'sum'),
+        ).reset_index()
+
+        return game_stats
+
+    @staticmethod
+    def rolling_averages(team_stats: pd.DataFrame, columns: List[str], windows: List[int]) -> pd.DataFrame:
+        """Grouped rolling means using the cythonized groupby-rolling path"""
+        grouped = team_stats.groupby('team', sort=False)
+        for window in windows:
+            for col in columns:
+                if col in team_stats.columns:
+                    rolled = grouped[col].rolling(window=window, min_periods=1).mean()
+                    team_stats[f'{col}_avg_{window}'] = rolled.reset_index(level=0, drop=True)
+        return team_stats
@@ -18,6 +18,8 @@ from dataclasses import dataclass
 from bs4 import BeautifulSoup
 import re
 
+from ..utils.team_index import team_abbreviation
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -66,21 +68,6 @@ class PublicDataCollector:
         self.team_stats: List[Dict] = []
         self.power_rankings: List[Dict] = []
         
-        # Team name mappings for consistency
-        self.team_mappings = {
-            'Arizona Cardinals': 'ARI', 'Atlanta Falcons': 'ATL', 'Baltimore Ravens': 'BAL',
-            'Buffalo Bills': 'BUF', 'Carolina Panthers': 'CAR', 'Chicago Bears': 'CHI',
-            'Cincinnati Bengals': 'CIN', 'Cleveland Browns': 'CLE', 'Dallas Cowboys': 'DAL',
-            'Denver Broncos': 'DEN', 'Detroit Lions': 'DET', 'Green Bay Packers': 'GB',
-            'Houston Texans': 'HOU', 'Indianapolis Colts': 'IND', 'Jacksonville Jaguars': 'JAX',
-            'Kansas City Chiefs': 'KC', 'Las Vegas Raiders': 'LV', 'Los Angeles Chargers': 'LAC',
-            'Los Angeles Rams': 'LAR', 'Miami Dolphins': 'MIA', 'Minnesota Vikings': 'MIN',
-            'New England Patriots': 'NE', 'New Orleans Saints': 'NO', 'New York Giants': 'NYG',
-            'New York Jets': 'NYJ', 'Philadelphia Eagles': 'PHI', 'Pittsburgh Steelers': 'PIT',
-            'San Francisco 49ers': 'SF', 'Seattle Seahawks': 'SEA', 'Tampa Bay Buccaneers': 'TB',
-            'Tennessee Titans': 'TEN', 'Washington Commanders': 'WAS'
-        }
-        
         # Headers to avoid being blocked
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
@@ -234,33 +221,10 @@ class PublicDataCollector:
         
     def _map_team_name(self, team_name: str) -> Optional[str]:
         """Map full team name to abbreviation"""
-        team_name = team_name.strip()
-        
-        # Direct mapping
-        if team_name in self.team_mappings:
-            return self.team_mappings[team_name]
-            
-        # Try partial matching
-        for full_name, abbrev in self.team_mappings.items():
-            if team_name.lower() in full_name.lower() or full_name.lower() in team_name.lower():
-                return abbrev
-                
-        # Common abbreviations
-        abbrev_map = {
-            'ARI': 'ARI', 'ATL': 'ATL', 'BAL': 'BAL', 'BUF': 'BUF', 'CAR': 'CAR',
-            'CHI': 'CHI', 'CIN': 'CIN', 'CLE': 'CLE', 'DAL': 'DAL', 'DEN': 'DEN',
-            'DET': 'DET', 'GB': 'GB', 'HOU': 'HOU', 'IND': 'IND', 'JAX': 'JAX',
-            'KC': 'KC', 'LV': 'LV', 'LAC': 'LAC', 'LAR': 'LAR', 'MIA': 'MIA',
-            'MIN': 'MIN', 'NE': 'NE', 'NO': 'NO', 'NYG': 'NYG', 'NYJ': 'NYJ',
-            'PHI': 'PHI', 'PIT': 'PIT', 'SF': 'SF', 'SEA': 'SEA', 'TB': 'TB',
-            'TEN': 'TEN', 'WAS': 'WAS'
-        }
-        
-        if team_name.upper() in abbrev_map:
-            return abbrev_map[team_name.upper()]
-            
-        logger.warning(f"⚠️ Could not map team name: {team_name}")
-        return None
+        abbrev = team_abbreviation(team_name.strip())
+        if abbrev is None:
+            logger.warning(f"⚠️ Could not map team name: {team_name}")
+        return abbrev
         
     def _parse_date(self, date_str: str, season: int) -> datetime:
         """Parse date string to datetime"""
@@ -0,0 +1,449 @@
+"""
+Historical Situation Index
+Maps discretized game states to outcome distributions built from historical play-by-play
+"""
+
+import logging
+from bisect import bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = "models/situation_index.npz"
+
+# Bucket edges (right-open); values below the first edge fall into bucket 0
+DISTANCE_EDGES = [2, 3, 4, 7, 11, 16]                    # 1, 2, 3, 4-6, 7-10, 11-15, 16+
+FIELD_EDGES = [6, 11, 21, 41, 61, 81]                    # yards from the opponent goal line
+SCORE_EDGES = [-16, -8, -3, 0, 1, 4, 9, 17]              # possession team score differential
+
+N_DOWNS = 4
+N_DISTANCE = len(DISTANCE_EDGES) + 1
+N_FIELD = len(FIELD_EDGES) + 1
+N_SCORE = len(SCORE_EDGES) + 1
+N_TIME = 8
+N_CELLS = N_DOWNS * N_DISTANCE * N_FIELD * N_SCORE * N_TIME
+
+# Outcome columns tracked per cell
+OUTCOMES = ('converted', 'touchdown', 'field_goal', 'turnover', 'no_score', 'won')
+OUTCOME_INDEX = {name: i for i, name in enumerate(OUTCOMES)}
+
+DRIVE_RESULTS = ('none', 'touchdown', 'field_goal', 'turnover', 'punt', 'safety', 'end_of_half')
+DRIVE_RESULT_CODES = {name: i for i, name in enumerate(DRIVE_RESULTS)}
+DRIVE_RESULT_ALIASES = {
+    'opp_touchdown': 'turnover',
+    'turnover_on_downs': 'turnover',
+    'missed_field_goal': 'punt',
+}
+
+# nflfastR-style column names accepted by the builder
+COLUMN_ALIASES = {
+    'ydstogo': 'yards_to_go',
+    'yardline_100': 'yard_line',
+    'qtr': 'quarter',
+    'quarter_seconds_remaining': 'seconds_remaining',
+    'fixed_drive_result': 'drive_result',
+}
+
+# Per-feature scales used for nearest-neighbour distances
+FEATURE_SCALES = np.array([1.0, 10.0, 25.0, 7.0, 900.0], dtype=np.float32)
+
+
+def time_bucket(quarter: int, seconds_remaining: int) -> int:
+    """Bucket game time: Q1, Q2, Q2 final 2:00, Q3, Q4, Q4 final 5:00, Q4 final 2:00, OT"""
+    if quarter <= 1:
+        return 0
+    if quarter == 2:
+        return 2 if seconds_remaining <= 120 else 1
+    if quarter == 3:
+        return 3
+    if quarter == 4:
+        if seconds_remaining <= 120:
+            return 6
+        return 5 if seconds_remaining <= 300 else 4
+    return 7
+
+
+def game_seconds_remaining(quarter: int, seconds_remaining: int) -> int:
+    return max(0, 4 - quarter) * 900 + seconds_remaining if quarter <= 4 else seconds_remaining
+
+
+def situation_key(down: int, yards_to_go: int, yard_line: int, score_diff: int,
+                  quarter: int, seconds_remaining: int) -> int:
+    """Mixed-radix cell index for a game state"""
+    down_idx = min(max(int(down), 1), N_DOWNS) - 1
+    key = down_idx * N_DISTANCE + bisect_right(DISTANCE_EDGES, yards_to_go)
+    key = key * N_FIELD + bisect_right(FIELD_EDGES, yard_line)
+    key = key * N_SCORE + bisect_right(SCORE_EDGES, score_diff)
+    return key * N_TIME + time_bucket(quarter, seconds_remaining)
+
+
+def _vector_keys(down: np.ndarray, yards_to_go: np.ndarray, yard_line: np.ndarray,
+                 score_diff: np.ndarray, quarter: np.ndarray, seconds: np.ndarray) -> np.ndarray:
+    down_idx = np.clip(down, 1, N_DOWNS) - 1
+    time_idx = np.select(
+        [quarter <= 1,
+         (quarter == 2) & (seconds > 120), quarter == 2,
+         quarter == 3,
+         (quarter == 4) & (seconds > 300), (quarter == 4) & (seconds > 120), quarter == 4],
+        [0, 1, 2, 3, 4, 5, 6],
+        default=7
+    )
+    key = down_idx * N_DISTANCE + np.searchsorted(DISTANCE_EDGES, yards_to_go, side='right')
+    key = key * N_FIELD + np.searchsorted(FIELD_EDGES, yard_line, side='right')
+    key = key * N_SCORE + np.searchsorted(SCORE_EDGES, score_diff, side='right')
+    return (key * N_TIME + time_idx).astype(np.int64)
+
+
+def _cell_centers() -> np.ndarray:
+    """Representative (down, distance, field, score, game seconds) for every cell"""
+    distance_mid = np.array([1, 2, 3, 5, 8.5, 13, 20], dtype=np.float32)
+    field_mid = np.array([3, 8, 15.5, 30.5, 50.5, 70.5, 90.5], dtype=np.float32)
+    score_mid = np.array([-21, -12, -5.5, -2, 0, 2, 6, 12.5, 21], dtype=np.float32)
+    time_mid = np.array([2700, 1260, 60, 1350, 510, 210, 60, 300], dtype=np.float32)
+
+    grid = np.indices((N_DOWNS, N_DISTANCE, N_FIELD, N_SCORE, N_TIME)).reshape(5, -1)
+    return np.stack([
+        grid[0] + 1.0,
+        distance_mid[grid[1]],
+        field_mid[grid[2]],
+        score_mid[grid[3]],
+        time_mid[grid[4]],
+    ], axis=1).astype(np.float32)
+
+
+@dataclass
+class SituationDistribution:
+    """Outcome distribution for a game-state cell"""
+    cell: int
+    sample_size: int
+    pooled: bool
+    rates: Dict[str, float]
+
+
+class SituationIndex:
+    """Dense index of historical outcome distributions by discretized game state.
+
+    Every cell stores outcome rates; cells with fewer than ``min_support`` plays
+    are filled at build time by pooling their nearest populated cells, so live
+    lookups are a single array read. A small set of exemplar plays per cell backs
+    ``similar_situations``.
+    """
+
+    def __init__(self,
+                 counts: np.ndarray,
+                 rates: np.ndarray,
+                 pooled: np.ndarray,
+                 neighbors: np.ndarray,
+                 exemplar_offsets: np.ndarray,
+                 exemplar_features: np.ndarray,
+                 exemplar_meta: np.ndarray,
+                 exemplar_games: np.ndarray,
+                 situation_rates: Optional[Dict[str, Tuple[float, int]]] = None):
+        self.counts = counts
+        self.rates = rates
+        self.pooled = pooled
+        self.neighbors = neighbors
+        self.exemplar_offsets = exemplar_offsets
+        self.exemplar_features = exemplar_features
+        self.exemplar_meta = exemplar_meta
+        self.exemplar_games = exemplar_games
+        self.situation_rates = situation_rates or {}
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+    @classmethod
+    def build(cls, plays_df: pd.DataFrame, min_support: int = 30, n_neighbors: int = 16,
+              max_exemplars: int = 5) -> 'SituationIndex':
+        """Build the index from historical play-by-play.
+
+        Expects down, yards_to_go, yard_line (yards from the opponent goal),
+        score_differential (possession team), quarter and seconds_remaining in
+        the quarter. Outcomes are read from first_down/success, drive_result and
+        final_margin (possession team) when present.
+        """
+        plays = plays_df.rename(columns={k: v for k, v in COLUMN_ALIASES.items() if k in plays_df.columns})
+        plays = plays.dropna(subset=['down', 'yards_to_go', 'yard_line', 'score_differential',
+                                     'quarter', 'seconds_remaining'])
+
+        down = plays['down'].to_numpy(dtype=np.int64)
+        yards_to_go = plays['yards_to_go'].to_numpy(dtype=np.float64)
+        yard_line = plays['yard_line'].to_numpy(dtype=np.float64)
+        score_diff = plays['score_differential'].to_numpy(dtype=np.float64)
+        quarter = plays['quarter'].to_numpy(dtype=np.int64)
+        seconds = plays['seconds_remaining'].to_numpy(dtype=np.float64)
+        keys = _vector_keys(down, yards_to_go, yard_line, score_diff, quarter, seconds)
+
+        drive_codes = cls._drive_result_codes(plays)
+        outcomes = cls._outcome_matrix(plays, drive_codes)
+        counts = np.bincount(keys, minlength=N_CELLS).astype(np.int64)
+        sums = np.stack([np.bincount(keys, weights=outcomes[:, i], minlength=N_CELLS)
+                         for i in range(len(OUTCOMES))], axis=1)
+
+        neighbors = cls._nearest_populated_cells(counts, n_neighbors)
+        rates, pooled = cls._pooled_rates(counts, sums, neighbors, min_support)
+
+        game_seconds = np.where(quarter <= 4, np.maximum(0, 4 - quarter) * 900 + seconds, seconds)
+        features = np.stack([down, yards_to_go, yard_line, score_diff, game_seconds], axis=1).astype(np.float32)
+        final_margin = (plays['final_margin'].to_numpy(dtype=np.float64)
+                        if 'final_margin' in plays.columns else np.full(len(plays), np.nan))
+        game_ids = (plays['game_id'].astype(str).to_numpy()
+                    if 'game_id' in plays.columns else np.full(len(plays), 'unknown', dtype=object))
+
+        offsets, selected = cls._select_exemplars(keys, game_ids, max_exemplars)
+        meta = np.stack([quarter[selected], seconds[selected], drive_codes[selected],
+                         final_margin[selected]], axis=1).astype(np.float32)
+
+        index = cls(
+            counts=counts,
+            rates=rates.astype(np.float32),
+            pooled=pooled,
+            neighbors=neighbors,
+            exemplar_offsets=offsets,
+            exemplar_features=features[selected],
+            exemplar_meta=meta,
+            exemplar_games=game_ids[selected].astype(str),
+            situation_rates=cls._situation_rates(down, yards_to_go, yard_line, score_diff,
+                                                 quarter, seconds, outcomes)
+        )
+        logger.info(f"Built situation index from {len(plays)} plays "
+                    f"({int((counts > 0).sum())}/{N_CELLS} populated cells)")
+        return index
+
+    @staticmethod
+    def _drive_result_codes(plays: pd.DataFrame) -> np.ndarray:
+        if 'drive_result' not in plays.columns:
+            return np.zeros(len(plays), dtype=np.int64)
+
+        # Normalize the distinct labels only, then broadcast the codes back
+        codes, labels = pd.factorize(plays['drive_result'], use_na_sentinel=True)
+        label_codes = np.zeros(len(labels) + 1, dtype=np.int64)
+        for i, label in enumerate(labels):
+            normalized = str(label).lower().replace(' ', '_')
+            normalized = DRIVE_RESULT_ALIASES.get(normalized, normalized)
+            label_codes[i] = DRIVE_RESULT_CODES.get(normalized, 0)
+        return label_codes[codes]
+
+    @classmethod
+    def _outcome_matrix(cls, plays: pd.DataFrame, drive_codes: np.ndarray) -> np.ndarray:
+        n = len(plays)
+        if 'first_down' in plays.columns:
+            converted = plays['first_down'].fillna(0).astype(bool).to_numpy()
+        elif 'success' in plays.columns:
+            converted = plays['success'].fillna(0).astype(bool).to_numpy()
+        elif 'yards_gained' in plays.columns:
+            converted = (plays['yards_gained'] >= plays['yards_to_go']).to_numpy()
+        else:
+            converted = np.zeros(n, dtype=bool)
+
+        touchdown = drive_codes == DRIVE_RESULT_CODES['touchdown']
+        field_goal = drive_codes == DRIVE_RESULT_CODES['field_goal']
+        turnover = drive_codes == DRIVE_RESULT_CODES['turnover']
+
+        if 'final_margin' in plays.columns:
+            won = (plays['final_margin'].to_numpy(dtype=np.float64) > 0)
+        else:
+            won = np.zeros(n, dtype=bool)
+
+        return np.stack([converted, touchdown, field_goal, turnover,
+                         ~(touchdown | field_goal), won], axis=1).astype(np.float64)
+
+    @staticmethod
+    def _nearest_populated_cells(counts: np.ndarray, n_neighbors: int, chunk: int = 512) -> np.ndarray:
+        """k nearest populated cells (by scaled cell-center distance) for every cell"""
+        centers = _cell_centers() / FEATURE_SCALES
+        populated = np.flatnonzero(counts > 0)
+        k = min(n_neighbors, len(populated))
+        neighbors = np.full((N_CELLS, n_neighbors), -1, dtype=np.int32)
+        if k == 0:
+            return neighbors
+
+        candidate_centers = centers[populated]
+        candidate_norms = (candidate_centers ** 2).sum(axis=1)
+        for start in range(0, N_CELLS, chunk):
+            block = centers[start:start + chunk]
+            distances = (block ** 2).sum(axis=1)[:, None] + candidate_norms[None, :] - 2.0 * block @ candidate_centers.T
+            nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+            order = np.take_along_axis(distances, nearest, axis=1).argsort(axis=1)
+            neighbors[start:start + chunk, :k] = populated[np.take_along_axis(nearest, order, axis=1)]
+        return neighbors
+
+    @staticmethod
+    def _pooled_rates(counts: np.ndarray, sums: np.ndarray, neighbors: np.ndarray,
+                      min_support: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Outcome rates per cell, pooling neighbours into sparse cells"""
+        pooled_counts = counts.astype(np.float64).copy()
+        pooled_sums = sums.copy()
+        sparse = np.flatnonzero(counts < min_support)
+
+        for column in range(neighbors.shape[1]):
+            active = sparse[pooled_counts[sparse] < min_support]
+            if len(active) == 0:
+                break
+            neighbor = neighbors[active, column]
+            valid = (neighbor >= 0) & (neighbor != active)
+            active, neighbor = active[valid], neighbor[valid]
+            pooled_counts[active] += counts[neighbor]
+            pooled_sums[active] += sums[neighbor]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            rates = np.where(pooled_counts[:, None] > 0, pooled_sums / pooled_counts[:, None], np.nan)
+        return rates, counts < min_support
+
+    @staticmethod
+    def _select_exemplars(keys: np.ndarray, game_ids: np.ndarray,
+                          max_exemplars: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Up to max_exemplars plays per cell from distinct games, as CSR offsets"""
+        frame = pd.DataFrame({'key': keys, 'game': game_ids, 'row': np.arange(len(keys))})
+        frame = frame.drop_duplicates(['key', 'game'])
+        frame = frame[frame.groupby('key').cumcount() < max_exemplars].sort_values(['key', 'row'])
+        selected = frame['row'].to_numpy()
+        per_cell = np.bincount(frame['key'].to_numpy(), minlength=N_CELLS)
+        offsets = np.concatenate([[0], np.cumsum(per_cell)]).astype(np.int64)
+        return offsets, selected
+
+    @staticmethod
+    def _situation_rates(down, yards_to_go, yard_line, score_diff, quarter, seconds,
+                         outcomes) -> Dict[str, Tuple[float, int]]:
+        """League-wide rates for the narrator's situation types"""
+        abs_diff = np.abs(score_diff)
+        masks = {
+            'fourth_down': (down == 4, 'converted'),
+            'critical_third_down': ((down == 3) & (yards_to_go >= 8), 'converted'),
+            'red_zone': (yard_line <= 20, 'touchdown'),
+            'goal_line': (yard_line <= 5, 'touchdown'),
+            'two_minute_warning': (((quarter <= 2) | (quarter >= 4)) & (seconds <= 120), 'scored'),
+            'comeback_attempt': ((quarter >= 4) & (seconds <= 300) & (abs_diff <= 8) & (score_diff < 0), 'won'),
+            'hail_mary': ((quarter >= 4) & (seconds <= 8) & (abs_diff <= 7), 'touchdown'),
+        }
+
+        rates = {}
+        for situation, (mask, outcome) in masks.items():
+            n = int(mask.sum())
+            if n == 0:
+                continue
+            if outcome == 'scored':
+                value = 1.0 - outcomes[mask, OUTCOME_INDEX['no_score']].mean()
+            else:
+                value = outcomes[mask, OUTCOME_INDEX[outcome]].mean()
+            rates[situation] = (float(value), n)
+        return rates
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def save(self, path: Union[str, Path] = DEFAULT_INDEX_PATH) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        situations = sorted(self.situation_rates)
+        np.savez_compressed(
+            path,
+            counts=self.counts,
+            rates=self.rates,
+            pooled=self.pooled,
+            neighbors=self.neighbors,
+            exemplar_offsets=self.exemplar_offsets,
+            exemplar_features=self.exemplar_features,
+            exemplar_meta=self.exemplar_meta,
+            exemplar_games=self.exemplar_games.astype(str),
+            situation_names=np.array(situations, dtype=str),
+            situation_values=np.array([self.situation_rates[s] for s in situations], dtype=np.float64).reshape(-1, 2)
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = DEFAULT_INDEX_PATH) -> 'SituationIndex':
+        with np.load(path, allow_pickle=False) as data:
+            situation_rates = {
+                str(name): (float(value), int(n))
+                for name, (value, n) in zip(data['situation_names'], data['situation_values'])
+            }
+            return cls(
+                counts=data['counts'],
+                rates=data['rates'],
+                pooled=data['pooled'],
+                neighbors=data['neighbors'],
+                exemplar_offsets=data['exemplar_offsets'],
+                exemplar_features=data['exemplar_features'],
+                exemplar_meta=data['exemplar_meta'],
+                exemplar_games=data['exemplar_games'],
+                situation_rates=situation_rates
+            )
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def lookup(self, down: int, yards_to_go: int, yard_line: int, score_diff: int,
+               quarter: int, seconds_remaining: int) -> Optional[SituationDistribution]:
+        """O(1) outcome distribution for a game state"""
+        cell = situation_key(down, yards_to_go, yard_line, score_diff, quarter, seconds_remaining)
+        row = self.rates[cell]
+        if np.isnan(row[0]):
+            return None
+        return SituationDistribution(
+            cell=cell,
+            sample_size=int(self.counts[cell]),
+            pooled=bool(self.pooled[cell]),
+            rates=dict(zip(OUTCOMES, row.tolist()))
+        )
+
+    def outcome_rate(self, outcome: str, down: int, yards_to_go: int, yard_line: int,
+                     score_diff: int, quarter: int, seconds_remaining: int) -> Optional[float]:
+        """Single outcome rate for a game state without building a distribution"""
+        cell = situation_key(down, yards_to_go, yard_line, score_diff, quarter, seconds_remaining)
+        if outcome == 'scored':
+            value = 1.0 - self.rates[cell, OUTCOME_INDEX['no_score']]
+        else:
+            value = self.rates[cell, OUTCOME_INDEX[outcome]]
+        return None if np.isnan(value) else float(value)
+
+    def similar_situations(self, down: int, yards_to_go: int, yard_line: int, score_diff: int,
+                           quarter: int, seconds_remaining: int, limit: int = 5) -> List[Dict[str, Any]]:
+        """Nearest historical exemplar plays from the state's cell and its neighbours"""
+        cell = situation_key(down, yards_to_go, yard_line, score_diff, quarter, seconds_remaining)
+        neighbors = self.neighbors[cell]
+        cells = np.concatenate(([cell], neighbors[(neighbors >= 0) & (neighbors != cell)]))
+        starts = self.exemplar_offsets[cells]
+        lengths = self.exemplar_offsets[cells + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return []
+
+        # Flatten the per-cell exemplar ranges without a Python loop
+        rows = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths) + np.arange(total)
+
+        query = np.array([down, yards_to_go, yard_line, score_diff,
+                          game_seconds_remaining(quarter, seconds_remaining)], dtype=np.float32)
+        distances = np.sqrt((((self.exemplar_features[rows] - query) / FEATURE_SCALES) ** 2).sum(axis=1))
+        order = np.argsort(distances, kind='stable')[:limit]
+
+        return [self._describe_exemplar(rows[i], float(distances[i])) for i in order]
+
+    def _describe_exemplar(self, row: int, distance: float) -> Dict[str, Any]:
+        down, yards_to_go, yard_line, score_diff, _ = self.exemplar_features[row].tolist()
+        quarter, seconds, drive_code, final_margin = self.exemplar_meta[row].tolist()
+        drive_result = DRIVE_RESULTS[int(drive_code)]
+        minutes, secs = divmod(int(seconds), 60)
+
+        if np.isnan(final_margin):
+            final_result = "Final result unavailable"
+        elif final_margin > 0:
+            final_result = f"Possession team victory by {int(final_margin)} points"
+        elif final_margin < 0:
+            final_result = f"Possession team loss by {int(-final_margin)} points"
+        else:
+            final_result = "Tie game"
+
+        return {
+            "game_id": str(self.exemplar_games[row]),
+            "similarity_score": round(float(np.exp(-distance)), 3),
+            "context": (f"Q{int(quarter)} {minutes}:{secs:02d}, {int(down)} & {int(yards_to_go)} "
+                        f"at the opponent {int(yard_line)}, score differential {int(score_diff):+d}"),
+            "outcome": f"Drive result: {drive_result.replace('_', ' ')}",
+            "key_factors": ["down and distance", "field position", "score differential", "game clock"],
+            "final_result": final_result
+        }
@@ -4,9 +4,17 @@ Comprehensive testing framework for the AI Sports Prediction Platform
 """
 
 from .backtesting_framework import BacktestingFramework, HistoricalDataGenerator, BacktestResult
+from .backtest_engine import (
+    VectorizedBacktestEngine, GameArrays, PredictionArrays, BacktestMetrics, score_predictions
+)
 
 __all__ = [
     'BacktestingFramework',
     'HistoricalDataGenerator', 
-    'BacktestResult'
+    'BacktestResult',
+    'VectorizedBacktestEngine',
+    'GameArrays',
+    'PredictionArrays',
+    'BacktestMetrics',
+    'score_predictions'
 ]
\ No newline at end of file
@@ -0,0 +1,420 @@
+"""
+Vectorized Backtest Engine - Season-scale scoring of expert predictions
+
+Games and predictions are held as aligned arrays (experts x games) so every
+metric for every expert is computed in a single NumPy pass. Expert x season
+grids, walk-forward runs and parameter sweeps fan out across processes and
+share one cached feature matrix per set of games.
+"""
+
+from typing import Dict, List, Any, Optional, Callable, Sequence, Tuple
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Standard -110 juice: a winning 1 unit bet returns 100/110 units of profit
+DEFAULT_AMERICAN_ODDS = -110
+CALIBRATION_BINS = 10
+LOG_LOSS_EPS = 1e-15
+SCORE_TOLERANCE = 7
+
+
+def american_odds_payout(odds: float) -> float:
+    """Profit per unit staked for a winning bet at the given American odds"""
+    return 100.0 / abs(odds) if odds < 0 else odds / 100.0
+
+
+@dataclass
+class GameArrays:
+    """Columnar view of historical games, sorted chronologically"""
+    game_ids: np.ndarray
+    season: np.ndarray
+    week: np.ndarray
+    home_team: np.ndarray
+    away_team: np.ndarray
+    home_score: np.ndarray
+    away_score: np.ndarray
+    spread: np.ndarray
+    total: np.ndarray
+
+    @classmethod
+    def from_games(cls, games: Sequence[Any]) -> 'GameArrays':
+        """Build arrays from HistoricalGame-like objects"""
+        ordered = sorted(games, key=lambda g: (g.season, g.week, g.game_date))
+        return cls(
+            game_ids=np.array([g.game_id for g in ordered], dtype=object),
+            season=np.array([g.season for g in ordered], dtype=np.int32),
+            week=np.array([g.week for g in ordered], dtype=np.int32),
+            home_team=np.array([g.home_team for g in ordered], dtype=object),
+            away_team=np.array([g.away_team for g in ordered], dtype=object),
+            home_score=np.array([g.home_score for g in ordered], dtype=np.float64),
+            away_score=np.array([g.away_score for g in ordered], dtype=np.float64),
+            spread=np.array([g.spread for g in ordered], dtype=np.float64),
+            total=np.array([g.total for g in ordered], dtype=np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.game_ids)
+
+    def subset(self, mask: np.ndarray) -> 'GameArrays':
+        """Select games by boolean mask or index array"""
+        return GameArrays(**{name: getattr(self, name)[mask] for name in self.__dataclass_fields__})
+
+    def season_mask(self, seasons: Sequence[int]) -> np.ndarray:
+        return np.isin(self.season, np.asarray(seasons))
+
+    @property
+    def home_won(self) -> np.ndarray:
+        return self.home_score > self.away_score
+
+    @property
+    def ats_margin(self) -> np.ndarray:
+        """Home score margin against the spread (spread quoted from the home side)"""
+        return self.home_score - self.away_score + self.spread
+
+    @property
+    def ou_margin(self) -> np.ndarray:
+        return self.home_score + self.away_score - self.total
+
+
+@dataclass
+class PredictionArrays:
+    """Expert predictions aligned to GameArrays, shape (experts, games)
+
+    ats_pick / ou_pick use +1 for home cover / over, -1 for away cover / under
+    and 0 for no pick. NaN probabilities or scores mark missing predictions.
+    """
+    expert_ids: List[str]
+    home_win_prob: np.ndarray
+    pred_home_score: np.ndarray
+    pred_away_score: np.ndarray
+    ats_pick: np.ndarray
+    ou_pick: np.ndarray
+    stake: Optional[np.ndarray] = None
+
+    def __post_init__(self):
+        if self.stake is None:
+            self.stake = np.ones_like(self.home_win_prob, dtype=np.float64)
+
+    @classmethod
+    def from_records(cls, expert_ids: List[str], games: GameArrays,
+                     records: Dict[str, Dict[str, Dict[str, Any]]]) -> 'PredictionArrays':
+        """Build arrays from {expert_id: {game_id: prediction_dict}} records
+
+        Prediction dicts use the same keys as the per-game framework:
+        winner_prediction, exact_score_home, exact_score_away,
+        against_the_spread, totals_over_under and an optional
+        home_win_probability / stake.
+        """
+        n_experts, n_games = len(expert_ids), len(games)
+        prob = np.full((n_experts, n_games), np.nan)
+        home = np.full((n_experts, n_games), np.nan)
+        away = np.full((n_experts, n_games), np.nan)
+        ats = np.zeros((n_experts, n_games), dtype=np.int8)
+        ou = np.zeros((n_experts, n_games), dtype=np.int8)
+        stake = np.ones((n_experts, n_games))
+        game_index = {gid: i for i, gid in enumerate(games.game_ids)}
+
+        for e, expert_id in enumerate(expert_ids):
+            for game_id, pred in records.get(expert_id, {}).items():
+                g = game_index.get(game_id)
+                if g is None:
+                    continue
+                if 'home_win_probability' in pred:
+                    prob[e, g] = pred['home_win_probability']
+                elif 'winner_prediction' in pred:
+                    prob[e, g] = 1.0 if pred['winner_prediction'] == 'home' else 0.0
+                home[e, g] = pred.get('exact_score_home', np.nan)
+                away[e, g] = pred.get('exact_score_away', np.nan)
+                ats[e, g] = {'home': 1, 'away': -1}.get(pred.get('against_the_spread'), 0)
+                ou[e, g] = {'over': 1, 'under': -1}.get(pred.get('totals_over_under'), 0)
+                stake[e, g] = pred.get('stake', 1.0)
+
+        return cls(expert_ids, prob, home, away, ats, ou, stake)
+
+    def subset(self, game_mask: Optional[np.ndarray] = None,
+               expert_index: Optional[np.ndarray] = None) -> 'PredictionArrays':
+        """Select a block of experts and/or games"""
+        rows = slice(None) if expert_index is None else np.asarray(expert_index)
+        cols = slice(None) if game_mask is None else game_mask
+        ids = self.expert_ids if expert_index is None else [self.expert_ids[i] for i in rows]
+        take = lambda a: a[rows][:, cols]
+        return PredictionArrays(ids, take(self.home_win_prob), take(self.pred_home_score),
+                                take(self.pred_away_score), take(self.ats_pick),
+                                take(self.ou_pick), take(self.stake))
+
+
+@dataclass
+class BacktestMetrics:
+    """Per-expert metric vectors produced by a single scoring pass"""
+    expert_ids: List[str]
+    games_scored: np.ndarray
+    winner_accuracy: np.ndarray
+    ats_accuracy: np.ndarray
+    ou_accuracy: np.ndarray
+    score_within_tolerance: np.ndarray
+    score_mae: np.ndarray
+    brier_score: np.ndarray
+    log_loss: np.ndarray
+    calibration_error: np.ndarray
+    calibration_counts: np.ndarray
+    calibration_observed: np.ndarray
+    roi: np.ndarray
+    profit_units: np.ndarray
+    max_drawdown: np.ndarray
+
+    def to_summaries(self) -> Dict[str, Dict[str, Any]]:
+        """Per-expert summary dicts"""
+        summaries = {}
+        for e, expert_id in enumerate(self.expert_ids):
+            summaries[expert_id] = {
+                'expert_id': expert_id,
+                'total_games': int(self.games_scored[e]),
+                'winner_accuracy': float(self.winner_accuracy[e]),
+                'ats_accuracy': float(self.ats_accuracy[e]),
+                'ou_accuracy': float(self.ou_accuracy[e]),
+                'score_within_tolerance': float(self.score_within_tolerance[e]),
+                'score_mae': float(self.score_mae[e]),
+                'brier_score': float(self.brier_score[e]),
+                'log_loss': float(self.log_loss[e]),
+                'calibration_error': float(self.calibration_error[e]),
+                'roi': float(self.roi[e]),
+                'profit_units': float(self.profit_units[e]),
+                'max_drawdown': float(self.max_drawdown[e]),
+            }
+        return summaries
+
+
+def _safe_ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominator > 0, numerator / np.maximum(denominator, 1), 0.0)
+
+
+def score_predictions(games: GameArrays, predictions: PredictionArrays,
+                      odds: float = DEFAULT_AMERICAN_ODDS,
+                      n_bins: int = CALIBRATION_BINS) -> BacktestMetrics:
+    """Score every expert against every game in one vectorized pass"""
+    n_experts = len(predictions.expert_ids)
+    payout = american_odds_payout(odds)
+
+    # Winner / probability metrics
+    prob = predictions.home_win_prob
+    has_prob = ~np.isnan(prob)
+    outcome = games.home_won.astype(np.float64)[None, :]
+    p = np.where(has_prob, prob, 0.5)
+    n_prob = has_prob.sum(axis=1)
+
+    winner_hits = ((p > 0.5) == (outcome > 0.5)) & has_prob
+    brier = np.where(has_prob, (p - outcome) ** 2, 0.0).sum(axis=1)
+    clipped = np.clip(p, LOG_LOSS_EPS, 1 - LOG_LOSS_EPS)
+    ll = np.where(has_prob, -(outcome * np.log(clipped) + (1 - outcome) * np.log(1 - clipped)), 0.0).sum(axis=1)
+
+    # Calibration: bin counts and observed frequencies for every expert at once
+    bins = np.minimum((p * n_bins).astype(np.int64), n_bins - 1)
+    flat = (np.arange(n_experts)[:, None] * n_bins + bins)[has_prob]
+    size = n_experts * n_bins
+    counts = np.bincount(flat, minlength=size).reshape(n_experts, n_bins)
+    observed_sum = np.bincount(flat, weights=np.broadcast_to(outcome, p.shape)[has_prob],
+                               minlength=size).reshape(n_experts, n_bins)
+    predicted_sum = np.bincount(flat, weights=p[has_prob], minlength=size).reshape(n_experts, n_bins)
+    observed = _safe_ratio(observed_sum, counts)
+    ece = _safe_ratio(np.abs(observed_sum - predicted_sum).sum(axis=1), n_prob)
+
+    # Score predictions
+    has_score = ~(np.isnan(predictions.pred_home_score) | np.isnan(predictions.pred_away_score))
+    home_err = np.abs(predictions.pred_home_score - games.home_score[None, :])
+    away_err = np.abs(predictions.pred_away_score - games.away_score[None, :])
+    within = np.where(has_score, (home_err <= SCORE_TOLERANCE) & (away_err <= SCORE_TOLERANCE), False)
+    mae = np.where(has_score, (home_err + away_err) / 2, 0.0).sum(axis=1)
+    n_score = has_score.sum(axis=1)
+
+    # ATS / OU: sign of pick times sign of margin; 0 margins are pushes
+    ats_result = predictions.ats_pick * np.sign(games.ats_margin)[None, :]
+    ou_result = predictions.ou_pick * np.sign(games.ou_margin)[None, :]
+    ats_decided = ats_result != 0
+    ou_decided = ou_result != 0
+
+    # Bankroll: flat stake on every ATS and OU pick, in chronological order
+    stake = predictions.stake
+    profit = (np.where(ats_result > 0, stake * payout, 0.0) - np.where(ats_result < 0, stake, 0.0)
+              + np.where(ou_result > 0, stake * payout, 0.0) - np.where(ou_result < 0, stake, 0.0))
+    staked = stake * ((predictions.ats_pick != 0).astype(np.float64) + (predictions.ou_pick != 0))
+    equity = np.cumsum(profit, axis=1)
+    if equity.shape[1]:
+        peak = np.maximum.accumulate(np.maximum(equity, 0.0), axis=1)
+        drawdown = (peak - equity).max(axis=1)
+    else:
+        drawdown = np.zeros(n_experts)
+
+    return BacktestMetrics(
+        expert_ids=list(predictions.expert_ids),
+        games_scored=np.maximum(n_prob, n_score),
+        winner_accuracy=_safe_ratio(winner_hits.sum(axis=1), n_prob),
+        ats_accuracy=_safe_ratio((ats_result > 0).sum(axis=1), ats_decided.sum(axis=1)),
+        ou_accuracy=_safe_ratio((ou_result > 0).sum(axis=1), ou_decided.sum(axis=1)),
+        score_within_tolerance=_safe_ratio(within.sum(axis=1), n_score),
+        score_mae=_safe_ratio(mae, n_score),
+        brier_score=_safe_ratio(brier, n_prob),
+        log_loss=_safe_ratio(ll, n_prob),
+        calibration_error=ece,
+        calibration_counts=counts,
+        calibration_observed=observed,
+        roi=_safe_ratio(profit.sum(axis=1), staked.sum(axis=1)),
+        profit_units=profit.sum(axis=1),
+        max_drawdown=drawdown,
+    )
+
+
+class FeatureCache:
+    """Pre-game team features computed once per set of games
+
+    Features are expanding means known strictly before kickoff, so the same
+    matrix can be sliced for any walk-forward fold or sweep configuration.
+    """
+
+    FEATURES = ['home_avg_margin', 'away_avg_margin', 'home_avg_points',
+                'away_avg_points', 'home_games_played', 'away_games_played']
+
+    def __init__(self):
+        self._cache: Dict[Tuple[int, int], np.ndarray] = {}
+
+    def get(self, games: GameArrays) -> np.ndarray:
+        # Two game sets can cover the same seasons, e.g. a filtered slate
+        key = (len(games), hash(tuple(games.game_ids.tolist())))
+        if key not in self._cache:
+            self._cache[key] = self._build(games)
+        return self._cache[key]
+
+    def clear(self):
+        self._cache.clear()
+
+    @staticmethod
+    def _build(games: GameArrays) -> np.ndarray:
+        teams = np.unique(np.concatenate([games.home_team, games.away_team]))
+        home_idx = np.searchsorted(teams, games.home_team)
+        away_idx = np.searchsorted(teams, games.away_team)
+        margin_sum = np.zeros(len(teams))
+        points_sum = np.zeros(len(teams))
+        played = np.zeros(len(teams))
+        features = np.zeros((len(games), len(FeatureCache.FEATURES)))
+
+        for g in range(len(games)):
+            h, a = home_idx[g], away_idx[g]
+            features[g] = (
+                margin_sum[h] / played[h] if played[h] else 0.0,
+                margin_sum[a] / played[a] if played[a] else 0.0,
+                points_sum[h] / played[h] if played[h] else 0.0,
+                points_sum[a] / played[a] if played[a] else 0.0,
+                played[h], played[a],
+            )
+            margin = games.home_score[g] - games.away_score[g]
+            margin_sum[h] += margin
+            margin_sum[a] -= margin
+            points_sum[h] += games.home_score[g]
+            points_sum[a] += games.away_score[g]
+            played[h] += 1
+            played[a] += 1
+
+        return features
+
+
+# Strategy signature: (games, features, train_mask, params) -> PredictionArrays for
+# every game in `games`; only columns outside train_mask are scored.
+Strategy = Callable[[GameArrays, np.ndarray, np.ndarray, Dict[str, Any]], PredictionArrays]
+
+
+def _score_task(args) -> Tuple[Any, Dict[str, Dict[str, Any]]]:
+    """Process-pool entry point: score one block of the grid"""
+    key, games, predictions, odds = args
+    return key, score_predictions(games, predictions, odds).to_summaries()
+
+
+def _sweep_task(args) -> Tuple[int, Dict[str, Dict[str, Any]]]:
+    """Process-pool entry point: run one strategy configuration"""
+    index, strategy, games, features, train_mask, params, odds = args
+    predictions = strategy(games, features, train_mask, params)
+    test_mask = ~train_mask
+    metrics = score_predictions(games.subset(test_mask), predictions.subset(test_mask), odds)
+    return index, metrics.to_summaries()
+
+
+class VectorizedBacktestEngine:
+    """Season backtest engine over experts x games arrays"""
+
+    def __init__(self, max_workers: Optional[int] = None, odds: float = DEFAULT_AMERICAN_ODDS,
+                 expert_chunk_size: int = 64):
+        self.max_workers = max_workers
+        self.odds = odds
+        self.expert_chunk_size = expert_chunk_size
+        self.feature_cache = FeatureCache()
+
+    def score(self, games: GameArrays, predictions: PredictionArrays) -> BacktestMetrics:
+        return score_predictions(games, predictions, self.odds)
+
+    def _map(self, fn, tasks: List[Any]) -> List[Any]:
+        if self.max_workers == 1 or len(tasks) <= 1:
+            return [fn(t) for t in tasks]
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(fn, tasks))
+
+    def run_grid(self, games: GameArrays, predictions: PredictionArrays,
+                 seasons: Optional[Sequence[int]] = None) -> Dict[Tuple[str, int], Dict[str, Any]]:
+        """Score the expert x season grid, one process task per (expert chunk, season)"""
+        seasons = sorted(set(games.season.tolist())) if seasons is None else list(seasons)
+        n_experts = len(predictions.expert_ids)
+        tasks = []
+        for season in seasons:
+            mask = games.season == season
+            if not mask.any():
+                continue
+            season_games = games.subset(mask)
+            for start in range(0, n_experts, self.expert_chunk_size):
+                rows = np.arange(start, min(start + self.expert_chunk_size, n_experts))
+                tasks.append((season, season_games, predictions.subset(mask, rows), self.odds))
+
+        grid = {}
+        for season, summaries in self._map(_score_task, tasks):
+            for expert_id, summary in summaries.items():
+                grid[(expert_id, season)] = {**summary, 'season': season}
+        return grid
+
+    def walk_forward(self, games: GameArrays, strategy: Strategy, params: Dict[str, Any],
+                     min_train_weeks: int = 4) -> Dict[str, Any]:
+        """Retrain-and-predict week by week, scoring only out-of-sample games"""
+        features = self.feature_cache.get(games)
+        period = games.season.astype(np.int64) * 100 + games.week
+        periods = np.unique(period)
+        tasks = []
+        for i, current in enumerate(periods[min_train_weeks:], start=min_train_weeks):
+            in_scope = period <= current
+            fold_games = games.subset(in_scope)
+            train_mask = period[in_scope] < current
+            tasks.append((i, strategy, fold_games, features[in_scope], train_mask, params, self.odds))
+
+        folds = {int(periods[i]): summaries for i, summaries in self._map(_sweep_task, tasks)}
+        return {'params': params, 'folds': folds}
+
+    def parameter_sweep(self, games: GameArrays, strategy: Strategy,
+                        param_grid: Dict[str, Sequence[Any]],
+                        train_seasons: Sequence[int]) -> List[Dict[str, Any]]:
+        """Evaluate every combination in param_grid on held-out seasons
+
+        Results are sorted by out-of-sample ROI, best first.
+        """
+        features = self.feature_cache.get(games)
+        train_mask = games.season_mask(train_seasons)
+        names = list(param_grid)
+        configs = [dict(zip(names, values)) for values in itertools.product(*param_grid.values())]
+        tasks = [(i, strategy, games, features, train_mask, cfg, self.odds) for i, cfg in enumerate(configs)]
+
+        results = []
+        for i, summaries in self._map(_sweep_task, tasks):
+            best_roi = max((s['roi'] for s in summaries.values()), default=0.0)
+            results.append({'params': configs[i], 'roi': best_roi, 'experts': summaries})
+        results.sort(key=lambda r: r['roi'], reverse=True)
+        logger.info(f"Parameter sweep evaluated {len(configs)} configurations")
+        return results
@@ -8,6 +8,8 @@ from datetime import datetime, timedelta
 import logging
 import numpy as np
 
+from .backtest_engine import GameArrays, PredictionArrays, VectorizedBacktestEngine
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -82,91 +84,89 @@ class HistoricalDataGenerator:
 class BacktestingFramework:
     """Framework for backtesting expert predictions"""
     
-    def __init__(self, expert_framework=None):
+    def __init__(self, expert_framework=None, max_workers: Optional[int] = None):
         self.expert_framework = expert_framework
         self.data_generator = HistoricalDataGenerator()
+        self.engine = VectorizedBacktestEngine(max_workers=max_workers)
         self.backtest_results = {}
     
     async def run_backtest(self, expert_ids: List[str], seasons: List[int] = [2023]) -> Dict[str, Any]:
         """Run backtest across historical data"""
         try:
-            # Generate historical data
-            all_games = []
-            for season in seasons:
-                season_games = self.data_generator.generate_season_data(season)
-                all_games.extend(season_games)
+            games = GameArrays.from_games(self._generate_games(seasons))
+            predictions = self._generate_mock_prediction_arrays(expert_ids, games)
+            metrics = self.engine.score(games, predictions).to_summaries()
             
             results = {}
             for expert_id in expert_ids:
-                expert_results = await self._backtest_expert(expert_id, all_games)
-                results[expert_id] = expert_results
+                results[expert_id] = self._calculate_array_summary(metrics[expert_id], games, predictions, expert_id)
             
+            self.backtest_results.update(results)
             return results
             
         except Exception as e:
             logger.error(f"Backtest failed: {e}")
             return {}
     
-    async def _backtest_expert(self, expert_id: str, games: List[HistoricalGame]) -> Dict[str, Any]:
-        """Backtest single expert"""
-        expert_results = []
-        
-        for game in games:
-            prediction = self._generate_mock_prediction(game)
-            result = self._evaluate_prediction(expert_id, game, prediction)
-            expert_results.append(result)
-        
-        return self._calculate_summary(expert_id, expert_results)
+    async def run_grid_backtest(self, expert_ids: List[str], seasons: List[int]) -> Dict[str, Any]:
+        """Run backtest for every expert x season cell, parallelized across processes"""
+        try:
+            games = GameArrays.from_games(self._generate_games(seasons))
+            predictions = self._generate_mock_prediction_arrays(expert_ids, games)
+            return self.engine.run_grid(games, predictions, seasons)
+            
+        except Exception as e:
+            logger.error(f"Grid backtest failed: {e}")
+            return {}
     
-    def _generate_mock_prediction(self, game: HistoricalGame) -> Dict[str, Any]:
-        """Generate mock prediction"""
-        winner = 'home' if game.spread < 0 else 'away'
-        
-        return {
-            'winner_prediction': winner,
-            'exact_score_home': int(game.total/2 - game.spread/2),
-            'exact_score_away': int(game.total/2 + game.spread/2),
-            'against_the_spread': winner,
-            'totals_over_under': 'over' if game.total > 45 else 'under'
-        }
+    def _generate_games(self, seasons: List[int]) -> List[HistoricalGame]:
+        all_games = []
+        for season in seasons:
+            all_games.extend(self.data_generator.generate_season_data(season))
+        return all_games
     
-    def _evaluate_prediction(self, expert_id: str, game: HistoricalGame, prediction: Dict[str, Any]) -> BacktestResult:
-        """Evaluate prediction accuracy"""
-        actual_winner = 'home' if game.home_score > game.away_score else 'away'
-        
-        scores = {
-            'winner_prediction': prediction.get('winner_prediction') == actual_winner,
-            'exact_score_home': abs(prediction.get('exact_score_home', 0) - game.home_score) <= 7,
-            'exact_score_away': abs(prediction.get('exact_score_away', 0) - game.away_score) <= 7,
-        }
-        
-        overall_score = sum(scores.values()) / len(scores)
-        
-        return BacktestResult(
-            expert_id=expert_id,
-            game_id=game.game_id,
-            predictions=prediction,
-            actual_results={'winner': actual_winner, 'home_score': game.home_score, 'away_score': game.away_score},
-            category_scores=scores,
-            overall_score=overall_score
+    def _generate_mock_prediction_arrays(self, expert_ids: List[str], games: GameArrays) -> PredictionArrays:
+        """Mock predictions for every expert: pick the spread favourite, split the total by the spread"""
+        shape = (len(expert_ids), len(games))
+        home_pick = games.spread < 0
+        side = np.where(home_pick, 1, -1).astype(np.int8)
+        
+        return PredictionArrays(
+            expert_ids=list(expert_ids),
+            home_win_prob=np.broadcast_to(home_pick.astype(np.float64), shape).copy(),
+            pred_home_score=np.broadcast_to(np.trunc(games.total/2 - games.spread/2), shape).copy(),
+            pred_away_score=np.broadcast_to(np.trunc(games.total/2 + games.spread/2), shape).copy(),
+            ats_pick=np.broadcast_to(side, shape).copy(),
+            ou_pick=np.broadcast_to(np.where(games.total > 45, 1, -1).astype(np.int8), shape).copy()
         )
     
-    def _calculate_summary(self, expert_id: str, results: List[BacktestResult]) -> Dict[str, Any]:
-        """Calculate backtest summary"""
-        if not results:
-            return {'expert_id': expert_id, 'accuracy': 0, 'total_games': 0}
-        
-        total_games = len(results)
-        overall_accuracy = sum(r.overall_score for r in results) / total_games
+    def _calculate_array_summary(self, metrics: Dict[str, Any], games: GameArrays,
+                                 predictions: PredictionArrays, expert_id: str) -> Dict[str, Any]:
+        """Per-expert summary: category accuracies plus engine calibration and betting metrics"""
+        e = predictions.expert_ids.index(expert_id)
+        home_hit = np.abs(predictions.pred_home_score[e] - games.home_score) <= 7
+        away_hit = np.abs(predictions.pred_away_score[e] - games.away_score) <= 7
+        total_games = len(games)
+        overall_accuracy = (
+            (metrics['winner_accuracy'] * total_games + home_hit.sum() + away_hit.sum()) / (3 * total_games)
+            if total_games else 0
+        )
         
         return {
             'expert_id': expert_id,
             'total_games': total_games,
-            'overall_accuracy': overall_accuracy,
+            'overall_accuracy': float(overall_accuracy),
             'category_accuracies': {
-                'winner_prediction': sum(r.category_scores.get('winner_prediction', False) for r in results) / total_games,
-                'score_prediction': sum(r.category_scores.get('exact_score_home', False) for r in results) / total_games
-            }
+                'winner_prediction': metrics['winner_accuracy'],
+                'score_prediction': float(home_hit.mean()) if total_games else 0,
+                'against_the_spread': metrics['ats_accuracy'],
+                'totals_over_under': metrics['ou_accuracy']
+            },
+            'brier_score': metrics['brier_score'],
+            'log_loss': metrics['log_loss'],
+            'calibration_error': metrics['calibration_error'],
+            'roi': metrics['roi'],
+            'max_drawdown': metrics['max_drawdown']
         }
 
 # Test function
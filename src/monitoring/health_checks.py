@@ -14,6 +14,8 @@ import json
 import psutil
 import aiohttp
 
+from ..performance.http_pool import get_http_session
+
 try:
     import redis
     REDIS_AVAILABLE = True
@@ -96,14 +98,13 @@ class APIHealthChecker:
     
     async def __aenter__(self):
         """Async context manager entry"""
-        timeout = aiohttp.ClientTimeout(total=self.timeout)
-        self.session = aiohttp.ClientSession(timeout=timeout)
+        self.session = get_http_session('health_checks', timeout=self.timeout)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        # The registry owns the session; release it rather than closing it
+        self.session = None
     
     async def check_odds_api(self, api_key: Optional[str] = None) -> HealthCheckResult:
         """Check The Odds API health"""
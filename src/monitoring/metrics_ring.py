@@ -0,0 +1,167 @@
+"""
+Expert Metrics Ring
+
+Preallocated NumPy ring buffers for per-expert prediction metrics. Running
+sums are maintained on insert so every getter is O(1), and readers never take
+the writer lock: a sequence counter (seqlock) tells them to retry if a write
+landed mid-read.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Sample channels stored per prediction
+CORRECT, CONFIDENCE, RESPONSE_TIME, ERROR = range(4)
+N_CHANNELS = 4
+
+# Row 0 holds the system-wide window; experts get rows from 1
+SYSTEM_ROW = 0
+
+SNAPSHOT_COLUMNS = ('accuracy', 'confidence_calibration', 'response_time', 'error_rate', 'count')
+
+
+@dataclass
+class MetricsArraySnapshot:
+    """Every expert's current metrics as one (E, 5) array, columns per SNAPSHOT_COLUMNS"""
+    sequence: int
+    expert_ids: List[str]
+    metrics: np.ndarray
+    system: np.ndarray
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        return {
+            expert_id: dict(zip(SNAPSHOT_COLUMNS, row.tolist()))
+            for expert_id, row in zip(self.expert_ids, self.metrics)
+        }
+
+
+def _derive(sums: np.ndarray, counts: np.ndarray, calibration_min: int) -> np.ndarray:
+    """Accuracy, calibration, response time, error rate and count from running sums"""
+    safe = np.maximum(counts, 1)[:, None]
+    means = sums / safe
+    has_data = counts > 0
+
+    accuracy = np.where(has_data, means[:, CORRECT], 0.5)
+    calibration = np.where(
+        counts >= calibration_min,
+        1.0 - np.abs(means[:, CONFIDENCE] - means[:, CORRECT]),
+        0.5
+    )
+    response_time = np.where(has_data, means[:, RESPONSE_TIME], 0.0)
+    error_rate = np.where(has_data, means[:, ERROR], 0.5)
+    return np.column_stack([accuracy, calibration, response_time, error_rate, counts.astype(np.float64)])
+
+
+class ExpertMetricsRing:
+    """Fixed-window metrics for the system and each expert, one ring row per series"""
+
+    def __init__(self, window_size: int = 100, initial_experts: int = 32, calibration_min: int = 10):
+        self.window_size = window_size
+        self.calibration_min = calibration_min
+
+        rows = initial_experts + 1
+        self._values = np.zeros((rows, window_size, N_CHANNELS))
+        self._sums = np.zeros((rows, N_CHANNELS))
+        self._counts = np.zeros(rows, dtype=np.int64)
+        self._heads = np.zeros(rows, dtype=np.int64)
+
+        self._rows: Dict[str, int] = {}
+        self._expert_ids: List[str] = []
+
+        self._write_lock = threading.Lock()
+        self._sequence = 0  # odd while a write is in progress
+
+    # Writes
+
+    def _row_for(self, expert_id: str) -> int:
+        row = self._rows.get(expert_id)
+        if row is None:
+            row = len(self._expert_ids) + 1
+            if row == len(self._counts):
+                self._grow()
+            self._expert_ids.append(expert_id)
+            self._rows[expert_id] = row
+        return row
+
+    def _grow(self):
+        rows = len(self._counts)
+        self._values = np.concatenate([self._values, np.zeros_like(self._values)])
+        self._sums = np.concatenate([self._sums, np.zeros((rows, N_CHANNELS))])
+        self._counts = np.concatenate([self._counts, np.zeros(rows, dtype=np.int64)])
+        self._heads = np.concatenate([self._heads, np.zeros(rows, dtype=np.int64)])
+
+    def _push(self, row: int, sample: np.ndarray):
+        head = self._heads[row]
+        self._sums[row] += sample - self._values[row, head]
+        self._values[row, head] = sample
+        head += 1
+        if head == self.window_size:
+            head = 0
+            # Re-sum once per lap so floating-point drift never accumulates
+            self._sums[row] = self._values[row].sum(axis=0)
+        self._heads[row] = head
+        if self._counts[row] < self.window_size:
+            self._counts[row] += 1
+
+    def add(self, expert_id: str, is_correct: bool, confidence: float,
+            response_time: float, error: float):
+        """Record one prediction in the system window and the expert's window"""
+        sample = np.array([1.0 if is_correct else 0.0, confidence, response_time, error])
+        with self._write_lock:
+            self._sequence += 1
+            try:
+                row = self._row_for(expert_id)
+                self._push(SYSTEM_ROW, sample)
+                self._push(row, sample)
+            finally:
+                self._sequence += 1
+
+    # Reads
+
+    def _read(self, reader):
+        """Run reader() until it completes without a concurrent write"""
+        while True:
+            sequence = self._sequence
+            if sequence & 1:
+                time.sleep(0)
+                continue
+            result = reader()
+            if self._sequence == sequence:
+                return result
+
+    def row_metrics(self, expert_id: Optional[str] = None) -> Optional[Tuple[List[float], int]]:
+        """(running sums per channel, count) for one series, or None for an unknown expert"""
+        row = SYSTEM_ROW if expert_id is None else self._rows.get(expert_id)
+        if row is None:
+            return None
+        return self._read(lambda: (self._sums[row].tolist(), int(self._counts[row])))
+
+    def count(self, expert_id: Optional[str] = None) -> int:
+        metrics = self.row_metrics(expert_id)
+        return metrics[1] if metrics else 0
+
+    def expert_ids(self) -> List[str]:
+        return list(self._expert_ids)
+
+    def snapshot(self) -> MetricsArraySnapshot:
+        """All experts' metrics in one array, plus the system-wide row"""
+        def reader():
+            n = len(self._expert_ids) + 1
+            return (
+                self._sequence, list(self._expert_ids),
+                self._sums[:n].copy(), self._counts[:n].copy()
+            )
+        sequence, expert_ids, sums, counts = self._read(reader)
+        derived = _derive(sums, counts, self.calibration_min)
+        # System-wide error rate is reported as 1 - accuracy
+        derived[SYSTEM_ROW, 3] = 1.0 - derived[SYSTEM_ROW, 0]
+        return MetricsArraySnapshot(
+            sequence=sequence,
+            expert_ids=expert_ids,
+            metrics=derived[1:],
+            system=derived[SYSTEM_ROW]
+        )
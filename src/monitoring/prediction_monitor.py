@@ -20,6 +20,10 @@ from collections import defaultdict, deque
 import threading
 import time
 
+from .metrics_ring import (
+    ExpertMetricsRing, MetricsArraySnapshot, CORRECT, CONFIDENCE, RESPONSE_TIME, ERROR
+)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -96,109 +100,82 @@ class RealTimeMetricsCollector:
 
     def __init__(self, window_size: int = 100):
         self.window_size = window_size
-        self.metrics_buffer = defaultdict(lambda: deque(maxlen=window_size))
-        self.accuracy_buffer = deque(maxlen=window_size)
-        self.prediction_times = deque(maxlen=window_size)
-        self.confidence_buffer = deque(maxlen=window_size)
-        self.actual_buffer = deque(maxlen=window_size)
-        self.lock = threading.Lock()
+        self.ring = ExpertMetricsRing(window_size=window_size)
 
     def add_prediction_result(self, expert_id: str, prediction: float,
                             actual: float, confidence: float, response_time: float):
         """Add a prediction result for real-time tracking"""
-        with self.lock:
-            timestamp = datetime.now()
-
-            # Calculate if prediction was correct
-            is_correct = (prediction > 0.5) == (actual > 0.5)
+        # Calculate if prediction was correct
+        is_correct = (prediction > 0.5) == (actual > 0.5)
+        self.ring.add(expert_id, is_correct, confidence, response_time, abs(prediction - actual))
 
-            # Add to buffers
-            self.accuracy_buffer.append(is_correct)
-            self.prediction_times.append(response_time)
-            self.confidence_buffer.append(confidence)
-            self.actual_buffer.append(actual)
-
-            # Add to expert-specific metrics
-            self.metrics_buffer[f"{expert_id}_accuracy"].append(is_correct)
-            self.metrics_buffer[f"{expert_id}_confidence"].append(confidence)
-            self.metrics_buffer[f"{expert_id}_response_time"].append(response_time)
-            self.metrics_buffer[f"{expert_id}_error"].append(abs(prediction - actual))
+    def _means(self, expert_id: Optional[str]) -> Optional[Tuple[List[float], int]]:
+        metrics = self.ring.row_metrics(expert_id or None)
+        if metrics is None or metrics[1] == 0:
+            return None
+        sums, count = metrics
+        return [total / count for total in sums], count
 
     def get_current_accuracy(self, expert_id: Optional[str] = None) -> float:
         """Get current accuracy for system or specific expert"""
-        with self.lock:
-            if expert_id:
-                buffer = self.metrics_buffer[f"{expert_id}_accuracy"]
-                if not buffer:
-                    return 0.5
-                return sum(buffer) / len(buffer)
-            else:
-                if not self.accuracy_buffer:
-                    return 0.5
-                return sum(self.accuracy_buffer) / len(self.accuracy_buffer)
+        means = self._means(expert_id)
+        if means is None:
+            return 0.5
+        return means[0][CORRECT]
 
     def get_confidence_calibration(self, expert_id: Optional[str] = None) -> float:
         """Get confidence calibration score"""
-        with self.lock:
-            if expert_id:
-                conf_buffer = self.metrics_buffer[f"{expert_id}_confidence"]
-                acc_buffer = self.metrics_buffer[f"{expert_id}_accuracy"]
-            else:
-                conf_buffer = self.confidence_buffer
-                acc_buffer = self.accuracy_buffer
+        means = self._means(expert_id)
+        if means is None or means[1] < 10:
+            return 0.5
 
-            if len(conf_buffer) < 10 or len(acc_buffer) < 10:
-                return 0.5
-
-            # Simple calibration score: 1 - |mean_confidence - accuracy|
-            mean_confidence = sum(conf_buffer) / len(conf_buffer)
-            accuracy = sum(acc_buffer) / len(acc_buffer)
-            return 1.0 - abs(mean_confidence - accuracy)
+        # Simple calibration score: 1 - |mean_confidence - accuracy|
+        return 1.0 - abs(means[0][CONFIDENCE] - means[0][CORRECT])
 
     def get_average_response_time(self, expert_id: Optional[str] = None) -> float:
         """Get average response time"""
-        with self.lock:
-            if expert_id:
-                buffer = self.metrics_buffer[f"{expert_id}_response_time"]
-            else:
-                buffer = self.prediction_times
-
-            if not buffer:
-                return 0.0
-
-            return sum(buffer) / len(buffer)
+        means = self._means(expert_id)
+        if means is None:
+            return 0.0
+        return means[0][RESPONSE_TIME]
 
     def get_error_rate(self, expert_id: Optional[str] = None) -> float:
         """Get average prediction error"""
-        with self.lock:
-            if expert_id:
-                buffer = self.metrics_buffer[f"{expert_id}_error"]
-            else:
-                # Calculate from accuracy buffer
-                if not self.accuracy_buffer:
-                    return 0.5
-                return 1.0 - (sum(self.accuracy_buffer) / len(self.accuracy_buffer))
-
-            if not buffer:
-                return 0.5
-
-            return sum(buffer) / len(buffer)
+        means = self._means(expert_id)
+        if means is None:
+            return 0.5
+        if expert_id:
+            return means[0][ERROR]
+        # System-wide error rate is derived from accuracy
+        return 1.0 - means[0][CORRECT]
+
+    def get_prediction_count(self) -> int:
+        """Number of predictions in the system-wide window"""
+        return self.ring.count()
+
+    def get_expert_ids(self) -> List[str]:
+        """Experts that have recorded at least one prediction"""
+        return self.ring.expert_ids()
+
+    def get_snapshot(self) -> MetricsArraySnapshot:
+        """Every expert's metrics as one array; see SNAPSHOT_COLUMNS"""
+        return self.ring.snapshot()
 
     def get_prediction_volume_trend(self) -> str:
         """Get prediction volume trend"""
-        with self.lock:
-            if len(self.accuracy_buffer) < 20:
-                return "stable"
+        count = self.ring.count()
+        if count < 20:
+            return "stable"
 
-            recent_count = len([1 for _ in range(min(10, len(self.accuracy_buffer)))])
-            older_count = len([1 for _ in range(min(10, len(self.accuracy_buffer) - 10))])
+        recent_count = min(10, count)
+        older_count = min(10, count - 10)
 
-            if recent_count > older_count * 1.2:
-                return "increasing"
-            elif recent_count < older_count * 0.8:
-                return "decreasing"
-            else:
-                return "stable"
+        if recent_count > older_count * 1.2:
+            return "increasing"
+        elif recent_count < older_count * 0.8:
+            return "decreasing"
+        else:
+            return "stable"
 
 class ThresholdManager:
     """Manages alert thresholds for different metrics"""
@@ -467,11 +444,13 @@ class PredictionMonitor:
         try:
             timestamp = datetime.now()
 
+            # One consistent read of every series
+            snapshot = self.metrics_collector.get_snapshot()
+
             # Collect system-wide metrics
-            overall_accuracy = self.metrics_collector.get_current_accuracy()
-            confidence_calibration = self.metrics_collector.get_confidence_calibration()
-            avg_response_time = self.metrics_collector.get_average_response_time()
-            error_rate = self.metrics_collector.get_error_rate()
+            overall_accuracy, confidence_calibration, avg_response_time, error_rate = (
+                snapshot.system[:4].tolist()
+            )
 
             # Store system metrics
             metrics = [
@@ -482,17 +461,8 @@ class PredictionMonitor:
             ]
 
             # Collect expert-specific metrics
-            expert_ids = set()
-            for key in self.metrics_collector.metrics_buffer.keys():
-                if '_' in key:
-                    expert_id = key.split('_')[0]
-                    expert_ids.add(expert_id)
-
-            for expert_id in expert_ids:
-                expert_accuracy = self.metrics_collector.get_current_accuracy(expert_id)
-                expert_confidence = self.metrics_collector.get_confidence_calibration(expert_id)
-                expert_response_time = self.metrics_collector.get_average_response_time(expert_id)
-                expert_error_rate = self.metrics_collector.get_error_rate(expert_id)
+            for expert_id, row in zip(snapshot.expert_ids, snapshot.metrics.tolist()):
+                expert_accuracy, expert_confidence, expert_response_time, expert_error_rate = row[:4]
                 expert_drift = self.drift_monitor.get_drift_score(expert_id)
 
                 expert_metrics = [
@@ -527,14 +497,9 @@ class PredictionMonitor:
             self._check_metric_threshold(MetricType.ERROR_RATE, error_rate, None)
 
             # Check expert-specific metrics
-            expert_ids = set()
-            for key in self.metrics_collector.metrics_buffer.keys():
-                if '_' in key:
-                    expert_id = key.split('_')[0]
-                    expert_ids.add(expert_id)
-
-            for expert_id in expert_ids:
-                expert_accuracy = self.metrics_collector.get_current_accuracy(expert_id)
+            snapshot = self.metrics_collector.get_snapshot()
+            for expert_id, row in zip(snapshot.expert_ids, snapshot.metrics.tolist()):
+                expert_accuracy = row[0]
                 expert_drift = self.drift_monitor.get_drift_score(expert_id)
 
                 self._check_metric_threshold(MetricType.ACCURACY, expert_accuracy, expert_id)
@@ -570,15 +535,9 @@ class PredictionMonitor:
             prediction_volume_trend = self.metrics_collector.get_prediction_volume_trend()
 
             # Get expert accuracies
-            expert_accuracies = {}
-            expert_ids = set()
-            for key in self.metrics_collector.metrics_buffer.keys():
-                if '_accuracy' in key:
-                    expert_id = key.replace('_accuracy', '')
-                    expert_ids.add(expert_id)
-
-            for expert_id in expert_ids:
-                expert_accuracies[expert_id] = self.metrics_collector.get_current_accuracy(expert_id)
+            snapshot = self.metrics_collector.get_snapshot()
+            expert_ids = snapshot.expert_ids
+            expert_accuracies = dict(zip(expert_ids, snapshot.metrics[:, 0].tolist()))
 
             # Get drift scores
             drift_scores = {}
@@ -603,7 +562,7 @@ class PredictionMonitor:
                 timestamp=timestamp,
                 overall_accuracy=overall_accuracy,
                 expert_accuracies=expert_accuracies,
-                recent_predictions=len(self.metrics_collector.accuracy_buffer),
+                recent_predictions=self.metrics_collector.get_prediction_count(),
                 active_alerts=active_alerts,
                 drift_scores=drift_scores,
                 confidence_calibration=confidence_calibration,
@@ -692,7 +651,7 @@ class PredictionMonitor:
             'confidence_calibration': self.metrics_collector.get_confidence_calibration(),
             'avg_response_time': self.metrics_collector.get_average_response_time(),
             'error_rate': self.metrics_collector.get_error_rate(),
-            'prediction_count': len(self.metrics_collector.accuracy_buffer)
+            'prediction_count': self.metrics_collector.get_prediction_count()
         }
 
     def get_active_alerts(self, level: Optional[AlertLevel] = None) -> List[Dict]:
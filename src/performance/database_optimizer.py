@@ -11,10 +11,14 @@ from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 import json
+from collections import OrderedDict
 
 import asyncpg
 from asyncpg import Pool, Connection
 
+from .tracing import traced, annotate
+from .week_loader import WeekDataLoader, PREDICTION_TYPE_DATASETS
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,8 +58,17 @@ class DatabaseOptimizer:
         self.pool: Optional[Pool] = None
         self.query_metrics: List[QueryMetrics] = []
         self.prepared_statements: Dict[str, str] = {}
-        self.query_cache: Dict[str, Tuple[Any, datetime]] = {}
+        self.query_cache: 'OrderedDict[str, Tuple[Any, datetime]]' = OrderedDict()
         self.cache_ttl_minutes = 5
+        self.max_cached_results = self.config.get('max_cached_results', 1000)
+        self.cache_version = 0  # bumped by writes; results fetched under an older version are not cached
+
+        # Batched, de-duplicated loader behind the prediction endpoints
+        self.week_loader = WeekDataLoader(
+            self,
+            max_cached_games=self.config.get('max_cached_games', 5000),
+            cache_ttl_seconds=self.cache_ttl_minutes * 60
+        )
 
         # Performance tracking
         self.total_queries = 0
@@ -99,6 +112,7 @@ class DatabaseOptimizer:
             await self.pool.close()
             logger.info("✅ Database connection pool closed")
 
+    @traced("db.execute_optimized_query", stage="db")
     async def execute_optimized_query(
         self,
         query: str,
@@ -110,6 +124,7 @@ class DatabaseOptimizer:
 
         start_time = time.time()
         cache_hit = False
+        cache_version = self.cache_version
 
         try:
             # Check cache first
@@ -119,6 +134,7 @@ class DatabaseOptimizer:
                 if cached_result:
                     cache_hit = True
                     execution_time = (time.time() - start_time) * 1000
+                    annotate(query_type=query_type, cache_hit=True, rows=len(cached_result))
 
                     self._record_query_metrics(
                         query_type, execution_time, len(cached_result), cache_hit
@@ -142,9 +158,13 @@ class DatabaseOptimizer:
                 # Cache SELECT results
                 if use_cache and query_type.lower() == "select" and results:
                     cache_key = self._generate_cache_key(query, params)
-                    self._cache_result(cache_key, results)
+                    self._cache_result(cache_key, results, cache_version)
+                elif query_type.lower() not in ("select", "health_check"):
+                    # Writes make every cached read suspect
+                    self.invalidate_cache()
 
                 execution_time = (time.time() - start_time) * 1000
+                annotate(query_type=query_type, cache_hit=False, rows=len(results))
                 self._record_query_metrics(
                     query_type, execution_time, len(results), cache_hit
                 )
@@ -192,6 +212,8 @@ class DatabaseOptimizer:
 
                         total_affected += len(batch)
 
+            self.invalidate_cache()
+
             execution_time = (time.time() - start_time) * 1000
             self._record_query_metrics(
                 f"batch_{operation_type}", execution_time, total_affected
@@ -215,173 +237,55 @@ class DatabaseOptimizer:
     ) -> Dict[str, List[Dict[str, Any]]]:
         """Get prediction data with optimized queries and joins"""
 
-        results = {}
+        datasets = ['games'] if game_ids else []
+        datasets += [
+            PREDICTION_TYPE_DATASETS[prediction_type]
+            for prediction_type in PREDICTION_TYPE_DATASETS
+            if prediction_type in prediction_types
+        ]
 
         try:
-            # Batch query for game information
-            if game_ids:
-                game_data = await self._get_games_batch(game_ids)
-                results['games'] = game_data
-
-            # Batch query for expert predictions
-            if 'expert' in prediction_types:
-                expert_data = await self._get_expert_predictions_batch(game_ids)
-                results['expert_predictions'] = expert_data
-
-            # Batch query for ML predictions
-            if 'ml' in prediction_types:
-                ml_data = await self._get_ml_predictions_batch(game_ids)
-                results['ml_predictions'] = ml_data
-
-            # Batch query for player props
-            if 'props' in prediction_types:
-                props_data = await self._get_player_props_batch(game_ids)
-                results['player_props'] = props_data
-
-            # Batch query for odds data
-            if 'odds' in prediction_types:
-                odds_data = await self._get_odds_batch(game_ids)
-                results['odds'] = odds_data
-
-            return results
+            # One batched query per dataset, all running concurrently on the pool
+            return await self.week_loader.load_datasets(game_ids, datasets)
 
         except Exception as e:
             logger.error(f"Optimized predictions data error: {e}")
             raise
 
+    async def get_week_predictions_data(
+        self,
+        season: int,
+        week: int,
+        prediction_types: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Prefetch every requested dataset for a week's games in one concurrent pass"""
+
+        datasets = ['games'] + [
+            PREDICTION_TYPE_DATASETS[prediction_type]
+            for prediction_type in PREDICTION_TYPE_DATASETS
+            if prediction_type in prediction_types
+        ]
+        return await self.week_loader.prefetch_week(season, week, datasets)
+
     async def _get_games_batch(self, game_ids: List[str]) -> List[Dict[str, Any]]:
         """Get game information in batch"""
-
-        if not game_ids:
-            return []
-
-        placeholders = ','.join(f'${i+1}' for i in range(len(game_ids)))
-
-        query = f"""
-            SELECT
-                game_id,
-                home_team,
-                away_team,
-                game_date,
-                week,
-                season,
-                status,
-                weather_conditions,
-                stadium
-            FROM games
-            WHERE game_id = ANY($1::text[])
-            ORDER BY game_date ASC;
-        """
-
-        return await self.execute_optimized_query(
-            query, (game_ids,), "select", use_cache=True
-        )
+        return await self.week_loader.load('games', game_ids)
 
     async def _get_expert_predictions_batch(self, game_ids: List[str]) -> List[Dict[str, Any]]:
         """Get expert predictions in batch with optimized join"""
-
-        if not game_ids:
-            return []
-
-        query = """
-            SELECT
-                ep.game_id,
-                ep.expert_id,
-                ep.expert_name,
-                ep.prediction_type,
-                ep.prediction_value,
-                ep.confidence,
-                ep.reasoning,
-                ep.created_at
-            FROM expert_predictions ep
-            INNER JOIN games g ON ep.game_id = g.game_id
-            WHERE ep.game_id = ANY($1::text[])
-                AND ep.created_at > CURRENT_TIMESTAMP - INTERVAL '1 day'
-            ORDER BY ep.game_id, ep.expert_id, ep.prediction_type;
-        """
-
-        return await self.execute_optimized_query(
-            query, (game_ids,), "select", use_cache=True
-        )
+        return await self.week_loader.load('expert_predictions', game_ids)
 
     async def _get_ml_predictions_batch(self, game_ids: List[str]) -> List[Dict[str, Any]]:
         """Get ML predictions in batch"""
-
-        if not game_ids:
-            return []
-
-        query = """
-            SELECT
-                p.game_id,
-                p.model_type,
-                p.prediction_type,
-                p.predicted_value,
-                p.confidence_score,
-                p.model_version,
-                p.created_at
-            FROM predictions p
-            WHERE p.game_id = ANY($1::text[])
-                AND p.created_at > CURRENT_TIMESTAMP - INTERVAL '1 day'
-            ORDER BY p.game_id, p.model_type, p.prediction_type;
-        """
-
-        return await self.execute_optimized_query(
-            query, (game_ids,), "select", use_cache=True
-        )
+        return await self.week_loader.load('ml_predictions', game_ids)
 
     async def _get_player_props_batch(self, game_ids: List[str]) -> List[Dict[str, Any]]:
         """Get player props in batch"""
-
-        if not game_ids:
-            return []
-
-        query = """
-            SELECT
-                pp.game_id,
-                pp.player_id,
-                pp.player_name,
-                pp.team,
-                pp.position,
-                pp.prop_type,
-                pp.predicted_value,
-                pp.over_under_line,
-                pp.confidence,
-                pp.created_at
-            FROM player_props pp
-            WHERE pp.game_id = ANY($1::text[])
-                AND pp.created_at > CURRENT_TIMESTAMP - INTERVAL '1 day'
-            ORDER BY pp.game_id, pp.player_name, pp.prop_type;
-        """
-
-        return await self.execute_optimized_query(
-            query, (game_ids,), "select", use_cache=True
-        )
+        return await self.week_loader.load('player_props', game_ids)
 
     async def _get_odds_batch(self, game_ids: List[str]) -> List[Dict[str, Any]]:
         """Get latest odds data in batch"""
-
-        if not game_ids:
-            return []
-
-        query = """
-            SELECT DISTINCT ON (o.game_id, o.sportsbook)
-                o.game_id,
-                o.sportsbook,
-                o.home_spread,
-                o.away_spread,
-                o.total_over_under,
-                o.home_moneyline,
-                o.away_moneyline,
-                o.timestamp
-            FROM odds o
-            WHERE o.game_id = ANY($1::text[])
-                AND o.timestamp > CURRENT_TIMESTAMP - INTERVAL '1 day'
-            ORDER BY o.game_id, o.sportsbook, o.timestamp DESC;
-        """
-
-        return await self.execute_optimized_query(
-            query, (game_ids,), "select", use_cache=True
-        )
+        return await self.week_loader.load('odds', game_ids)
 
     async def _create_performance_indexes(self):
         """Create performance indexes for faster queries"""
@@ -485,6 +389,7 @@ class DatabaseOptimizer:
         if cache_key in self.query_cache:
             result, timestamp = self.query_cache[cache_key]
             if datetime.now() - timestamp < timedelta(minutes=self.cache_ttl_minutes):
+                self.query_cache.move_to_end(cache_key)
                 return result
             else:
                 # Remove expired cache entry
@@ -492,21 +397,24 @@ class DatabaseOptimizer:
 
         return None
 
-    def _cache_result(self, cache_key: str, result: List[Dict[str, Any]]):
-        """Cache query result with timestamp"""
-
-        # Limit cache size
-        if len(self.query_cache) > 1000:
-            # Remove oldest entries
-            oldest_keys = sorted(
-                self.query_cache.keys(),
-                key=lambda k: self.query_cache[k][1]
-            )[:100]
+    def _cache_result(self, cache_key: str, result: List[Dict[str, Any]], version: Optional[int] = None):
+        """Cache query result with timestamp, evicting least recently used entries"""
 
-            for key in oldest_keys:
-                del self.query_cache[key]
+        if version is not None and version != self.cache_version:
+            return  # a write landed while this query was running
 
         self.query_cache[cache_key] = (result, datetime.now())
+        self.query_cache.move_to_end(cache_key)
+
+        while len(self.query_cache) > self.max_cached_results:
+            self.query_cache.popitem(last=False)
+
+    def invalidate_cache(self):
+        """Drop cached query results and per-game loader slices"""
+
+        self.cache_version += 1
+        self.query_cache.clear()
+        self.week_loader.invalidate()
 
     def _record_query_metrics(
         self,
@@ -599,7 +507,8 @@ class DatabaseOptimizer:
             'error_rate_percent': round(error_rate, 1),
             'query_types_performance': query_types,
             'connection_pool_healthy': self.pool is not None and not self.pool.is_closing(),
-            'cached_results_count': len(self.query_cache)
+            'cached_results_count': len(self.query_cache),
+            'week_loader': self.week_loader.get_stats()
         }
 
     async def health_check(self) -> Dict[str, Any]:
@@ -0,0 +1,298 @@
+"""
+Shared HTTP Connection Pools
+Process-wide registry of HTTP sessions. Each client gets a named aiohttp
+session with its own default headers and timeout, but every session on an
+event loop shares one TCPConnector, so keep-alive connections, TLS sessions
+and cached DNS lookups are reused across clients instead of being rebuilt per
+call. Synchronous `requests` clients get pooled sessions from the same place.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, Tuple, Union
+
+import aiohttp
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = 'NFL-Predictor-API/1.0'
+
+
+@dataclass
+class HTTPPoolConfig:
+    """Connection pool configuration"""
+    limit: int = 100  # total open connections per event loop
+    limit_per_host: int = 20
+    keepalive_timeout: float = 30.0  # seconds an idle connection is kept
+    dns_cache_ttl: int = 300  # seconds
+    default_timeout: float = 30.0
+    sync_pool_connections: int = 10  # hosts cached per requests session
+    sync_pool_maxsize: int = 20  # connections per host per requests session
+
+
+@dataclass
+class PoolMetrics:
+    """Counters gathered from aiohttp request tracing"""
+    requests: int = 0
+    request_errors: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    queued_requests: int = 0
+    queue_wait_seconds: float = 0.0
+    max_queue_wait_seconds: float = 0.0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+    requests_by_host: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        connections = self.connections_created + self.connections_reused
+        return {
+            'requests': self.requests,
+            'request_errors': self.request_errors,
+            'connections_created': self.connections_created,
+            'connections_reused': self.connections_reused,
+            'connection_reuse_rate': self.connections_reused / connections if connections else 0.0,
+            'queued_requests': self.queued_requests,
+            'avg_queue_wait_ms': (
+                self.queue_wait_seconds / self.queued_requests * 1000 if self.queued_requests else 0.0
+            ),
+            'max_queue_wait_ms': self.max_queue_wait_seconds * 1000,
+            'dns_cache_hits': self.dns_cache_hits,
+            'dns_cache_misses': self.dns_cache_misses,
+            'requests_by_host': dict(self.requests_by_host)
+        }
+
+
+@dataclass
+class _LoopPool:
+    """The shared connector and named sessions for one event loop"""
+    connector: aiohttp.TCPConnector
+    sessions: Dict[Tuple, aiohttp.ClientSession] = field(default_factory=dict)
+
+
+class HTTPSessionRegistry:
+    """Hands out sessions that share per-host connection pools"""
+
+    def __init__(self, config: Optional[HTTPPoolConfig] = None):
+        self.config = config or HTTPPoolConfig()
+        self.metrics = PoolMetrics()
+        # Connectors hold their loop, so pools are dropped explicitly once it closes
+        self._pools: Dict[asyncio.AbstractEventLoop, _LoopPool] = {}
+        self._sync_sessions: Dict[Tuple, Any] = {}
+        self._sync_lock = threading.Lock()
+        self._trace_config = self._build_trace_config()
+
+    # Async sessions
+
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        metrics = self.metrics
+        trace_config = aiohttp.TraceConfig(trace_config_ctx_factory=SimpleNamespace)
+
+        async def on_request_start(session, ctx, params):
+            metrics.requests += 1
+            host = params.url.host or ''
+            metrics.requests_by_host[host] = metrics.requests_by_host.get(host, 0) + 1
+
+        async def on_request_exception(session, ctx, params):
+            metrics.request_errors += 1
+
+        async def on_queued_start(session, ctx, params):
+            ctx.queued_at = time.perf_counter()
+
+        async def on_queued_end(session, ctx, params):
+            wait = time.perf_counter() - ctx.queued_at
+            metrics.queued_requests += 1
+            metrics.queue_wait_seconds += wait
+            metrics.max_queue_wait_seconds = max(metrics.max_queue_wait_seconds, wait)
+
+        async def on_connection_create_end(session, ctx, params):
+            metrics.connections_created += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            metrics.connections_reused += 1
+
+        async def on_dns_cache_hit(session, ctx, params):
+            metrics.dns_cache_hits += 1
+
+        async def on_dns_cache_miss(session, ctx, params):
+            metrics.dns_cache_misses += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_exception.append(on_request_exception)
+        trace_config.on_connection_queued_start.append(on_queued_start)
+        trace_config.on_connection_queued_end.append(on_queued_end)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
+
+    def _prune(self):
+        """Forget pools whose event loop has closed without calling close()"""
+        for loop in [loop for loop in self._pools if loop.is_closed()]:
+            pool = self._pools.pop(loop)
+            logger.warning(f"HTTP pool for a closed event loop was not closed ({len(pool.sessions)} sessions)")
+
+    def _pool(self) -> _LoopPool:
+        loop = asyncio.get_running_loop()
+        self._prune()
+        pool = self._pools.get(loop)
+        if pool is None or pool.connector.closed:
+            pool = _LoopPool(connector=aiohttp.TCPConnector(
+                limit=self.config.limit,
+                limit_per_host=self.config.limit_per_host,
+                keepalive_timeout=self.config.keepalive_timeout,
+                use_dns_cache=True,
+                ttl_dns_cache=self.config.dns_cache_ttl,
+                enable_cleanup_closed=True
+            ))
+            self._pools[loop] = pool
+        return pool
+
+    def _session_key(
+        self,
+        name: str,
+        headers: Optional[Dict[str, str]],
+        timeout: Union[float, aiohttp.ClientTimeout, None]
+    ) -> Tuple[Tuple, Dict[str, str], aiohttp.ClientTimeout]:
+        headers = {'User-Agent': DEFAULT_USER_AGENT, **(headers or {})}
+        if timeout is None:
+            timeout = self.config.default_timeout
+        if not isinstance(timeout, aiohttp.ClientTimeout):
+            timeout = aiohttp.ClientTimeout(total=timeout)
+        return (name, timeout, tuple(sorted(headers.items()))), headers, timeout
+
+    def get_session(
+        self,
+        name: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Union[float, aiohttp.ClientTimeout, None] = None
+    ) -> aiohttp.ClientSession:
+        """
+        Shared session for a client on the running event loop.
+
+        timeout is a total in seconds or a full ClientTimeout. Sessions are
+        cached by name and defaults, and are owned by the registry:
+        callers must not close them. Call close() on the same loop before it
+        shuts down, e.g. in the application lifespan or at the end of the
+        coroutine passed to asyncio.run().
+        """
+        pool = self._pool()
+        key, headers, timeout = self._session_key(name, headers, timeout)
+
+        session = pool.sessions.get(key)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=pool.connector,
+                connector_owner=False,
+                headers=headers,
+                timeout=timeout,
+                trace_configs=[self._trace_config]
+            )
+            pool.sessions[key] = session
+        return session
+
+    async def reset_session(
+        self,
+        name: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Union[float, aiohttp.ClientTimeout, None] = None
+    ) -> aiohttp.ClientSession:
+        """
+        Close a client's cached session and return a new one, e.g. to reconnect.
+        The replacement starts without the old session's cookies; idle
+        connections stay in the shared connector, which drops broken ones.
+        """
+        pool = self._pool()
+        key, _, _ = self._session_key(name, headers, timeout)
+        session = pool.sessions.pop(key, None)
+        if session is not None:
+            await session.close()
+        return self.get_session(name, headers, timeout)
+
+    async def close(self):
+        """
+        Close every session and the shared connector for the running loop.
+
+        Pools of other loops belong to those loops and are left alone; any
+        whose loop has already closed are forgotten.
+        """
+        self._prune()
+        pool = self._pools.pop(asyncio.get_running_loop(), None)
+        if pool is None:
+            return
+        for session in pool.sessions.values():
+            await session.close()
+        await pool.connector.close()
+
+    # Sync sessions
+
+    def get_sync_session(self, name: str, headers: Optional[Dict[str, str]] = None):
+        """Pooled requests.Session shared by every synchronous client with the same name and headers"""
+        if not REQUESTS_AVAILABLE:
+            raise ImportError("requests is required for synchronous HTTP sessions")
+
+        headers = {'User-Agent': DEFAULT_USER_AGENT, **(headers or {})}
+        key = (name, tuple(sorted(headers.items())))
+        with self._sync_lock:
+            session = self._sync_sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=self.config.sync_pool_connections,
+                    pool_maxsize=self.config.sync_pool_maxsize
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers.update(headers)
+                self._sync_sessions[key] = session
+        return session
+
+    def close_sync(self):
+        with self._sync_lock:
+            for session in self._sync_sessions.values():
+                session.close()
+            self._sync_sessions.clear()
+
+    # Metrics
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Request counters plus connection pool utilization per live event loop"""
+        pools = []
+        for loop, pool in list(self._pools.items()):
+            connector = pool.connector
+            if loop.is_closed() or connector.closed:
+                continue
+            # aiohttp has no public accessor for pool occupancy
+            acquired = len(getattr(connector, '_acquired', ()))
+            idle = sum(len(conns) for conns in getattr(connector, '_conns', {}).values())
+            pools.append({
+                'sessions': sum(1 for s in pool.sessions.values() if not s.closed),
+                'limit': connector.limit,
+                'limit_per_host': connector.limit_per_host,
+                'in_use': acquired,
+                'idle': idle,
+                'utilization': acquired / connector.limit if connector.limit else 0.0
+            })
+        return {
+            **self.metrics.to_dict(),
+            'pools': pools,
+            'sync_sessions': len(self._sync_sessions)
+        }
+
+
+# Global registry
+http_registry = HTTPSessionRegistry()
+get_http_session = http_registry.get_session
+get_sync_session = http_registry.get_sync_session
@@ -25,13 +25,11 @@ from fastapi import HTTPException
 from pydantic import BaseModel
 
 # Import existing services
-import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from ml.expert_prediction_service import ExpertPredictionService
-from ml.prediction_service import NFLPredictionService
-from cache.enhanced_cache_strategy import EnhancedCacheManager, CacheConfiguration, CacheKey
+from ..ml.expert_prediction_service import ExpertPredictionService
+from ..ml.prediction_service import NFLPredictionService
+from ..cache.enhanced_cache_strategy import EnhancedCacheManager, CacheConfiguration, CacheKey
 
 logger = logging.getLogger(__name__)
 
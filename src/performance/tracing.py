@@ -0,0 +1,391 @@
+"""
+Request-Scoped Tracing
+Lightweight spans for the prediction hot path (cache, database, external APIs,
+model inference, LLM calls). The active span is carried in a ContextVar so it
+follows asyncio tasks, every span feeds a per-stage latency histogram, and a
+head-sampled subset is exported as OTLP/JSON to a local file or collector.
+"""
+
+import atexit
+import functools
+import inspect
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+import urllib.request
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# OTLP span kinds and status codes
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+# Histogram upper bounds in milliseconds; the last bucket is open-ended
+DEFAULT_BUCKETS_MS = (
+    0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500,
+    1000, 2500, 5000, 10000, 30000
+)
+
+
+@dataclass
+class TracingConfig:
+    """Tracing configuration, normally read from the environment"""
+    enabled: bool = True
+    sample_rate: float = 0.05
+    service_name: str = "nfl-predictor-api"
+    export_path: Optional[str] = None
+    collector_endpoint: Optional[str] = None
+    batch_size: int = 256
+    flush_interval_seconds: float = 5.0
+    max_queue_size: int = 10000
+
+    @classmethod
+    def from_env(cls) -> 'TracingConfig':
+        endpoint = os.getenv('OTEL_EXPORTER_OTLP_ENDPOINT')
+        if endpoint and not endpoint.rstrip('/').endswith('/v1/traces'):
+            endpoint = endpoint.rstrip('/') + '/v1/traces'
+        return cls(
+            enabled=os.getenv('TRACING_ENABLED', 'true').lower() not in ('0', 'false', 'no'),
+            sample_rate=float(os.getenv('TRACE_SAMPLE_RATE', '0.05')),
+            service_name=os.getenv('OTEL_SERVICE_NAME', 'nfl-predictor-api'),
+            export_path=os.getenv('TRACE_EXPORT_PATH') or None,
+            collector_endpoint=endpoint or None
+        )
+
+
+@dataclass
+class Span:
+    """One timed operation within a trace"""
+    name: str
+    stage: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    sampled: bool
+    kind: int = SPAN_KIND_INTERNAL
+    start_unix_ns: int = 0
+    duration_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration_ns / 1e6
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            'traceId': self.trace_id,
+            'spanId': self.span_id,
+            'name': self.name,
+            'kind': self.kind,
+            'startTimeUnixNano': str(self.start_unix_ns),
+            'endTimeUnixNano': str(self.start_unix_ns + self.duration_ns),
+            'attributes': _otlp_attributes({'stage': self.stage, **self.attributes}),
+            'status': (
+                {'code': STATUS_ERROR, 'message': self.error} if self.error
+                else {'code': STATUS_OK}
+            )
+        }
+        if self.parent_id:
+            span['parentSpanId'] = self.parent_id
+        return span
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {'key': key, 'value': _otlp_value(value)}
+        for key, value in attributes.items() if value is not None
+    ]
+
+
+class StageHistograms:
+    """Fixed-bucket latency histograms keyed by pipeline stage"""
+
+    def __init__(self, buckets_ms=DEFAULT_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self._counts: Dict[str, List[int]] = {}
+        self._totals: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, duration_ms: float):
+        index = bisect_left(self.buckets_ms, duration_ms)
+        with self._lock:
+            counts = self._counts.get(stage)
+            if counts is None:
+                counts = self._counts[stage] = [0] * (len(self.buckets_ms) + 1)
+                self._totals[stage] = 0.0
+            counts[index] += 1
+            self._totals[stage] += duration_ms
+
+    def percentile(self, stage: str, q: float) -> Optional[float]:
+        """Upper bucket bound containing the q-th percentile (0-100)
+
+        Percentiles in the open-ended overflow bucket report the last bound,
+        a lower limit, so the value stays JSON-serializable.
+        """
+        with self._lock:
+            counts = list(self._counts.get(stage, ()))
+        total = sum(counts)
+        if not total:
+            return None
+        rank = q / 100.0 * total
+        running = 0
+        for index, count in enumerate(counts):
+            running += count
+            if running >= rank and count:
+                break
+        return self.buckets_ms[min(index, len(self.buckets_ms) - 1)]
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Count, mean and p50/p95/p99 per stage"""
+        with self._lock:
+            stages = {stage: (sum(counts), self._totals[stage]) for stage, counts in self._counts.items()}
+        return {
+            stage: {
+                'count': count,
+                'mean_ms': total / count if count else 0.0,
+                'p50_ms': self.percentile(stage, 50),
+                'p95_ms': self.percentile(stage, 95),
+                'p99_ms': self.percentile(stage, 99)
+            }
+            for stage, (count, total) in stages.items()
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Raw bucket counts, suitable for Prometheus-style exposition"""
+        with self._lock:
+            return {
+                'buckets_ms': list(self.buckets_ms),
+                'stages': {stage: list(counts) for stage, counts in self._counts.items()},
+                'sum_ms': dict(self._totals)
+            }
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+            self._totals.clear()
+
+
+class SpanExporter:
+    """Batches sampled spans on a background thread and writes OTLP/JSON"""
+
+    def __init__(self, config: TracingConfig):
+        self.config = config
+        self._queue: 'queue.Queue[Optional[Span]]' = queue.Queue(maxsize=config.max_queue_size)
+        self._worker: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.exported = 0
+        self.dropped = 0
+
+    @property
+    def active(self) -> bool:
+        return bool(self.config.export_path or self.config.collector_endpoint)
+
+    def export(self, span: Span):
+        if self._worker is None:
+            self._start()
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _start(self):
+        with self._start_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+                self._worker.start()
+                atexit.register(self.shutdown)
+
+    def _run(self):
+        batch: List[Span] = []
+        deadline = time.monotonic() + self.config.flush_interval_seconds
+        while True:
+            try:
+                span = self._queue.get(timeout=max(deadline - time.monotonic(), 0.01))
+            except queue.Empty:
+                span = False
+            if span is None:
+                self._write(batch)
+                return
+            if span:
+                batch.append(span)
+            if len(batch) >= self.config.batch_size or time.monotonic() >= deadline:
+                self._write(batch)
+                batch = []
+                deadline = time.monotonic() + self.config.flush_interval_seconds
+
+    def _payload(self, spans: List[Span]) -> Dict[str, Any]:
+        return {
+            'resourceSpans': [{
+                'resource': {'attributes': _otlp_attributes({'service.name': self.config.service_name})},
+                'scopeSpans': [{
+                    'scope': {'name': __name__},
+                    'spans': [span.to_otlp() for span in spans]
+                }]
+            }]
+        }
+
+    def _write(self, spans: List[Span]):
+        if not spans:
+            return
+        body = json.dumps(self._payload(spans), separators=(',', ':'))
+        try:
+            if self.config.export_path:
+                with open(self.config.export_path, 'a', encoding='utf-8') as f:
+                    f.write(body + '\n')
+            if self.config.collector_endpoint:
+                request = urllib.request.Request(
+                    self.config.collector_endpoint,
+                    data=body.encode('utf-8'),
+                    headers={'Content-Type': 'application/json'},
+                    method='POST'
+                )
+                with urllib.request.urlopen(request, timeout=5):
+                    pass
+            self.exported += len(spans)
+        except Exception as e:
+            self.dropped += len(spans)
+            logger.warning(f"Span export failed ({len(spans)} spans): {e}")
+
+    def shutdown(self, timeout: float = 5.0):
+        """Flush queued spans and stop the worker"""
+        worker = self._worker
+        if worker is None:
+            return
+        self._queue.put(None)
+        worker.join(timeout)
+        self._worker = None
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar('current_span', default=None)
+
+
+class Tracer:
+    """Creates spans, records stage latencies and hands sampled spans to the exporter"""
+
+    def __init__(self, config: Optional[TracingConfig] = None):
+        self.config = config or TracingConfig.from_env()
+        self.histograms = StageHistograms()
+        self.exporter = SpanExporter(self.config)
+        self._random = random.Random()
+
+    def configure(self, **overrides):
+        """Replace configuration fields (and the exporter) at runtime"""
+        self.exporter.shutdown()
+        for key, value in overrides.items():
+            setattr(self.config, key, value)
+        self.exporter = SpanExporter(self.config)
+
+    @contextmanager
+    def span(self, name: str, stage: str = "internal", root: bool = False, **attributes) -> Iterator[Optional[Span]]:
+        """Time a block as a child of the current span (or start a trace when there is none)"""
+        if not self.config.enabled:
+            yield None
+            return
+
+        parent = _current_span.get()
+        if parent is None:
+            trace_id = f"{self._random.getrandbits(128):032x}"
+            sampled = self._random.random() < self.config.sample_rate
+            parent_id = None
+        else:
+            trace_id, sampled, parent_id = parent.trace_id, parent.sampled, parent.span_id
+
+        span = Span(
+            name=name,
+            stage=stage,
+            trace_id=trace_id,
+            span_id=f"{self._random.getrandbits(64):016x}",
+            parent_id=parent_id,
+            sampled=sampled,
+            kind=SPAN_KIND_SERVER if root and parent is None else SPAN_KIND_INTERNAL,
+            start_unix_ns=time.time_ns(),
+            attributes=attributes
+        )
+        token = _current_span.set(span)
+        started = time.perf_counter_ns()
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.duration_ns = time.perf_counter_ns() - started
+            _current_span.reset(token)
+            self._finish(span)
+
+    def _finish(self, span: Span):
+        self.histograms.record(span.stage, span.duration_ms)
+        if span.sampled and self.exporter.active:
+            self.exporter.export(span)
+
+    def traced(self, name: Optional[str] = None, stage: str = "internal", **attributes) -> Callable:
+        """Decorator form of span() for sync and async callables"""
+        def decorator(func):
+            span_name = name or func.__qualname__
+
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(span_name, stage, **attributes):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(span_name, stage, **attributes):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'enabled': self.config.enabled,
+            'sample_rate': self.config.sample_rate,
+            'exporting': self.exporter.active,
+            'spans_exported': self.exporter.exported,
+            'spans_dropped': self.exporter.dropped,
+            'stages': self.histograms.summary()
+        }
+
+
+# Global tracer
+tracer = Tracer()
+trace_span = tracer.span
+traced = tracer.traced
+
+
+def current_span() -> Optional[Span]:
+    """The span active in this context, if any"""
+    return _current_span.get()
+
+
+def annotate(**attributes):
+    """Attach attributes to the active span; a no-op outside any span"""
+    span = _current_span.get()
+    if span is not None:
+        span.attributes.update(attributes)
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+Week-Scoped Data Loader
+Batches the per-game prediction datasets (games, expert and ML predictions,
+player props, odds) DataLoader-style: concurrent requests for overlapping games
+in the same event-loop tick share one query per dataset, datasets load in
+parallel on the pool, rows stream in by cursor into columnar arrays, and
+per-game slices are kept in a bounded cache invalidated by version.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .tracing import trace_span
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DatasetSpec:
+    """SQL and ordering for one per-game dataset"""
+    name: str
+    query: str  # takes the game id array as $1
+    columns: List[str]  # result columns, in SELECT order
+    sort_key: Optional[Callable[[Dict[str, Any]], Any]] = None  # None: ORDER BY starts with game_id
+
+
+DATASETS: Dict[str, DatasetSpec] = {
+    'games': DatasetSpec(
+        name='games',
+        query="""
+            SELECT
+                game_id,
+                home_team,
+                away_team,
+                game_date,
+                week,
+                season,
+                status,
+                weather_conditions,
+                stadium
+            FROM games
+            WHERE game_id = ANY($1::text[])
+            ORDER BY game_date ASC;
+        """,
+        columns=['game_id', 'home_team', 'away_team', 'game_date', 'week', 'season', 'status', 'weather_conditions',
+                 'stadium'],
+        sort_key=lambda row: (row['game_date'] is None, row['game_date'] or 0)
+    ),
+    'expert_predictions': DatasetSpec(
+        name='expert_predictions',
+        query="""
+            SELECT
+                ep.game_id,
+                ep.expert_id,
+                ep.expert_name,
+                ep.prediction_type,
+                ep.prediction_value,
+                ep.confidence,
+                ep.reasoning,
+                ep.created_at
+            FROM expert_predictions ep
+            INNER JOIN games g ON ep.game_id = g.game_id
+            WHERE ep.game_id = ANY($1::text[])
+                AND ep.created_at > CURRENT_TIMESTAMP - INTERVAL '1 day'
+            ORDER BY ep.game_id, ep.expert_id, ep.prediction_type;
+        """,
+        columns=['game_id', 'expert_id', 'expert_name', 'prediction_type', 'prediction_value', 'confidence', 'reasoning',
+                 'created_at']
+    ),
+    'ml_predictions': DatasetSpec(
+        name='ml_predictions',
+        query="""
+            SELECT
+                p.game_id,
+                p.model_type,
+                p.prediction_type,
+                p.predicted_value,
+                p.confidence_score,
+                p.model_version,
+                p.created_at
+            FROM predictions p
+            WHERE p.game_id = ANY($1::text[])
+                AND p.created_at > CURRENT_TIMESTAMP - INTERVAL '1 day'
+            ORDER BY p.game_id, p.model_type, p.prediction_type;
+        """,
+        columns=['game_id', 'model_type', 'prediction_type', 'predicted_value', 'confidence_score', 'model_version',
+                 'created_at']
+    ),
+    'player_props': DatasetSpec(
+        name='player_props',
+        query="""
+            SELECT
+                pp.game_id,
+                pp.player_id,
+                pp.player_name,
+                pp.team,
+                pp.position,
+                pp.prop_type,
+                pp.predicted_value,
+                pp.over_under_line,
+                pp.confidence,
+                pp.created_at
+            FROM player_props pp
+            WHERE pp.game_id = ANY($1::text[])
+                AND pp.created_at > CURRENT_TIMESTAMP - INTERVAL '1 day'
+            ORDER BY pp.game_id, pp.player_name, pp.prop_type;
+        """,
+        columns=['game_id', 'player_id', 'player_name', 'team', 'position', 'prop_type', 'predicted_value',
+                 'over_under_line', 'confidence', 'created_at']
+    ),
+    'odds': DatasetSpec(
+        name='odds',
+        query="""
+            SELECT DISTINCT ON (o.game_id, o.sportsbook)
+                o.game_id,
+                o.sportsbook,
+                o.home_spread,
+                o.away_spread,
+                o.total_over_under,
+                o.home_moneyline,
+                o.away_moneyline,
+                o.timestamp
+            FROM odds o
+            WHERE o.game_id = ANY($1::text[])
+                AND o.timestamp > CURRENT_TIMESTAMP - INTERVAL '1 day'
+            ORDER BY o.game_id, o.sportsbook, o.timestamp DESC;
+        """,
+        columns=['game_id', 'sportsbook', 'home_spread', 'away_spread', 'total_over_under', 'home_moneyline',
+                 'away_moneyline', 'timestamp']
+    ),
+}
+
+# prediction_types accepted by get_optimized_predictions_data, mapped to datasets
+PREDICTION_TYPE_DATASETS = {
+    'expert': 'expert_predictions',
+    'ml': 'ml_predictions',
+    'props': 'player_props',
+    'odds': 'odds',
+}
+
+WEEK_GAMES_QUERY = """
+    SELECT game_id
+    FROM games
+    WHERE season = $1 AND week = $2
+    ORDER BY game_date ASC;
+"""
+
+
+def _to_array(values: List[Any]) -> np.ndarray:
+    """Typed array for homogeneous numeric columns, object array otherwise"""
+    kinds = set(map(type, values))
+    if kinds and kinds <= {int, float}:
+        return np.asarray(values, dtype=np.float64 if float in kinds else np.int64)
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+@dataclass
+class ColumnarRows:
+    """Rows of one dataset held as one array per column"""
+    names: List[str]
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.columns[self.names[0]]) if self.names else 0
+
+    @classmethod
+    def empty(cls, names: List[str]) -> 'ColumnarRows':
+        return cls(names, {name: np.empty(0, dtype=object) for name in names})
+
+    @classmethod
+    def from_chunks(cls, names: List[str], chunks: List[List[Tuple]]) -> 'ColumnarRows':
+        if not chunks:
+            return cls.empty(names)
+        columns = [[] for _ in names]
+        for chunk in chunks:
+            for column, values in zip(columns, zip(*chunk)):
+                column.extend(values)
+        return cls(names, {name: _to_array(values) for name, values in zip(names, columns)})
+
+    def take(self, indices: np.ndarray) -> 'ColumnarRows':
+        return ColumnarRows(self.names, {name: column[indices] for name, column in self.columns.items()})
+
+    @classmethod
+    def concat(cls, names: List[str], parts: List['ColumnarRows']) -> 'ColumnarRows':
+        parts = [part for part in parts if len(part)]
+        if not parts:
+            return cls.empty(names)
+        if len(parts) == 1:
+            return parts[0]
+        columns = {}
+        for name in names:
+            arrays = [part.columns[name] for part in parts]
+            if len({array.dtype for array in arrays}) > 1:
+                arrays = [array.astype(object) for array in arrays]
+            columns[name] = np.concatenate(arrays)
+        return cls(names, columns)
+
+    def split_by(self, key: str) -> Dict[Any, 'ColumnarRows']:
+        """Per-key slices, preserving row order within each key"""
+        keys = self.columns[key]
+        groups: Dict[Any, List[int]] = {}
+        for index, value in enumerate(keys.tolist()):
+            groups.setdefault(value, []).append(index)
+        return {value: self.take(np.asarray(indices)) for value, indices in groups.items()}
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Row dicts with native Python values"""
+        lists = [self.columns[name].tolist() for name in self.names]
+        return [dict(zip(self.names, values)) for values in zip(*lists)]
+
+
+class ResultCache:
+    """Bounded LRU of per-game dataset slices, invalidated by a version counter"""
+
+    def __init__(self, max_entries: int = 5000, ttl_seconds: float = 300):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.version = 0
+        self._entries: 'OrderedDict[Tuple[str, Any], Tuple[ColumnarRows, float, int]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, dataset: str, game_id: Any) -> Optional[ColumnarRows]:
+        entry = self._entries.get((dataset, game_id))
+        if entry is not None:
+            rows, stored_at, version = entry
+            if version == self.version and time.monotonic() - stored_at < self.ttl_seconds:
+                self._entries.move_to_end((dataset, game_id))
+                self.hits += 1
+                return rows
+            del self._entries[(dataset, game_id)]
+        self.misses += 1
+        return None
+
+    def put(self, dataset: str, game_id: Any, rows: ColumnarRows, version: int):
+        if version != self.version:
+            return  # invalidated while the query was running
+        self._entries[(dataset, game_id)] = (rows, time.monotonic(), version)
+        self._entries.move_to_end((dataset, game_id))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self):
+        self.version += 1
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'version': self.version,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
+class WeekDataLoader:
+    """De-duplicating, batched loader for per-game prediction datasets"""
+
+    def __init__(self, optimizer, max_cached_games: int = 5000, cache_ttl_seconds: float = 300,
+                 fetch_size: int = 2000):
+        self.optimizer = optimizer
+        self.fetch_size = fetch_size
+        self.cache = ResultCache(max_cached_games, cache_ttl_seconds)
+        self._inflight: Dict[Tuple[str, Any], asyncio.Future] = {}
+        self._pending: Dict[str, List[Any]] = {}
+        self.batches_dispatched = 0
+        self.keys_deduplicated = 0
+
+    # Public API
+
+    async def load_columns(self, dataset: str, game_ids: Iterable[Any]) -> ColumnarRows:
+        """Dataset rows for the given games as columns, in the dataset's SQL order"""
+        spec = DATASETS[dataset]
+        game_ids = list(dict.fromkeys(game_ids))
+        slices = await self._load_slices(dataset, game_ids)
+
+        if spec.sort_key is None:
+            # ORDER BY starts with game_id, so sorted per-game slices reproduce it
+            ordered = [slices[game_id] for game_id in sorted(game_ids) if slices.get(game_id) is not None]
+            return ColumnarRows.concat(self._names(spec, ordered), ordered)
+
+        parts = [slices[game_id] for game_id in game_ids if slices.get(game_id) is not None]
+        merged = ColumnarRows.concat(self._names(spec, parts), parts)
+        if len(merged) > 1:
+            records = merged.to_records()
+            order = sorted(range(len(records)), key=lambda i: spec.sort_key(records[i]))
+            merged = merged.take(np.asarray(order))
+        return merged
+
+    @staticmethod
+    def _names(spec: DatasetSpec, parts: List[ColumnarRows]) -> List[str]:
+        """Column names as returned by the driver, or the spec's when no game has rows"""
+        return next((rows.names for rows in parts if len(rows)), spec.columns)
+
+    async def load(self, dataset: str, game_ids: Iterable[Any]) -> List[Dict[str, Any]]:
+        """Dataset rows for the given games as dicts, in the dataset's SQL order"""
+        game_ids = list(game_ids)
+        if not game_ids:
+            return []
+        return (await self.load_columns(dataset, game_ids)).to_records()
+
+    async def load_datasets(self, game_ids: List[Any], datasets: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Several datasets for the same games, loaded concurrently"""
+        results = await asyncio.gather(*(self.load(dataset, game_ids) for dataset in datasets))
+        return dict(zip(datasets, results))
+
+    async def prefetch_week(self, season: int, week: int,
+                            datasets: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Load every dataset for a week's games in one concurrent pass, warming the cache"""
+        rows = await self.optimizer.execute_optimized_query(
+            WEEK_GAMES_QUERY, (season, week), "select", use_cache=True
+        )
+        game_ids = [row['game_id'] for row in rows]
+        return await self.load_datasets(game_ids, datasets or list(DATASETS))
+
+    def invalidate(self):
+        """Drop cached slices; results of queries already in flight are not cached"""
+        self.cache.invalidate()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'cache': self.cache.get_stats(),
+            'batches_dispatched': self.batches_dispatched,
+            'keys_deduplicated': self.keys_deduplicated,
+            'inflight_keys': len(self._inflight)
+        }
+
+    # Batching
+
+    async def _load_slices(self, dataset: str, game_ids: List[Any]) -> Dict[Any, Optional[ColumnarRows]]:
+        loop = asyncio.get_running_loop()
+        slices: Dict[Any, Optional[ColumnarRows]] = {}
+        waiting: List[Tuple[Any, asyncio.Future]] = []
+
+        for game_id in game_ids:
+            cached = self.cache.get(dataset, game_id)
+            if cached is not None:
+                slices[game_id] = cached
+                continue
+            future = self._inflight.get((dataset, game_id))
+            if future is None:
+                future = loop.create_future()
+                self._inflight[(dataset, game_id)] = future
+                self._schedule(loop, dataset, game_id)
+            else:
+                self.keys_deduplicated += 1
+            waiting.append((game_id, future))
+
+        if waiting:
+            # Futures are shared with other callers; shield them so cancelling this one leaves theirs running
+            results = await asyncio.gather(*(asyncio.shield(future) for _, future in waiting))
+            for (game_id, _), rows in zip(waiting, results):
+                slices[game_id] = rows
+        return slices
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop, dataset: str, game_id: Any):
+        pending = self._pending.get(dataset)
+        if pending is None:
+            pending = self._pending[dataset] = []
+            # Dispatch after the current tick so concurrent callers join this batch
+            loop.call_soon(lambda: asyncio.ensure_future(self._dispatch(dataset)))
+        pending.append(game_id)
+
+    async def _dispatch(self, dataset: str):
+        game_ids = self._pending.pop(dataset, [])
+        if not game_ids:
+            return
+        version = self.cache.version
+        self.batches_dispatched += 1
+        try:
+            rows = await self._fetch(dataset, game_ids)
+            by_game = rows.split_by('game_id') if len(rows) else {}
+            for game_id in game_ids:
+                slice_ = by_game.get(game_id) or ColumnarRows.empty(rows.names)
+                self.cache.put(dataset, game_id, slice_, version)
+                future = self._inflight.pop((dataset, game_id), None)
+                if future is not None and not future.done():
+                    future.set_result(slice_)
+        except Exception as e:
+            logger.error(f"Week loader query failed for {dataset}: {e}")
+            for game_id in game_ids:
+                future = self._inflight.pop((dataset, game_id), None)
+                if future is not None and not future.done():
+                    future.set_exception(e)
+
+    async def _fetch(self, dataset: str, game_ids: List[Any]) -> ColumnarRows:
+        """Stream one dataset for a batch of games through a server-side cursor"""
+        pool = self.optimizer.pool
+        if not pool:
+            raise Exception("Database pool not initialized")
+
+        spec = DATASETS[dataset]
+        start_time = time.time()
+        chunks: List[List[Tuple]] = []
+        names: List[str] = []
+        error = None
+        try:
+            with trace_span(f"db.week_loader.{dataset}", stage="db", games=len(game_ids)):
+                async with pool.acquire() as conn:
+                    async with conn.transaction(readonly=True):
+                        cursor = await conn.cursor(spec.query, list(game_ids))
+                        while True:
+                            chunk = await cursor.fetch(self.fetch_size)
+                            if not chunk:
+                                break
+                            if not names:
+                                names = list(chunk[0].keys())
+                            chunks.append([tuple(record.values()) for record in chunk])
+                            if len(chunk) < self.fetch_size:
+                                break
+            return ColumnarRows.from_chunks(names, chunks) if names else ColumnarRows.empty(spec.columns)
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            self.optimizer._record_query_metrics(
+                f"week_loader_{dataset}",
+                (time.time() - start_time) * 1000,
+                sum(len(chunk) for chunk in chunks),
+                False,
+                error
+            )
@@ -12,12 +12,16 @@ import json
 import statistics
 from dotenv import load_dotenv
 import hashlib
+import numpy as np
 
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+ODDS_REQUIRED_FIELDS = {'id', 'home_team', 'away_team', 'bookmakers'}
+ODDS_MARKET_KINDS = {'spreads': 0, 'totals': 1, 'h2h': 2}
+
 class DataValidationService:
     """Validates premium data quality and consistency"""
 
@@ -89,7 +93,15 @@ class DataValidationService:
             validation_result['errors'].append('No odds data provided')
             return validation_result
 
-        for game in odds_data:
+        # Columnar pass over every market of every game; only flagged games
+        # are re-walked to build their error and warning messages
+        flagged = self._flag_odds_games(odds_data)
+
+        for game, needs_review in zip(odds_data, flagged):
+            if not needs_review:
+                validation_result['metrics']['valid_games'] += 1
+                continue
+
             game_validation = self._validate_single_game_odds(game)
 
             if game_validation['is_valid']:
@@ -114,6 +126,111 @@ class DataValidationService:
 
         return validation_result
 
+    def _flag_odds_games(self, odds_data: List[Dict]) -> np.ndarray:
+        """Flag games that would produce any error or warning, using columnar checks"""
+        rules = self.validation_rules['odds']
+        n_games = len(odds_data)
+        flagged = np.zeros(n_games, dtype=bool)
+        multi_book = np.zeros(n_games, dtype=bool)
+
+        # One row per spreads/totals/h2h market: (game index, market kind, outcomes)
+        rows = []
+        for g, game in enumerate(odds_data):
+            try:
+                if not game.keys() >= ODDS_REQUIRED_FIELDS or not game['bookmakers']:
+                    flagged[g] = True
+                    continue
+                multi_book[g] = len(game['bookmakers']) > 1
+                for bookmaker in game['bookmakers']:
+                    markets = bookmaker.get('markets')
+                    if not markets:
+                        flagged[g] = True
+                        break
+                    for market in markets:
+                        kind = ODDS_MARKET_KINDS.get(market['key'])
+                        if kind is not None:
+                            rows.append((g, kind, market.get('outcomes', [])))
+            except (AttributeError, KeyError, TypeError):
+                flagged[g] = True
+
+        if not rows:
+            return flagged
+
+        n = len(rows)
+        game_index = np.fromiter((row[0] for row in rows), dtype=np.int64, count=n)
+        kind = np.fromiter((row[1] for row in rows), dtype=np.int8, count=n)
+
+        # First and second outcome values; anything but exactly two numeric
+        # outcomes becomes NaN and is flagged for the scalar validators
+        columns = []
+        for position in (0, 1):
+            try:
+                values = [
+                    outcomes[position].get('price' if k == 2 else 'point') if len(outcomes) == 2 else None
+                    for _, k, outcomes in rows
+                ]
+            except (AttributeError, KeyError, TypeError):
+                values = [self._outcome_value(outcomes, position, k) for _, k, outcomes in rows]
+            if not set(map(type, values)) <= {int, float, type(None)}:
+                values = [v if type(v) in (int, float) else None for v in values]
+            columns.append(np.array(values, dtype=np.float64))
+        first, second = columns
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            malformed = np.isnan(first) | np.isnan(second)
+
+            spread_range = rules['spread_range']
+            spread_issue = (
+                (first < spread_range['min']) | (first > spread_range['max'])
+                | (second < spread_range['min']) | (second > spread_range['max'])
+                | (np.abs(first + second) > 0.1)
+            )
+
+            total_range = rules['total_range']
+            total_issue = (
+                (first < total_range['min']) | (first > total_range['max'])
+                | (np.abs(first - second) > 0.1)
+            )
+
+            ml_range = rules['moneyline_range']
+            implied = sum(
+                np.where(odds > 0, 100 / (odds + 100) * 100, np.abs(odds) / (np.abs(odds) + 100) * 100)
+                for odds in (first, second)
+            )
+            ml_issue = (
+                (first < ml_range['min']) | (first > ml_range['max'])
+                | (second < ml_range['min']) | (second > ml_range['max'])
+                | (implied < 95) | (implied > 120)
+            )
+
+        issue = malformed | np.choose(kind, [spread_issue, total_issue, ml_issue])
+        flagged |= np.bincount(game_index[issue], minlength=n_games).astype(bool)
+
+        # Spread and total variance across bookmakers; malformed games are already flagged
+        variance = rules['max_bookmaker_variance']
+        spreads = kind == 0
+        totals = kind == 1
+        for games, values, limit in (
+            (np.concatenate([game_index[spreads]] * 2), np.abs(np.concatenate([first[spreads], second[spreads]])), variance['spread']),
+            (game_index[totals], first[totals], variance['total'])
+        ):
+            high = np.full(n_games, -np.inf)
+            low = np.full(n_games, np.inf)
+            np.fmax.at(high, games, values)
+            np.fmin.at(low, games, values)
+            flagged |= multi_book & (high - low > limit)
+
+        return flagged
+
+    def _outcome_value(self, outcomes: Any, position: int, kind: int) -> Any:
+        """Value of one outcome of a two-outcome market, or None if irregular"""
+        try:
+            if len(outcomes) == 2:
+                return outcomes[position].get('price' if kind == 2 else 'point')
+        except (AttributeError, KeyError, TypeError):
+            pass
+        return None
+
     def _validate_single_game_odds(self, game: Dict) -> Dict:
         """Validate a single game's odds data"""
         result = {
@@ -342,8 +459,13 @@ class DataValidationService:
         for position in ['quarterbacks', 'running_backs', 'receivers']:
             players = props_data.get(position, [])
             validation_result['metrics']['total_players'] += len(players)
+            flagged = self._flag_player_props(players, position)
+
+            for player, needs_review in zip(players, flagged):
+                if not needs_review:
+                    validation_result['metrics']['valid_players'] += 1
+                    continue
 
-            for player in players:
                 player_validation = self._validate_player_props(player, position)
 
                 if player_validation['is_valid']:
@@ -362,6 +484,39 @@ class DataValidationService:
 
         return validation_result
 
+    def _flag_player_props(self, players: List[Dict], position: str) -> np.ndarray:
+        """Flag players that would produce any error or warning, using columnar checks"""
+        rules = self.validation_rules['player_props']
+        checks = {
+            'quarterbacks': [('passing_yards', 'passing_yards_range'),
+                             ('passing_touchdowns', 'touchdowns_range'),
+                             ('passing_completions', 'completions_range')],
+            'running_backs': [('rushing_yards', 'rushing_yards_range')],
+            'receivers': [('receiving_yards', 'receiving_yards_range')],
+        }.get(position, [])
+
+        n = len(players)
+        rows = [player if isinstance(player, dict) else {} for player in players]
+        flagged = np.fromiter(
+            (not isinstance(player, dict) or any(f not in player for f in ('player_name', 'team', 'position'))
+             for player in players),
+            dtype=bool, count=n
+        )
+
+        for field, rule in checks:
+            values = [row.get(field) for row in rows]
+            numeric = np.fromiter(
+                (v if type(v) in (int, float) else 0.0 for v in values), dtype=np.float64, count=n
+            )
+            irregular = np.fromiter(
+                (v is not None and type(v) not in (int, float) for v in values), dtype=bool, count=n
+            )
+            present = np.fromiter((v is not None for v in values), dtype=bool, count=n)
+            out_of_range = ~((rules[rule]['min'] <= numeric) & (numeric <= rules[rule]['max']))
+            flagged |= irregular | (present & out_of_range)
+
+        return flagged
+
     def _validate_player_props(self, player: Dict, position: str) -> Dict:
         """Validate individual player props"""
         result = {'is_valid': True, 'errors': [], 'warnings': []}
@@ -21,8 +21,11 @@ from datetime import datetime, timezone
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 import os
+from collections import OrderedDict
 from decimal import Decimal
 
+from ..performance.http_pool import get_http_session, http_registry
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -95,32 +98,154 @@ class EnhancedGameData:
     raw_stats_data: Optional[Dict] = None
     raw_advanced_metrics: Optional[Dict] = None
 
-@dataclass
+def parse_clock_seconds(time_remaining: Optional[str]) -> Optional[int]:
+    """Parse an MM:SS game clock into seconds, or None if unparseable"""
+    if not time_remaining:
+        return None
+
+    try:
+        parts = time_remaining.split(':')
+        if len(parts) == 2:
+            return int(parts[0]) * 60 + int(parts[1])
+    except (ValueError, AttributeError):
+        pass
+
+    return None
+
+
+class RawPlayStore:
+    """Side store for raw play payloads.
+
+    Payloads are kept as encoded JSON per game and only decoded when a play's
+    ``raw_play_data`` is actually requested, so analysis does not have to hold
+    every API dict in memory. At most ``max_games`` games are kept; callers
+    that never release a game lose its payloads, least recently stored first,
+    and those plays then report no raw data.
+    """
+
+    def __init__(self, max_games: int = 32):
+        self.max_games = max_games
+        self._payloads: 'OrderedDict[str, List[str]]' = OrderedDict()
+
+    def put(self, game_id: str, raw_plays: List[Dict]) -> None:
+        self._payloads[game_id] = [json.dumps(play_data, default=str) for play_data in raw_plays]
+        self._payloads.move_to_end(game_id)
+        while len(self._payloads) > self.max_games:
+            evicted, _ = self._payloads.popitem(last=False)
+            logger.debug(f"Raw play store full, dropped payloads for game {evicted}")
+
+    def get_json(self, game_id: str, index: int) -> Optional[str]:
+        payloads = self._payloads.get(game_id)
+        if payloads is None or index >= len(payloads):
+            return None
+        return payloads[index]
+
+    def get(self, game_id: str, index: int) -> Optional[Dict]:
+        payload = self.get_json(game_id, index)
+        return json.loads(payload) if payload is not None else None
+
+    def release(self, game_id: str) -> None:
+        self._payloads.pop(game_id, None)
+
+    def __contains__(self, game_id: str) -> bool:
+        return game_id in self._payloads
+
+
 class GamePlayByPlay:
-    """Play-by-play data structure"""
-    game_id: str
-    play_id: str
-    quarter: Optional[int] = None
-    time_remaining: Optional[str] = None
-    down: Optional[int] = None
-    yards_to_go: Optional[int] = None
-    yard_line: Optional[int] = None
-    possession_team: Optional[str] = None
-    play_type: Optional[str] = None
-    play_description: Optional[str] = None
-    yards_gained: Optional[int] = None
-    is_touchdown: bool = False
-    is_field_goal: bool = False
-    is_safety: bool = False
-    is_turnover: bool = False
-    is_penalty: bool = False
-    primary_player: Optional[str] = None
-    secondary_players: Optional[Dict] = None
-    is_red_zone: bool = False
-    is_goal_to_go: bool = False
-    is_fourth_down: bool = False
-    is_two_minute_warning: bool = False
-    raw_play_data: Optional[Dict] = None
+    """Play-by-play data structure.
+
+    Slotted record with the game clock pre-parsed into ``clock_seconds``. The
+    raw API payload lives in a ``RawPlayStore`` and is loaded on access.
+    """
+
+    __slots__ = (
+        'game_id', 'play_id', 'quarter', 'time_remaining', 'clock_seconds',
+        'down', 'yards_to_go', 'yard_line', 'possession_team', 'play_type',
+        'play_description', 'yards_gained', 'is_touchdown', 'is_field_goal',
+        'is_safety', 'is_turnover', 'is_penalty', 'primary_player',
+        'secondary_players', 'is_red_zone', 'is_goal_to_go', 'is_fourth_down',
+        'is_two_minute_warning', '_raw_play_data', '_raw_store', '_raw_index'
+    )
+
+    def __init__(self, game_id: str, play_id: str,
+                 quarter: Optional[int] = None,
+                 time_remaining: Optional[str] = None,
+                 down: Optional[int] = None,
+                 yards_to_go: Optional[int] = None,
+                 yard_line: Optional[int] = None,
+                 possession_team: Optional[str] = None,
+                 play_type: Optional[str] = None,
+                 play_description: Optional[str] = None,
+                 yards_gained: Optional[int] = None,
+                 is_touchdown: bool = False,
+                 is_field_goal: bool = False,
+                 is_safety: bool = False,
+                 is_turnover: bool = False,
+                 is_penalty: bool = False,
+                 primary_player: Optional[str] = None,
+                 secondary_players: Optional[Dict] = None,
+                 is_red_zone: bool = False,
+                 is_goal_to_go: bool = False,
+                 is_fourth_down: bool = False,
+                 is_two_minute_warning: bool = False,
+                 raw_play_data: Optional[Dict] = None,
+                 clock_seconds: Optional[int] = None,
+                 raw_store: Optional[RawPlayStore] = None,
+                 raw_index: Optional[int] = None):
+        self.game_id = game_id
+        self.play_id = play_id
+        self.quarter = quarter
+        self.time_remaining = time_remaining
+        self.clock_seconds = clock_seconds if clock_seconds is not None else parse_clock_seconds(time_remaining)
+        self.down = down
+        self.yards_to_go = yards_to_go
+        self.yard_line = yard_line
+        self.possession_team = possession_team
+        self.play_type = play_type
+        self.play_description = play_description
+        self.yards_gained = yards_gained
+        self.is_touchdown = is_touchdown
+        self.is_field_goal = is_field_goal
+        self.is_safety = is_safety
+        self.is_turnover = is_turnover
+        self.is_penalty = is_penalty
+        self.primary_player = primary_player
+        self.secondary_players = secondary_players
+        self.is_red_zone = is_red_zone
+        self.is_goal_to_go = is_goal_to_go
+        self.is_fourth_down = is_fourth_down
+        self.is_two_minute_warning = is_two_minute_warning
+        self._raw_play_data = raw_play_data
+        self._raw_store = raw_store
+        self._raw_index = raw_index
+
+    @property
+    def raw_play_data(self) -> Optional[Dict]:
+        if self._raw_play_data is not None:
+            return self._raw_play_data
+        if self._raw_store is not None and self._raw_index is not None:
+            return self._raw_store.get(self.game_id, self._raw_index)
+        return None
+
+    @raw_play_data.setter
+    def raw_play_data(self, value: Optional[Dict]):
+        self._raw_play_data = value
+        self._raw_store = None
+        self._raw_index = None
+
+    @property
+    def raw_play_json(self) -> Optional[str]:
+        """Raw payload as JSON text, without a decode/encode round trip when stored"""
+        if self._raw_play_data is not None:
+            return json.dumps(self._raw_play_data)
+        if self._raw_store is not None and self._raw_index is not None:
+            return self._raw_store.get_json(self.game_id, self._raw_index)
+        return None
+
+    def __repr__(self) -> str:
+        return (f"GamePlayByPlay(game_id={self.game_id!r}, play_id={self.play_id!r}, "
+                f"quarter={self.quarter!r}, time_remaining={self.time_remaining!r}, "
+                f"possession_team={self.possession_team!r}, play_type={self.play_type!r})")
 
 @dataclass
 class GameDrive:
@@ -202,11 +327,22 @@ class SituationalPerformance:
     time_with_lead: Optional[int] = None
     comeback_ability_score: Optional[Decimal] = None
 
+@dataclass
+class GamePlayAnalysis:
+    """Per-game analysis produced from a single traversal of the plays"""
+    game_id: str
+    plays: List[GamePlayByPlay]
+    drives: List[GameDrive]
+    coaching_decisions: List[CoachingDecision]
+    situational_performance: List[SituationalPerformance]
+
 class EnhancedDataFetcher:
     """Fetches comprehensive NFL data from SportsData.io APIs"""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, keep_raw_plays: bool = True, raw_play_games: int = 32):
         self.api_key = api_key
+        # Bounded, so long-running fetchers that never release games stay flat
+        self.raw_play_store = RawPlayStore(max_games=raw_play_games) if keep_raw_plays else None
         self.base_url = "https://api.sportsdata.io/v3/nfl"
         self.headers = {
             "Ocp-Apim-Subscription-Key": api_key,
@@ -219,25 +355,25 @@ class EnhancedDataFetcher:
 
         try:
             # Fetch multiple data sources concurrently
-            async with aiohttp.ClientSession() as session:
-                # Core endpoints for comprehensive data
-                tasks = [
-                    self._fetch_scores(session, season, week),
-                    self._fetch_team_stats(session, season, week),
-                    self._fetch_advanced_metrics(session, season, week)
-                ]
-
-                scores_data, stats_data, metrics_data = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Process and combine data
-                enhanced_games = []
-                if not isinstance(scores_data, Exception):
-                    for game in scores_data:
-                        enhanced_game = self._build_enhanced_game_data(game, stats_data, metrics_data)
-                        enhanced_games.append(enhanced_game)
-
-                logger.info(f"Successfully fetched {len(enhanced_games)} enhanced games")
-                return enhanced_games
+            session = get_http_session('sportsdata_enhanced')
+            # Core endpoints for comprehensive data
+            tasks = [
+                self._fetch_scores(session, season, week),
+                self._fetch_team_stats(session, season, week),
+                self._fetch_advanced_metrics(session, season, week)
+            ]
+
+            scores_data, stats_data, metrics_data = await asyncio.gather(*tasks, return_exceptions=True)
+
+            # Process and combine data
+            enhanced_games = []
+            if not isinstance(scores_data, Exception):
+                for game in scores_data:
+                    enhanced_game = self._build_enhanced_game_data(game, stats_data, metrics_data)
+                    enhanced_games.append(enhanced_game)
+
+            logger.info(f"Successfully fetched {len(enhanced_games)} enhanced games")
+            return enhanced_games
 
         except Exception as e:
             logger.error(f"Error fetching enhanced game data: {e}")
@@ -248,20 +384,27 @@ class EnhancedDataFetcher:
         logger.info(f"Fetching play-by-play data for game {game_id}")
 
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.base_url}/pbp/{game_id}"
-                async with session.get(url, headers=self.headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return self._process_play_by_play_data(data, game_id)
-                    else:
-                        logger.error(f"Failed to fetch play-by-play: {response.status}")
-                        return []
+            session = get_http_session('sportsdata_enhanced')
+            url = f"{self.base_url}/pbp/{game_id}"
+            async with session.get(url, headers=self.headers) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return self._process_play_by_play_data(data, game_id)
+                else:
+                    logger.error(f"Failed to fetch play-by-play: {response.status}")
+                    return []
 
         except Exception as e:
             logger.error(f"Error fetching play-by-play data: {e}")
             return []
 
+    async def fetch_game_analysis(self, game_id: str) -> GamePlayAnalysis:
+        """Fetch play-by-play once and derive drives, coaching decisions and situational metrics"""
+        logger.info(f"Fetching play-by-play analysis for game {game_id}")
+
+        plays = await self.fetch_play_by_play_data(game_id)
+        return self._analyze_game_plays(plays, game_id)
+
     async def fetch_drive_data(self, game_id: str) -> List[GameDrive]:
         """Fetch drive-level data for a game"""
         logger.info(f"Fetching drive data for game {game_id}")
@@ -287,25 +430,31 @@ class EnhancedDataFetcher:
             logger.error(f"Error analyzing coaching decisions: {e}")
             return []
 
-    async def fetch_special_teams_data(self, game_id: str) -> List[SpecialTeamsPerformance]:
+    async def fetch_special_teams_data(self, game_id: str,
+                                       plays: Optional[List[GamePlayByPlay]] = None) -> List[SpecialTeamsPerformance]:
         """Extract special teams performance from game data"""
         logger.info(f"Extracting special teams data for game {game_id}")
 
         try:
             # Get team stats and play-by-play for special teams analysis
-            async with aiohttp.ClientSession() as session:
+            session = get_http_session('sportsdata_enhanced')
+            if plays is None:
                 tasks = [
                     self._fetch_team_game_stats(session, game_id),
                     self.fetch_play_by_play_data(game_id)
                 ]
-
                 team_stats, plays = await asyncio.gather(*tasks, return_exceptions=True)
+            else:
+                try:
+                    team_stats = await self._fetch_team_game_stats(session, game_id)
+                except Exception as e:
+                    team_stats = e
 
-                if not isinstance(team_stats, Exception) and not isinstance(plays, Exception):
-                    return self._extract_special_teams_performance(team_stats, plays, game_id)
-                else:
-                    logger.error("Failed to fetch data for special teams analysis")
-                    return []
+            if not isinstance(team_stats, Exception) and not isinstance(plays, Exception):
+                return self._extract_special_teams_performance(team_stats, plays, game_id)
+            else:
+                logger.error("Failed to fetch data for special teams analysis")
+                return []
 
         except Exception as e:
             logger.error(f"Error extracting special teams data: {e}")
@@ -508,15 +657,27 @@ class EnhancedDataFetcher:
         if not data or 'Plays' not in data:
             return plays
 
-        for play_data in data['Plays']:
+        raw_plays = data['Plays']
+        raw_store = self.raw_play_store
+        if raw_store is not None:
+            raw_store.put(game_id, raw_plays)
+
+        for index, play_data in enumerate(raw_plays):
+            quarter = play_data.get('Quarter')
+            time_remaining = play_data.get('TimeRemaining')
+            clock_seconds = parse_clock_seconds(time_remaining)
+            yard_line = play_data.get('YardLine')
+            yards_to_go = play_data.get('YardsToGo')
+
             play = GamePlayByPlay(
                 game_id=game_id,
                 play_id=str(play_data.get('PlayID', '')),
-                quarter=play_data.get('Quarter'),
-                time_remaining=play_data.get('TimeRemaining'),
+                quarter=quarter,
+                time_remaining=time_remaining,
+                clock_seconds=clock_seconds,
                 down=play_data.get('Down'),
-                yards_to_go=play_data.get('YardsToGo'),
-                yard_line=play_data.get('YardLine'),
+                yards_to_go=yards_to_go,
+                yard_line=yard_line,
                 possession_team=play_data.get('Team'),
                 play_type=play_data.get('Type'),
                 play_description=play_data.get('Description'),
@@ -527,72 +688,153 @@ class EnhancedDataFetcher:
                 is_turnover=play_data.get('IsTurnover', False),
                 is_penalty=play_data.get('IsPenalty', False),
                 primary_player=play_data.get('Player'),
-                is_red_zone=play_data.get('YardLine', 100) <= 20 if play_data.get('YardLine') else False,
-                is_goal_to_go=play_data.get('YardsToGo', 0) >= play_data.get('YardLine', 100) if play_data.get('YardsToGo') and play_data.get('YardLine') else False,
+                is_red_zone=yard_line <= 20 if yard_line else False,
+                is_goal_to_go=yards_to_go >= yard_line if yards_to_go and yard_line else False,
                 is_fourth_down=play_data.get('Down') == 4,
-                is_two_minute_warning=self._is_two_minute_warning(play_data.get('TimeRemaining'), play_data.get('Quarter')),
-                raw_play_data=play_data
+                is_two_minute_warning=self._clock_is_two_minute_warning(clock_seconds, quarter),
+                raw_store=raw_store,
+                raw_index=index if raw_store is not None else None
             )
             plays.append(play)
 
         return plays
 
-    def _extract_drive_data(self, plays: List[GamePlayByPlay], game_id: str) -> List[GameDrive]:
-        """Extract drive data from play-by-play"""
+    def _analyze_game_plays(self, plays: List[GamePlayByPlay], game_id: str) -> GamePlayAnalysis:
+        """Build drives, coaching decisions and situational metrics in one pass over the plays"""
         drives = []
+        decisions = []
+        team_totals: Dict[str, Dict[str, Any]] = {}
+
         current_drive = None
         drive_id_counter = 1
 
         for play in plays:
-            # Start new drive on possession change or game start
+            team = play.possession_team
+            description = play.play_description or ""
+            converted = (play.yards_gained or 0) >= (play.yards_to_go or 0)
+
+            # Drives - start a new one on possession change or scoring/turnover plays
             if (current_drive is None or
-                current_drive.possession_team != play.possession_team or
+                current_drive.possession_team != team or
                 play.is_turnover or
                 play.is_touchdown or
                 play.is_field_goal or
                 play.is_safety):
 
-                # Finalize previous drive
                 if current_drive:
                     self._finalize_drive(current_drive)
                     drives.append(current_drive)
 
-                # Start new drive
                 current_drive = GameDrive(
                     game_id=game_id,
                     drive_id=f"{game_id}_drive_{drive_id_counter}",
                     quarter=play.quarter,
-                    possession_team=play.possession_team,
+                    possession_team=team,
                     starting_field_position=play.yard_line,
                     total_plays=0,
                     total_yards=0
                 )
                 drive_id_counter += 1
 
-            # Update current drive
-            if current_drive and play.possession_team == current_drive.possession_team:
-                current_drive.total_plays = (current_drive.total_plays or 0) + 1
-                current_drive.total_yards = (current_drive.total_yards or 0) + (play.yards_gained or 0)
-                current_drive.ending_field_position = play.yard_line
+            current_drive.total_plays += 1
+            current_drive.total_yards += (play.yards_gained or 0)
+            current_drive.ending_field_position = play.yard_line
+
+            if play.is_touchdown:
+                current_drive.drive_result = "touchdown"
+                current_drive.is_scoring_drive = True
+            elif play.is_field_goal:
+                current_drive.drive_result = "field_goal"
+                current_drive.is_scoring_drive = True
+            elif play.is_turnover:
+                current_drive.drive_result = "turnover"
+            elif play.is_safety:
+                current_drive.drive_result = "safety"
+
+            # Coaching decisions
+            if play.is_fourth_down and play.down == 4:
+                decisions.append(CoachingDecision(
+                    game_id=game_id,
+                    team=team,
+                    quarter=play.quarter,
+                    situation="fourth_down",
+                    decision_type=self._classify_fourth_down_decision(play),
+                    decision_description=play.play_description,
+                    outcome="successful" if converted else "failed",
+                    game_state={
+                        "quarter": play.quarter,
+                        "time_remaining": play.time_remaining,
+                        "yard_line": play.yard_line,
+                        "yards_to_go": play.yards_to_go
+                    }
+                ))
 
-                # Determine drive result
+            if "two point" in description.lower():
+                decisions.append(CoachingDecision(
+                    game_id=game_id,
+                    team=team,
+                    quarter=play.quarter,
+                    situation="two_point_conversion",
+                    decision_type="attempt_two_point",
+                    decision_description=play.play_description,
+                    outcome="successful" if play.is_touchdown else "failed"
+                ))
+
+            # Situational totals per possession team
+            if not team:
+                continue
+
+            totals = team_totals.get(team)
+            if totals is None:
+                totals = team_totals[team] = {
+                    'points_final_2_minutes': 0,
+                    'fourth_down_attempts': 0,
+                    'fourth_down_conversions': 0,
+                    'red_zone_trips': set(),
+                    'red_zone_touchdowns': 0
+                }
+
+            if self._clock_is_final_2_minutes(play.clock_seconds, play.quarter):
+                totals['points_final_2_minutes'] += 6 if play.is_touchdown else 3 if play.is_field_goal else 0
+
+            if play.is_fourth_down:
+                totals['fourth_down_attempts'] += 1
+                if converted:
+                    totals['fourth_down_conversions'] += 1
+
+            if play.is_red_zone:
+                totals['red_zone_trips'].add(f"{play.quarter}_{play.time_remaining}")
                 if play.is_touchdown:
-                    current_drive.drive_result = "touchdown"
-                    current_drive.is_scoring_drive = True
-                elif play.is_field_goal:
-                    current_drive.drive_result = "field_goal"
-                    current_drive.is_scoring_drive = True
-                elif play.is_turnover:
-                    current_drive.drive_result = "turnover"
-                elif play.is_safety:
-                    current_drive.drive_result = "safety"
-
-        # Finalize last drive
+                    totals['red_zone_touchdowns'] += 1
+
         if current_drive:
             self._finalize_drive(current_drive)
             drives.append(current_drive)
 
-        return drives
+        situational_performance = [
+            SituationalPerformance(
+                game_id=game_id,
+                team=team,
+                points_final_2_minutes=totals['points_final_2_minutes'],
+                fourth_down_attempts=totals['fourth_down_attempts'],
+                fourth_down_conversions=totals['fourth_down_conversions'],
+                red_zone_trips=len(totals['red_zone_trips']),
+                red_zone_touchdowns=totals['red_zone_touchdowns']
+            )
+            for team, totals in team_totals.items()
+        ]
+
+        return GamePlayAnalysis(
+            game_id=game_id,
+            plays=plays,
+            drives=drives,
+            coaching_decisions=decisions,
+            situational_performance=situational_performance
+        )
+
+    def _extract_drive_data(self, plays: List[GamePlayByPlay], game_id: str) -> List[GameDrive]:
+        """Extract drive data from play-by-play"""
+        return self._analyze_game_plays(plays, game_id).drives
 
     def _finalize_drive(self, drive: GameDrive):
         """Finalize drive calculations"""
@@ -611,42 +853,7 @@ class EnhancedDataFetcher:
 
     def _analyze_coaching_decisions(self, plays: List[GamePlayByPlay], game_id: str) -> List[CoachingDecision]:
         """Analyze coaching decisions from play-by-play data"""
-        decisions = []
-
-        for play in plays:
-            # Fourth down decisions
-            if play.is_fourth_down and play.down == 4:
-                decision = CoachingDecision(
-                    game_id=game_id,
-                    team=play.possession_team,
-                    quarter=play.quarter,
-                    situation="fourth_down",
-                    decision_type=self._classify_fourth_down_decision(play),
-                    decision_description=play.play_description,
-                    outcome="successful" if (play.yards_gained or 0) >= (play.yards_to_go or 0) else "failed",
-                    game_state={
-                        "quarter": play.quarter,
-                        "time_remaining": play.time_remaining,
-                        "yard_line": play.yard_line,
-                        "yards_to_go": play.yards_to_go
-                    }
-                )
-                decisions.append(decision)
-
-            # Two-point conversion attempts
-            if "two point" in (play.play_description or "").lower():
-                decision = CoachingDecision(
-                    game_id=game_id,
-                    team=play.possession_team,
-                    quarter=play.quarter,
-                    situation="two_point_conversion",
-                    decision_type="attempt_two_point",
-                    decision_description=play.play_description,
-                    outcome="successful" if play.is_touchdown else "failed"
-                )
-                decisions.append(decision)
-
-        return decisions
+        return self._analyze_game_plays(plays, game_id).coaching_decisions
 
     def _classify_fourth_down_decision(self, play: GamePlayByPlay) -> str:
         """Classify type of fourth down decision"""
@@ -700,137 +907,91 @@ class EnhancedDataFetcher:
 
     def _extract_situational_performance(self, plays: List[GamePlayByPlay], game_id: str) -> List[SituationalPerformance]:
         """Extract situational performance metrics"""
-        teams = set()
-        for play in plays:
-            if play.possession_team:
-                teams.add(play.possession_team)
-
-        situational_performance = []
-
-        for team in teams:
-            team_plays = [play for play in plays if play.possession_team == team]
-
-            # Final 2 minutes performance
-            final_2_min_plays = [play for play in team_plays if self._is_final_2_minutes(play.time_remaining, play.quarter)]
-            points_final_2_minutes = sum(6 if play.is_touchdown else 3 if play.is_field_goal else 0 for play in final_2_min_plays)
-
-            # Fourth down performance
-            fourth_down_plays = [play for play in team_plays if play.is_fourth_down]
-            fourth_down_attempts = len(fourth_down_plays)
-            fourth_down_conversions = sum(1 for play in fourth_down_plays if (play.yards_gained or 0) >= (play.yards_to_go or 0))
-
-            # Red zone performance
-            red_zone_plays = [play for play in team_plays if play.is_red_zone]
-            red_zone_trips = len(set(f"{play.quarter}_{play.time_remaining}" for play in red_zone_plays))
-            red_zone_touchdowns = sum(1 for play in red_zone_plays if play.is_touchdown)
-
-            performance = SituationalPerformance(
-                game_id=game_id,
-                team=team,
-                points_final_2_minutes=points_final_2_minutes,
-                fourth_down_attempts=fourth_down_attempts,
-                fourth_down_conversions=fourth_down_conversions,
-                red_zone_trips=red_zone_trips,
-                red_zone_touchdowns=red_zone_touchdowns
-            )
-
-            situational_performance.append(performance)
-
-        return situational_performance
+        return self._analyze_game_plays(plays, game_id).situational_performance
 
     def _is_two_minute_warning(self, time_remaining: str, quarter: int) -> bool:
         """Check if play is at two minute warning"""
-        if not time_remaining or quarter not in [2, 4]:
-            return False
-
-        try:
-            # Parse time format MM:SS
-            parts = time_remaining.split(':')
-            if len(parts) == 2:
-                minutes = int(parts[0])
-                seconds = int(parts[1])
-                total_seconds = minutes * 60 + seconds
-                return total_seconds <= 120  # 2 minutes = 120 seconds
-        except:
-            pass
-
-        return False
+        return self._clock_is_two_minute_warning(parse_clock_seconds(time_remaining), quarter)
 
     def _is_final_2_minutes(self, time_remaining: str, quarter: int) -> bool:
         """Check if play is in final 2 minutes of either half"""
-        if not time_remaining or quarter not in [2, 4]:
-            return False
+        return self._clock_is_final_2_minutes(parse_clock_seconds(time_remaining), quarter)
 
-        try:
-            parts = time_remaining.split(':')
-            if len(parts) == 2:
-                minutes = int(parts[0])
-                return minutes <= 2
-        except:
-            pass
+    @staticmethod
+    def _clock_is_two_minute_warning(clock_seconds: Optional[int], quarter: Optional[int]) -> bool:
+        if clock_seconds is None or quarter not in (2, 4):
+            return False
+        return clock_seconds <= 120  # 2 minutes = 120 seconds
 
-        return False
+    @staticmethod
+    def _clock_is_final_2_minutes(clock_seconds: Optional[int], quarter: Optional[int]) -> bool:
+        if clock_seconds is None or quarter not in (2, 4):
+            return False
+        return clock_seconds // 60 <= 2
 
 # Example usage and testing
 async def main():
     """Test the enhanced data fetcher"""
+    try:
+        # Get API key from environment
+        api_key = os.getenv('SPORTSDATA_IO_KEY', 'bc297647c7aa4ef29747e6a85cb575dc')
 
-    # Get API key from environment
-    api_key = os.getenv('SPORTSDATA_IO_KEY', 'bc297647c7aa4ef29747e6a85cb575dc')
+        if not api_key:
+            logger.error("SPORTSDATA_IO_KEY environment variable not set")
+            return
 
-    if not api_key:
-        logger.error("SPORTSDATA_IO_KEY environment variable not set")
-        return
+        fetcher = EnhancedDataFetcher(api_key)
 
-    fetcher = EnhancedDataFetcher(api_key)
+        # Test fetching enhanced game data for current week
+        season = 2024
+        week = 18
 
-    # Test fetching enhanced game data for current week
-    season = 2024
-    week = 18
+        logger.info(f"Testing enhanced data fetcher for {season} Week {week}")
 
-    logger.info(f"Testing enhanced data fetcher for {season} Week {week}")
+        # Fetch enhanced game data
+        enhanced_games = await fetcher.fetch_enhanced_game_data(season, week)
+        logger.info(f"Fetched {len(enhanced_games)} enhanced games")
 
-    # Fetch enhanced game data
-    enhanced_games = await fetcher.fetch_enhanced_game_data(season, week)
-    logger.info(f"Fetched {len(enhanced_games)} enhanced games")
+        # Test detailed data for first game
+        if enhanced_games:
+            game = enhanced_games[0]
+            logger.info(f"Testing detailed data for game: {game.game_id}")
 
-    # Test detailed data for first game
-    if enhanced_games:
-        game = enhanced_games[0]
-        logger.info(f"Testing detailed data for game: {game.game_id}")
+            # Fetch play-by-play
+            plays = await fetcher.fetch_play_by_play_data(game.game_id)
+            logger.info(f"Fetched {len(plays)} plays")
 
-        # Fetch play-by-play
-        plays = await fetcher.fetch_play_by_play_data(game.game_id)
-        logger.info(f"Fetched {len(plays)} plays")
+            # Extract drives
+            drives = await fetcher.fetch_drive_data(game.game_id)
+            logger.info(f"Extracted {len(drives)} drives")
 
-        # Extract drives
-        drives = await fetcher.fetch_drive_data(game.game_id)
-        logger.info(f"Extracted {len(drives)} drives")
+            # Analyze coaching decisions
+            decisions = await fetcher.fetch_coaching_decisions(game.game_id)
+            logger.info(f"Analyzed {len(decisions)} coaching decisions")
 
-        # Analyze coaching decisions
-        decisions = await fetcher.fetch_coaching_decisions(game.game_id)
-        logger.info(f"Analyzed {len(decisions)} coaching decisions")
+            # Extract special teams
+            st_performance = await fetcher.fetch_special_teams_data(game.game_id)
+            logger.info(f"Extracted special teams data for {len(st_performance)} teams")
 
-        # Extract special teams
-        st_performance = await fetcher.fetch_special_teams_data(game.game_id)
-        logger.info(f"Extracted special teams data for {len(st_performance)} teams")
+            # Extract situational performance
+            situational = await fetcher.fetch_situational_performance(game.game_id)
+            logger.info(f"Extracted situational data for {len(situational)} teams")
 
-        # Extract situational performance
-        situational = await fetcher.fetch_situational_performance(game.game_id)
-        logger.info(f"Extracted situational data for {len(situational)} teams")
+            # Print sample data
+            print(f"\nSample Enhanced Game Data:")
+            print(f"Game: {game.home_team} vs {game.away_team}")
+            print(f"Score: {game.final_score_home} - {game.final_score_away}")
+            print(f"Stadium: {game.stadium_name}")
+            print(f"Weather: {game.weather_condition}, {game.weather_temperature}°F")
 
-        # Print sample data
-        print(f"\nSample Enhanced Game Data:")
-        print(f"Game: {game.home_team} vs {game.away_team}")
-        print(f"Score: {game.final_score_home} - {game.final_score_away}")
-        print(f"Stadium: {game.stadium_name}")
-        print(f"Weather: {game.weather_condition}, {game.weather_temperature}°F")
+            if plays:
+                print(f"\nSample Play: {plays[0].play_description}")
 
-        if plays:
-            print(f"\nSample Play: {plays[0].play_description}")
+            if drives:
+                print(f"\nSample Drive: {drives[0].possession_team} - {drives[0].total_plays} plays, {drives[0].total_yards} yards, {drives[0].drive_result}")
+    finally:
+        await http_registry.close()
 
-        if drives:
-            print(f"\nSample Drive: {drives[0].possession_team} - {drives[0].total_plays} plays, {drives[0].total_yards} yards, {drives[0].drive_result}")
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -133,18 +133,14 @@ class EnhancedDataPipeline:
         }
 
         try:
-            # Fetch all detailed data concurrently
-            tasks = [
-                self.fetcher.fetch_play_by_play_data(game_id),
-                self.fetcher.fetch_drive_data(game_id),
-                self.fetcher.fetch_coaching_decisions(game_id),
-                self.fetcher.fetch_special_teams_data(game_id),
-                self.fetcher.fetch_situational_performance(game_id)
-            ]
-
-            play_by_play, drives, coaching_decisions, special_teams, situational = await asyncio.gather(
-                *tasks, return_exceptions=True
-            )
+            # Fetch play-by-play once and derive drives, decisions and situational metrics from it
+            analysis = await self.fetcher.fetch_game_analysis(game_id)
+            play_by_play = analysis.plays
+            drives = analysis.drives
+            coaching_decisions = analysis.coaching_decisions
+            situational = analysis.situational_performance
+
+            special_teams = await self.fetcher.fetch_special_teams_data(game_id, plays=play_by_play)
 
             # Store play-by-play data
             if not isinstance(play_by_play, Exception) and play_by_play:
@@ -189,6 +185,10 @@ class EnhancedDataPipeline:
             else:
                 logger.warning(f"Partial success processing game {game_id}: {result['errors']}")
 
+            # Raw payloads are only needed until the plays are persisted
+            if self.fetcher.raw_play_store is not None:
+                self.fetcher.raw_play_store.release(game_id)
+
         except Exception as e:
             error_msg = f"Error processing detailed game data: {e}"
             logger.error(error_msg)
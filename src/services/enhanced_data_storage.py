@@ -170,7 +170,7 @@ class EnhancedDataStorage:
                         json.dumps(play.secondary_players) if play.secondary_players else None,
                         play.is_red_zone, play.is_goal_to_go, play.is_fourth_down,
                         play.is_two_minute_warning,
-                        json.dumps(play.raw_play_data) if play.raw_play_data else None
+                        play.raw_play_json
                     )
                     play_records.append(record)
 
@@ -11,6 +11,8 @@ from typing import Dict, List, Optional, Any
 import json
 from dotenv import load_dotenv
 
+from ..utils.team_index import team_abbreviation
+
 # Load environment variables
 load_dotenv()
 
@@ -276,51 +278,8 @@ class LiveDataService:
 
     def _normalize_team_name(self, team: str) -> str:
         """Normalize team names to 2-3 letter codes"""
-        team_map = {
-            'Kansas City Chiefs': 'KC',
-            'Buffalo Bills': 'BUF',
-            'San Francisco 49ers': 'SF',
-            'Dallas Cowboys': 'DAL',
-            'Philadelphia Eagles': 'PHI',
-            'Baltimore Ravens': 'BAL',
-            'Detroit Lions': 'DET',
-            'Green Bay Packers': 'GB',
-            'Miami Dolphins': 'MIA',
-            'New York Jets': 'NYJ',
-            'Cincinnati Bengals': 'CIN',
-            'Houston Texans': 'HOU',
-            'Cleveland Browns': 'CLE',
-            'Pittsburgh Steelers': 'PIT',
-            'Los Angeles Rams': 'LAR',
-            'Los Angeles Chargers': 'LAC',
-            'Seattle Seahawks': 'SEA',
-            'Minnesota Vikings': 'MIN',
-            'Tampa Bay Buccaneers': 'TB',
-            'Atlanta Falcons': 'ATL',
-            'New Orleans Saints': 'NO',
-            'Jacksonville Jaguars': 'JAX',
-            'Indianapolis Colts': 'IND',
-            'Tennessee Titans': 'TEN',
-            'Denver Broncos': 'DEN',
-            'Las Vegas Raiders': 'LV',
-            'Arizona Cardinals': 'ARI',
-            'Chicago Bears': 'CHI',
-            'New England Patriots': 'NE',
-            'New York Giants': 'NYG',
-            'Washington Commanders': 'WAS',
-            'Carolina Panthers': 'CAR'
-        }
-
-        # Try to find in map
-        for full_name, code in team_map.items():
-            if team in full_name or full_name in team:
-                return code
-
-        # Already a code
-        if len(team) <= 3:
-            return team.upper()
-
-        return team
+        # Unknown short strings are assumed to already be codes
+        return team_abbreviation(team, default=team.upper() if len(team) <= 3 else team)
 
     def _check_divisional(self, home: str, away: str) -> bool:
         """Check if game is divisional"""
@@ -11,6 +11,8 @@ from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 import random
 
+from ..performance.http_pool import get_sync_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,12 +46,11 @@ class LocalLLMService:
     def __init__(self, base_url: str = "http://192.168.254.253:1234", timeout: int = 60):
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
-        self.session = requests.Session()
         self.last_request_time = 0
         self.min_request_interval = 0.5  # 0.5 seconds between requests for rate limiting
 
-        # Configure session with connection pooling
-        self.session.headers.update({
+        # Pooled keep-alive session shared by every expert talking to the local LLM
+        self.session = get_sync_session('local_llm', headers={
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         })
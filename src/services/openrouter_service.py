@@ -8,6 +8,8 @@ import logging
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
+from ..performance.http_pool import get_sync_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,11 +29,11 @@ class OpenRouterService:
         self.api_key = api_key
         self.base_url = "https://openrouter.ai/api/v1"
         self.timeout = timeout
-        self.session = requests.Session()
         self.last_request_time = 0
         self.min_request_interval = 1.0  # 1 second between requests for rate limiting
 
-        self.session.headers.update({
+        # Pooled keep-alive session shared by every service using the same key
+        self.session = get_sync_session('openrouter', headers={
             'Authorization': f'Bearer {api_key}',
             'Content-Type': 'application/json',
             'HTTP-Referer': 'https://github.com/nfl-predictor',
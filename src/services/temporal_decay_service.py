@@ -9,9 +9,18 @@ import math
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
+import numpy as np
+
+# Baseline accuracy assumed for memories that carry no accuracy of their own
+DEFAULT_MEMORY_ACCURACY = 0.65
+# Weighted memory accuracy above which a prediction counts as memory-supported
+MEMORY_SUPPORT_THRESHOLD = 0.6
+# Upper bound on elements materialized per broadcast chunk in half-life searches
+HALF_LIFE_SEARCH_CHUNK_ELEMENTS = 20_000_000
+
 
 class ExpertType(Enum):
     CONSERVATIVE_ANALYZER = "conservative_analyzer"
@@ -53,6 +62,27 @@ class MemoryScore:
     memory_category: Optional[str] = None
 
 
+@dataclass
+class DecayAgeMatrix:
+    """Prediction x memory-age matrix built once from performance data"""
+    ages: np.ndarray               # (predictions, memories) age in days, 0 where padded
+    mask: np.ndarray               # (predictions, memories) True for real memories
+    memory_accuracy: np.ndarray    # (predictions, memories) accuracy of each memory
+    half_life_scale: np.ndarray    # (predictions, memories) category half-life / default half-life
+    was_correct: np.ndarray        # (predictions,) outcome of each prediction
+
+
+@dataclass
+class HalfLifeSearchResult:
+    """Outcome of a half-life grid search, including the full sensitivity curve"""
+    expert_type: ExpertType
+    best_half_life: int
+    best_multiplier: float
+    best_accuracy: float
+    half_lives: List[float] = field(default_factory=list)
+    accuracy_curve: List[float] = field(default_factory=list)
+
+
 class TemporalDecayService:
     """
     Service for applying personality-specific temporal decay to expert memories.
@@ -502,74 +532,185 @@ class TemporalDecayService:
                 int(current_half_life * 1.5)
             ]
 
-        best_half_life = self.decay_configs[expert_type].default_half_life
-        best_accuracy = 0.0
+        default_half_life = self.decay_configs[expert_type].default_half_life
+        matrix = self.build_decay_age_matrix(expert_type, performance_data)
+        accuracies = self._evaluate_half_life_grid(
+            matrix.ages[None], matrix.mask[None], matrix.memory_accuracy[None],
+            matrix.half_life_scale[None], matrix.was_correct[None],
+            np.ones((1, len(matrix.was_correct)), dtype=bool),
+            np.asarray(test_half_lives, dtype=np.float64)[None]
+        )[0]
 
-        for test_half_life in test_half_lives:
-            # Simulate performance with this half-life
-            accuracy = self._simulate_performance_with_half_life(
-                expert_type, performance_data, test_half_life
-            )
-
-            if accuracy > best_accuracy:
-                best_accuracy = accuracy
-                best_half_life = test_half_life
+        # Keep the default unless some candidate actually scores
+        best_index = int(np.argmax(accuracies)) if len(accuracies) else 0
+        best_accuracy = float(accuracies[best_index]) if len(accuracies) else 0.0
+        best_half_life = test_half_lives[best_index] if best_accuracy > 0.0 else default_half_life
 
         self.logger.info(f"Optimized half-life for {expert_type.value}: {best_half_life} days (accuracy: {best_accuracy:.3f})")
 
         return best_half_life
 
-    def _simulate_performance_with_half_life(
+    def build_decay_age_matrix(
         self,
         expert_type: ExpertType,
-        performance_data: List[Dict[str, Any]],
-        test_half_life: int
-    ) -> float:
-        """Simulate expert performance with a specific half-life parameter"""
-        # This is a simplified simulation - in practice, you'd run the full
-        # memory retrieval and prediction pipeline with the test half-life
+        performance_data: List[Dict[str, Any]]
+    ) -> DecayAgeMatrix:
+        """
+        Build the padded prediction x memory-age matrix for an expert.
 
-        correct_predictions = 0
-        total_predictions = len(performance_data)
+        Each record needs prediction_date, memory_dates and was_correct, and may
+        carry memory_accuracies and memory_categories aligned with memory_dates.
+        Categories map to the expert's category half-life as a multiple of the
+        default, so every candidate half-life scales the whole configuration.
+        """
+        config = self.decay_configs[expert_type]
+        n_predictions = len(performance_data)
+        n_memories = max((len(p.get('memory_dates') or []) for p in performance_data), default=0)
+
+        ages = np.zeros((n_predictions, n_memories))
+        mask = np.zeros((n_predictions, n_memories), dtype=bool)
+        memory_accuracy = np.full((n_predictions, n_memories), DEFAULT_MEMORY_ACCURACY)
+        half_life_scale = np.ones((n_predictions, n_memories))
+        was_correct = np.zeros(n_predictions, dtype=bool)
+
+        for i, prediction in enumerate(performance_data):
+            was_correct[i] = bool(prediction.get('was_correct', False))
+            memory_dates = prediction.get('memory_dates') or []
+            if not memory_dates:
+                continue
 
-        for prediction in performance_data:
-            # Calculate what the temporal weighting would have been
             prediction_date = prediction.get('prediction_date')
-            memory_dates = prediction.get('memory_dates', [])
+            count = len(memory_dates)
+            ages[i, :count] = [(prediction_date - memory_date).days for memory_date in memory_dates]
+            mask[i, :count] = True
 
-            # Simulate memory weighting with test half-life
-            weighted_accuracy = self._calculate_weighted_memory_accuracy(
-                prediction_date, memory_dates, test_half_life
-            )
+            accuracies = prediction.get('memory_accuracies')
+            if accuracies:
+                memory_accuracy[i, :count] = accuracies
 
-            # Simple heuristic: higher weighted accuracy = more likely correct
-            if weighted_accuracy > 0.6:  # Threshold for "good" memory support
-                if prediction.get('was_correct', False):
-                    correct_predictions += 1
+            categories = prediction.get('memory_categories')
+            if categories:
+                half_life_scale[i, :count] = [
+                    config.memory_category_half_lives.get(category, config.default_half_life)
+                    / config.default_half_life
+                    for category in categories
+                ]
 
-        return correct_predictions / total_predictions if total_predictions > 0 else 0.0
+        return DecayAgeMatrix(ages, mask, memory_accuracy, half_life_scale, was_correct)
 
-    def _calculate_weighted_memory_accuracy(
+    def optimize_half_lives_for_experts(
         self,
-        prediction_date: datetime,
-        memory_dates: List[datetime],
-        half_life: int
-    ) -> float:
-        """Calculate weighted accuracy of supporting memories"""
-        if not memory_dates:
-            return 0.5  # Neutral
+        performance_by_expert: Dict[ExpertType, List[Dict[str, Any]]],
+        multipliers: Optional[np.ndarray] = None
+    ) -> Dict[ExpertType, HalfLifeSearchResult]:
+        """
+        Search half-life multipliers for many experts in one broadcast pass.
 
-        total_weight = 0.0
-        weighted_accuracy_sum = 0.0
+        Candidate half-lives are each expert's default half-life times every
+        multiplier, applied proportionally to its category half-lives. Returns
+        the best half-life per expert with the full accuracy-vs-half-life curve.
 
-        for memory_date in memory_dates:
-            age_days = (prediction_date - memory_date).days
-            weight = math.pow(0.5, age_days / half_life)
+        Args:
+            performance_by_expert: Historical performance data per expert type
+            multipliers: Half-life multipliers to test (default 0.25x to 3x)
 
-            # Assume memories have some baseline accuracy
-            memory_accuracy = 0.65  # Placeholder - would use actual memory accuracy
+        Returns:
+            Dict[ExpertType, HalfLifeSearchResult]: Search results per expert
+        """
+        if multipliers is None:
+            multipliers = np.linspace(0.25, 3.0, 56)
+        multipliers = np.asarray(multipliers, dtype=np.float64)
 
-            total_weight += weight
-            weighted_accuracy_sum += weight * memory_accuracy
+        expert_types = [e for e in performance_by_expert if e in self.decay_configs]
+        if not expert_types:
+            return {}
 
-        return weighted_accuracy_sum / total_weight if total_weight > 0 else 0.5
+        matrices = [self.build_decay_age_matrix(e, performance_by_expert[e]) for e in expert_types]
+        n_predictions = max(len(m.was_correct) for m in matrices)
+        n_memories = max(m.ages.shape[1] for m in matrices)
+
+        def stack(attr: str, fill, dtype) -> np.ndarray:
+            out = np.full((len(matrices), n_predictions, n_memories), fill, dtype=dtype)
+            for x, m in enumerate(matrices):
+                values = getattr(m, attr)
+                out[x, :values.shape[0], :values.shape[1]] = values
+            return out
+
+        was_correct = np.zeros((len(matrices), n_predictions), dtype=bool)
+        prediction_mask = np.zeros((len(matrices), n_predictions), dtype=bool)
+        for x, m in enumerate(matrices):
+            was_correct[x, :len(m.was_correct)] = m.was_correct
+            prediction_mask[x, :len(m.was_correct)] = True
+
+        default_half_lives = np.array(
+            [self.decay_configs[e].default_half_life for e in expert_types], dtype=np.float64
+        )
+        half_life_grid = default_half_lives[:, None] * multipliers[None, :]
+
+        accuracies = self._evaluate_half_life_grid(
+            stack('ages', 0.0, np.float64), stack('mask', False, bool),
+            stack('memory_accuracy', DEFAULT_MEMORY_ACCURACY, np.float64),
+            stack('half_life_scale', 1.0, np.float64),
+            was_correct, prediction_mask, half_life_grid
+        )
+
+        results = {}
+        for x, expert_type in enumerate(expert_types):
+            best_index = int(np.argmax(accuracies[x]))
+            results[expert_type] = HalfLifeSearchResult(
+                expert_type=expert_type,
+                best_half_life=int(round(half_life_grid[x, best_index])),
+                best_multiplier=float(multipliers[best_index]),
+                best_accuracy=float(accuracies[x, best_index]),
+                half_lives=half_life_grid[x].tolist(),
+                accuracy_curve=accuracies[x].tolist()
+            )
+
+        self.logger.info(f"Optimized half-lives for {len(results)} experts over {len(multipliers)} candidates")
+
+        return results
+
+    def _evaluate_half_life_grid(
+        self,
+        ages: np.ndarray,
+        mask: np.ndarray,
+        memory_accuracy: np.ndarray,
+        half_life_scale: np.ndarray,
+        was_correct: np.ndarray,
+        prediction_mask: np.ndarray,
+        half_lives: np.ndarray
+    ) -> np.ndarray:
+        """
+        Share of each expert's predictions that were correct and had decay-weighted
+        memory accuracy above MEMORY_SUPPORT_THRESHOLD, for every half-life.
+
+        Shapes: ages/mask/memory_accuracy/half_life_scale (X, P, M),
+        was_correct/prediction_mask (X, P), half_lives (X, H). Returns (X, H).
+        The half-life axis is chunked so the (X, H, P, M) weight tensor stays bounded.
+        """
+        n_experts, n_predictions, n_memories = ages.shape
+        n_half_lives = half_lives.shape[1]
+        accuracies = np.zeros((n_experts, n_half_lives))
+        totals = prediction_mask.sum(axis=1)
+        if n_predictions == 0 or n_half_lives == 0:
+            return accuracies
+
+        has_memories = mask.any(axis=2)[:, None, :]
+        weighted_memory = np.where(mask, memory_accuracy, 0.0)[:, None]
+        ages_scaled = (ages / half_life_scale)[:, None]
+        chunk = max(1, HALF_LIFE_SEARCH_CHUNK_ELEMENTS // max(1, n_experts * n_predictions * n_memories))
+
+        for start in range(0, n_half_lives, chunk):
+            stop = min(start + chunk, n_half_lives)
+            hl = half_lives[:, start:stop, None, None]
+            weights = np.where(mask[:, None], np.exp2(-ages_scaled / hl), 0.0)
+            total_weight = weights.sum(axis=3)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                weighted = np.where(
+                    total_weight > 0, (weights * weighted_memory).sum(axis=3) / total_weight, 0.5
+                )
+            weighted = np.where(has_memories, weighted, 0.5)
+            supported = (weighted > MEMORY_SUPPORT_THRESHOLD) & (was_correct & prediction_mask)[:, None]
+            accuracies[:, start:stop] = supported.sum(axis=2)
+
+        return np.where(totals[:, None] > 0, accuracies / np.maximum(totals, 1)[:, None], 0.0)
@@ -7,8 +7,10 @@ Handles storage of predictions and results to local files and Supabase
 import os
 import json
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable
 from dataclasses import dataclass
 import logging
 
@@ -31,11 +33,30 @@ class PredictionRecord:
     prediction_time: str = ""
     game_time: Optional[str] = None
 
+PREDICTION_COLUMNS = [
+    'id', 'game_id', 'home_team', 'away_team', 'expert_name', 'predicted_home_score',
+    'predicted_away_score', 'actual_home_score', 'actual_away_score', 'confidence',
+    'prediction_time', 'game_time', 'season', 'week'
+]
+
+RESULT_COLUMNS = [
+    'id', 'game_id', 'home_team', 'away_team', 'home_score', 'away_score',
+    'game_status', 'game_date', 'season', 'week'
+]
+
 class NFLPredictionStorage:
-    """Handles all prediction storage operations"""
+    """Handles all prediction storage operations
 
-    def __init__(self, db_path: str = "data/predictions.db"):
+    By default a single persistent WAL-mode connection is shared by all calls
+    and writes are batched with executemany inside one transaction. Pass
+    persistent=False for the old open-per-call behaviour.
+    """
+
+    def __init__(self, db_path: str = "data/predictions.db", persistent: bool = True):
         self.db_path = db_path
+        self.persistent = persistent
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
         self.ensure_directory()
         self.init_database()
 
@@ -43,9 +64,42 @@ class NFLPredictionStorage:
         """Create data directory if it doesn't exist"""
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
 
+    def _open_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        return conn
+
+    @contextmanager
+    def _connection(self):
+        """Yield a connection inside a transaction that commits on success"""
+        if not self.persistent:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                with conn:
+                    yield conn
+            finally:
+                conn.close()
+            return
+
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._open_connection()
+            with self._conn:
+                yield self._conn
+
+    def close(self):
+        """Close the persistent connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
     def init_database(self):
         """Initialize SQLite database for predictions"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS predictions (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -83,64 +137,85 @@ class NFLPredictionStorage:
                 )
             """)
 
-            conn.commit()
+            # Result updates look up predictions by game; the accuracy index
+            # covers every column get_prediction_accuracy reads
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_predictions_game_id ON predictions(game_id)")
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_predictions_accuracy ON predictions(
+                    expert_name, actual_home_score, actual_away_score,
+                    predicted_home_score, predicted_away_score
+                )
+            """)
         logger.info(f"Database initialized at {self.db_path}")
 
     def store_predictions(self, predictions: List[Dict], season: int = 2024, week: int = 2):
         """Store predictions to database"""
-        with sqlite3.connect(self.db_path) as conn:
-            for pred in predictions:
-                game_data = pred.get('game_data', {})
-                expert_predictions = pred.get('predictions', [])
-
-                for expert_pred in expert_predictions:
-                    conn.execute("""
-                        INSERT INTO predictions (
-                            game_id, home_team, away_team, expert_name,
-                            predicted_home_score, predicted_away_score,
-                            confidence, prediction_time, season, week
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        expert_pred.get('game_id', ''),
-                        game_data.get('HomeTeam', ''),
-                        game_data.get('AwayTeam', ''),
-                        expert_pred.get('expert_name', 'unknown'),
-                        expert_pred.get('predictions', {}).get('exact_score', {}).get('home', 0),
-                        expert_pred.get('predictions', {}).get('exact_score', {}).get('away', 0),
-                        expert_pred.get('confidence', 0.75),
-                        expert_pred.get('timestamp', datetime.now().isoformat()),
-                        season,
-                        week
-                    ))
-            conn.commit()
-        logger.info(f"Stored {len(predictions)} prediction sets to database")
+        rows = []
+        for pred in predictions:
+            game_data = pred.get('game_data', {})
+
+            for expert_pred in pred.get('predictions', []):
+                exact_score = expert_pred.get('predictions', {}).get('exact_score', {})
+                rows.append((
+                    expert_pred.get('game_id', ''),
+                    game_data.get('HomeTeam', ''),
+                    game_data.get('AwayTeam', ''),
+                    expert_pred.get('expert_name', 'unknown'),
+                    exact_score.get('home', 0),
+                    exact_score.get('away', 0),
+                    expert_pred.get('confidence', 0.75),
+                    expert_pred.get('timestamp', datetime.now().isoformat()),
+                    season,
+                    week
+                ))
+
+        with self._connection() as conn:
+            conn.executemany("""
+                INSERT INTO predictions (
+                    game_id, home_team, away_team, expert_name,
+                    predicted_home_score, predicted_away_score,
+                    confidence, prediction_time, season, week
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+        logger.info(f"Stored {len(predictions)} prediction sets ({len(rows)} rows) to database")
 
     def store_game_result(self, game_id: str, home_team: str, away_team: str,
                          home_score: int, away_score: int, game_date: str = None,
                          season: int = 2024, week: int = 2):
         """Store actual game result"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
+        self.store_game_results([{
+            'game_id': game_id, 'home_team': home_team, 'away_team': away_team,
+            'home_score': home_score, 'away_score': away_score, 'game_date': game_date,
+            'season': season, 'week': week
+        }])
+        logger.info(f"Stored result for {game_id}: {home_team} {home_score} - {away_team} {away_score}")
+
+    def store_game_results(self, results: List[Dict]):
+        """Store a batch of game results and update their predictions in one transaction"""
+        result_rows = [(
+            r['game_id'], r['home_team'], r['away_team'], r['home_score'], r['away_score'],
+            r.get('game_date') or datetime.now().isoformat(), r.get('season', 2024), r.get('week', 2)
+        ) for r in results]
+        update_rows = [(r['home_score'], r['away_score'], r['game_id']) for r in results]
+
+        with self._connection() as conn:
+            conn.executemany("""
                 INSERT OR REPLACE INTO game_results (
                     game_id, home_team, away_team, home_score, away_score,
                     game_date, season, week
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (game_id, home_team, away_team, home_score, away_score,
-                  game_date or datetime.now().isoformat(), season, week))
+            """, result_rows)
 
             # Update predictions with actual results
-            conn.execute("""
+            conn.executemany("""
                 UPDATE predictions
                 SET actual_home_score = ?, actual_away_score = ?, updated_at = CURRENT_TIMESTAMP
                 WHERE game_id = ?
-            """, (home_score, away_score, game_id))
-
-            conn.commit()
-        logger.info(f"Stored result for {game_id}: {home_team} {home_score} - {away_team} {away_score}")
+            """, update_rows)
 
     def get_prediction_accuracy(self, expert_name: str = None) -> Dict:
         """Calculate prediction accuracy"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             query = """
                 SELECT
                     expert_name,
@@ -179,40 +254,57 @@ class NFLPredictionStorage:
 
             return results
 
-    def export_to_json(self, output_file: str):
-        """Export all data to JSON file"""
-        with sqlite3.connect(self.db_path) as conn:
-            # Get predictions
-            predictions = []
-            for row in conn.execute("SELECT * FROM predictions"):
-                predictions.append({
-                    'id': row[0], 'game_id': row[1], 'home_team': row[2], 'away_team': row[3],
-                    'expert_name': row[4], 'predicted_home_score': row[5], 'predicted_away_score': row[6],
-                    'actual_home_score': row[7], 'actual_away_score': row[8], 'confidence': row[9],
-                    'prediction_time': row[10], 'game_time': row[11], 'season': row[12], 'week': row[13]
-                })
+    def _iter_rows(self, table: str, columns: List[str], batch_size: int = 1000) -> Iterable[Dict[str, Any]]:
+        """Rows in rowid order, fetched a batch at a time
 
-            # Get results
-            results = []
-            for row in conn.execute("SELECT * FROM game_results"):
-                results.append({
-                    'id': row[0], 'game_id': row[1], 'home_team': row[2], 'away_team': row[3],
-                    'home_score': row[4], 'away_score': row[5], 'game_status': row[6],
-                    'game_date': row[7], 'season': row[8], 'week': row[9]
-                })
+        The lock and connection are only held while a batch is read, so writers
+        are not blocked for the length of an export.
+        """
+        query = f"SELECT rowid, {', '.join(columns)} FROM {table} WHERE rowid > ? ORDER BY rowid LIMIT ?"
+        last_rowid = 0
+        while True:
+            with self._connection() as conn:
+                batch = conn.execute(query, (last_rowid, batch_size)).fetchall()
+            if not batch:
+                break
+            last_rowid = batch[-1][0]
+            for row in batch:
+                yield dict(zip(columns, row[1:]))
 
-        export_data = {
-            'export_time': datetime.now().isoformat(),
-            'predictions': predictions,
-            'results': results,
-            'accuracy': self.get_prediction_accuracy()
-        }
+    def _write_json_array(self, f, rows: Iterable[Dict[str, Any]]) -> int:
+        count = 0
+        f.write('[')
+        for row in rows:
+            f.write(',\n    ' if count else '\n    ')
+            f.write(json.dumps(row))
+            count += 1
+        f.write('\n  ]' if count else ']')
+        return count
+
+    def export_to_json(self, output_file: str) -> Dict[str, Any]:
+        """Export all data to JSON file
+
+        Rows are streamed to disk in batches rather than collected in memory,
+        so the returned summary carries row counts (prediction_count,
+        result_count) instead of the rows themselves.
+        """
+        export_time = datetime.now().isoformat()
+        accuracy = self.get_prediction_accuracy()
 
         with open(output_file, 'w') as f:
-            json.dump(export_data, f, indent=2)
+            f.write('{\n  "export_time": ' + json.dumps(export_time) + ',\n  "predictions": ')
+            prediction_count = self._write_json_array(f, self._iter_rows('predictions', PREDICTION_COLUMNS))
+            f.write(',\n  "results": ')
+            result_count = self._write_json_array(f, self._iter_rows('game_results', RESULT_COLUMNS))
+            f.write(',\n  "accuracy": ' + json.dumps(accuracy) + '\n}\n')
 
-        logger.info(f"Exported {len(predictions)} predictions and {len(results)} results to {output_file}")
-        return export_data
+        logger.info(f"Exported {prediction_count} predictions and {result_count} results to {output_file}")
+        return {
+            'export_time': export_time,
+            'prediction_count': prediction_count,
+            'result_count': result_count,
+            'accuracy': accuracy
+        }
 
 # Global storage instance
 storage = NFLPredictionStorage()
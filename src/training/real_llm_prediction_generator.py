@@ -23,6 +23,8 @@ sys.path.append('src')
 from training.expert_configuration import ExpertType, ExpertConfiguration, ExpertConfigurationManager
 from training.prediction_generator import GamePrediction, PredictionType
 from training.memory_retrieval_system import MemoryRetrievalResult, RetrievedMemory
+from performance.tracing import traced, trace_span, annotate
+from performance.http_pool import get_http_session, http_registry
 
 # Load environment variables
 load_dotenv()
@@ -182,12 +184,14 @@ class RealLLMPredictionGenerator:
 
         logger.info("✅ Real LLM Prediction Generator initialized with parallel processing")
 
+    @traced("llm.generate_real_prediction", stage="prediction")
     async def generate_real_prediction(self, expert_type: ExpertType, game_context: Dict[str, Any],
                                      retrieved_memories: List[RetrievedMemory],
                                      prediction_type: PredictionType = PredictionType.WINNER) -> GamePrediction:
         """Generate a real prediction using LLM API call"""
 
         logger.info(f"🤖 Generating real LLM prediction for {expert_type.value}")
+        annotate(expert=expert_type.value, llm_available=self.llm_available)
 
         try:
             # Get expert configuration
@@ -267,11 +271,14 @@ class RealLLMPredictionGenerator:
         logger.info(f"✅ Completed parallel predictions: {len(predictions)} experts")
         return predictions
 
+    @traced("llm.generate_single_expert_prediction", stage="prediction")
     async def _generate_single_expert_prediction(self, expert_type: ExpertType,
                                                game_context: Dict[str, Any],
                                                retrieved_memories: List[RetrievedMemory]) -> GamePrediction:
         """Generate prediction for a single expert using their assigned model"""
 
+        annotate(expert=expert_type.value, llm_available=self.llm_available)
+
         # Get model assignment for this expert
         model_config = EXPERT_MODEL_ASSIGNMENTS.get(expert_type)
         if not model_config:
@@ -309,13 +316,16 @@ class RealLLMPredictionGenerator:
             prediction_timestamp=datetime.now()
         )
 
+    @traced("llm.call_with_model", stage="llm")
     async def _call_llm_with_model(self, request: LLMPredictionRequest, model_config: Dict[str, Any]) -> LLMPredictionResponse:
         """Make LLM API call using specific model configuration"""
 
         model_key = f"{model_config['provider']}:{model_config['model']}"
+        annotate(model=model_key, expert=request.expert_type.value)
 
         # Apply rate limiting for this specific model
-        await self.rate_limiter.wait_if_needed(model_key, model_config['rpm_limit'])
+        with trace_span("llm.rate_limit_wait", stage="rate_limit", model=model_key):
+            await self.rate_limiter.wait_if_needed(model_key, model_config['rpm_limit'])
 
         # Build the prompt
         prompt = self._build_expert_prompt(request)
@@ -339,20 +349,20 @@ class RealLLMPredictionGenerator:
         }
 
         try:
-            import aiohttp
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.openrouter_url, headers=headers, json=payload) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        llm_text = data['choices'][0]['message']['content']
-                        logger.debug(f"✅ LLM response for {request.expert_type.value} using {model_config['model']}")
-                        return self._parse_llm_response(llm_text, request)
-                    else:
-                        error_text = await response.text()
-                        raise Exception(f"API call failed: {response.status} {error_text}")
+            session = get_http_session('openrouter_llm', timeout=300)
+            async with session.post(self.openrouter_url, headers=headers, json=payload) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    llm_text = data['choices'][0]['message']['content']
+                    logger.debug(f"✅ LLM response for {request.expert_type.value} using {model_config['model']}")
+                    return self._parse_llm_response(llm_text, request)
+                else:
+                    error_text = await response.text()
+                    raise Exception(f"API call failed: {response.status} {error_text}")
 
         except Exception as e:
             logger.error(f"❌ LLM call failed for {request.expert_type.value} using {model_config['model']}: {e}")
+            annotate(fallback=True, error=str(e))
             # Fallback to simulation
             return await self._simulate_enhanced_prediction(request)
 
@@ -370,6 +380,7 @@ class RealLLMPredictionGenerator:
             prediction_timestamp=datetime.now()
         )
 
+    @traced("llm.call_for_prediction", stage="llm", model="gpt-4")
     async def _call_llm_for_prediction(self, request: LLMPredictionRequest) -> LLMPredictionResponse:
         """Make actual LLM API call to generate prediction"""
 
@@ -401,6 +412,7 @@ class RealLLMPredictionGenerator:
 
         except Exception as e:
             logger.error(f"❌ LLM API call failed: {e}")
+            annotate(fallback=True, error=str(e))
             # Fallback to enhanced simulation
             return await self._simulate_enhanced_prediction(request)
 
@@ -763,80 +775,83 @@ Remember to stay true to your analytical approach and personality. Provide speci
 
 async def main():
     """Test the Real LLM Prediction Generator"""
-    print("🤖 Real LLM Prediction Generator Test")
-    print("=" * 60)
-
-    from training.expert_configuration import ExpertConfigurationManager
-    from training.memory_retrieval_system import RetrievedMemory, GameMemory, DecayScore
-
-    # Initialize components
-    config_manager = ExpertConfigurationManager()
-    generator = RealLLMPredictionGenerator(config_manager)
-
-    # Create test game context
-    test_game_context = {
-        'game_id': 'test_game_001',
-        'home_team': 'Chiefs',
-        'away_team': 'Raiders',
-        'season': 2020,
-        'week': 15,
-        'game_date': '2020-12-13',
-        'weather': {'temperature': 35, 'wind_speed': 12},
-        'spread_line': -7.0,
-        'total_line': 52.5,
-        'division_game': True,
-        'public_betting': {'home': 75}
-    }
+    try:
+        print("🤖 Real LLM Prediction Generator Test")
+        print("=" * 60)
+
+        from training.expert_configuration import ExpertConfigurationManager
+        from training.memory_retrieval_system import RetrievedMemory, GameMemory, DecayScore
+
+        # Initialize components
+        config_manager = ExpertConfigurationManager()
+        generator = RealLLMPredictionGenerator(config_manager)
+
+        # Create test game context
+        test_game_context = {
+            'game_id': 'test_game_001',
+            'home_team': 'Chiefs',
+            'away_team': 'Raiders',
+            'season': 2020,
+            'week': 15,
+            'game_date': '2020-12-13',
+            'weather': {'temperature': 35, 'wind_speed': 12},
+            'spread_line': -7.0,
+            'total_line': 52.5,
+            'division_game': True,
+            'public_betting': {'home': 75}
+        }
 
-    # Create test memories
-    test_memories = [
-        RetrievedMemory(
-            memory=GameMemory(
-                memory_id='mem_001',
-                memory_type='reasoning',
-                content='Chiefs struggle in cold weather divisional games',
-                game_context={},
-                outcome_data=None,
-                created_date=datetime.now()
-            ),
-            decay_score=DecayScore(
-                base_score=0.8,
-                age_days=30,
-                temporal_decay=0.9,
-                final_weighted_score=0.72
-            ),
-            similarity_explanation='Similar cold weather divisional context',
-            relevance_rank=1
-        )
-    ]
+        # Create test memories
+        test_memories = [
+            RetrievedMemory(
+                memory=GameMemory(
+                    memory_id='mem_001',
+                    memory_type='reasoning',
+                    content='Chiefs struggle in cold weather divisional games',
+                    game_context={},
+                    outcome_data=None,
+                    created_date=datetime.now()
+                ),
+                decay_score=DecayScore(
+                    base_score=0.8,
+                    age_days=30,
+                    temporal_decay=0.9,
+                    final_weighted_score=0.72
+                ),
+                similarity_explanation='Similar cold weather divisional context',
+                relevance_rank=1
+            )
+        ]
 
-    # Test different expert types
-    test_experts = [
-        ExpertType.MOMENTUM_RIDER,
-        ExpertType.CONTRARIAN_REBEL,
-        ExpertType.CHAOS_THEORY_BELIEVER
-    ]
+        # Test different expert types
+        test_experts = [
+            ExpertType.MOMENTUM_RIDER,
+            ExpertType.CONTRARIAN_REBEL,
+            ExpertType.CHAOS_THEORY_BELIEVER
+        ]
 
-    for expert_type in test_experts:
-        print(f"\n🎯 Testing {expert_type.value}:")
+        for expert_type in test_experts:
+            print(f"\n🎯 Testing {expert_type.value}:")
 
-        try:
-            prediction = await generator.generate_real_prediction(
-                expert_type, test_game_context, test_memories
-            )
+            try:
+                prediction = await generator.generate_real_prediction(
+                    expert_type, test_game_context, test_memories
+                )
 
-            print(f"   Winner: {prediction.predicted_winner}")
-            print(f"   Probability: {prediction.win_probability:.1%}")
-            print(f"   Confidence: {prediction.confidence_level:.1%}")
-            print(f"   Key Factors: {', '.join(prediction.key_factors)}")
-            print(f"   Reasoning:")
-            for i, reason in enumerate(prediction.reasoning_chain, 1):
-                print(f"     {i}. {reason}")
+                print(f"   Winner: {prediction.predicted_winner}")
+                print(f"   Probability: {prediction.win_probability:.1%}")
+                print(f"   Confidence: {prediction.confidence_level:.1%}")
+                print(f"   Key Factors: {', '.join(prediction.key_factors)}")
+                print(f"   Reasoning:")
+                for i, reason in enumerate(prediction.reasoning_chain, 1):
+                    print(f"     {i}. {reason}")
 
-        except Exception as e:
-            print(f"   ❌ Failed: {e}")
+            except Exception as e:
+                print(f"   ❌ Failed: {e}")
 
-    print(f"\n✅ Real LLM Prediction Generator test completed!")
+        print(f"\n✅ Real LLM Prediction Generator test completed!")
+    finally:
+        await http_registry.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Compiled Team Index
+
+Single normalization point for NFL team names. Every team has an interned,
+compact integer TeamId (stable, 0-31) usable directly as an array index in
+feature building. Known variants -- abbreviations from each data provider,
+full names, cities, nicknames and relocated/renamed franchises -- are compiled
+once at import into one alias table; anything else goes through a fuzzy
+fallback whose results are cached alongside the exact hits.
+"""
+
+import re
+import sys
+import difflib
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+
+class TeamId(IntEnum):
+    """Compact team ids. Values are persisted in feature arrays: append only, never reorder."""
+    ARI = 0
+    ATL = 1
+    BAL = 2
+    BUF = 3
+    CAR = 4
+    CHI = 5
+    CIN = 6
+    CLE = 7
+    DAL = 8
+    DEN = 9
+    DET = 10
+    GB = 11
+    HOU = 12
+    IND = 13
+    JAX = 14
+    KC = 15
+    LAC = 16
+    LAR = 17
+    LV = 18
+    MIA = 19
+    MIN = 20
+    NE = 21
+    NO = 22
+    NYG = 23
+    NYJ = 24
+    PHI = 25
+    PIT = 26
+    SEA = 27
+    SF = 28
+    TB = 29
+    TEN = 30
+    WAS = 31
+
+
+NUM_TEAMS = len(TeamId)
+UNKNOWN_TEAM = -1  # placeholder id in team id arrays
+
+
+@dataclass(frozen=True)
+class TeamInfo:
+    """Static facts about one franchise"""
+    team_id: TeamId
+    key: str  # snake_case name used by TeamNameStandardizer
+    display_name: str
+    city: str
+    nickname: str
+    conference: str
+    division: str
+    aliases: Tuple[str, ...] = ()  # abbreviations, nicknames and historical names
+
+    @property
+    def abbreviation(self) -> str:
+        return self.team_id.name
+
+
+def _team(team_id: TeamId, city: str, nickname: str, division: str, *aliases: str) -> TeamInfo:
+    display_name = f"{city} {nickname}"
+    return TeamInfo(
+        team_id=team_id,
+        key=display_name.lower().replace(' ', '_'),
+        display_name=display_name,
+        city=city,
+        nickname=nickname,
+        conference=division.split()[0],
+        division=division,
+        aliases=aliases
+    )
+
+
+# Indexed by TeamId
+TEAMS: Tuple[TeamInfo, ...] = (
+    _team(TeamId.ARI, 'Arizona', 'Cardinals', 'NFC West', 'ARZ', 'CRD', 'Phoenix Cardinals', 'St. Louis Cardinals'),
+    _team(TeamId.ATL, 'Atlanta', 'Falcons', 'NFC South'),
+    _team(TeamId.BAL, 'Baltimore', 'Ravens', 'AFC North', 'BLT', 'RAV'),
+    _team(TeamId.BUF, 'Buffalo', 'Bills', 'AFC East'),
+    _team(TeamId.CAR, 'Carolina', 'Panthers', 'NFC South'),
+    _team(TeamId.CHI, 'Chicago', 'Bears', 'NFC North'),
+    _team(TeamId.CIN, 'Cincinnati', 'Bengals', 'AFC North'),
+    _team(TeamId.CLE, 'Cleveland', 'Browns', 'AFC North', 'CLV'),
+    _team(TeamId.DAL, 'Dallas', 'Cowboys', 'NFC East'),
+    _team(TeamId.DEN, 'Denver', 'Broncos', 'AFC West'),
+    _team(TeamId.DET, 'Detroit', 'Lions', 'NFC North'),
+    _team(TeamId.GB, 'Green Bay', 'Packers', 'NFC North', 'GNB'),
+    _team(TeamId.HOU, 'Houston', 'Texans', 'AFC South', 'HST', 'HTX'),
+    _team(TeamId.IND, 'Indianapolis', 'Colts', 'AFC South', 'CLT', 'Baltimore Colts'),
+    _team(TeamId.JAX, 'Jacksonville', 'Jaguars', 'AFC South', 'JAC', 'Jags'),
+    _team(TeamId.KC, 'Kansas City', 'Chiefs', 'AFC West', 'KAN'),
+    _team(TeamId.LAC, 'Los Angeles', 'Chargers', 'AFC West', 'SD', 'SDG', 'San Diego', 'San Diego Chargers', 'Bolts'),
+    _team(TeamId.LAR, 'Los Angeles', 'Rams', 'NFC West', 'LA', 'RAM', 'STL', 'SL', 'St. Louis', 'St. Louis Rams'),
+    _team(TeamId.LV, 'Las Vegas', 'Raiders', 'AFC West', 'LVR', 'LAS', 'OAK', 'RAI', 'Oakland', 'Oakland Raiders',
+          'Los Angeles Raiders'),
+    _team(TeamId.MIA, 'Miami', 'Dolphins', 'AFC East', 'Fins'),
+    _team(TeamId.MIN, 'Minnesota', 'Vikings', 'NFC North'),
+    _team(TeamId.NE, 'New England', 'Patriots', 'AFC East', 'NWE', 'Pats', 'Boston Patriots'),
+    _team(TeamId.NO, 'New Orleans', 'Saints', 'NFC South', 'NOR', 'NOS'),
+    _team(TeamId.NYG, 'New York', 'Giants', 'NFC East', 'NY Giants'),
+    _team(TeamId.NYJ, 'New York', 'Jets', 'AFC East', 'NY Jets'),
+    _team(TeamId.PHI, 'Philadelphia', 'Eagles', 'NFC East'),
+    _team(TeamId.PIT, 'Pittsburgh', 'Steelers', 'AFC North'),
+    _team(TeamId.SEA, 'Seattle', 'Seahawks', 'NFC West'),
+    _team(TeamId.SF, 'San Francisco', '49ers', 'NFC West', 'SFO', 'Niners', 'Forty Niners'),
+    _team(TeamId.TB, 'Tampa Bay', 'Buccaneers', 'NFC South', 'TAM', 'Bucs'),
+    _team(TeamId.TEN, 'Tennessee', 'Titans', 'AFC South', 'OTI', 'Houston Oilers', 'Tennessee Oilers'),
+    _team(TeamId.WAS, 'Washington', 'Commanders', 'NFC East', 'WSH', 'WFT', 'Washington Football Team',
+          'Washington Redskins', 'Redskins'),
+)
+
+_CLEAN_PUNCTUATION = re.compile(r"[.'’]")
+_CLEAN_SEPARATORS = re.compile(r"[^A-Z0-9]+")
+_CLEAN_AFFIXES = re.compile(r"^THE |(?: NFL| FOOTBALL| FOOTBALL CLUB)$")
+
+
+def normalize_key(name: str) -> str:
+    """Canonical lookup form: upper case, no punctuation, single spaces"""
+    cleaned = _CLEAN_PUNCTUATION.sub('', name.upper())
+    cleaned = _CLEAN_SEPARATORS.sub(' ', cleaned).strip()
+    return _CLEAN_AFFIXES.sub('', cleaned).strip()
+
+
+def _compile_aliases() -> Dict[str, TeamId]:
+    """Alias table over every variant; keys shared by two teams (e.g. a city) are left out"""
+    candidates: Dict[str, set] = {}
+    for team in TEAMS:
+        variants = (team.abbreviation, team.key, team.display_name, team.city, team.nickname, *team.aliases)
+        for variant in variants:
+            candidates.setdefault(normalize_key(variant), set()).add(team.team_id)
+
+    return {
+        sys.intern(key): next(iter(team_ids))
+        for key, team_ids in candidates.items()
+        if len(team_ids) == 1
+    }
+
+
+TEAM_ALIASES: Dict[str, TeamId] = _compile_aliases()
+
+FUZZY_CUTOFF = 0.85
+FUZZY_MIN_LENGTH = 5  # shorter names are too close to ordinary words ("Team" vs "TAM")
+
+
+def _fuzzy_keys() -> Tuple[str, ...]:
+    """Spelling-correction targets: full names, cities, nicknames and long aliases, never abbreviations"""
+    keys = []
+    for team in TEAMS:
+        names = (team.display_name, team.city, team.nickname, *(a for a in team.aliases if not a.isupper()))
+        keys.extend(normalize_key(name) for name in names)
+    return tuple(dict.fromkeys(
+        key for key in keys
+        if len(key) >= FUZZY_MIN_LENGTH and key in TEAM_ALIASES
+    ))
+
+
+_FUZZY_KEYS = _fuzzy_keys()
+
+
+def _fuzzy_match(key: str) -> Optional[TeamId]:
+    """Resolve an unlisted variant by the names it contains, then by close spelling"""
+    # Extra words around a known name ("Kansas City Chiefs Football Club", "LA Chargers").
+    # Only multi-letter names count here, so a stray "LA" or "NO" cannot decide it.
+    words = key.split()
+    found = {
+        TEAM_ALIASES[phrase]
+        for size in range(len(words), 0, -1)
+        for start in range(len(words) - size + 1)
+        if len(phrase := ' '.join(words[start:start + size])) > 3 and phrase in TEAM_ALIASES
+    }
+    if len(found) == 1:
+        return found.pop()
+    if found:
+        return None  # names of two different teams
+
+    # Misspellings. A word no longer than the shortest target is as likely a
+    # different name ("Texas") as a typo, so only longer keys are corrected.
+    if len(key) <= FUZZY_MIN_LENGTH:
+        return None
+    matches = difflib.get_close_matches(key, _FUZZY_KEYS, n=1, cutoff=FUZZY_CUTOFF)
+    return TEAM_ALIASES[matches[0]] if matches else None
+
+
+@lru_cache(maxsize=4096)
+def resolve_team(name: str) -> Optional[TeamId]:
+    """TeamId for any team name variant, or None if it cannot be identified"""
+    if not isinstance(name, str) or not name:
+        return None
+    key = normalize_key(name)
+    team_id = TEAM_ALIASES.get(key)
+    if team_id is None and len(key) > 3:
+        team_id = _fuzzy_match(key)
+    return team_id
+
+
+def team_info(name_or_id) -> Optional[TeamInfo]:
+    """TeamInfo for a TeamId, integer index or team name"""
+    if isinstance(name_or_id, (int, np.integer)):
+        return TEAMS[name_or_id] if 0 <= name_or_id < NUM_TEAMS else None
+    team_id = resolve_team(name_or_id)
+    return TEAMS[team_id] if team_id is not None else None
+
+
+def team_abbreviation(name: str, default: Optional[str] = None) -> Optional[str]:
+    """Standard abbreviation (e.g. 'KC') for any team name variant"""
+    team_id = resolve_team(name)
+    return team_id.name if team_id is not None else default
+
+
+def team_ids(names: Iterable[str]) -> np.ndarray:
+    """Team ids for a sequence of names as an int16 array; UNKNOWN_TEAM where unresolved"""
+    return np.fromiter(
+        (UNKNOWN_TEAM if (team_id := resolve_team(name)) is None else team_id for name in names),
+        dtype=np.int16
+    )
+
+
+def get_index_stats() -> Dict[str, int]:
+    info = resolve_team.cache_info()
+    return {
+        'aliases': len(TEAM_ALIASES),
+        'cache_hits': info.hits,
+        'cache_misses': info.misses,
+        'cache_size': info.currsize
+    }
@@ -16,6 +16,7 @@ from .data_validator import (
     OddsDataModel,
     data_validator
 )
+from .batch_validator import BatchValidator
 
 __all__ = [
     'DataValidator',
@@ -27,5 +28,6 @@ __all__ = [
     'GameStateModel',
     'PlayerStatsModel',
     'OddsDataModel',
-    'data_validator'
+    'data_validator',
+    'BatchValidator'
 ]
\ No newline at end of file
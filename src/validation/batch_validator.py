@@ -0,0 +1,277 @@
+"""
+Batch Validation Engine
+
+Columnar fast path for validating whole feed payloads at once. Type, length
+and range checks mirror the Pydantic models but run over NumPy columns; rows
+that pass are sanitized directly, and only rows that fail (or look unusual)
+are handed back to the per-record validators to build ValidationIssues.
+"""
+
+import logging
+import re
+from typing import Dict, List, Optional, Any, Tuple
+from datetime import datetime
+from dataclasses import dataclass
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Integers outside this magnitude are left to Pydantic rather than cast to float
+_MAX_EXACT_INT = 2 ** 53
+
+_TIME_PATTERN = re.compile(r'[0-9]{1,2}:[0-9]{2}')
+
+_VALID_QUARTERS = {'1', '2', '3', '4', 'OT', 'OT1', 'OT2', 'FINAL'}
+
+_VALID_POSITIONS = {
+    'QB', 'RB', 'FB', 'WR', 'TE', 'OL', 'C', 'G', 'T',
+    'DL', 'DE', 'DT', 'NT', 'LB', 'MLB', 'OLB', 'CB', 'S',
+    'FS', 'SS', 'K', 'P', 'LS', 'KR', 'PR'
+}
+
+
+@dataclass
+class ColumnSpec:
+    """Constraint for one model field, mirroring its Pydantic Field()"""
+    name: str
+    kind: str  # 'str', 'int', 'float' or 'any'
+    required: bool = True
+    min_length: int = 0
+    max_length: Optional[int] = None
+    ge: Optional[float] = None
+    le: Optional[float] = None
+
+
+GAME_STATE_COLUMNS = [
+    ColumnSpec('game_id', 'str', min_length=1, max_length=50),
+    ColumnSpec('home_team', 'str', min_length=2, max_length=4),
+    ColumnSpec('away_team', 'str', min_length=2, max_length=4),
+    ColumnSpec('home_score', 'int', ge=0, le=100),
+    ColumnSpec('away_score', 'int', ge=0, le=100),
+    ColumnSpec('quarter', 'any'),
+    ColumnSpec('time_remaining', 'str'),
+    ColumnSpec('possession', 'str', required=False, min_length=2, max_length=4),
+    ColumnSpec('down', 'int', required=False, ge=1, le=4),
+    ColumnSpec('distance', 'int', required=False, ge=0, le=99),
+    ColumnSpec('field_position', 'str', required=False),
+    ColumnSpec('status', 'str', max_length=20),
+    ColumnSpec('week', 'int', required=False, ge=1, le=22),
+]
+
+PLAYER_STATS_COLUMNS = [
+    ColumnSpec('player_id', 'str', min_length=1, max_length=20),
+    ColumnSpec('name', 'str', min_length=2, max_length=100),
+    ColumnSpec('team', 'str', min_length=2, max_length=4),
+    ColumnSpec('position', 'str', min_length=1, max_length=5),
+    ColumnSpec('passing_yards', 'int', required=False, ge=0, le=1000),
+    ColumnSpec('rushing_yards', 'int', required=False, ge=-50, le=500),
+    ColumnSpec('receiving_yards', 'int', required=False, ge=0, le=500),
+    ColumnSpec('receptions', 'int', required=False, ge=0, le=50),
+    ColumnSpec('touchdowns', 'int', required=False, ge=0, le=10),
+]
+
+ODDS_COLUMNS = [
+    ColumnSpec('game_id', 'str', min_length=1, max_length=50),
+    ColumnSpec('home_team', 'str', min_length=2, max_length=4),
+    ColumnSpec('away_team', 'str', min_length=2, max_length=4),
+    ColumnSpec('spread', 'float', required=False, ge=-50, le=50),
+    ColumnSpec('total', 'float', required=False, ge=20, le=100),
+    ColumnSpec('home_moneyline', 'int', required=False, ge=-2000, le=2000),
+    ColumnSpec('away_moneyline', 'int', required=False, ge=-2000, le=2000),
+    ColumnSpec('timestamp', 'any'),
+]
+
+
+def _is_int(value: Any) -> bool:
+    return type(value) is int and -_MAX_EXACT_INT < value < _MAX_EXACT_INT
+
+
+def _is_number(value: Any) -> bool:
+    return type(value) is float or _is_int(value)
+
+
+def _zero_nan(column: np.ndarray) -> np.ndarray:
+    return np.where(np.isnan(column), 0.0, column)
+
+
+class BatchValidator:
+    """Vectorized accept/flag decisions for batches of feed records"""
+
+    def columns(self, records: List[Any], specs: List[ColumnSpec]
+                ) -> Tuple[np.ndarray, Dict[str, List[Any]], Dict[str, np.ndarray]]:
+        """Check every spec column; return the accept mask, raw columns and numeric columns"""
+        n = len(records)
+        rows = [record if isinstance(record, dict) else {} for record in records]
+        accepted = np.fromiter((isinstance(record, dict) for record in records), dtype=bool, count=n)
+        raw: Dict[str, List[Any]] = {}
+        numeric: Dict[str, np.ndarray] = {}
+
+        for spec in specs:
+            values = [row.get(spec.name) for row in rows]
+            raw[spec.name] = values
+            types = set(map(type, values))
+            if type(None) in types:
+                is_none = np.array([v is None for v in values], dtype=bool)
+            else:
+                is_none = np.zeros(n, dtype=bool)
+
+            if spec.kind == 'str':
+                if types == {str}:
+                    lengths = np.fromiter(map(len, values), dtype=np.int64, count=n)
+                else:
+                    lengths = np.array([len(v) if type(v) is str else -1 for v in values], dtype=np.int64)
+                ok = lengths >= spec.min_length
+                if spec.max_length is not None:
+                    ok &= lengths <= spec.max_length
+            elif spec.kind in ('int', 'float'):
+                allowed = {int, type(None)} if spec.kind == 'int' else {int, float, type(None)}
+                column = None
+                if types <= allowed:
+                    # Homogeneous column: convert in one call, None becomes NaN
+                    try:
+                        column = np.array(values, dtype=np.float64)
+                        if int in types:
+                            column[np.abs(column) >= _MAX_EXACT_INT] = np.nan
+                    except OverflowError:
+                        column = None
+                if column is None:
+                    typed = _is_int if spec.kind == 'int' else _is_number
+                    column = np.array([float(v) if typed(v) else np.nan for v in values], dtype=np.float64)
+                numeric[spec.name] = column
+                # NaN compares False, so untyped and non-finite values fail here
+                ok = ~np.isnan(column)
+                if spec.ge is not None:
+                    ok &= column >= spec.ge
+                if spec.le is not None:
+                    ok &= column <= spec.le
+            else:
+                ok = ~is_none
+
+            if not spec.required:
+                ok |= is_none
+            accepted &= ok
+
+        return accepted, raw, numeric
+
+    def _sanitize(self, raw: Dict[str, List[Any]], specs: List[ColumnSpec], index: int) -> Dict[str, Any]:
+        """Rebuild the model's dict() output for an accepted row"""
+        sanitized = {}
+        for spec in specs:
+            value = raw[spec.name][index]
+            if spec.kind == 'float' and value is not None:
+                value = float(value)
+            sanitized[spec.name] = value
+        return sanitized
+
+    def game_states(self, records: List[Any]) -> Tuple[np.ndarray, List[Optional[Dict[str, Any]]], np.ndarray]:
+        """Accept mask, sanitized rows and game-logic flags for GameStateModel records"""
+        accepted, raw, numeric = self.columns(records, GAME_STATE_COLUMNS)
+        n = len(records)
+
+        quarters = [
+            str(q) if _is_int(q) and 1 <= q <= 4
+            else q.upper() if type(q) is str and q.upper() in _VALID_QUARTERS
+            else None
+            for q in raw['quarter']
+        ]
+        accepted &= np.fromiter((q is not None for q in quarters), dtype=bool, count=n)
+
+        clocks = [
+            t.split(':') if type(t) is str and _TIME_PATTERN.fullmatch(t) else None
+            for t in raw['time_remaining']
+        ]
+        accepted &= np.fromiter(
+            (c is not None and int(c[0]) <= 15 and int(c[1]) < 60 for c in clocks), dtype=bool, count=n
+        )
+
+        possessions = [
+            p.upper() if type(p) is str else None for p in raw['possession']
+        ]
+        accepted &= np.fromiter(
+            (p is None or (type(h) is str and type(a) is str and p in (h.upper(), a.upper()))
+             for p, h, a in zip(possessions, raw['home_team'], raw['away_team'])),
+            dtype=bool, count=n
+        )
+
+        sanitized: List[Optional[Dict[str, Any]]] = [None] * n
+        for i in np.nonzero(accepted)[0]:
+            row = self._sanitize(raw, GAME_STATE_COLUMNS, i)
+            row['quarter'] = quarters[i]
+            row['possession'] = possessions[i]
+            sanitized[i] = row
+
+        # Business-logic flags, evaluated only where the row was accepted
+        status = np.array([s if type(s) is str else '' for s in raw['status']], dtype=object)
+        scored = (_zero_nan(numeric['home_score']) > 0) | (_zero_nan(numeric['away_score']) > 0)
+        has_possession = np.fromiter((bool(p) for p in possessions), dtype=bool, count=n)
+        no_down = _zero_nan(numeric['down']) == 0
+        final_clock = np.fromiter(
+            (q == 'FINAL' and t != '0:00' for q, t in zip(quarters, raw['time_remaining'])), dtype=bool, count=n
+        )
+        flagged = (
+            ((status == 'SCHEDULED') & scored)
+            | (has_possession & no_down & (status == 'IN_PROGRESS'))
+            | final_clock
+        )
+        return accepted, sanitized, accepted & flagged
+
+    def player_stats(self, records: List[Any]) -> Tuple[np.ndarray, List[Optional[Dict[str, Any]]], np.ndarray]:
+        """Accept mask, sanitized rows and stat-logic flags for PlayerStatsModel records"""
+        accepted, raw, numeric = self.columns(records, PLAYER_STATS_COLUMNS)
+        n = len(records)
+
+        # Unusual positions are valid but logged by the model, so they take the slow path
+        positions = np.array(
+            [p.upper() if type(p) is str else '' for p in raw['position']], dtype=object
+        )
+        accepted &= np.fromiter((p in _VALID_POSITIONS for p in positions), dtype=bool, count=n)
+
+        sanitized: List[Optional[Dict[str, Any]]] = [None] * n
+        for i in np.nonzero(accepted)[0]:
+            row = self._sanitize(raw, PLAYER_STATS_COLUMNS, i)
+            row['position'] = positions[i]
+            sanitized[i] = row
+
+        receiving = numeric['receiving_yards']
+        passing = _zero_nan(numeric['passing_yards'])
+        receptions = _zero_nan(numeric['receptions'])
+        flagged = (
+            ((positions == 'QB') & (_zero_nan(receiving) > 0))
+            | (((positions == 'RB') | (positions == 'FB')) & (passing > 0))
+            | ((receptions > 0) & (receiving == 0))
+        )
+        return accepted, sanitized, accepted & flagged
+
+    def odds(self, records: List[Any], now: Optional[datetime] = None
+             ) -> Tuple[np.ndarray, List[Optional[Dict[str, Any]]], np.ndarray]:
+        """Accept mask, sanitized rows and line-logic flags for OddsDataModel records"""
+        now = now or datetime.utcnow()
+        records = [
+            {**record, 'timestamp': now} if isinstance(record, dict) and 'timestamp' not in record else record
+            for record in records
+        ]
+        accepted, raw, numeric = self.columns(records, ODDS_COLUMNS)
+        n = len(records)
+
+        accepted &= np.fromiter((isinstance(ts, datetime) for ts in raw['timestamp']), dtype=bool, count=n)
+
+        # Unusual lines are valid but logged by the model, so they take the slow path
+        spread = numeric['spread']
+        total = numeric['total']
+        with np.errstate(invalid='ignore'):
+            accepted &= ~(np.abs(spread) > 30)
+            accepted &= ~((total < 30) | (total > 80))
+
+        sanitized: List[Optional[Dict[str, Any]]] = [None] * n
+        for i in np.nonzero(accepted)[0]:
+            sanitized[i] = self._sanitize(raw, ODDS_COLUMNS, i)
+
+        home_ml = _zero_nan(numeric['home_moneyline'])
+        away_ml = _zero_nan(numeric['away_moneyline'])
+        both_lines = (home_ml != 0) & (away_ml != 0)
+        flagged = (
+            (both_lines & (home_ml > 0) & (away_ml > 0))
+            | (both_lines & (_zero_nan(spread) < 0) & (home_ml > 0))
+        )
+        return accepted, sanitized, accepted & flagged
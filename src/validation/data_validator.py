@@ -15,6 +15,8 @@ import json
 
 from pydantic import BaseModel, Field, validator, ValidationError
 
+from .batch_validator import BatchValidator
+
 logger = logging.getLogger(__name__)
 
 
@@ -224,6 +226,8 @@ class DataValidator:
             'FINAL', 'POSTPONED', 'CANCELLED', 'SUSPENDED'
         }
 
+        self.batch_validator = BatchValidator()
+
     def validate_game_data(self, data: Dict[str, Any]) -> ValidationReport:
         """
         Validate game data
@@ -349,6 +353,68 @@ class DataValidator:
 
         return self._create_validation_report(issues, sanitized_data)
 
+    def validate_game_batch(self, games: List[Dict[str, Any]]) -> List[ValidationReport]:
+        """
+        Validate a whole feed of game records
+
+        Clean rows are accepted by vectorized column checks; only rows that
+        fail a check go through validate_game_data to build their issues.
+
+        Args:
+            games: Raw game data dictionaries
+
+        Returns:
+            One ValidationReport per game, in input order
+        """
+        accepted, sanitized, flagged = self.batch_validator.game_states(games)
+        return self._batch_reports(games, accepted, sanitized, flagged,
+                                   self.validate_game_data, self._validate_game_logic)
+
+    def validate_player_stats_batch(self, players: List[Dict[str, Any]]) -> List[ValidationReport]:
+        """
+        Validate a whole feed of player statistics records
+
+        Args:
+            players: Raw player stats dictionaries
+
+        Returns:
+            One ValidationReport per player, in input order
+        """
+        accepted, sanitized, flagged = self.batch_validator.player_stats(players)
+        return self._batch_reports(players, accepted, sanitized, flagged,
+                                   self.validate_player_stats, self._validate_player_logic)
+
+    def validate_odds_batch(self, odds: List[Dict[str, Any]]) -> List[ValidationReport]:
+        """
+        Validate a whole feed of betting odds records
+
+        Args:
+            odds: Raw odds data dictionaries
+
+        Returns:
+            One ValidationReport per record, in input order
+        """
+        accepted, sanitized, flagged = self.batch_validator.odds(odds)
+        return self._batch_reports(odds, accepted, sanitized, flagged,
+                                   self.validate_odds_data, self._validate_odds_logic)
+
+    def _batch_reports(self, records, accepted, sanitized, flagged, validate_record, validate_logic) -> List[ValidationReport]:
+        """Build reports, materializing issues only for rejected or flagged rows"""
+        reports = []
+        for i, record in enumerate(records):
+            if not accepted[i]:
+                reports.append(validate_record(record))
+            elif flagged[i]:
+                reports.append(self._create_validation_report(validate_logic(sanitized[i]), sanitized[i]))
+            else:
+                reports.append(ValidationReport(
+                    is_valid=True,
+                    result=ValidationResult.VALID,
+                    issues=[],
+                    sanitized_data=sanitized[i]
+                ))
+        return reports
+
     def sanitize_text_input(self, text: str, max_length: int = 1000) -> str:
         """
         Sanitize text input to prevent injection attacks
@@ -452,7 +518,7 @@ class DataValidator:
         position = data.get('position', '')
 
         if position == 'QB':
-            if data.get('receiving_yards', 0) > 0:
+            if (data.get('receiving_yards') or 0) > 0:
                 issues.append(ValidationIssue(
                     field='receiving_yards',
                     level=ValidationLevel.WARNING,
@@ -460,7 +526,7 @@ class DataValidator:
                 ))
 
         elif position in ['RB', 'FB']:
-            if data.get('passing_yards', 0) > 0:
+            if (data.get('passing_yards') or 0) > 0:
                 issues.append(ValidationIssue(
                     field='passing_yards',
                     level=ValidationLevel.WARNING,
@@ -468,7 +534,7 @@ class DataValidator:
                 ))
 
         # Check stat consistency
-        receptions = data.get('receptions', 0)
+        receptions = data.get('receptions') or 0
         receiving_yards = data.get('receiving_yards', 0)
 
         if receptions > 0 and receiving_yards == 0: